@@ -32,6 +32,14 @@ target "unicode-api" {
         RATE_LIMIT_PER_PERIOD="50"
         RATE_LIMIT_PERIOD_SECONDS="60"
         RATE_LIMIT_BURST="10"
+        RESULT_CACHE_MAX_ENTRIES="256"
+        RESULT_CACHE_TTL_SECONDS="3600"
+        RESPONSE_CACHE_ENABLED="false"
+        RESPONSE_CACHE_TTL_SECONDS="86400"
+        RESPONSE_CACHE_MAX_LOCAL_ENTRIES="1024"
+        VALIDATE_RESPONSES="false"
+        FILTER_ENGINE="sql"
+        MAX_CHAR_STRING_LENGTH="1000"
         UMAMI_WEBSITE_ID="${UMAMI_WEBSITE_ID}"
     }
 }
@@ -4,6 +4,7 @@ from unicode_api.api.api_v1.dependencies.block_name_resolver import (
 )
 from unicode_api.api.api_v1.dependencies.block_search_params import BlockSearchParameters
 from unicode_api.api.api_v1.dependencies.char_search_params import CharacterSearchParameters
+from unicode_api.api.api_v1.dependencies.codepoint_batch_params import CodepointBatchParameters
 from unicode_api.api.api_v1.dependencies.filter_settings import FilterSettings
 from unicode_api.api.api_v1.dependencies.list_params import ListParameters, ListParametersDecimal
 from unicode_api.api.api_v1.dependencies.plane_abbrev_resolver import UnicodePlaneResolver
@@ -13,6 +14,7 @@ __all__ = [
     "UnicodeBlockQueryParamResolver",
     "BlockSearchParameters",
     "CharacterSearchParameters",
+    "CodepointBatchParameters",
     "FilterSettings",
     "ListParameters",
     "ListParametersDecimal",
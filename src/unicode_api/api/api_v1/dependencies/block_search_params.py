@@ -2,7 +2,9 @@ from typing import Annotated
 
 from fastapi import Query
 
+from unicode_api.api.api_v1.dependencies.util import check_page_and_cursor_not_both_provided
 from unicode_api.docs.dependencies.custom_parameters import (
+    CURSOR_DESCRIPTION,
     MIN_SCORE_DESCRIPTION,
     MIN_SEARCH_RESULT_SCORE,
     PAGE_NUMBER_DESCRIPTION,
@@ -20,8 +22,11 @@ class BlockSearchParameters:
         ] = None,
         per_page: Annotated[int | None, Query(ge=1, le=100, description=PER_PAGE_DESCRIPTION)] = None,
         page: Annotated[int | None, Query(ge=1, description=PAGE_NUMBER_DESCRIPTION)] = None,
+        cursor: Annotated[str | None, Query(description=CURSOR_DESCRIPTION)] = None,
     ):
+        check_page_and_cursor_not_both_provided(page, cursor)
         self.name = name
         self.min_score = min_score or 80
         self.per_page = per_page or 10
         self.page = page or 1
+        self.cursor = cursor
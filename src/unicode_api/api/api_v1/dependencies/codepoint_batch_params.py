@@ -0,0 +1,86 @@
+from typing import Annotated
+
+from fastapi import Body, HTTPException, status
+
+import unicode_api.db.models as db
+from unicode_api.api.api_v1.dependencies.filter_param_matcher import CharacterPropGroupParameterMatcher
+from unicode_api.api.api_v1.dependencies.util import get_decimal_number_from_hex_codepoint
+from unicode_api.docs.dependencies.custom_parameters import (
+    BATCH_SHOW_PROPS_DESCRIPTION,
+    CODEPOINT_BATCH_DESCRIPTION,
+    MAX_BATCH_CODEPOINTS,
+    MAX_BATCH_COST,
+    MAX_BATCH_ITEMS,
+    VERBOSE_DESCRIPTION,
+)
+
+CODEPOINT_RANGE_SEPARATOR = ".."
+
+
+class CodepointBatchParameters:
+    def __init__(
+        self,
+        codepoints: Annotated[
+            list[str], Body(min_length=1, max_length=MAX_BATCH_ITEMS, description=CODEPOINT_BATCH_DESCRIPTION)
+        ],
+        show_props: Annotated[list[str] | None, Body(description=BATCH_SHOW_PROPS_DESCRIPTION)] = None,
+        verbose: Annotated[bool | None, Body(description=VERBOSE_DESCRIPTION)] = None,
+    ):
+        self.codepoints = get_unique_codepoints(parse_codepoint_ranges(codepoints))
+        self.show_props = parse_show_props(show_props) if show_props else []
+        self.verbose = verbose or False
+        check_batch_cost(self.codepoints, self.show_props)
+
+
+def parse_codepoint_ranges(values: list[str]) -> list[range]:
+    codepoint_ranges: list[range] = []
+    for value in values:
+        (start, separator, finish) = value.strip().partition(CODEPOINT_RANGE_SEPARATOR)
+        start_dec = get_decimal_number_from_hex_codepoint(start)
+        finish_dec = get_decimal_number_from_hex_codepoint(finish) if separator else start_dec
+        if finish_dec < start_dec:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"The range of codepoints {value!r} is invalid, the first codepoint must not exceed the last.",
+            )
+        codepoint_ranges.append(range(start_dec, finish_dec + 1))
+    # Ranges are measured before they are expanded, so a single request can never generate more work than this
+    total_codepoints = sum(len(codepoint_range) for codepoint_range in codepoint_ranges)
+    if total_codepoints > MAX_BATCH_CODEPOINTS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=(
+                f"The request contains {total_codepoints} codepoints, the maximum number of codepoints that can be "
+                f"requested at once is {MAX_BATCH_CODEPOINTS}."
+            ),
+        )
+    return codepoint_ranges
+
+
+def get_unique_codepoints(codepoint_ranges: list[range]) -> list[int]:
+    return list(dict.fromkeys(codepoint for codepoint_range in codepoint_ranges for codepoint in codepoint_range))
+
+
+def parse_show_props(show_props: list[str]) -> list[db.CharPropertyGroup]:
+    param_matcher = CharacterPropGroupParameterMatcher("show_props")
+    result = param_matcher.parse_filter_params(show_props)
+    if result.failure or not result.value:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=result.error)
+    return result.value
+
+
+def check_batch_cost(codepoints: list[int], show_props: list[db.CharPropertyGroup]) -> None:
+    # The Minimum property group is always included, "All" includes every property group
+    total_prop_groups = (
+        len(db.CharPropertyGroup.get_all_non_unihan_character_prop_groups())
+        if db.CharPropertyGroup.ALL in show_props
+        else len(show_props) + 1
+    )
+    if (cost := len(codepoints) * total_prop_groups) > MAX_BATCH_COST:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=(
+                f"The request is too large ({len(codepoints)} codepoints x {total_prop_groups} property groups = "
+                f"{cost}), the maximum allowed is {MAX_BATCH_COST}. Request fewer codepoints or property groups."
+            ),
+        )
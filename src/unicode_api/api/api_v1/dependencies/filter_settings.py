@@ -11,11 +11,13 @@ from unicode_api.api.api_v1.dependencies.filter_param_matcher import (
     CharacterPropGroupParameterMatcher,
     DatabaseFilterParameterMatcher,
 )
+from unicode_api.api.api_v1.dependencies.util import check_page_and_cursor_not_both_provided
 from unicode_api.core.cache import cached_data
 from unicode_api.core.util import s
 from unicode_api.docs.dependencies.custom_parameters import (
     CHAR_NAME_FILTER_DESCRIPTION,
     CJK_DEFINITION_FILTER_DESCRIPTION,
+    CURSOR_DESCRIPTION,
     PAGE_NUMBER_DESCRIPTION,
     PER_PAGE_DESCRIPTION,
     VERBOSE_DESCRIPTION,
@@ -220,6 +222,28 @@ class FilterParameters:
         all_errors += "\n\n".join(self.errors)
         return all_errors
 
+    @property
+    def cache_key(self) -> tuple[Any, ...]:
+        # Canonical form of every setting that affects which codepoints match the filter. Values are normalized
+        # the same way they are when the filter query is constructed, and the order of values in each list is
+        # ignored since they are only used in IN (...) / OR conditions.
+        return (
+            self.name.upper() if self.name else None,
+            self.cjk_definition.lower() if self.cjk_definition else None,
+            _sorted_tuple(self.blocks),
+            _sorted_tuple(self.categories),
+            _sorted_tuple(self.age_list),
+            _sorted_tuple(self.script_names),
+            _sorted_tuple(self.script_ids),
+            _sorted_tuple(self.bidi_class_list),
+            _sorted_tuple(self.decomp_types),
+            _sorted_tuple(self.line_break_types),
+            _sorted_tuple(self.ccc_list),
+            _sorted_tuple(self.num_types),
+            _sorted_tuple(self.join_types),
+            _sorted_tuple([flag.db_column_name for flag in self.flags] if self.flags else None),
+        )
+
     @property
     def parsed(self) -> db.UserFilterSettings:
         get_prop_value = cached_data.get_display_name_for_property_value
@@ -264,6 +288,10 @@ class FilterParameters:
             self.parsed_settings[setting] = default
 
 
+def _sorted_tuple(values: list[Any] | None) -> tuple[Any, ...]:
+    return tuple(sorted(set(values))) if values else ()
+
+
 class FilterSettings:
     def __init__(
         self,
@@ -284,7 +312,9 @@ class FilterSettings:
         verbose: Annotated[bool | None, Query(description=VERBOSE_DESCRIPTION)] = None,
         per_page: Annotated[int | None, Query(ge=1, le=100, description=PER_PAGE_DESCRIPTION)] = None,
         page: Annotated[int | None, Query(ge=1, description=PAGE_NUMBER_DESCRIPTION)] = None,
+        cursor: Annotated[str | None, Query(description=CURSOR_DESCRIPTION)] = None,
     ):
+        check_page_and_cursor_not_both_provided(page, cursor)
         form_inputs = db.UserFilterSettings(
             name=name,
             cjk_definition=cjk_definition,
@@ -305,6 +335,7 @@ class FilterSettings:
         self.verbose = verbose or False
         self.per_page = per_page or 10
         self.page = page or 1
+        self.cursor = cursor
 
     def __repr__(self) -> str:
         s = f"""
@@ -315,6 +346,7 @@ class FilterSettings:
             verbose={self.verbose},
             per_page={self.per_page},
             page={self.page},
+            cursor={self.cursor},
             error_message={self.error_message},
         )
         """
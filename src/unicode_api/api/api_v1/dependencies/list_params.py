@@ -5,6 +5,7 @@ from fastapi import HTTPException, Query, status
 from unicode_api.api.api_v1.dependencies.util import get_decimal_number_from_hex_codepoint
 from unicode_api.core.cache import cached_data
 from unicode_api.docs.dependencies.custom_parameters import (
+    DEFINED_ONLY_DESCRIPTION,
     ENDING_BEFORE_BLOCK_ID_DESCRIPTION,
     ENDING_BEFORE_CODEPOINT_DESCRIPTION,
     LIMIT_DESCRIPTION,
@@ -19,6 +20,7 @@ class ListParameters:
         limit: Annotated[int | None, Query(ge=1, le=100, description=LIMIT_DESCRIPTION)] = None,
         starting_after: Annotated[str | None, Query(description=STARTING_AFTER_CODEPOINT_DESCRIPTION)] = None,
         ending_before: Annotated[str | None, Query(description=ENDING_BEFORE_CODEPOINT_DESCRIPTION)] = None,
+        defined_only: Annotated[bool | None, Query(description=DEFINED_ONLY_DESCRIPTION)] = None,
     ):
         if ending_before and starting_after:
             raise HTTPException(
@@ -35,6 +37,7 @@ class ListParameters:
         self.starting_after: int | None = (
             get_decimal_number_from_hex_codepoint(starting_after) if starting_after else None
         )
+        self.defined_only: bool = defined_only or False
 
 
 class ListParametersDecimal:
@@ -14,6 +14,16 @@ from unicode_api.core.result import Result
 from unicode_api.core.util import s
 
 
+def check_page_and_cursor_not_both_provided(page: int | None, cursor: str | None) -> None:
+    if page and cursor:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=(
+                "Request contained values for BOTH 'page' and 'cursor', you must specify ONLY ONE of these two values."
+            ),
+        )
+
+
 def get_decimal_number_from_hex_codepoint(codepoint: str, starting_after: bool = True) -> int:
     result = get_codepoint_hex_from_string(codepoint)
     if result.failure:
@@ -9,7 +9,11 @@ from unicode_api.api.api_v1.dependencies import (
     UnicodeBlockPathParamResolver,
     UnicodePlaneResolver,
 )
-from unicode_api.api.api_v1.pagination import paginate_search_results
+from unicode_api.api.api_v1.pagination import (
+    encode_cursor,
+    paginate_search_results,
+    paginate_search_results_after_cursor,
+)
 from unicode_api.config.api_settings import get_settings
 from unicode_api.core.cache import cached_data
 
@@ -40,24 +44,35 @@ def search_unicode_blocks_by_name(
         "url": f"{get_settings().API_VERSION}/blocks/search",
         "query": search_params.name,
     }
-    results = cached_data.search_blocks_by_name(search_params.name, search_params.min_score)
-    if not results:
+    (block_ids, scores) = cached_data.rank_blocks_by_name(search_params.name, search_params.min_score)
+    if not block_ids:
         return params | {
             "current_page": 0,
             "total_results": 0,
             "has_more": False,
             "results": [],
         }
-    block_ids = [block_id for (block_id, _) in results]
-    paginate_result = paginate_search_results(block_ids, search_params.per_page, search_params.page)
+    paginate_result = (
+        paginate_search_results_after_cursor(
+            block_ids,
+            scores,
+            search_params.cursor,
+            search_params.per_page,
+            lambda block_id: cached_data.score_block_name(search_params.name, block_id),
+        )
+        if search_params.cursor
+        else paginate_search_results(block_ids, search_params.per_page, search_params.page)
+    )
     if paginate_result.failure:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=paginate_result.error)
     paginated = paginate_result.value if paginate_result.value else {}
     start = paginated.pop("start", 0)
     end = paginated.pop("end", 0)
+    if paginated["has_more"]:
+        paginated["next_cursor"] = encode_cursor(block_ids[end - 1])
     paginated["results"] = [
         cached_data.get_unicode_block_by_id(block_id).as_search_result(score)
-        for (block_id, score) in results[start:end]
+        for (block_id, score) in zip(block_ids[start:end], scores[start:end], strict=True)
     ]
     return params | paginated
 
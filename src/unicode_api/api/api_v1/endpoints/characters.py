@@ -1,6 +1,9 @@
+from bisect import bisect_left, bisect_right
+from collections.abc import Callable, Sequence
 from typing import Annotated, Any
 
 from fastapi import APIRouter, Depends, HTTPException, Path, Query, status
+from fastapi.responses import StreamingResponse
 
 import unicode_api.db.models as db
 from unicode_api.api.api_v1.dependencies import (
@@ -10,20 +13,33 @@ from unicode_api.api.api_v1.dependencies import (
     UnicodeBlockQueryParamResolver,
 )
 from unicode_api.api.api_v1.dependencies.filter_param_matcher import CharacterPropGroupParameterMatcher
-from unicode_api.api.api_v1.endpoints.util import get_character_details
-from unicode_api.api.api_v1.pagination import paginate_search_results
+from unicode_api.api.api_v1.endpoints.util import get_character_details_many, serialize_response
+from unicode_api.api.api_v1.pagination import (
+    encode_cursor,
+    paginate_codepoints_after_cursor,
+    paginate_search_results,
+    paginate_search_results_after_cursor,
+)
 from unicode_api.core.cache import cached_data
+from unicode_api.core.character_export import encode_characters
 from unicode_api.core.encoding import get_codepoint_string
-from unicode_api.core.util import convert_keys_to_camel_case
 from unicode_api.db.session import DBSession, get_session
 from unicode_api.docs.dependencies.custom_parameters import (
+    EXPORT_FORMAT_DESCRIPTION,
     UNICODE_CHAR_STRING_DESCRIPTION,
     VERBOSE_DESCRIPTION,
     get_description_and_values_table_for_property_group,
 )
+from unicode_api.enums.export_format import ExportFormat
+from unicode_api.models.response_serializer import ResponseSerializer
 
 router = APIRouter()
 
+CHARACTER_LIST_SERIALIZER = ResponseSerializer(db.PaginatedList[db.UnicodeCharacterResponse])
+CHARACTER_SEARCH_SERIALIZER = ResponseSerializer(db.PaginatedSearchResults[db.UnicodeCharacterResult])
+CHARACTER_FILTER_SERIALIZER = ResponseSerializer(db.PaginatedSearchResults[db.UnicodeCharacterResponse])
+CHARACTER_DETAILS_SERIALIZER = ResponseSerializer(db.UnicodeCharacterResponse)
+
 
 @router.get(
     "",
@@ -35,12 +51,17 @@ def list_all_unicode_characters(
     list_params: Annotated[ListParameters, Depends()],
     block: Annotated[UnicodeBlockQueryParamResolver, Depends()],
 ):
-    (start, stop) = get_char_list_endpoints(list_params, block)
-    return {
+    if list_params.defined_only:
+        (codepoints, has_more) = get_defined_char_list(list_params, block)
+    else:
+        (start, stop) = get_char_list_endpoints(list_params, block)
+        (codepoints, has_more) = (list(range(start, stop)), stop <= block.finish)
+    response_data = {
         "url": f"{db_ctx.api_settings.API_VERSION}/characters",
-        "has_more": stop <= block.finish,
-        "data": [responsify_character_details(db_ctx, codepoint, []) for codepoint in range(start, stop)],
+        "has_more": has_more,
+        "data": get_character_details_many(db_ctx, codepoints, []),
     }
+    return serialize_response(db_ctx, response_data, CHARACTER_LIST_SERIALIZER)
 
 
 @router.get(
@@ -52,17 +73,8 @@ def search_unicode_characters_by_name(
     db_ctx: Annotated[DBSession, Depends(get_session)],
     search_parameters: Annotated[CharacterSearchParameters, Depends()],
 ):
-    response_data = {"url": f"{db_ctx.api_settings.API_VERSION}/characters/search", "query": search_parameters.name}
-    search_results = cached_data.search_characters_by_name(search_parameters.name, search_parameters.min_score)
-    return get_paginated_character_list(
-        db_ctx,
-        search_results,
-        [db.CharPropertyGroup.MINIMUM],
-        search_parameters.per_page,
-        search_parameters.page,
-        response_data,
-        False,
-    )
+    search_results = get_character_search_results(db_ctx, search_parameters)
+    return serialize_response(db_ctx, search_results, CHARACTER_SEARCH_SERIALIZER)
 
 
 @router.get(
@@ -72,31 +84,29 @@ def search_unicode_characters_by_name(
 )
 def filter_unicode_characters(
     db_ctx: Annotated[DBSession, Depends(get_session)], filter_settings: Annotated[FilterSettings, Depends()]
+):
+    filter_results = get_character_filter_results(db_ctx, filter_settings)
+    return serialize_response(db_ctx, filter_results, CHARACTER_FILTER_SERIALIZER)
+
+
+@router.get("/export", response_class=StreamingResponse)
+def export_unicode_characters(
+    db_ctx: Annotated[DBSession, Depends(get_session)],
+    filter_settings: Annotated[FilterSettings, Depends()],
+    format: Annotated[ExportFormat | None, Query(description=EXPORT_FORMAT_DESCRIPTION)] = None,
 ):
     if not filter_settings.did_parse:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=filter_settings.error_message,
         )
-    if filter_settings.no_settings_provided:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="No filter settings were specified in the request.",
-        )
-    response_data = {
-        "url": f"{db_ctx.api_settings.API_VERSION}/characters/filter",
-        "filter_settings": filter_settings.parsed,
-    }
-    codepoints = db_ctx.filter_all_characters(filter_settings.params)
-    filter_results = [(cp, None) for cp in codepoints]
-    return get_paginated_character_list(
-        db_ctx,
-        filter_results,
-        filter_settings.show_props,
-        filter_settings.per_page,
-        filter_settings.page,
-        response_data,
-        filter_settings.verbose,
+    export_format = format or ExportFormat.NDJSON
+    filter_params = None if filter_settings.no_settings_provided else filter_settings.params
+    batches = db_ctx.stream_character_properties(filter_settings.show_props, filter_settings.verbose, filter_params)
+    return StreamingResponse(
+        encode_characters(batches, export_format, filter_settings.show_props),
+        media_type=export_format.media_type,
+        headers={"Content-Disposition": f'attachment; filename="unicode_characters.{export_format}"'},
     )
 
 
@@ -111,6 +121,12 @@ def get_unicode_character_details(
     show_props: Annotated[list[str], Query(description=get_description_and_values_table_for_property_group())] = None,  # type: ignore[reportArgumentType]
     verbose: Annotated[bool | None, Query(description=VERBOSE_DESCRIPTION)] = None,
 ):
+    max_length = db_ctx.api_settings.MAX_CHAR_STRING_LENGTH
+    if len(string) > max_length:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"The string provided contains {len(string)} characters, the maximum allowed is {max_length}.",
+        )
     if show_props:
         param_matcher = CharacterPropGroupParameterMatcher("show_props")
         result = param_matcher.parse_filter_params(show_props)
@@ -121,7 +137,58 @@ def get_unicode_character_details(
         prop_groups = []
     if verbose is None:
         verbose = False
-    return [get_character_details(db_ctx, ord(char), prop_groups, verbose=verbose) for char in string]
+    # Each distinct character is fetched once, repeated characters share the same details in the response
+    codepoints = [ord(char) for char in string]
+    unique_codepoints = list(dict.fromkeys(codepoints))
+    unique_details = get_character_details_many(db_ctx, unique_codepoints, prop_groups, verbose=verbose)
+    details_map = dict(zip(unique_codepoints, unique_details, strict=True))
+    character_details = [details_map[codepoint] for codepoint in codepoints]
+    return serialize_response(db_ctx, character_details, CHARACTER_DETAILS_SERIALIZER)
+
+
+def get_character_search_results(db_ctx: DBSession, search_parameters: CharacterSearchParameters) -> dict[str, Any]:
+    response_data = {"url": f"{db_ctx.api_settings.API_VERSION}/characters/search", "query": search_parameters.name}
+    (codepoints, scores) = cached_data.rank_characters_by_name(search_parameters.name, search_parameters.min_score)
+    return get_paginated_character_list(
+        db_ctx,
+        codepoints,
+        [db.CharPropertyGroup.MINIMUM],
+        search_parameters.per_page,
+        search_parameters.page,
+        response_data,
+        False,
+        scores,
+        search_parameters.cursor,
+        lambda codepoint: cached_data.score_character_name(search_parameters.name, codepoint),
+    )
+
+
+def get_character_filter_results(db_ctx: DBSession, filter_settings: FilterSettings) -> dict[str, Any]:
+    if not filter_settings.did_parse:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=filter_settings.error_message,
+        )
+    if filter_settings.no_settings_provided:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="No filter settings were specified in the request.",
+        )
+    response_data = {
+        "url": f"{db_ctx.api_settings.API_VERSION}/characters/filter",
+        "filter_settings": filter_settings.parsed,
+    }
+    codepoints = db_ctx.filter_all_characters(filter_settings.params)
+    return get_paginated_character_list(
+        db_ctx,
+        codepoints,
+        filter_settings.show_props,
+        filter_settings.per_page,
+        filter_settings.page,
+        response_data,
+        filter_settings.verbose,
+        cursor=filter_settings.cursor,
+    )
 
 
 def get_char_list_endpoints(list_params: ListParameters, block: UnicodeBlockQueryParamResolver) -> tuple[int, int]:
@@ -132,36 +199,56 @@ def get_char_list_endpoints(list_params: ListParameters, block: UnicodeBlockQuer
         start = list_params.ending_before - list_params.limit
     stop = min(block.finish + 1, start + list_params.limit)
     if start < block.start or start > stop:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=(
-                f"The starting codepoint value {get_codepoint_string(start)} is outside the range of characters "
-                f"{get_codepoint_string(block.start)}...{get_codepoint_string(block.finish)} ({block.name})"
-            ),
-        )
+        raise get_invalid_start_error(start, block)
     return (start, stop)
 
 
+def get_defined_char_list(list_params: ListParameters, block: UnicodeBlockQueryParamResolver) -> tuple[list[int], bool]:
+    # Reserved and unassigned codepoints are skipped by paging through the sorted array of defined codepoints
+    defined = cached_data.all_defined_codepoints
+    (first, last) = (bisect_left(defined, block.start), bisect_right(defined, block.finish))
+    if list_params.ending_before is not None:
+        if not block.start <= list_params.ending_before <= block.finish + 1:
+            raise get_invalid_start_error(list_params.ending_before, block)
+        stop = bisect_left(defined, list_params.ending_before, first, last)
+        start = max(first, stop - list_params.limit)
+    else:
+        start = first
+        if list_params.starting_after is not None:
+            if not block.start <= list_params.starting_after + 1 <= block.finish + 1:
+                raise get_invalid_start_error(list_params.starting_after + 1, block)
+            start = bisect_right(defined, list_params.starting_after, first, last)
+        stop = min(last, start + list_params.limit)
+    return (defined[start:stop].tolist(), stop < last)
+
+
+def get_invalid_start_error(start: int, block: UnicodeBlockQueryParamResolver) -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_400_BAD_REQUEST,
+        detail=(
+            f"The starting codepoint value {get_codepoint_string(start)} is outside the range of characters "
+            f"{get_codepoint_string(block.start)}...{get_codepoint_string(block.finish)} ({block.name})"
+        ),
+    )
+
+
 def get_paginated_character_list(
     db_ctx: DBSession,
-    results: list[tuple[int, Any]],
+    codepoints: Sequence[int],
     show_props: list[db.CharPropertyGroup],
     per_page: int,
     page: int,
     response_data: dict[str, Any],
     verbose: bool,
+    scores: Sequence[float] | None = None,
+    cursor: str | None = None,
+    get_score: Callable[[int], float | None] | None = None,
 ):
-    codepoints = [cp for (cp, _) in results]
     if codepoints:
-        result = paginate_search_results(codepoints, per_page, page)
-        if result.failure:
-            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=result.error)
-        paginated = result.value or {}
-        start = paginated.pop("start", 0)
-        end = paginated.pop("end", 0)
-        paginated["results"] = [
-            responsify_character_details(db_ctx, cp, show_props, score, verbose) for (cp, score) in results[start:end]
-        ]
+        (paginated, page_codepoints, page_scores) = get_character_page(
+            codepoints, per_page, page, cursor, scores, get_score
+        )
+        paginated["results"] = get_character_details_many(db_ctx, page_codepoints, show_props, page_scores, verbose)
         return response_data | paginated
     return response_data | {
         "current_page": 0,
@@ -171,11 +258,32 @@ def get_paginated_character_list(
     }
 
 
-def responsify_character_details(
-    db_ctx: DBSession,
-    codepoint: int,
-    show_props: list[db.CharPropertyGroup],
-    score: float | None = None,
-    verbose: bool = False,
-) -> dict[str, Any]:
-    return convert_keys_to_camel_case(get_character_details(db_ctx, codepoint, show_props, score, verbose=verbose))
+def get_character_page(
+    codepoints: Sequence[int],
+    per_page: int,
+    page: int,
+    cursor: str | None,
+    scores: Sequence[float] | None,
+    get_score: Callable[[int], float | None] | None,
+) -> tuple[dict[str, Any], list[int], list[float | None] | None]:
+    if cursor and (scores is None or get_score is None):
+        # Filter results are sorted by codepoint, the page after the cursor is requested from the filter engine
+        filter_result = paginate_codepoints_after_cursor(codepoints, cursor, per_page)
+        if filter_result.failure or not filter_result.value:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=filter_result.error)
+        (paginated, page_codepoints) = filter_result.value
+        return (paginated, page_codepoints, None)
+    result = (
+        paginate_search_results_after_cursor(codepoints, scores, cursor, per_page, get_score)
+        if cursor and scores is not None and get_score
+        else paginate_search_results(codepoints, per_page, page)
+    )
+    if result.failure:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=result.error)
+    paginated = result.value or {}
+    start = paginated.pop("start", 0)
+    end = paginated.pop("end", 0)
+    page_codepoints = list(codepoints[start:end])
+    if paginated["has_more"]:
+        paginated["next_cursor"] = encode_cursor(page_codepoints[-1])
+    return (paginated, page_codepoints, list(scores[start:end]) if scores else None)
@@ -1,20 +1,39 @@
-from typing import Annotated
+from typing import Annotated, Any
 
 from fastapi import APIRouter, Depends, HTTPException, Path, Query, status
 
 import unicode_api.db.models as db
+from unicode_api.api.api_v1.dependencies import CodepointBatchParameters
 from unicode_api.api.api_v1.dependencies.filter_param_matcher import CharacterPropGroupParameterMatcher
 from unicode_api.api.api_v1.dependencies.util import get_decimal_number_from_hex_codepoint
-from unicode_api.api.api_v1.endpoints.util import get_character_details
+from unicode_api.api.api_v1.endpoints.util import get_character_details, get_character_details_many, serialize_response
 from unicode_api.db.session import DBSession, get_session
 from unicode_api.docs.dependencies.custom_parameters import (
     CODEPOINT_PATH_PARAM_DESSCRIPTION,
     VERBOSE_DESCRIPTION,
     get_description_and_values_table_for_property_group,
 )
+from unicode_api.models.response_serializer import ResponseSerializer
 
 router = APIRouter()
 
+CHARACTER_DETAILS_SERIALIZER = ResponseSerializer(db.UnicodeCharacterResponse)
+
+
+@router.post(
+    "/batch",
+    response_model=list[db.UnicodeCharacterResponse],
+    response_model_exclude_unset=True,
+)
+def get_unicode_characters_at_codepoints(
+    db_ctx: Annotated[DBSession, Depends(get_session)],
+    batch_params: Annotated[CodepointBatchParameters, Depends()],
+):
+    character_details = get_character_details_many(
+        db_ctx, batch_params.codepoints, batch_params.show_props, verbose=batch_params.verbose
+    )
+    return serialize_response(db_ctx, character_details, CHARACTER_DETAILS_SERIALIZER)
+
 
 @router.get(
     "/{codepoint}",
@@ -27,6 +46,13 @@ def get_unicode_character_at_codepoint(
     show_props: Annotated[list[str], Query(description=get_description_and_values_table_for_property_group())] = None,  # type: ignore[reportArgumentType]
     verbose: Annotated[bool | None, Query(description=VERBOSE_DESCRIPTION)] = None,
 ):
+    character_details = get_character_details_at_codepoint(db_ctx, codepoint, show_props, verbose)
+    return serialize_response(db_ctx, character_details, CHARACTER_DETAILS_SERIALIZER)
+
+
+def get_character_details_at_codepoint(
+    db_ctx: DBSession, codepoint: str, show_props: list[str] | None, verbose: bool | None
+) -> dict[str, Any]:
     codepoint_dec = get_decimal_number_from_hex_codepoint(codepoint)
     if show_props:
         param_matcher = CharacterPropGroupParameterMatcher("show_props")
@@ -1,7 +1,10 @@
 from typing import Any
 
+from fastapi.responses import ORJSONResponse
+
 import unicode_api.db.models as db
 from unicode_api.db.session import DBSession
+from unicode_api.models.response_serializer import ResponseSerializer
 
 
 def get_character_details(
@@ -15,3 +18,40 @@ def get_character_details(
     if score:
         response_dict["score"] = float(f"{score:.1f}")
     return response_dict
+
+
+def get_character_details_many(
+    db_ctx: DBSession,
+    codepoints: list[int],
+    show_props: list[db.CharPropertyGroup],
+    scores: list[float | None] | None = None,
+    verbose: bool = False,
+) -> list[dict[str, Any]]:
+    all_details = db_ctx.get_character_properties_many(codepoints, show_props, verbose)
+    for response_dict, score in zip(all_details, scores or [], strict=False):
+        if score:
+            response_dict["score"] = float(f"{score:.1f}")
+    return all_details
+
+
+def serialize_response(db_ctx: DBSession, content: Any, serializer: ResponseSerializer) -> Any:
+    """
+    Prepares the response for an endpoint that returns character details.
+
+    If the `VALIDATE_RESPONSES` setting is enabled (e.g., when running tests), the content is returned unchanged
+    and FastAPI validates it against the endpoint's `response_model`. Otherwise, the content is serialized with
+    the precompiled serializer for the response model and returned as an `ORJSONResponse`, which skips validation.
+
+    Args:
+        db_ctx (DBSession): The database session (used to access the API settings).
+        content (Any): The response data (a dict, or a list of dicts).
+        serializer (ResponseSerializer): Serializer for the endpoint's response model (or the item model, if the
+            response is a list).
+
+    Returns:
+        Any: The content, or an ORJSONResponse containing the serialized content.
+    """
+    if db_ctx.api_settings.VALIDATE_RESPONSES:
+        return content
+    serialized = serializer.serialize_many(content) if isinstance(content, list) else serializer.serialize(content)
+    return ORJSONResponse(serialized)
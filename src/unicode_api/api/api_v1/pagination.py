@@ -1,10 +1,17 @@
+import base64
+import binascii
+from bisect import bisect_left, bisect_right
+from collections.abc import Callable, Sequence
 from typing import Any
 
 from unicode_api.core.result import Result
+from unicode_api.db.procs.filter_characters import FilterQueryPlan
+
+CURSOR_PREFIX = "after:"
 
 
 def paginate_search_results(
-    codepoints: list[int],
+    codepoints: Sequence[int],
     per_page: int,
     page_number: int,
 ) -> Result[dict[str, Any]]:
@@ -29,3 +36,94 @@ def paginate_search_results(
     if has_more:
         paginated["next_page"] = page_number + 1
     return Result[dict[str, Any]].Ok(paginated)
+
+
+def paginate_search_results_after_cursor(
+    keys: Sequence[int],
+    scores: Sequence[float],
+    cursor: str,
+    per_page: int,
+    get_score: Callable[[int], float | None],
+) -> Result[dict[str, Any]]:
+    """
+    Finds the page of search results that follows the result identified by a cursor.
+
+    Search results are ranked by score (highest first), and results with equal scores are ranked by key. The
+    score of the result in the cursor is recomputed with `get_score`, and its position is found with a binary
+    search on (score, key), so the cost of retrieving a page does not depend on how deep the page is.
+
+    Args:
+        keys (Sequence[int]): The key (codepoint or block ID) of every search result, in the order they are ranked.
+        scores (Sequence[float]): The score of every search result, in the same order as `keys`.
+        cursor (str): The `next_cursor` value from the response containing the previous page.
+        per_page (int): The number of results in each page.
+        get_score (Callable[[int], float | None]): Returns the score of the search result with the given key.
+
+    Returns:
+        Result[dict[str, Any]]: The pagination details (including the `start` and `end` positions of the page),
+        or an error if the cursor is invalid or does not identify one of the search results.
+    """
+    result = decode_cursor(cursor)
+    if result.failure or result.value is None:
+        return Result[dict[str, Any]].Fail(result.error)
+    key = result.value
+    score = get_score(key)
+    position = (
+        bisect_left(range(len(keys)), (-score, key), key=lambda index: (-scores[index], keys[index]))
+        if score is not None
+        else len(keys)
+    )
+    if position == len(keys) or keys[position] != key:
+        return Result[dict[str, Any]].Fail(f"The cursor '{cursor}' does not match any of the search results.")
+    page_start = position + 1
+    page_end = min(len(keys), page_start + per_page)
+    paginated = {"total_results": len(keys), "has_more": page_end < len(keys), "start": page_start, "end": page_end}
+    return Result[dict[str, Any]].Ok(paginated)
+
+
+def paginate_codepoints_after_cursor(
+    codepoints: Sequence[int], cursor: str, per_page: int
+) -> Result[tuple[dict[str, Any], list[int]]]:
+    """
+    Retrieves the page of (sorted) codepoints that follows the codepoint identified by a cursor.
+
+    Only the codepoints on the requested page are retrieved: a FilterQueryPlan resumes the query from the
+    codepoint in the cursor (`WHERE codepoint_dec > ... LIMIT ...`), other sequences are searched with `bisect`.
+
+    Args:
+        codepoints (Sequence[int]): The codepoints of all matching characters, sorted in ascending order.
+        cursor (str): The `next_cursor` value from the response containing the previous page.
+        per_page (int): The number of results in each page.
+
+    Returns:
+        Result[tuple[dict[str, Any], list[int]]]: The pagination details and the codepoints on the page, or an
+        error if the cursor is invalid.
+    """
+    result = decode_cursor(cursor)
+    if result.failure or result.value is None:
+        return Result[tuple[dict[str, Any], list[int]]].Fail(result.error)
+    if isinstance(codepoints, FilterQueryPlan):
+        page = codepoints.get_codepoints_after(result.value, per_page + 1)
+    else:
+        page_start = bisect_right(codepoints, result.value)
+        page = list(codepoints[page_start : page_start + per_page + 1])
+    paginated: dict[str, Any] = {"total_results": len(codepoints), "has_more": len(page) > per_page}
+    page = page[:per_page]
+    if paginated["has_more"]:
+        paginated["next_cursor"] = encode_cursor(page[-1])
+    return Result[tuple[dict[str, Any], list[int]]].Ok((paginated, page))
+
+
+def encode_cursor(key: int) -> str:
+    return base64.urlsafe_b64encode(f"{CURSOR_PREFIX}{key}".encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Result[int]:
+    try:
+        decoded = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode()
+    except (binascii.Error, UnicodeDecodeError):
+        decoded = ""
+    key = decoded.removeprefix(CURSOR_PREFIX)
+    if not decoded.startswith(CURSOR_PREFIX) or not (key.isascii() and key.isdigit()):
+        return Result[int].Fail(f"The value provided for 'cursor' ({cursor}) is invalid.")
+    return Result[int].Ok(int(key))
@@ -5,10 +5,12 @@ import click
 from trogon import tui  # pyright: ignore[reportMissingTypeStubs]
 
 from unicode_api.core.result import Result
+from unicode_api.data.scripts import export_characters as _export_characters
 from unicode_api.data.scripts import sync_requirements_files as _sync_requirements_files
 from unicode_api.data.scripts import update_all_data as _update_all_data
 from unicode_api.data.scripts import update_test_data as _update_test_data
 from unicode_api.docs.api_docs.readme import update_readme as _update_readme
+from unicode_api.enums.export_format import ExportFormat
 
 
 @tui()
@@ -18,8 +20,25 @@ def cli():
 
 
 @cli.command()
-def update_all_data():
-    result = _update_all_data()
+@click.option(
+    "--stream",
+    is_flag=True,
+    help="Parse the XML database incrementally and insert characters while parsing (uses far less memory).",
+)
+@click.option(
+    "--workers",
+    "-w",
+    type=click.IntRange(min=1),
+    default=1,
+    show_default=True,
+    help="Number of processes used to parse character data.",
+)
+@click.option("--orm-insert", is_flag=True, help="Insert rows through the ORM instead of the (faster) bulk loader.")
+@click.option(
+    "--no-cache", is_flag=True, help="Parse the XML database even if it has not changed since the last update."
+)
+def update_all_data(stream: bool, workers: int, orm_insert: bool, no_cache: bool):
+    result = _update_all_data(stream, workers, bulk_insert=not orm_insert, use_cache=not no_cache)
     exit_app(result, f"Updated database with data for Unicode version {os.environ.get('UNICODE_VERSION')}")
 
 
@@ -42,6 +61,38 @@ def update_test_data() -> None:
     exit_app(result, "Updated all data files containing expected results for API testing.")
 
 
+@cli.command()
+@click.option(
+    "--format",
+    "export_format",
+    type=click.Choice([export_format.value for export_format in ExportFormat]),
+    default=ExportFormat.NDJSON.value,
+    show_default=True,
+    help="Output format.",
+)
+@click.option(
+    "--output",
+    "-o",
+    type=click.Path(dir_okay=False, path_type=Path),
+    default=None,
+    help="File to write the exported characters to (default: stdout).",
+)
+@click.option("--show-props", "-p", multiple=True, help="Property group to include (can be repeated).")
+@click.option(
+    "--filter",
+    "-f",
+    "filters",
+    multiple=True,
+    help="Filter setting formatted as 'name=value', e.g. 'category=lu' (can be repeated).",
+)
+@click.option("--verbose", is_flag=True, help="Include property values that are irrelevant for a character.")
+def export_characters(
+    export_format: str, output: Path | None, show_props: tuple[str, ...], filters: tuple[str, ...], verbose: bool
+) -> None:
+    result = _export_characters(output, ExportFormat(export_format), list(show_props), list(filters), verbose)
+    exit_app(result, f"Exported characters to {output}" if output else None)
+
+
 def exit_app(result: Result[None], message: str | None = None):
     return exit_app_success(message) if result.success else exit_app_error(result.error)
 
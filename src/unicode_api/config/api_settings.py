@@ -16,6 +16,7 @@ from unicode_api.constants import (
     UNICODE_PLANES_DEFAULT,
 )
 from unicode_api.core.util import s
+from unicode_api.enums.filter_engine import FilterEngine
 
 if TYPE_CHECKING:  # pragma: no cover
     from unicode_api.custom_types import UnicodePropertyGroupMap
@@ -62,6 +63,9 @@ class UnicodeApiSettings:
     - Path management for Unicode data files
     - Database and Redis connection settings
     - Rate limiting configuration
+    - Search/filter result cache and response cache configuration
+    - Filter engine (SQL, in-memory columnar or bitmap index) configuration
+    - Request size limits
     """
 
     ENV: str
@@ -75,6 +79,14 @@ class UnicodeApiSettings:
     RATE_LIMIT_PER_PERIOD: int
     RATE_LIMIT_PERIOD_SECONDS: timedelta
     RATE_LIMIT_BURST: int
+    RESULT_CACHE_MAX_ENTRIES: int
+    RESULT_CACHE_TTL_SECONDS: timedelta
+    RESPONSE_CACHE_ENABLED: bool
+    RESPONSE_CACHE_TTL_SECONDS: timedelta
+    RESPONSE_CACHE_MAX_LOCAL_ENTRIES: int
+    VALIDATE_RESPONSES: bool
+    FILTER_ENGINE: FilterEngine
+    MAX_CHAR_STRING_LENGTH: int
     UMAMI_WEBSITE_ID: str
     UMAMI_API_URL: str
     DOCKER_IP_OCTET_1: int
@@ -94,8 +106,10 @@ class UnicodeApiSettings:
     xml_file: Path = field(init=False)
     xml_zip_file: Path = field(init=False)
     xml_db_url: str = field(init=False, default="")
+    parsed_data_cache: Path = field(init=False)
     db_folder: Path = field(init=False)
     db_file: Path = field(init=False)
+    filter_bitmaps_file: Path = field(init=False)
     db_zip_file: Path = field(init=False)
     db_zip_url: str = field(init=False, default="")
     db_url: str = field(init=False, default="")
@@ -108,6 +122,8 @@ class UnicodeApiSettings:
     char_name_map: Path = field(init=False)
     unihan_chars_json: Path = field(init=False)
     tangut_chars_json: Path = field(init=False)
+    char_type_table: Path = field(init=False)
+    unicode_data_file: Path = field(init=False)
     json_zip_file: Path = field(init=False)
     json_zip_url: str = field(init=False, default="")
 
@@ -135,8 +151,10 @@ class UnicodeApiSettings:
         self.xml_file = xml_folder.joinpath(XML_FILE_NAME)
         self.xml_zip_file = xml_folder.joinpath(XML_ZIP_FILE_NAME)
         self.xml_db_url = f"{UNICODE_ORG_ROOT}/{self.UNICODE_VERSION}/{UNICODE_XML_FOLDER}/{self.xml_zip_file.name}"
+        self.parsed_data_cache = xml_folder.joinpath("parsed_data.bin")
         self.db_folder = db_folder
         self.db_file = db_folder.joinpath(DB_FILE_NAME)
+        self.filter_bitmaps_file = db_folder.joinpath("filter_bitmaps.bin")
         self.db_zip_file = db_folder.joinpath(DB_ZIP_FILE_NAME)
         self.db_zip_url = f"{HTTP_BUCKET_URL}/{self.UNICODE_VERSION}/{DB_ZIP_FILE_NAME}"
         self.db_url = f"sqlite:///{db_folder.joinpath(DB_FILE_NAME).absolute()}"
@@ -149,6 +167,8 @@ class UnicodeApiSettings:
         self.char_name_map = json_folder.joinpath("char_name_map.json")
         self.unihan_chars_json = json_folder.joinpath("unihan_chars.json")
         self.tangut_chars_json = json_folder.joinpath("tangut_chars.json")
+        self.char_type_table = json_folder.joinpath("char_types.bin")
+        self.unicode_data_file = json_folder.joinpath("unicode_data.bin")
         self.json_zip_file = json_folder.joinpath(JSON_ZIP_FILE_NAME)
         self.json_zip_url = f"{HTTP_BUCKET_URL}/{self.UNICODE_VERSION}/{JSON_ZIP_FILE_NAME}"
 
@@ -247,6 +267,9 @@ class UnicodeApiSettings:
         if self.tangut_chars_json.exists():
             self.tangut_chars_json.unlink()
 
+        if self.unicode_data_file.exists():
+            self.unicode_data_file.unlink()
+
 
 def load_api_settings() -> UnicodeApiSettings:  # pragma: no cover
     result = load_dotenv_file()
@@ -264,6 +287,14 @@ def load_api_settings() -> UnicodeApiSettings:  # pragma: no cover
         RATE_LIMIT_PER_PERIOD=int(os.getenv("RATE_LIMIT_PER_PERIOD", "1")),
         RATE_LIMIT_PERIOD_SECONDS=timedelta(seconds=int(os.getenv("RATE_LIMIT_PERIOD_SECONDS", "100"))),
         RATE_LIMIT_BURST=int(os.getenv("RATE_LIMIT_BURST", "10")),
+        RESULT_CACHE_MAX_ENTRIES=int(os.getenv("RESULT_CACHE_MAX_ENTRIES", "256")),
+        RESULT_CACHE_TTL_SECONDS=timedelta(seconds=int(os.getenv("RESULT_CACHE_TTL_SECONDS", "3600"))),
+        RESPONSE_CACHE_ENABLED=os.getenv("RESPONSE_CACHE_ENABLED", "false").lower() == "true",
+        RESPONSE_CACHE_TTL_SECONDS=timedelta(seconds=int(os.getenv("RESPONSE_CACHE_TTL_SECONDS", "86400"))),
+        RESPONSE_CACHE_MAX_LOCAL_ENTRIES=int(os.getenv("RESPONSE_CACHE_MAX_LOCAL_ENTRIES", "1024")),
+        VALIDATE_RESPONSES=os.getenv("VALIDATE_RESPONSES", "false").lower() == "true",
+        FILTER_ENGINE=FilterEngine(os.getenv("FILTER_ENGINE", "sql").lower()),
+        MAX_CHAR_STRING_LENGTH=int(os.getenv("MAX_CHAR_STRING_LENGTH", "1000")),
         UMAMI_WEBSITE_ID=os.getenv("UMAMI_WEBSITE_ID", ""),
         UMAMI_API_URL=os.getenv("UMAMI_API_URL", ""),
         DOCKER_IP_OCTET_1=int(os.getenv("DOCKER_IP_OCTET_1", "0")),
@@ -285,6 +316,14 @@ def create_test_settings() -> UnicodeApiSettings:
         RATE_LIMIT_PER_PERIOD=2,
         RATE_LIMIT_PERIOD_SECONDS=timedelta(seconds=1),
         RATE_LIMIT_BURST=1,
+        RESULT_CACHE_MAX_ENTRIES=256,
+        RESULT_CACHE_TTL_SECONDS=timedelta(seconds=3600),
+        RESPONSE_CACHE_ENABLED=False,
+        RESPONSE_CACHE_TTL_SECONDS=timedelta(seconds=86400),
+        RESPONSE_CACHE_MAX_LOCAL_ENTRIES=1024,
+        VALIDATE_RESPONSES=True,
+        FILTER_ENGINE=FilterEngine.SQL,
+        MAX_CHAR_STRING_LENGTH=1000,
         UMAMI_WEBSITE_ID="",
         UMAMI_API_URL="",
         DOCKER_IP_OCTET_1=0,
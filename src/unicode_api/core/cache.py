@@ -1,33 +1,37 @@
 import itertools
-import json
 import re
-from collections.abc import Callable
+from bisect import bisect_right
+from collections.abc import Callable, Mapping
+from collections.abc import Set as AbstractSet
 from functools import cache, cached_property
-from typing import TYPE_CHECKING, Any, TypedDict
+from typing import TYPE_CHECKING, TypedDict
 
-from pydantic import ValidationError
-from rapidfuzz import process
-
-from unicode_api.config.api_settings import get_settings
+from unicode_api.config.api_settings import UnicodeApiSettings, get_settings
 from unicode_api.constants import (
-    ALL_CONTROL_CHARACTERS,
     ALL_UNICODE_CODEPOINTS,
     ASCII_HEX,
     C0_CONTROL_CHARACTERS,
     DEFAULT_BC_AL_CODEPOINTS,
     DEFAULT_BC_ET_CODEPOINTS,
     DEFAULT_BC_R_CODEPOINTS,
-    DEFAULT_VO_U_BLOCK_NAMES,
     DEFAULT_VO_U_PLANE_NUMBERS,
     MAX_CODEPOINT,
-    NON_CHARACTER_CODEPOINTS,
     PROP_GROUP_INVALID_FOR_VERSION_ROW_ID,
-    UNICODE_PLANES_DEFAULT,
 )
+from unicode_api.core.cache_snapshot import NULL_BLOCK, NULL_PLANE, UnicodeDataSnapshot, build_unicode_data_snapshot
+from unicode_api.core.character_type_table import CharacterTypeTable, get_character_type_from_table
+from unicode_api.core.name_search_index import NameSearchIndex
 from unicode_api.core.result import Result
+from unicode_api.core.result_cache import (
+    CompactSearchResults,
+    block_search_cache,
+    character_search_cache,
+    clear_all_result_caches,
+    pack_search_results,
+    unpack_search_results,
+)
 from unicode_api.enums.character_type import CharacterType
 from unicode_api.models.block import UnicodeBlock
-from unicode_api.models.character import UnicodeCharacter
 from unicode_api.models.plane import UnicodePlane
 from unicode_api.models.util import normalize_string_lm3
 
@@ -41,33 +45,16 @@ class ApiRouteDetails(TypedDict):
     path_regex: re.Pattern[str]
 
 
-NULL_BLOCK = UnicodeBlock(
-    id=0,
-    long_name="None",
-    short_name="None",
-    plane_id=-1,
-    start="",
-    start_dec=0,
-    finish="",
-    finish_dec=0,
-    total_allocated=0,
-    total_defined=0,
-)
-
-NULL_PLANE = UnicodePlane(
-    id=-1,
-    number=-1,
-    name="None",
-    abbreviation="None",
-    start="",
-    start_dec=0,
-    finish="",
-    finish_dec=0,
-    start_block_id=0,
-    finish_block_id=0,
-    total_allocated=0,
-    total_defined=0,
-)
+CONSTANT_DEFAULT_PROPERTY_VALUE_MAP = {
+    "Bidi_Paired_Bracket_Type": "None",
+    "Canonical_Combining_Class": "Not_Reordered",
+    "Decomposition_Type": "None",
+    "Hangul_Syllable_Type": "Not_Applicable",
+    "Joining_Type": "Non_Joining",
+    "Line_Break": "Unknown",
+    "Numeric_Type": "None",
+    "Script": "Unknown",
+}
 
 
 class UnicodeDataCache:
@@ -75,9 +62,10 @@ class UnicodeDataCache:
     UnicodeDataCache provides a cached interface to Unicode data and metadata.
 
     This class centralizes access to Unicode-related data, supporting efficient lookups,
-    fuzzy searches, and property value resolution for codepoints. It leverages cached
-    properties and methods to minimize redundant computation and file I/O, and exposes
-    utility methods for querying Unicode blocks, planes, character types, and property values.
+    fuzzy searches, and property value resolution for codepoints. All data loaded from the Unicode
+    data files, and every lookup table derived from that data, is built exactly once and stored in an
+    immutable UnicodeDataSnapshot. Calling reload() builds a new snapshot and swaps it in with a single
+    assignment, so lookups never observe a partially rebuilt cache.
 
     Attributes:
         settings: Settings
@@ -85,69 +73,80 @@ class UnicodeDataCache:
         api_routes: list[ApiRouteDetails]
             List of API route details for path matching.
 
-    Cached Properties:
+    Properties (served from the current snapshot):
+        snapshot: UnicodeDataSnapshot
+            The current snapshot, built on first access.
         property_value_id_map: UnicodePropertyGroupMap
             Mapping of property group names to their value ID maps.
         missing_property_groups: list[str]
             List of property groups missing in the current Unicode version.
         character_flag_names: list[str]
             List of boolean character property names present in the UnicodeCharacter model.
-        non_unihan_character_name_map: dict[int, str]
-            Mapping of codepoints to names for non-Unihan characters.
+        non_unihan_character_name_map: Mapping[int, str]
+            Mapping of codepoints to names for non-Unihan characters (backed by the packed Unicode data).
+        character_name_search_index: NameSearchIndex
+            Fuzzy-search index of the (lowercased) names of all non-Unihan characters.
         blocks: list[UnicodeBlock]
             List of UnicodeBlock objects loaded from JSON.
-        planes: list[UnicodePlane]
-            List of UnicodePlane objects loaded from JSON or defaults.
-        all_non_unihan_codepoints: set[int]
-            Set of codepoints for non-Unihan characters.
-        all_cjk_codepoints: set[int]
-            Set of codepoints for CJK Unihan characters.
-        all_tangut_ideograph_codepoints: set[int]
-            Set of codepoints for Tangut ideographs.
-        all_tangut_component_codepoints: set[int]
-            Set of codepoints for Tangut components.
-
-    Properties:
-        non_unihan_character_name_choices: dict[int, str]
-            Lowercased mapping of codepoints to names for non-Unihan characters.
+        block_interval_index: tuple[tuple[int, ...], tuple[UnicodeBlock, ...]]
+            Block start offsets (sorted) and the corresponding blocks, used to find the block
+            containing a codepoint with a binary search.
         block_id_map: dict[int, UnicodeBlock]
             Mapping of block IDs to UnicodeBlock objects.
-        block_name_choices: dict[int, str]
-            Mapping of block IDs to lowercased block long names.
+        block_name_search_index: NameSearchIndex
+            Fuzzy-search index of the (lowercased) long names of all blocks.
         all_characters_block: UnicodeBlock
             UnicodeBlock representing all Unicode characters.
-        cjk_unified_ideograph_block_ids: set[int]
+        cjk_unified_ideograph_block_ids: frozenset[int]
             Set of block IDs for CJK Unified Ideographs.
-        cjk_compatibility_block_ids: set[int]
+        cjk_compatibility_block_ids: frozenset[int]
             Set of block IDs for CJK Compatibility Ideographs.
-        tangut_ideograph_block_ids: set[int]
+        tangut_ideograph_block_ids: frozenset[int]
             Set of block IDs for Tangut ideographs.
-        tangut_component_block_ids: set[int]
+        tangut_component_block_ids: frozenset[int]
             Set of block IDs for Tangut components.
-        surrogate_block_ids: set[int]
+        surrogate_block_ids: frozenset[int]
             Set of block IDs for surrogate codepoints.
-        private_use_block_ids: set[int]
+        private_use_block_ids: frozenset[int]
             Set of block IDs for private use areas.
+        default_vert_orient_upright_block_ids: frozenset[int]
+            Set of block IDs with default upright vertical orientation.
+        planes: list[UnicodePlane]
+            List of UnicodePlane objects loaded from JSON or defaults.
+        block_id_plane_map: dict[int, UnicodePlane]
+            Mapping of block IDs to the UnicodePlane containing each block.
         plane_number_map: dict[int, UnicodePlane]
             Mapping of plane numbers to UnicodePlane objects.
         plane_abbreviation_map: dict[str, UnicodePlane]
             Mapping of plane abbreviations to UnicodePlane objects.
         all_characters_plane: UnicodePlane
             UnicodePlane representing all Unicode characters.
-        all_codepoints_in_unicode_space: set[int]
-            Set of all valid Unicode codepoints.
-        all_control_character_codepoints: set[int]
+        all_control_character_codepoints: frozenset[int]
             Set of all control character codepoints.
-        all_noncharacter_codepoints: set[int]
+        all_noncharacter_codepoints: frozenset[int]
             Set of all noncharacter codepoints.
-        all_tangut_codepoints: set[int]
+        all_non_unihan_codepoints: AbstractSet[int]
+            Set of codepoints for non-Unihan characters (backed by a sorted array).
+        all_cjk_codepoints: AbstractSet[int]
+            Set of codepoints for CJK Unihan characters (backed by a sorted array).
+        all_tangut_ideograph_codepoints: frozenset[int]
+            Set of codepoints for Tangut ideographs.
+        all_tangut_component_codepoints: frozenset[int]
+            Set of codepoints for Tangut components.
+        all_tangut_codepoints: frozenset[int]
             Set of all Tangut codepoints (ideographs and components).
-        all_surrogate_codepoints: set[int]
-            Set of all surrogate codepoints.
-        all_private_use_codepoints: set[int]
-            Set of all private use codepoints.
+        all_defined_codepoints: memoryview
+            Sorted array of all codepoints assigned to a character (non-Unihan, CJK Unihan and Tangut), used to
+            list characters without stepping through reserved or unassigned codepoints.
+        character_type_table: bytearray | mmap
+            Table containing the CharacterType of every codepoint in the Unicode codespace (one byte per
+            codepoint), memory-mapped from disk when the table file exists.
         official_number_of_unicode_characters: int
             The official count of Unicode characters, excluding private-use, control, noncharacters, and surrogates.
+
+    Properties:
+        all_codepoints_in_unicode_space: range
+            Range of all valid Unicode codepoints.
         unicode_version: str
             The Unicode version string.
         constant_default_property_value_map: dict[str, str]
@@ -156,14 +155,25 @@ class UnicodeDataCache:
             Mapping of property groups to callables for variable default values.
 
     Methods:
+        reload(settings: UnicodeApiSettings | None = None) -> UnicodeDataSnapshot
+            Build a new snapshot from the Unicode data files, replace the current snapshot and clear all
+            cached search/filter results.
         search_characters_by_name(query: str, score_cutoff: int = 80) -> list[tuple[int, float]]
-            Fuzzy search for character names.
+            Fuzzy search for character names (results are cached by query and score cutoff).
+        rank_characters_by_name(query: str, score_cutoff: int = 80) -> CompactSearchResults
+            Same as `search_characters_by_name`, but returns the cached (codepoints, scores) arrays.
+        score_character_name(query: str, codepoint: int) -> float | None
+            Returns the score of a single character name, as computed by `search_characters_by_name`.
         get_unicode_block_by_id(block_id: int) -> UnicodeBlock
             Retrieve a UnicodeBlock by its ID.
         get_unicode_block_containing_codepoint(codepoint: int) -> UnicodeBlock
             Find the block containing a codepoint.
         search_blocks_by_name(query: str, score_cutoff: int = 80) -> list[tuple[int, float]]
-            Fuzzy search for block names.
+            Fuzzy search for block names (results are cached by query and score cutoff).
+        rank_blocks_by_name(query: str, score_cutoff: int = 80) -> CompactSearchResults
+            Same as `search_blocks_by_name`, but returns the cached (block IDs, scores) arrays.
+        score_block_name(query: str, block_id: int) -> float | None
+            Returns the score of a single block name, as computed by `search_blocks_by_name`.
         loose_match_block_name(block_name: str) -> int | None
             Loosely match a block name to its ID.
         get_unicode_plane_by_number(plane_number: int) -> UnicodePlane
@@ -202,7 +212,7 @@ class UnicodeDataCache:
             Map a hex string to a codepoint display string.
         get_mapped_codepoint_from_int(codepoint_dec: int) -> str
             Map an integer codepoint to a display string.
-        get_all_codepoints_in_block_id_list(block_id_list: set[int]) -> set[int]
+        get_all_codepoints_in_block_id_list(block_id_list: set[int] | frozenset[int]) -> set[int]
             Get all codepoints in a set of block IDs.
         get_all_values_for_property_group(prop_group: str) -> list[UnicodePropertyGroupValues]
             Get all values for a property group.
@@ -228,7 +238,7 @@ class UnicodeDataCache:
             Get the default General_Category property value for a codepoint.
         get_default_vo(codepoint: int) -> str
             Get the default Vertical_Orientation property value for a codepoint.
-        get_default_vert_orient_upright_block_ids() -> set[int]
+        get_default_vert_orient_upright_block_ids() -> frozenset[int]
             Get block IDs with default upright vertical orientation.
         get_api_route_from_requested_path(requested_path: str) -> tuple[ApiRouteDetails, str]
             Match a requested path to an API route.
@@ -240,211 +250,166 @@ class UnicodeDataCache:
     def __init__(self):
         self.settings = get_settings()
         self.api_routes: list[ApiRouteDetails] = []
+        self._snapshot: UnicodeDataSnapshot | None = None
 
-    @cached_property
+    @property
+    def snapshot(self) -> UnicodeDataSnapshot:
+        if not (snapshot := self._snapshot):
+            snapshot = self._snapshot = build_unicode_data_snapshot(self.settings)
+        return snapshot
+
+    def reload(self, settings: UnicodeApiSettings | None = None) -> UnicodeDataSnapshot:
+        # The new snapshot is fully built before it replaces the current snapshot, so requests that
+        # are being processed while the data is reloaded never observe a partially built snapshot.
+        if settings:
+            self.settings = settings
+        snapshot = build_unicode_data_snapshot(self.settings)
+        self._snapshot = snapshot
+        UnicodeDataCache.get_character_name.cache_clear()
+        clear_all_result_caches()
+        return snapshot
+
+    @property
     def property_value_id_map(self) -> "UnicodePropertyGroupMap":
-        return self.settings.property_value_id_map
+        return self.snapshot.property_value_id_map
 
-    @cached_property
+    @property
     def missing_property_groups(self) -> list[str]:
-        return self.settings.missing_property_group_names
+        return self.snapshot.missing_property_groups
 
-    @cached_property
+    @property
     def character_flag_names(self) -> list[str]:
-        all_flag_names = [p.lower() for p in self.settings.boolean_character_property_names]
-        return sorted(set(all_flag_names) & set(UnicodeCharacter.model_fields.keys()))
+        return self.snapshot.character_flag_names
 
-    @cached_property
-    def non_unihan_character_name_map(self) -> dict[int, str]:
-        return self.settings.non_unihan_character_name_map
+    @property
+    def non_unihan_character_name_map(self) -> Mapping[int, str]:
+        return self.snapshot.non_unihan_character_name_map
 
     @property
-    def non_unihan_character_name_choices(self) -> dict[int, str]:
-        return {codepoint: name.lower() for (codepoint, name) in self.non_unihan_character_name_map.items()}
+    def character_name_search_index(self) -> NameSearchIndex:
+        return self.snapshot.character_name_search_index
 
-    @cached_property
+    @property
     def blocks(self) -> list[UnicodeBlock]:
-        blocks_json: list[dict[str, Any]] = (
-            json.loads(self.settings.blocks_json.read_text()) if self.settings.blocks_json.exists() else []
-        )
-        try:
-            blocks = [UnicodeBlock.model_validate(block) for block in blocks_json]
-        except ValidationError as ex:  # pragma: no cover
-            raise ValueError(f"Invalid block data: {ex}") from ex
-        for block in blocks:
-            block.plane = self.get_unicode_plane_containing_block_id(block.id if block.id else 0)
-        return blocks
+        return self.snapshot.blocks
+
+    @property
+    def block_interval_index(self) -> tuple[tuple[int, ...], tuple[UnicodeBlock, ...]]:
+        return self.snapshot.block_interval_index
 
     @property
     def block_id_map(self) -> dict[int, UnicodeBlock]:
-        return {block.id: block for block in self.blocks if block and block.id}
+        return self.snapshot.block_id_map
 
     @property
-    def block_name_choices(self) -> dict[int, str]:
-        return {block.id: block.long_name.lower() for block in self.blocks if block and block.id}
+    def block_name_search_index(self) -> NameSearchIndex:
+        return self.snapshot.block_name_search_index
 
     @property
     def all_characters_block(self) -> UnicodeBlock:
-        block = UnicodeBlock(
-            id=0,
-            long_name="All Unicode Characters",
-            short_name="All",
-            plane_id=-1,
-            start_dec=0,
-            start="0000",
-            finish_dec=MAX_CODEPOINT,
-            finish="10FFFF",
-            total_allocated=(MAX_CODEPOINT + 1),
-            total_defined=self.official_number_of_unicode_characters,
-        )
-        block.plane = self.all_characters_plane
-        return block
+        return self.snapshot.all_characters_block
 
     @property
-    def cjk_unified_ideograph_block_ids(self) -> set[int]:
-        return {b.id for b in self.blocks if "cjk unified ideographs" in b.long_name.lower() and b.id}
+    def cjk_unified_ideograph_block_ids(self) -> frozenset[int]:
+        return self.snapshot.cjk_unified_ideograph_block_ids
 
     @property
-    def cjk_compatibility_block_ids(self) -> set[int]:
-        return {b.id for b in self.blocks if "cjk compatibility ideographs" in b.long_name.lower() and b.id}
+    def cjk_compatibility_block_ids(self) -> frozenset[int]:
+        return self.snapshot.cjk_compatibility_block_ids
 
     @property
-    def tangut_ideograph_block_ids(self) -> set[int]:
-        return {
-            b.id
-            for b in self.blocks
-            if "tangut" in b.long_name.lower() and "component" not in b.long_name.lower() and b.id
-        }
+    def tangut_ideograph_block_ids(self) -> frozenset[int]:
+        return self.snapshot.tangut_ideograph_block_ids
 
     @property
-    def tangut_component_block_ids(self) -> set[int]:
-        return {b.id for b in self.blocks if "tangut components" in b.long_name.lower() and b.id}
+    def tangut_component_block_ids(self) -> frozenset[int]:
+        return self.snapshot.tangut_component_block_ids
 
     @property
-    def surrogate_block_ids(self) -> set[int]:
-        return {b.id for b in self.blocks if "surrogate" in b.long_name.lower() and b.id}
+    def surrogate_block_ids(self) -> frozenset[int]:
+        return self.snapshot.surrogate_block_ids
 
     @property
-    def private_use_block_ids(self) -> set[int]:
-        return {
-            b.id
-            for b in self.blocks
-            if "private use" in b.long_name.lower() and "surrogate" not in b.long_name.lower() and b.id
-        }
+    def private_use_block_ids(self) -> frozenset[int]:
+        return self.snapshot.private_use_block_ids
 
-    @cached_property
+    @property
+    def default_vert_orient_upright_block_ids(self) -> frozenset[int]:
+        return self.snapshot.default_vert_orient_upright_block_ids
+
+    @property
     def planes(self) -> list[UnicodePlane]:
-        plane_data = (
-            json.loads(self.settings.planes_json.read_text())
-            if self.settings.planes_json.exists()
-            else UNICODE_PLANES_DEFAULT
-        )
-        try:
-            return [UnicodePlane.model_validate(plane) for plane in plane_data]
-        except ValidationError as ex:  # pragma: no cover
-            raise ValueError(f"Invalid plane data: {ex}") from ex
+        return self.snapshot.planes
+
+    @property
+    def block_id_plane_map(self) -> dict[int, UnicodePlane]:
+        return self.snapshot.block_id_plane_map
 
     @property
     def plane_number_map(self) -> dict[int, UnicodePlane]:
-        return {plane.number: plane for plane in self.planes}
+        return self.snapshot.plane_number_map
 
     @property
     def plane_abbreviation_map(self) -> dict[str, UnicodePlane]:
-        return {plane.abbreviation: plane for plane in self.planes}
+        return self.snapshot.plane_abbreviation_map
 
     @property
     def all_characters_plane(self) -> UnicodePlane:
-        return UnicodePlane(
-            number=-1,
-            name="All Unicode Characters",
-            abbreviation="ALL",
-            start="0000",
-            start_dec=0,
-            finish="10FFFF",
-            finish_dec=MAX_CODEPOINT,
-            start_block_id=1,
-            finish_block_id=327,
-            total_allocated=(MAX_CODEPOINT + 1),
-            total_defined=self.official_number_of_unicode_characters,
-        )
+        return self.snapshot.all_characters_plane
 
     @property
-    def all_codepoints_in_unicode_space(self) -> set[int]:
-        return set(ALL_UNICODE_CODEPOINTS)
+    def all_control_character_codepoints(self) -> frozenset[int]:
+        return self.snapshot.all_control_character_codepoints
 
     @property
-    def all_control_character_codepoints(self) -> set[int]:
-        return set(ALL_CONTROL_CHARACTERS)
+    def all_noncharacter_codepoints(self) -> frozenset[int]:
+        return self.snapshot.all_noncharacter_codepoints
 
     @property
-    def all_noncharacter_codepoints(self) -> set[int]:
-        return set(NON_CHARACTER_CODEPOINTS)
+    def all_non_unihan_codepoints(self) -> AbstractSet[int]:
+        return self.snapshot.all_non_unihan_codepoints
 
-    @cached_property
-    def all_non_unihan_codepoints(self) -> set[int]:
-        return set(self.settings.non_unihan_character_name_map.keys())
-
-    @cached_property
-    def all_cjk_codepoints(self) -> set[int]:
-        return set(self.settings.unihan_character_name_map.keys())
+    @property
+    def all_cjk_codepoints(self) -> AbstractSet[int]:
+        return self.snapshot.all_cjk_codepoints
 
-    @cached_property
-    def all_tangut_ideograph_codepoints(self) -> set[int]:
-        return {
-            cp
-            for cp, block_id in self.settings.tangut_character_name_map.items()
-            if block_id in self.tangut_ideograph_block_ids
-        }
+    @property
+    def all_tangut_ideograph_codepoints(self) -> frozenset[int]:
+        return self.snapshot.all_tangut_ideograph_codepoints
 
-    @cached_property
-    def all_tangut_component_codepoints(self) -> set[int]:
-        return {
-            cp
-            for cp, block_id in self.settings.tangut_character_name_map.items()
-            if block_id in self.tangut_component_block_ids
-        }
+    @property
+    def all_tangut_component_codepoints(self) -> frozenset[int]:
+        return self.snapshot.all_tangut_component_codepoints
 
     @property
-    def all_tangut_codepoints(self) -> set[int]:
-        return self.all_tangut_ideograph_codepoints | self.all_tangut_component_codepoints
+    def all_tangut_codepoints(self) -> frozenset[int]:
+        return self.snapshot.all_tangut_codepoints
 
     @property
-    def all_surrogate_codepoints(self) -> set[int]:
-        return self.get_all_codepoints_in_block_id_list(self.surrogate_block_ids)
+    def all_defined_codepoints(self) -> memoryview:
+        return self.snapshot.all_defined_codepoints
 
     @property
-    def all_private_use_codepoints(self) -> set[int]:
-        return self.get_all_codepoints_in_block_id_list(self.private_use_block_ids)
+    def character_type_table(self) -> CharacterTypeTable:
+        return self.snapshot.character_type_table
 
     @property
     def official_number_of_unicode_characters(self) -> int:
-        # The "official" number of characters listed for each version of Unicode is the total number
-        # of graphic and format characters (i.e., excluding private-use characters, control characters,
-        # noncharacters and surrogate code points).
-        # source: https://en.wikipedia.org/wiki/Unicode#cite_ref-25
-        total_defined = (
-            len(self.all_non_unihan_codepoints) + len(self.all_cjk_codepoints) + len(self.all_tangut_codepoints)
-        )
-        return total_defined - len(self.all_control_character_codepoints)
+        return self.snapshot.official_number_of_unicode_characters
+
+    @property
+    def all_codepoints_in_unicode_space(self) -> range:
+        return ALL_UNICODE_CODEPOINTS
 
     @property
     def unicode_version(self) -> str:
         return self.settings.UNICODE_VERSION
 
     @property
-    def constant_default_property_value_map(self):
-        return {
-            "Bidi_Paired_Bracket_Type": "None",
-            "Canonical_Combining_Class": "Not_Reordered",
-            "Decomposition_Type": "None",
-            "Hangul_Syllable_Type": "Not_Applicable",
-            "Joining_Type": "Non_Joining",
-            "Line_Break": "Unknown",
-            "Numeric_Type": "None",
-            "Script": "Unknown",
-        }
+    def constant_default_property_value_map(self) -> dict[str, str]:
+        return CONSTANT_DEFAULT_PROPERTY_VALUE_MAP
 
-    @property
+    @cached_property
     def variable_default_property_value_map(self) -> dict[str, Callable[[int], str]]:
         return {
             "Age": self.get_default_age,
@@ -455,28 +420,43 @@ class UnicodeDataCache:
         }
 
     def search_characters_by_name(self, query: str, score_cutoff: int = 80) -> list[tuple[int, float]]:
+        return unpack_search_results(self.rank_characters_by_name(query, score_cutoff))
+
+    def rank_characters_by_name(self, query: str, score_cutoff: int = 80) -> CompactSearchResults:
         score_cutoff = max(70, score_cutoff)
-        fuzzy_search_results = process.extract(
-            query.lower(), self.non_unihan_character_name_choices, limit=len(self.non_unihan_character_name_map)
+        return character_search_cache.get_or_compute(
+            (query.lower(), score_cutoff),
+            lambda: pack_search_results(self.character_name_search_index.search(query, score_cutoff=score_cutoff)),
         )
-        return [(result, score) for (_, score, result) in fuzzy_search_results if score >= float(score_cutoff)]
+
+    def score_character_name(self, query: str, codepoint: int) -> float | None:
+        return self.character_name_search_index.get_score(query, codepoint)
 
     def get_unicode_block_by_id(self, block_id: int) -> UnicodeBlock:
         return self.block_id_map.get(block_id, NULL_BLOCK)
 
     def get_unicode_block_containing_codepoint(self, codepoint: int) -> UnicodeBlock:
-        found = [block for block in self.blocks if block.start_dec <= codepoint and codepoint <= block.finish_dec]
-        return found[0] if found else NULL_BLOCK
+        (start_offsets, sorted_blocks) = self.block_interval_index
+        index = bisect_right(start_offsets, codepoint) - 1
+        if index >= 0 and codepoint <= (block := sorted_blocks[index]).finish_dec:
+            return block
+        return NULL_BLOCK
 
     def search_blocks_by_name(self, query: str, score_cutoff: int = 80) -> list[tuple[int, float]]:
+        return unpack_search_results(self.rank_blocks_by_name(query, score_cutoff))
+
+    def rank_blocks_by_name(self, query: str, score_cutoff: int = 80) -> CompactSearchResults:
         score_cutoff = max(70, score_cutoff)
-        fuzzy_search_results = process.extract(query.lower(), self.block_name_choices, limit=len(self.blocks))
-        return [(result, score) for (_, score, result) in fuzzy_search_results if score >= float(score_cutoff)]
+        return block_search_cache.get_or_compute(
+            (query.lower(), score_cutoff),
+            lambda: pack_search_results(self.block_name_search_index.search(query, score_cutoff=score_cutoff)),
+        )
+
+    def score_block_name(self, query: str, block_id: int) -> float | None:
+        return self.block_name_search_index.get_score(query, block_id)
 
     def loose_match_block_name(self, block_name: str) -> int | None:
-        block_name_map = {normalize_string_lm3(b.long_name): b.id for b in self.blocks if b.id}
-        block_name_map.update({normalize_string_lm3(b.short_name): b.id for b in self.blocks if b.id})
-        return block_name_map.get(normalize_string_lm3(block_name))
+        return self.snapshot.loose_block_name_map.get(normalize_string_lm3(block_name))
 
     def get_unicode_plane_by_number(self, plane_number: int) -> UnicodePlane:
         plane = self.plane_number_map.get(plane_number)
@@ -505,20 +485,27 @@ class UnicodeDataCache:
         return self.plane_abbreviation_map.get(plane_abbr, NULL_PLANE)
 
     def get_unicode_plane_containing_block_id(self, block_id: int) -> UnicodePlane:
-        found = [p for p in self.planes if p.start_block_id <= block_id and block_id <= p.finish_block_id]
-        return found[0] if found else NULL_PLANE
+        return self.block_id_plane_map.get(block_id, NULL_PLANE)
 
     def codepoint_is_in_unicode_space(self, codepoint: int) -> bool:
-        return codepoint in self.all_codepoints_in_unicode_space
+        return 0 <= codepoint <= MAX_CODEPOINT
 
     def codepoint_is_noncharacter(self, codepoint: int) -> bool:
-        return codepoint in self.all_noncharacter_codepoints
+        return self.get_character_type(codepoint) == CharacterType.NONCHARACTER
 
     def codepoint_is_surrogate(self, codepoint: int) -> bool:
-        return codepoint in self.all_surrogate_codepoints
+        return self.get_character_type(codepoint) == CharacterType.SURROGATE
 
     def codepoint_is_private_use(self, codepoint: int) -> bool:
-        return codepoint in self.all_private_use_codepoints
+        # The noncharacters at the end of planes 15 and 16 are also part of the private use blocks in those planes,
+        # but the character type table can only store one type for each codepoint
+        match self.get_character_type(codepoint):
+            case CharacterType.PRIVATE_USE:
+                return True
+            case CharacterType.NONCHARACTER:
+                return self.get_unicode_block_containing_codepoint(codepoint).id in self.private_use_block_ids
+            case _:
+                return False
 
     def codepoint_is_ascii_control_character(self, codepoint: int) -> bool:
         return codepoint in C0_CONTROL_CHARACTERS
@@ -546,21 +533,7 @@ class UnicodeDataCache:
                 return f"<{char_type}-{codepoint:04X}>"
 
     def get_character_type(self, codepoint: int) -> CharacterType:
-        if self.character_is_non_unihan(codepoint):
-            return CharacterType.NON_UNIHAN
-        if self.character_is_unihan(codepoint):
-            return CharacterType.UNIHAN
-        if self.character_is_tangut(codepoint):
-            return CharacterType.TANGUT
-        if self.codepoint_is_noncharacter(codepoint):
-            return CharacterType.NONCHARACTER
-        if self.codepoint_is_surrogate(codepoint):
-            return CharacterType.SURROGATE  # pragma: no cover
-        if self.codepoint_is_private_use(codepoint):
-            return CharacterType.PRIVATE_USE
-        if self.codepoint_is_in_unicode_space(codepoint):
-            return CharacterType.RESERVED
-        return CharacterType.INVALID
+        return get_character_type_from_table(self.character_type_table, codepoint)
 
     def get_generic_name_for_codepoint(self, codepoint: int) -> str:
         block = self.get_unicode_block_containing_codepoint(codepoint)
@@ -575,7 +548,7 @@ class UnicodeDataCache:
         return ""  # pragma: no cover
 
     def get_tangut_component_index(self, codepoint: int) -> int:
-        tangut_components_block = self.get_unicode_block_by_id(list(self.tangut_component_block_ids)[0])
+        tangut_components_block = self.get_unicode_block_by_id(min(self.tangut_component_block_ids))
         # The Tangut component characters are one-indexed
         return (codepoint - tangut_components_block.start_dec) + 1
 
@@ -595,13 +568,13 @@ class UnicodeDataCache:
             return f"Invalid Codepoint ({codepoint_dec} is not within the Unicode codespace)"
         return f"{chr(codepoint_dec)} (U+{codepoint_dec:04X} {self.get_character_name(codepoint_dec)})"
 
-    def get_all_codepoints_in_block_id_list(self, block_id_list: set[int]) -> set[int]:
+    def get_all_codepoints_in_block_id_list(self, block_id_list: set[int] | frozenset[int]) -> set[int]:
         blocks = [self.get_unicode_block_by_id(block_id) for block_id in block_id_list]
         return set(itertools.chain(*[list(range(block.start_dec, block.finish_dec + 1)) for block in blocks]))
 
     def get_all_values_for_property_group(self, prop_group: str) -> list["UnicodePropertyGroupValues"]:
         if prop_group == "Block":
-            return json.loads(self.settings.blocks_json.read_text()) if self.settings.blocks_json.exists() else []
+            return self.snapshot.block_property_values
         prop_group_values: dict[str, UnicodePropertyGroupValues] | list[str] = self.property_value_id_map.get(
             prop_group, None
         )
@@ -624,14 +597,7 @@ class UnicodeDataCache:
         return Result[int].Fail(f"Invalid {prop_group} value: {prop_value}")  # pragma: no cover
 
     def get_name_value_map_for_property_group(self, prop_group: str) -> dict[str, int] | None:
-        prop_group_values: dict[str, UnicodePropertyGroupValues] | list[str] = self.property_value_id_map.get(
-            prop_group, None
-        )
-        if not prop_group_values or not isinstance(prop_group_values, dict):  # pragma: no cover
-            return None
-        short_name_value_map = {value_map["short_name"]: value_map["id"] for value_map in prop_group_values.values()}
-        long_name_value_map = {value_map["long_name"]: value_map["id"] for value_map in prop_group_values.values()}
-        return short_name_value_map | long_name_value_map
+        return self.snapshot.property_value_name_id_maps.get(prop_group)
 
     def get_display_name_for_property_value(
         self, prop_group: str, prop_value_id: int | None = None, codepoint: int | None = None
@@ -708,17 +674,13 @@ class UnicodeDataCache:
         if (
             block.plane
             and block.plane.number in DEFAULT_VO_U_PLANE_NUMBERS
-            or block.id in self.get_default_vert_orient_upright_block_ids()
+            or block.id in self.default_vert_orient_upright_block_ids
         ):
             return "Upright"
         return "Rotated"  # pragma: no cover
 
-    def get_default_vert_orient_upright_block_ids(self) -> set[int]:
-        return {
-            block_id
-            for block_name in DEFAULT_VO_U_BLOCK_NAMES
-            if (block_id := self.loose_match_block_name(block_name)) is not None
-        }
+    def get_default_vert_orient_upright_block_ids(self) -> frozenset[int]:
+        return self.default_vert_orient_upright_block_ids
 
     def get_api_route_from_requested_path(self, requested_path: str) -> tuple[ApiRouteDetails, str]:
         for route in self.api_routes:
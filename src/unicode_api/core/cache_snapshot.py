@@ -0,0 +1,458 @@
+"""
+This module builds an immutable snapshot of all Unicode data that is held in memory by the API.
+
+Every lookup table used by `UnicodeDataCache` (blocks, planes, character name maps, codepoint sets,
+property value maps, etc.) is derived from the Unicode data files exactly once, when a snapshot is built.
+The character name map and the sorted codepoint arrays are read directly from the memory-mapped packed
+data file (see `packed_unicode_data`), the JSON data files are only read if the packed file does not exist.
+The snapshot is a frozen dataclass, so a new version of the data can be swapped in by replacing a single
+reference, and requests that are in-flight continue to use the snapshot they started with.
+
+The time required to build each structure and its approximate size in memory are recorded while the
+snapshot is built, and can be reported after startup or after the data is reloaded.
+
+Classes:
+    SnapshotStructureStats:
+        Build time and approximate memory usage for a single structure in the snapshot.
+    UnicodeDataSnapshot:
+        Frozen container for all precomputed Unicode data structures.
+
+Functions:
+    build_unicode_data_snapshot(settings: UnicodeApiSettings) -> UnicodeDataSnapshot:
+        Loads all Unicode data files and builds every derived structure.
+"""
+
+import json
+import struct
+import sys
+import time
+from collections.abc import Callable, Mapping
+from collections.abc import Set as AbstractSet
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, cast
+
+from pydantic import ValidationError
+
+from unicode_api.config.api_settings import UnicodeApiSettings
+from unicode_api.constants import (
+    ALL_CONTROL_CHARACTERS,
+    DEFAULT_VO_U_BLOCK_NAMES,
+    MAX_CODEPOINT,
+    NON_CHARACTER_CODEPOINTS,
+    UNICODE_PLANES_DEFAULT,
+)
+from unicode_api.core.character_type_table import (
+    CharacterTypeTable,
+    build_character_type_table,
+    load_character_type_table,
+)
+from unicode_api.core.name_search_index import NameSearchIndex
+from unicode_api.core.packed_unicode_data import PackedUnicodeData, load_packed_unicode_data, pack_unicode_data
+from unicode_api.core.util import s
+from unicode_api.models.block import UnicodeBlock
+from unicode_api.models.character import UnicodeCharacter
+from unicode_api.models.plane import UnicodePlane
+from unicode_api.models.util import normalize_string_lm3
+
+if TYPE_CHECKING:  # pragma: no cover
+    from unicode_api.custom_types import UnicodePropertyGroupMap, UnicodePropertyGroupValues
+
+
+NULL_BLOCK = UnicodeBlock(
+    id=0,
+    long_name="None",
+    short_name="None",
+    plane_id=-1,
+    start="",
+    start_dec=0,
+    finish="",
+    finish_dec=0,
+    total_allocated=0,
+    total_defined=0,
+)
+
+NULL_PLANE = UnicodePlane(
+    id=-1,
+    number=-1,
+    name="None",
+    abbreviation="None",
+    start="",
+    start_dec=0,
+    finish="",
+    finish_dec=0,
+    start_block_id=0,
+    finish_block_id=0,
+    total_allocated=0,
+    total_defined=0,
+)
+
+
+@dataclass(frozen=True, slots=True)
+class SnapshotStructureStats:
+    name: str
+    build_time_ms: float
+    size_bytes: int
+
+    def __str__(self) -> str:
+        return f"{self.name}: {self.build_time_ms:.2f} ms, {self.size_bytes / 1024:,.1f} KB"
+
+
+@dataclass(frozen=True, slots=True)
+class UnicodeDataSnapshot:
+    property_value_id_map: "UnicodePropertyGroupMap"
+    property_value_name_id_maps: dict[str, dict[str, int]]
+    missing_property_groups: list[str]
+    character_flag_names: list[str]
+    non_unihan_character_name_map: Mapping[int, str]
+    character_name_search_index: NameSearchIndex
+    planes: list[UnicodePlane]
+    plane_number_map: dict[int, UnicodePlane]
+    plane_abbreviation_map: dict[str, UnicodePlane]
+    block_id_plane_map: dict[int, UnicodePlane]
+    blocks: list[UnicodeBlock]
+    block_property_values: list["UnicodePropertyGroupValues"]
+    block_interval_index: tuple[tuple[int, ...], tuple[UnicodeBlock, ...]]
+    block_id_map: dict[int, UnicodeBlock]
+    block_name_search_index: NameSearchIndex
+    loose_block_name_map: dict[str, int]
+    cjk_unified_ideograph_block_ids: frozenset[int]
+    cjk_compatibility_block_ids: frozenset[int]
+    tangut_ideograph_block_ids: frozenset[int]
+    tangut_component_block_ids: frozenset[int]
+    surrogate_block_ids: frozenset[int]
+    private_use_block_ids: frozenset[int]
+    default_vert_orient_upright_block_ids: frozenset[int]
+    all_control_character_codepoints: frozenset[int]
+    all_noncharacter_codepoints: frozenset[int]
+    all_non_unihan_codepoints: AbstractSet[int]
+    all_cjk_codepoints: AbstractSet[int]
+    all_tangut_ideograph_codepoints: frozenset[int]
+    all_tangut_component_codepoints: frozenset[int]
+    all_tangut_codepoints: frozenset[int]
+    all_defined_codepoints: memoryview
+    character_type_table: CharacterTypeTable
+    official_number_of_unicode_characters: int
+    all_characters_plane: UnicodePlane
+    all_characters_block: UnicodeBlock
+    build_stats: list[SnapshotStructureStats]
+
+    @property
+    def total_build_time_ms(self) -> float:
+        return sum(stats.build_time_ms for stats in self.build_stats)
+
+    @property
+    def total_size_bytes(self) -> int:
+        return sum(stats.size_bytes for stats in self.build_stats)
+
+    @property
+    def build_report(self) -> list[str]:
+        total_structures = len(self.build_stats)
+        report = [
+            f"Built {total_structures} Unicode data structure{s(total_structures)} in "
+            f"{self.total_build_time_ms:.2f} ms (approx. {self.total_size_bytes / (1024 * 1024):,.1f} MB)"
+        ]
+        report.extend(f"  {stats}" for stats in self.build_stats)
+        return report
+
+
+class _SnapshotBuilder:
+    def __init__(self) -> None:
+        self.stats: list[SnapshotStructureStats] = []
+
+    def build[T](self, name: str, factory: Callable[[], T]) -> T:
+        start = time.perf_counter()
+        value = factory()
+        build_time_ms = (time.perf_counter() - start) * 1000
+        self.stats.append(SnapshotStructureStats(name, build_time_ms, _get_approximate_size(value)))
+        return value
+
+
+def build_unicode_data_snapshot(settings: UnicodeApiSettings) -> UnicodeDataSnapshot:
+    """
+    Loads all Unicode data files for the configured Unicode version and builds every structure used by
+    `UnicodeDataCache` to answer lookups without further computation.
+
+    Args:
+        settings (UnicodeApiSettings): The settings object containing the paths to the Unicode data files.
+
+    Returns:
+        UnicodeDataSnapshot: An immutable snapshot of all Unicode data, including the time required to
+            build each structure and its approximate size in memory.
+
+    Raises:
+        ValueError: If the block or plane data files contain invalid data.
+    """
+    builder = _SnapshotBuilder()
+    unicode_data = builder.build("packed_unicode_data", lambda: _load_packed_unicode_data(settings))
+    property_value_id_map = unicode_data.property_value_id_map
+    property_value_name_id_maps = builder.build(
+        "property_value_name_id_maps", lambda: _get_property_value_name_id_maps(property_value_id_map)
+    )
+    missing_property_groups = property_value_id_map["missing_prop_groups"]
+    character_flag_names = builder.build(
+        "character_flag_names", lambda: _get_character_flag_names(property_value_id_map["boolean_properties"])
+    )
+    non_unihan_character_name_map = unicode_data.non_unihan_character_name_map
+    character_name_search_index = builder.build(
+        "character_name_search_index", lambda: NameSearchIndex(non_unihan_character_name_map.iter_items())
+    )
+
+    planes = builder.build("planes", lambda: _load_planes(unicode_data.planes))
+    plane_number_map = builder.build("plane_number_map", lambda: {plane.number: plane for plane in planes})
+    plane_abbreviation_map = builder.build(
+        "plane_abbreviation_map", lambda: {plane.abbreviation: plane for plane in planes}
+    )
+    block_id_plane_map = builder.build("block_id_plane_map", lambda: _get_block_id_plane_map(planes))
+
+    block_property_values = cast(list["UnicodePropertyGroupValues"], unicode_data.blocks)
+    blocks = builder.build("blocks", lambda: _load_blocks(block_property_values, block_id_plane_map))
+    block_interval_index = builder.build("block_interval_index", lambda: _get_block_interval_index(blocks))
+    block_id_map = builder.build("block_id_map", lambda: {block.id: block for block in blocks if block and block.id})
+    block_name_search_index = builder.build(
+        "block_name_search_index",
+        lambda: NameSearchIndex((block.id, block.long_name) for block in blocks if block and block.id),
+    )
+    loose_block_name_map = builder.build("loose_block_name_map", lambda: _get_loose_block_name_map(blocks))
+    cjk_unified_ideograph_block_ids = builder.build(
+        "cjk_unified_ideograph_block_ids", lambda: _get_block_ids(blocks, "cjk unified ideographs")
+    )
+    cjk_compatibility_block_ids = builder.build(
+        "cjk_compatibility_block_ids", lambda: _get_block_ids(blocks, "cjk compatibility ideographs")
+    )
+    tangut_ideograph_block_ids = builder.build(
+        "tangut_ideograph_block_ids", lambda: _get_block_ids(blocks, "tangut", exclude="component")
+    )
+    tangut_component_block_ids = builder.build(
+        "tangut_component_block_ids", lambda: _get_block_ids(blocks, "tangut components")
+    )
+    surrogate_block_ids = builder.build("surrogate_block_ids", lambda: _get_block_ids(blocks, "surrogate"))
+    private_use_block_ids = builder.build(
+        "private_use_block_ids", lambda: _get_block_ids(blocks, "private use", exclude="surrogate")
+    )
+    default_vert_orient_upright_block_ids = builder.build(
+        "default_vert_orient_upright_block_ids",
+        lambda: frozenset(
+            block_id
+            for block_name in DEFAULT_VO_U_BLOCK_NAMES
+            if (block_id := loose_block_name_map.get(normalize_string_lm3(block_name))) is not None
+        ),
+    )
+
+    all_control_character_codepoints = builder.build(
+        "all_control_character_codepoints", lambda: frozenset(ALL_CONTROL_CHARACTERS)
+    )
+    all_noncharacter_codepoints = builder.build(
+        "all_noncharacter_codepoints", lambda: frozenset(NON_CHARACTER_CODEPOINTS)
+    )
+    all_non_unihan_codepoints = non_unihan_character_name_map.codepoint_set
+    all_cjk_codepoints = unicode_data.unihan_character_block_map.codepoint_set
+    tangut_character_block_map = unicode_data.tangut_character_block_map
+    all_tangut_ideograph_codepoints = builder.build(
+        "all_tangut_ideograph_codepoints",
+        lambda: frozenset(
+            cp for cp, block_id in tangut_character_block_map.iter_items() if block_id in tangut_ideograph_block_ids
+        ),
+    )
+    all_tangut_component_codepoints = builder.build(
+        "all_tangut_component_codepoints",
+        lambda: frozenset(
+            cp for cp, block_id in tangut_character_block_map.iter_items() if block_id in tangut_component_block_ids
+        ),
+    )
+    all_tangut_codepoints = builder.build(
+        "all_tangut_codepoints", lambda: all_tangut_ideograph_codepoints | all_tangut_component_codepoints
+    )
+    all_defined_codepoints = unicode_data.all_defined_codepoints
+    character_type_table = builder.build(
+        "character_type_table",
+        lambda: load_character_type_table(settings.char_type_table)
+        or build_character_type_table(
+            blocks,
+            surrogate_block_ids,
+            private_use_block_ids,
+            all_non_unihan_codepoints,
+            all_cjk_codepoints,
+            all_tangut_codepoints,
+        ),
+    )
+
+    # The "official" number of characters listed for each version of Unicode is the total number
+    # of graphic and format characters (i.e., excluding private-use characters, control characters,
+    # noncharacters and surrogate code points).
+    # source: https://en.wikipedia.org/wiki/Unicode#cite_ref-25
+    official_number_of_unicode_characters = (
+        len(all_non_unihan_codepoints) + len(all_cjk_codepoints) + len(all_tangut_codepoints)
+    ) - len(all_control_character_codepoints)
+    all_characters_plane = _get_all_characters_plane(official_number_of_unicode_characters)
+    all_characters_block = _get_all_characters_block(official_number_of_unicode_characters, all_characters_plane)
+
+    return UnicodeDataSnapshot(
+        property_value_id_map=property_value_id_map,
+        property_value_name_id_maps=property_value_name_id_maps,
+        missing_property_groups=missing_property_groups,
+        character_flag_names=character_flag_names,
+        non_unihan_character_name_map=non_unihan_character_name_map,
+        character_name_search_index=character_name_search_index,
+        planes=planes,
+        plane_number_map=plane_number_map,
+        plane_abbreviation_map=plane_abbreviation_map,
+        block_id_plane_map=block_id_plane_map,
+        blocks=blocks,
+        block_property_values=block_property_values,
+        block_interval_index=block_interval_index,
+        block_id_map=block_id_map,
+        block_name_search_index=block_name_search_index,
+        loose_block_name_map=loose_block_name_map,
+        cjk_unified_ideograph_block_ids=cjk_unified_ideograph_block_ids,
+        cjk_compatibility_block_ids=cjk_compatibility_block_ids,
+        tangut_ideograph_block_ids=tangut_ideograph_block_ids,
+        tangut_component_block_ids=tangut_component_block_ids,
+        surrogate_block_ids=surrogate_block_ids,
+        private_use_block_ids=private_use_block_ids,
+        default_vert_orient_upright_block_ids=default_vert_orient_upright_block_ids,
+        all_control_character_codepoints=all_control_character_codepoints,
+        all_noncharacter_codepoints=all_noncharacter_codepoints,
+        all_non_unihan_codepoints=all_non_unihan_codepoints,
+        all_cjk_codepoints=all_cjk_codepoints,
+        all_tangut_ideograph_codepoints=all_tangut_ideograph_codepoints,
+        all_tangut_component_codepoints=all_tangut_component_codepoints,
+        all_tangut_codepoints=all_tangut_codepoints,
+        all_defined_codepoints=all_defined_codepoints,
+        character_type_table=character_type_table,
+        official_number_of_unicode_characters=official_number_of_unicode_characters,
+        all_characters_plane=all_characters_plane,
+        all_characters_block=all_characters_block,
+        build_stats=builder.stats,
+    )
+
+
+def _get_property_value_name_id_maps(property_value_id_map: "UnicodePropertyGroupMap") -> dict[str, dict[str, int]]:
+    name_id_maps: dict[str, dict[str, int]] = {}
+    for prop_group, prop_group_values in property_value_id_map.items():
+        if not prop_group_values or not isinstance(prop_group_values, dict):
+            continue
+        values: list[UnicodePropertyGroupValues] = list(prop_group_values.values())  # type: ignore[reportUnknownArgumentType]
+        short_name_value_map = {value_map["short_name"]: value_map["id"] for value_map in values}
+        long_name_value_map = {value_map["long_name"]: value_map["id"] for value_map in values}
+        name_id_maps[prop_group] = short_name_value_map | long_name_value_map
+    return name_id_maps
+
+
+def _load_packed_unicode_data(settings: UnicodeApiSettings) -> PackedUnicodeData:
+    if unicode_data := load_packed_unicode_data(settings.unicode_data_file):
+        return unicode_data
+    # If the packed data file does not exist (or has an unexpected format), the JSON data files are packed in memory
+    try:
+        data = pack_unicode_data(
+            settings.property_value_id_map,
+            json.loads(settings.planes_json.read_text()) if settings.planes_json.exists() else UNICODE_PLANES_DEFAULT,
+            json.loads(settings.blocks_json.read_text()) if settings.blocks_json.exists() else [],
+            settings.non_unihan_character_name_map,
+            settings.unihan_character_name_map,
+            settings.tangut_character_name_map,
+        )
+    except (KeyError, struct.error) as ex:  # pragma: no cover
+        raise ValueError(f"Invalid plane or block data: {ex!r}") from ex
+    if not (unicode_data := PackedUnicodeData.from_buffer(data)):  # pragma: no cover
+        raise ValueError("Failed to read packed Unicode data")
+    return unicode_data
+
+
+def _get_character_flag_names(boolean_property_names: list[str]) -> list[str]:
+    all_flag_names = [p.lower() for p in boolean_property_names]
+    return sorted(set(all_flag_names) & set(UnicodeCharacter.model_fields.keys()))
+
+
+def _load_planes(plane_data: list[dict[str, Any]]) -> list[UnicodePlane]:
+    try:
+        return [UnicodePlane.model_validate(plane) for plane in plane_data]
+    except ValidationError as ex:  # pragma: no cover
+        raise ValueError(f"Invalid plane data: {ex}") from ex
+
+
+def _get_block_id_plane_map(planes: list[UnicodePlane]) -> dict[int, UnicodePlane]:
+    block_id_plane_map: dict[int, UnicodePlane] = {}
+    for plane in planes:
+        for block_id in range(plane.start_block_id, plane.finish_block_id + 1):
+            block_id_plane_map.setdefault(block_id, plane)
+    return block_id_plane_map
+
+
+def _load_blocks(
+    blocks_json: list["UnicodePropertyGroupValues"], block_id_plane_map: dict[int, UnicodePlane]
+) -> list[UnicodeBlock]:
+    try:
+        blocks = [UnicodeBlock.model_validate(block) for block in blocks_json]
+    except ValidationError as ex:  # pragma: no cover
+        raise ValueError(f"Invalid block data: {ex}") from ex
+    for block in blocks:
+        block.plane = block_id_plane_map.get(block.id if block.id else 0, NULL_PLANE)
+    return blocks
+
+
+def _get_block_interval_index(blocks: list[UnicodeBlock]) -> tuple[tuple[int, ...], tuple[UnicodeBlock, ...]]:
+    sorted_blocks = tuple(sorted(blocks, key=lambda block: block.start_dec))
+    return (tuple(block.start_dec for block in sorted_blocks), sorted_blocks)
+
+
+def _get_loose_block_name_map(blocks: list[UnicodeBlock]) -> dict[str, int]:
+    block_name_map = {normalize_string_lm3(b.long_name): b.id for b in blocks if b.id}
+    block_name_map.update({normalize_string_lm3(b.short_name): b.id for b in blocks if b.id})
+    return block_name_map
+
+
+def _get_block_ids(blocks: list[UnicodeBlock], name_contains: str, exclude: str | None = None) -> frozenset[int]:
+    return frozenset(
+        b.id
+        for b in blocks
+        if b.id and name_contains in b.long_name.lower() and not (exclude and exclude in b.long_name.lower())
+    )
+
+
+def _get_all_characters_plane(total_defined: int) -> UnicodePlane:
+    return UnicodePlane(
+        number=-1,
+        name="All Unicode Characters",
+        abbreviation="ALL",
+        start="0000",
+        start_dec=0,
+        finish="10FFFF",
+        finish_dec=MAX_CODEPOINT,
+        start_block_id=1,
+        finish_block_id=327,
+        total_allocated=(MAX_CODEPOINT + 1),
+        total_defined=total_defined,
+    )
+
+
+def _get_all_characters_block(total_defined: int, all_characters_plane: UnicodePlane) -> UnicodeBlock:
+    block = UnicodeBlock(
+        id=0,
+        long_name="All Unicode Characters",
+        short_name="All",
+        plane_id=-1,
+        start_dec=0,
+        start="0000",
+        finish_dec=MAX_CODEPOINT,
+        finish="10FFFF",
+        total_allocated=(MAX_CODEPOINT + 1),
+        total_defined=total_defined,
+    )
+    block.plane = all_characters_plane
+    return block
+
+
+def _get_approximate_size(obj: Any) -> int:
+    # Includes the size of the container and each of its keys/items, but not objects nested any deeper
+    if isinstance(obj, NameSearchIndex):
+        arrays = [obj.char_counts, obj.token_lengths, *obj.token_positions.values()]
+        return _get_approximate_size(obj.keys) + _get_approximate_size(obj.names) + sum(a.nbytes for a in arrays)
+    if isinstance(obj, PackedUnicodeData):
+        maps = [obj.non_unihan_character_name_map, obj.unihan_character_block_map, obj.tangut_character_block_map]
+        return sum(m.nbytes for m in maps) + obj.all_defined_codepoints.nbytes
+    size = sys.getsizeof(obj)
+    if isinstance(obj, Mapping):
+        size += sum(sys.getsizeof(k) + sys.getsizeof(v) for (k, v) in obj.items())  # type: ignore[reportUnknownVariableType]
+    elif isinstance(obj, list | tuple | set | frozenset):
+        size += sum(sys.getsizeof(item) for item in obj)  # type: ignore[reportUnknownVariableType]
+    return size
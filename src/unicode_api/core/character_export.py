@@ -0,0 +1,85 @@
+"""
+This module encodes the details of Unicode characters as newline-delimited JSON (NDJSON) or CSV, for exporting
+the character database in bulk.
+
+The character details are produced in batches by `DBSession.stream_character_properties`, and each batch is
+encoded as soon as it is received, so an export of every character never holds more than one batch of characters
+(and one encoded chunk) in memory. Each character is serialized with the same keys and values as the API
+responses for the `UnicodeCharacterResponse` model.
+
+Functions:
+    encode_characters(batches, export_format, show_props) -> Iterator[bytes]:
+        Encodes batches of character details in the requested format.
+    get_csv_field_names(show_props) -> list[str]:
+        Returns the CSV column names for the requested property groups.
+"""
+
+import csv
+import io
+from collections.abc import Iterable, Iterator
+from typing import Any
+
+import orjson
+
+import unicode_api.db.models as db
+from unicode_api.db.procs.get_char_details import get_property_names
+from unicode_api.enums.export_format import ExportFormat
+from unicode_api.models.response_serializer import ResponseSerializer
+
+CHARACTER_SERIALIZER = ResponseSerializer(db.UnicodeCharacterResponse)
+
+
+def encode_characters(
+    batches: Iterable[list[dict[str, Any]]], export_format: ExportFormat, show_props: list[db.CharPropertyGroup]
+) -> Iterator[bytes]:
+    """
+    Encodes batches of character details in the requested format, yielding one chunk of bytes per batch.
+
+    Args:
+        batches (Iterable[list[dict[str, Any]]]): Batches of character details, in the format returned by
+            `DBSession.stream_character_properties`.
+        export_format (ExportFormat): The output format (NDJSON or CSV).
+        show_props (list[db.CharPropertyGroup]): The property groups that were requested, used to determine
+            the columns of the CSV header.
+
+    Returns:
+        Iterator[bytes]: The encoded characters. For CSV output, the first chunk contains the header row.
+    """
+    if export_format == ExportFormat.CSV:
+        return _encode_csv(batches, get_csv_field_names(show_props))
+    return _encode_ndjson(batches)
+
+
+def get_csv_field_names(show_props: list[db.CharPropertyGroup]) -> list[str]:
+    # Columns are listed in the same order as the keys in a character details response
+    prop_names = get_property_names(show_props)
+    return [alias for (name, alias, _) in CHARACTER_SERIALIZER.fields if name in prop_names]
+
+
+def _encode_ndjson(batches: Iterable[list[dict[str, Any]]]) -> Iterator[bytes]:
+    for batch in batches:
+        yield b"".join(orjson.dumps(CHARACTER_SERIALIZER.serialize(char)) + b"\n" for char in batch)
+
+
+def _encode_csv(batches: Iterable[list[dict[str, Any]]], field_names: list[str]) -> Iterator[bytes]:
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, field_names, extrasaction="ignore")
+    writer.writeheader()
+    yield _flush(buffer)
+    for batch in batches:
+        writer.writerows(_get_csv_row(CHARACTER_SERIALIZER.serialize(char)) for char in batch)
+        yield _flush(buffer)
+
+
+def _get_csv_row(char: dict[str, Any]) -> dict[str, Any]:
+    # Lists and nested objects are stored in a single column as JSON
+    return {
+        key: orjson.dumps(value).decode() if isinstance(value, list | dict) else value for (key, value) in char.items()
+    }
+
+
+def _flush(buffer: io.StringIO) -> bytes:
+    chunk = buffer.getvalue().encode()
+    buffer.seek(0)
+    buffer.truncate()
+    return chunk
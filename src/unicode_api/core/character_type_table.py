@@ -0,0 +1,108 @@
+"""
+This module provides a compact lookup table that stores the CharacterType of every codepoint in the Unicode
+codespace, allowing a codepoint to be classified with a single indexed read.
+
+The table contains one byte per codepoint (0x110000 bytes in total), preceded by a short header that identifies
+the file format. The value of each byte is the integer value of the codepoint's CharacterType. When the table
+has been saved to disk it is loaded with `mmap`, so the operating system can share the pages between all API
+worker processes instead of each worker holding its own copy.
+
+Functions:
+    build_character_type_table(...) -> bytearray:
+        Builds the table from the codepoint sets and block data for a version of Unicode.
+    save_character_type_table(table: CharacterTypeTable, table_file: Path) -> None:
+        Writes the table (with header) to disk.
+    load_character_type_table(table_file: Path) -> mmap | None:
+        Memory-maps a table previously written by `save_character_type_table`.
+    get_character_type_from_table(table: CharacterTypeTable, codepoint: int) -> CharacterType:
+        Returns the CharacterType for a codepoint.
+"""
+
+import mmap
+from collections.abc import Iterable
+from pathlib import Path
+
+from unicode_api.constants import MAX_CODEPOINT, NON_CHARACTER_CODEPOINTS
+from unicode_api.enums.character_type import CharacterType
+from unicode_api.models.block import UnicodeBlock
+
+CHARACTER_TYPE_TABLE_HEADER = b"UCTYPE01"
+CHARACTER_TYPE_TABLE_SIZE = len(CHARACTER_TYPE_TABLE_HEADER) + MAX_CODEPOINT + 1
+
+CHARACTER_TYPE_VALUE_MAP = {char_type.value: char_type for char_type in CharacterType}
+
+type CharacterTypeTable = bytearray | mmap.mmap
+
+
+def build_character_type_table(
+    blocks: Iterable[UnicodeBlock],
+    surrogate_block_ids: Iterable[int],
+    private_use_block_ids: Iterable[int],
+    non_unihan_codepoints: Iterable[int],
+    unihan_codepoints: Iterable[int],
+    tangut_codepoints: Iterable[int],
+) -> bytearray:
+    """
+    Builds a table containing the CharacterType of every codepoint in the Unicode codespace.
+
+    Character types are applied from lowest to highest precedence (i.e., if a codepoint belongs to more than
+    one category, the category checked first by `UnicodeDataCache.get_character_type` is the one stored in
+    the table).
+
+    Args:
+        blocks (Iterable[UnicodeBlock]): All blocks defined in this version of Unicode.
+        surrogate_block_ids (Iterable[int]): IDs of all blocks containing surrogate codepoints.
+        private_use_block_ids (Iterable[int]): IDs of all blocks containing private use codepoints.
+        non_unihan_codepoints (Iterable[int]): Codepoints of all non-Unihan characters.
+        unihan_codepoints (Iterable[int]): Codepoints of all Unihan characters.
+        tangut_codepoints (Iterable[int]): Codepoints of all Tangut ideographs and components.
+
+    Returns:
+        bytearray: The table (with header), one byte per codepoint.
+    """
+    table = bytearray(CHARACTER_TYPE_TABLE_HEADER) + bytearray([CharacterType.RESERVED]) * (MAX_CODEPOINT + 1)
+    block_id_map = {block.id: block for block in blocks if block.id}
+    _set_block_ranges(table, block_id_map, private_use_block_ids, CharacterType.PRIVATE_USE)
+    _set_block_ranges(table, block_id_map, surrogate_block_ids, CharacterType.SURROGATE)
+    _set_codepoints(table, NON_CHARACTER_CODEPOINTS, CharacterType.NONCHARACTER)
+    _set_codepoints(table, tangut_codepoints, CharacterType.TANGUT)
+    _set_codepoints(table, unihan_codepoints, CharacterType.UNIHAN)
+    _set_codepoints(table, non_unihan_codepoints, CharacterType.NON_UNIHAN)
+    return table
+
+
+def save_character_type_table(table: CharacterTypeTable, table_file: Path) -> None:
+    table_file.write_bytes(table)
+
+
+def load_character_type_table(table_file: Path) -> mmap.mmap | None:
+    if not table_file.exists() or table_file.stat().st_size != CHARACTER_TYPE_TABLE_SIZE:
+        return None
+    with table_file.open("rb") as f:
+        table = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    if table[: len(CHARACTER_TYPE_TABLE_HEADER)] != CHARACTER_TYPE_TABLE_HEADER:  # pragma: no cover
+        table.close()
+        return None
+    return table
+
+
+def get_character_type_from_table(table: CharacterTypeTable, codepoint: int) -> CharacterType:
+    if codepoint < 0 or codepoint > MAX_CODEPOINT:
+        return CharacterType.INVALID
+    return CHARACTER_TYPE_VALUE_MAP[table[len(CHARACTER_TYPE_TABLE_HEADER) + codepoint]]
+
+
+def _set_block_ranges(
+    table: bytearray, block_id_map: dict[int, UnicodeBlock], block_ids: Iterable[int], char_type: CharacterType
+) -> None:
+    offset = len(CHARACTER_TYPE_TABLE_HEADER)
+    for block_id in block_ids:
+        if block := block_id_map.get(block_id):
+            total = block.finish_dec - block.start_dec + 1
+            table[offset + block.start_dec : offset + block.finish_dec + 1] = bytes([char_type]) * total
+
+
+def _set_codepoints(table: bytearray, codepoints: Iterable[int], char_type: CharacterType) -> None:
+    offset = len(CHARACTER_TYPE_TABLE_HEADER)
+    for codepoint in codepoints:
+        table[offset + codepoint] = char_type
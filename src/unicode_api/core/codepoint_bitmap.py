@@ -0,0 +1,255 @@
+"""
+This module provides a compressed bitmap of codepoints, used to store the posting list (the set of characters) for
+every filterable property value.
+
+The design follows Roaring bitmaps: the codespace is divided into 65,536-codepoint chunks (one per plane), and
+the codepoints in each chunk are stored in a container chosen by the number of codepoints in the chunk. Sparse
+chunks (4,096 codepoints or fewer) are stored as a sorted `array` of 16-bit offsets, dense chunks are stored as a
+65,536-bit integer. Unions and intersections are computed container by container, and the number of codepoints
+in each container is stored alongside it, so the cardinality of a bitmap (and the codepoint at any position) is
+available without decoding the whole bitmap.
+
+Classes:
+    CodepointBitmap:
+        Immutable, sorted set of codepoints stored as a compressed bitmap.
+"""
+
+import sys
+from array import array
+from bisect import bisect_right
+from collections.abc import Iterable, Iterator, Sequence
+from itertools import accumulate
+from typing import overload
+
+CHUNK_BITS = 16
+CHUNK_SIZE = 1 << CHUNK_BITS
+CHUNK_MASK = CHUNK_SIZE - 1
+CHUNK_BYTES = CHUNK_SIZE // 8
+ARRAY_CONTAINER_MAX_SIZE = 4096
+
+ARRAY_CONTAINER = 0
+BITMAP_CONTAINER = 1
+
+BYTE_BIT_POSITIONS = [tuple(bit for bit in range(8) if byte & (1 << bit)) for byte in range(256)]
+
+type Container = array[int] | int
+
+
+class CodepointBitmap(Sequence[int]):
+    """
+    Immutable, sorted set of codepoints stored as a compressed bitmap.
+
+    Supports `len()`, iteration (in ascending order), indexing/slicing by position, `in`, and the `|` (union) and
+    `&` (intersection) operators.
+    """
+
+    __slots__ = ("_cardinalities", "_containers", "_keys", "_offsets")
+
+    def __init__(self, containers: dict[int, Container] | None = None):
+        containers = {key: c for (key, c) in sorted((containers or {}).items()) if _get_cardinality(c)}
+        self._keys: tuple[int, ...] = tuple(containers.keys())
+        self._containers: tuple[Container, ...] = tuple(containers.values())
+        self._cardinalities: tuple[int, ...] = tuple(_get_cardinality(c) for c in self._containers)
+        self._offsets: tuple[int, ...] = tuple(accumulate(self._cardinalities, initial=0))
+
+    @classmethod
+    def from_codepoints(cls, codepoints: Iterable[int]) -> "CodepointBitmap":
+        chunks: dict[int, set[int]] = {}
+        for codepoint in codepoints:
+            chunks.setdefault(codepoint >> CHUNK_BITS, set()).add(codepoint & CHUNK_MASK)
+        return cls({key: _normalize(array("H", sorted(offsets))) for (key, offsets) in chunks.items()})
+
+    @classmethod
+    def union(cls, bitmaps: Iterable["CodepointBitmap"]) -> "CodepointBitmap":
+        chunks: dict[int, list[Container]] = {}
+        for bitmap in bitmaps:
+            for key, container in zip(bitmap._keys, bitmap._containers, strict=True):
+                chunks.setdefault(key, []).append(container)
+        return cls({key: _union_containers(containers) for (key, containers) in chunks.items()})
+
+    @classmethod
+    def intersection(cls, bitmaps: Iterable["CodepointBitmap"]) -> "CodepointBitmap":
+        # Intersecting the smallest bitmaps first keeps the intermediate results as small as possible
+        (first, *others) = sorted(bitmaps, key=len)
+        result = first
+        for bitmap in others:
+            if not result:
+                break
+            result = result & bitmap
+        return result
+
+    def __len__(self) -> int:
+        return self._offsets[-1]
+
+    def __iter__(self) -> Iterator[int]:
+        for key, container in zip(self._keys, self._containers, strict=True):
+            base = key << CHUNK_BITS
+            yield from (base + offset for offset in _get_offsets(container))
+
+    def __contains__(self, codepoint: object) -> bool:
+        if not isinstance(codepoint, int):
+            return False
+        index = bisect_right(self._keys, codepoint >> CHUNK_BITS) - 1
+        if index < 0 or self._keys[index] != codepoint >> CHUNK_BITS:
+            return False
+        container = self._containers[index]
+        offset = codepoint & CHUNK_MASK
+        if isinstance(container, int):
+            return bool((container >> offset) & 1)
+        position = bisect_right(container, offset) - 1
+        return position >= 0 and container[position] == offset
+
+    @overload
+    def __getitem__(self, index: int) -> int: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[int]: ...
+
+    def __getitem__(self, index: int | slice) -> int | list[int]:
+        if isinstance(index, slice):
+            (start, stop, step) = index.indices(len(self))
+            if step != 1:
+                return list(self)[index]
+            return self._get_range(start, stop)
+        if index < 0:
+            index += len(self)
+        if index < 0 or index >= len(self):
+            raise IndexError("CodepointBitmap index out of range")
+        return self._get_range(index, index + 1)[0]
+
+    def __or__(self, other: "CodepointBitmap") -> "CodepointBitmap":
+        return CodepointBitmap.union([self, other])
+
+    def __and__(self, other: "CodepointBitmap") -> "CodepointBitmap":
+        other_map = dict(zip(other._keys, other._containers, strict=True))
+        return CodepointBitmap(
+            {
+                key: _intersect_containers(container, other_map[key])
+                for (key, container) in zip(self._keys, self._containers, strict=True)
+                if key in other_map
+            }
+        )
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, CodepointBitmap):
+            return NotImplemented
+        return self._keys == other._keys and all(
+            _get_offsets(a) == _get_offsets(b) for (a, b) in zip(self._containers, other._containers, strict=True)
+        )
+
+    def __hash__(self) -> int:
+        return hash((self._keys, self._cardinalities))
+
+    def __repr__(self) -> str:
+        return f"CodepointBitmap(cardinality={len(self)}, containers={len(self._containers)})"
+
+    def to_bytes(self) -> bytes:
+        """
+        Serializes the bitmap. Each container is written as its key (1 byte), type (1 byte) and cardinality
+        (4 bytes, little-endian), followed by the sorted offsets (2 bytes each) or the 65,536-bit bitmap.
+        """
+        data = bytearray()
+        for key, container, cardinality in zip(self._keys, self._containers, self._cardinalities, strict=True):
+            kind = BITMAP_CONTAINER if isinstance(container, int) else ARRAY_CONTAINER
+            data += bytes([key, kind]) + cardinality.to_bytes(4, "little")
+            data += container.to_bytes(CHUNK_BYTES, "little") if isinstance(container, int) else _to_le_bytes(container)
+        return bytes(data)
+
+    @classmethod
+    def from_bytes(cls, data: bytes | memoryview) -> "CodepointBitmap":
+        containers: dict[int, Container] = {}
+        position = 0
+        while position < len(data):
+            (key, kind) = (data[position], data[position + 1])
+            cardinality = int.from_bytes(data[position + 2 : position + 6], "little")
+            position += 6
+            if kind == BITMAP_CONTAINER:
+                containers[key] = int.from_bytes(data[position : position + CHUNK_BYTES], "little")
+                position += CHUNK_BYTES
+            else:
+                containers[key] = _from_le_bytes(data[position : position + 2 * cardinality])
+                position += 2 * cardinality
+        return cls(containers)
+
+    def _get_range(self, start: int, stop: int) -> list[int]:
+        codepoints: list[int] = []
+        index = max(bisect_right(self._offsets, start) - 1, 0)
+        while start < stop and index < len(self._containers):
+            base = self._keys[index] << CHUNK_BITS
+            container_start = self._offsets[index]
+            container = self._containers[index]
+            (first, last) = (start - container_start, min(stop, self._offsets[index + 1]) - container_start)
+            offsets = container[first:last] if isinstance(container, array) else _get_offsets(container)[first:last]
+            codepoints.extend(base + offset for offset in offsets)
+            start = self._offsets[index + 1]
+            index += 1
+        return codepoints
+
+
+def _get_cardinality(container: Container) -> int:
+    return container.bit_count() if isinstance(container, int) else len(container)
+
+
+def _get_offsets(container: Container) -> list[int]:
+    if isinstance(container, array):
+        return container.tolist()
+    offsets: list[int] = []
+    for byte_index, byte in enumerate(container.to_bytes(CHUNK_BYTES, "little")):
+        if byte:
+            base = byte_index * 8
+            offsets.extend(base + bit for bit in BYTE_BIT_POSITIONS[byte])
+    return offsets
+
+
+def _to_bitmap(container: Container) -> int:
+    if isinstance(container, int):
+        return container
+    bits = bytearray(CHUNK_BYTES)
+    for offset in container:
+        bits[offset >> 3] |= 1 << (offset & 7)
+    return int.from_bytes(bits, "little")
+
+
+def _normalize(container: Container) -> Container:
+    cardinality = _get_cardinality(container)
+    if isinstance(container, int) and cardinality <= ARRAY_CONTAINER_MAX_SIZE:
+        return array("H", _get_offsets(container))
+    if isinstance(container, array) and cardinality > ARRAY_CONTAINER_MAX_SIZE:
+        return _to_bitmap(container)
+    return container
+
+
+def _union_containers(containers: list[Container]) -> Container:
+    if len(containers) == 1:
+        return containers[0]
+    if all(isinstance(c, array) for c in containers) and sum(map(len, containers)) <= ARRAY_CONTAINER_MAX_SIZE:
+        return array("H", sorted(set().union(*containers)))
+    bitmap = 0
+    for container in containers:
+        bitmap |= _to_bitmap(container)
+    return _normalize(bitmap)
+
+
+def _intersect_containers(a: Container, b: Container) -> Container:
+    if isinstance(a, int) and isinstance(b, int):
+        return _normalize(a & b)
+    if isinstance(a, array) and isinstance(b, array):
+        return array("H", sorted(set(a).intersection(b)))
+    (offsets, bitmap) = (a, b) if isinstance(a, array) else (b, a)
+    bits = _to_bitmap(bitmap).to_bytes(CHUNK_BYTES, "little")
+    return array("H", [offset for offset in offsets if bits[offset >> 3] & (1 << (offset & 7))])
+
+
+def _to_le_bytes(offsets: array[int]) -> bytes:
+    if sys.byteorder == "big":  # pragma: no cover
+        offsets = array("H", offsets)
+        offsets.byteswap()
+    return offsets.tobytes()
+
+
+def _from_le_bytes(data: bytes | memoryview) -> array[int]:
+    offsets = array("H")
+    offsets.frombytes(data)
+    if sys.byteorder == "big":  # pragma: no cover
+        offsets.byteswap()
+    return offsets
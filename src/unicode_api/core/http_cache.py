@@ -0,0 +1,54 @@
+"""
+This module provides the validators used to answer conditional GET requests for API responses.
+
+Every response returned by the API endpoints is a pure function of the version of Unicode and the request URL.
+Because of this, a strong ETag can be derived from the Unicode version, the request path and the (sorted) query
+parameters without rendering the response body, allowing a request with a matching `If-None-Match` header to be
+answered with 304 Not Modified before the endpoint runs.
+
+Functions:
+    get_canonical_request(path: str, query_params: Iterable[tuple[str, str]]) -> str:
+        Returns a canonical representation of a request's path and query parameters.
+    get_etag(path: str, query_params: Iterable[tuple[str, str]]) -> str | None:
+        Returns the ETag for a request, or None if the requested path is not an API endpoint.
+    etag_matches(if_none_match: str | None, etag: str) -> bool:
+        Returns True if the value of an `If-None-Match` header matches an ETag.
+
+Constants:
+    CACHE_CONTROL_MAX_AGE:
+        Amount of time clients and CDNs may reuse a response without revalidating it.
+    CACHE_CONTROL_HEADER:
+        Value of the `Cache-Control` header sent with all API responses that include an ETag.
+"""
+
+import hashlib
+from collections.abc import Iterable
+from datetime import timedelta
+
+from unicode_api.core.cache import cached_data
+
+CACHE_CONTROL_MAX_AGE = timedelta(days=1)
+CACHE_CONTROL_HEADER = f"public, max-age={int(CACHE_CONTROL_MAX_AGE.total_seconds())}"
+
+
+def get_canonical_request(path: str, query_params: Iterable[tuple[str, str]]) -> str:
+    # Query parameters are sorted so that requests which only differ in parameter order are treated as equal
+    return f"{path}?{'&'.join(f'{k}={v}' for (k, v) in sorted(query_params))}"
+
+
+def get_etag(path: str, query_params: Iterable[tuple[str, str]]) -> str | None:
+    (route, _) = cached_data.get_api_route_from_requested_path(path)
+    if not route["name"]:
+        return None
+    canonical_request = get_canonical_request(path, query_params)
+    digest = hashlib.sha256(f"{cached_data.unicode_version}:{canonical_request}".encode()).hexdigest()
+    return f'"{digest[:32]}"'
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    # If-None-Match uses the weak comparison function (RFC 9110, section 13.1.2), so a W/ prefix is ignored
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    return any(tag.strip().removeprefix("W/") == etag for tag in if_none_match.split(","))
@@ -0,0 +1,159 @@
+"""
+This module provides the index used to fuzzy-search character and block names.
+
+Names are normalized (lowercased) once when the index is built and stored in a flat list, with a parallel
+tuple holding the key (codepoint or block ID) of each name, sorted by key.
+
+Before any name is scored, the names that cannot possibly reach the cutoff are removed from the search. Every
+ratio computed by `WRatio` compares a string built from the characters of the query with a string built from
+the characters of the name, and none of these strings is shorter than the distinct tokens of the query/name
+joined with spaces. Unless the query and the name have a token in common (which makes `partial_token_ratio`
+return 100), the score is therefore bounded by the number of characters the query and the name have in common
+(counted with multiplicity) and the length of their distinct tokens:
+
+    max(100 * 2 * common / (query_tokens + name_tokens), 90 * 2 * c / (shortest + c))
+
+where `shortest = min(query_tokens, name_tokens)` and `c = min(common, shortest)`. The character counts of every
+name are stored in a numpy array (one row per character in the index), so the bound is computed for every name
+with a handful of vectorized operations. Only the names with a bound >= the cutoff or a token in common with the
+query are scored with `rapidfuzz.process.cdist` in the calling thread (each search runs inside a request, so
+spreading it across every CPU core would oversubscribe the CPU when requests are handled concurrently), and
+the names meeting the cutoff are selected and ranked with numpy, so no Python object is created for a name
+unless it is part of the results.
+
+The ranking is identical to calling `process.extract` with the default `WRatio` scorer on a dict of
+key -> lowercased name (sorted by key): results are ordered by score (highest first), and results with equal
+scores are ordered by key. Since the score of any single name can be recomputed with `get_score`, a position in
+the ranked results can be found with a binary search on (score, key) instead of a linear scan.
+
+Classes:
+    NameSearchIndex:
+        Immutable fuzzy-search index of lowercased names.
+"""
+
+from bisect import bisect_left
+from collections import defaultdict
+from collections.abc import Iterable
+
+import numpy as np
+from numpy.typing import NDArray
+from rapidfuzz import fuzz, process
+
+
+class NameSearchIndex:
+    """
+    Immutable fuzzy-search index of lowercased names.
+
+    Attributes:
+        keys (tuple[int, ...]): The key (codepoint or block ID) of each name in the index, sorted in ascending
+            order.
+        names (list[str]): The lowercased names, in the same order as `keys`.
+        char_rows (dict[str, int]): Maps each character found in any name to its row in `char_counts`.
+        char_counts (NDArray[np.uint16]): The number of times each character occurs in each name (one row per
+            character, one column per name).
+        token_lengths (NDArray[np.int64]): The length of the distinct tokens of each name joined with spaces.
+        token_positions (dict[str, NDArray[np.intp]]): Maps each token to the positions of the names containing it.
+    """
+
+    __slots__ = ("keys", "names", "char_rows", "char_counts", "token_lengths", "token_positions")
+
+    def __init__(self, items: Iterable[tuple[int, str]]):
+        key_name_map = dict(sorted(dict(items).items()))
+        self.keys: tuple[int, ...] = tuple(key_name_map.keys())
+        self.names: list[str] = [name.lower() for name in key_name_map.values()]
+        (self.char_rows, self.char_counts) = _count_characters(self.names)
+        self.token_lengths = np.fromiter(
+            (_get_token_length(name) for name in self.names), dtype=np.int64, count=len(self.names)
+        )
+        token_positions: defaultdict[str, list[int]] = defaultdict(list)
+        for position, name in enumerate(self.names):
+            for token in set(name.split()):
+                token_positions[token].append(position)
+        self.token_positions = {token: np.array(positions) for (token, positions) in token_positions.items()}
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def search(self, query: str, score_cutoff: float, limit: int | None = None) -> list[tuple[int, float]]:
+        """
+        Fuzzy-searches the index for names similar to the query.
+
+        Args:
+            query (str): The search term. Case is ignored.
+            score_cutoff (float): The minimum similarity score (0-100) a name must have to be included.
+            limit (int | None, optional): The maximum number of results to return. Defaults to None (return
+                all names with a score >= score_cutoff).
+
+        Returns:
+            list[tuple[int, float]]: (key, score) for each matching name, sorted by score (highest first).
+        """
+        query = query.lower()
+        candidates = self._get_candidates(query, score_cutoff)
+        scores = process.cdist(
+            [query],
+            self.names if candidates is None else [self.names[position] for position in candidates.tolist()],
+            scorer=fuzz.WRatio,
+            processor=None,
+            score_cutoff=score_cutoff,
+            dtype=np.float64,
+            workers=1,
+        )[0]
+        matches = np.flatnonzero(scores >= score_cutoff)
+        (positions, scores) = (matches if candidates is None else candidates[matches], scores[matches])
+        ranked = np.lexsort((positions, -scores))[:limit]
+        return [
+            (self.keys[position], score)
+            for (position, score) in zip(positions[ranked].tolist(), scores[ranked].tolist())
+        ]
+
+    def _get_candidates(self, query: str, score_cutoff: float) -> NDArray[np.intp] | None:
+        # Returns the positions of the names that can reach the cutoff score, or None if every name must be scored.
+        # The bound relies on the query being split into tokens the same way by rapidfuzz and str.split, which is
+        # only guaranteed when the only whitespace character in the query is a space
+        if score_cutoff <= 0 or not query or not (query.isascii() and query.isprintable()):
+            return None
+        common = np.zeros(len(self.names), dtype=np.int64)
+        for char in set(query):
+            if (row := self.char_rows.get(char)) is not None:
+                common += np.minimum(self.char_counts[row], query.count(char))
+        query_length = _get_token_length(query)
+        shortest = np.minimum(self.token_lengths, query_length)
+        common_shortest = np.minimum(common, shortest)
+        ratio_bound = 200 * common / np.maximum(self.token_lengths + query_length, 1)
+        partial_ratio_bound = 180 * common_shortest / np.maximum(shortest + common_shortest, 1)
+        # A small tolerance keeps names whose score equals the bound, even if it is rounded differently by rapidfuzz
+        is_candidate = np.maximum(ratio_bound, partial_ratio_bound) >= score_cutoff - 1e-6
+        for token in set(query.split()):
+            if (positions := self.token_positions.get(token)) is not None:
+                is_candidate[positions] = True
+        return np.flatnonzero(is_candidate)
+
+    def get_score(self, query: str, key: int) -> float | None:
+        """
+        Returns the similarity score of the name with the given key, computed exactly as it is by `search`.
+
+        Args:
+            query (str): The search term. Case is ignored.
+            key (int): The key (codepoint or block ID) of the name.
+
+        Returns:
+            float | None: The similarity score (0-100), or None if the index does not contain the key.
+        """
+        index = bisect_left(self.keys, key)
+        if index == len(self.keys) or self.keys[index] != key:
+            return None
+        return fuzz.WRatio(query.lower(), self.names[index], processor=None)
+
+
+def _count_characters(names: list[str]) -> tuple[dict[str, int], NDArray[np.uint16]]:
+    lengths = np.fromiter((len(name) for name in names), dtype=np.int64, count=len(names))
+    codes = np.frombuffer("".join(names).encode("utf-32-le"), dtype=np.uint32)
+    (chars, rows) = np.unique(codes, return_inverse=True)
+    columns = np.repeat(np.arange(len(names)), lengths)
+    counts = np.bincount(rows * len(names) + columns, minlength=len(chars) * len(names))
+    char_rows = {chr(code): row for (row, code) in enumerate(chars.tolist())}
+    return (char_rows, counts.reshape(len(chars), len(names)).astype(np.uint16))
+
+
+def _get_token_length(name: str) -> int:
+    return len(" ".join(set(name.split())))
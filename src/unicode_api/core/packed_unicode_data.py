@@ -0,0 +1,395 @@
+"""
+This module provides a compact, versioned binary format for the Unicode data that is loaded by the API at startup
+(i.e., the contents of prop_values.json, planes.json, blocks.json, char_name_map.json, unihan_chars.json and
+tangut_chars.json).
+
+Codepoints are stored in sorted arrays of unsigned 32-bit integers, and character names are stored in a packed
+table of UTF-8 strings with a parallel array containing the offset of each string. Planes and blocks are stored as
+fixed-size records (the string fields of each record are indexes into a second string table). Lookups perform a
+binary search directly on the arrays, so nothing needs to be parsed or converted when the data is loaded. When
+the data has been saved to disk it is loaded with `mmap`, so the operating system can share the pages between all
+API worker processes instead of each worker holding its own copy.
+
+File layout: header (8 bytes), byte order mark (4 bytes), number of sections (4 bytes), the offset and length of
+each section (8 bytes each), followed by the sections (each aligned to an 8-byte boundary).
+
+Classes:
+    PackedStringTable:
+        Immutable sequence of strings, decoded from a packed table of UTF-8 strings when accessed.
+    CodepointSet:
+        Immutable set of codepoints backed by a sorted array.
+    CodepointMap:
+        Immutable mapping of codepoints to values, backed by a sorted array of codepoints and a table of values.
+    PackedUnicodeData:
+        The Unicode data contained in a packed buffer.
+
+Functions:
+    pack_unicode_data(...) -> bytes:
+        Packs the parsed Unicode data into the binary format.
+    save_packed_unicode_data(data: bytes, data_file: Path) -> None:
+        Writes packed Unicode data to disk.
+    load_packed_unicode_data(data_file: Path) -> PackedUnicodeData | None:
+        Memory-maps a file previously written by `save_packed_unicode_data`.
+"""
+
+import json
+import mmap
+import struct
+from array import array
+from bisect import bisect_left
+from collections.abc import Buffer, Iterable, Iterator, Mapping, Sequence
+from collections.abc import Set as AbstractSet
+from dataclasses import dataclass
+from enum import IntEnum
+from itertools import batched, pairwise
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Protocol
+
+if TYPE_CHECKING:  # pragma: no cover
+    from unicode_api.custom_types import UnicodePropertyGroupMap
+
+PACKED_UNICODE_DATA_HEADER = b"UCDATA01"
+BYTE_ORDER_MARK = 0x01020304
+SECTION_ALIGNMENT = 8
+
+# The fields of each plane and block record, in the same order as the fields in planes.json and blocks.json
+PLANE_RECORD_FIELDS: tuple[tuple[str, type], ...] = (
+    ("number", int),
+    ("name", str),
+    ("abbreviation", str),
+    ("start", str),
+    ("finish", str),
+    ("total_allocated", int),
+    ("total_defined", int),
+    ("id", int),
+    ("start_dec", int),
+    ("finish_dec", int),
+    ("start_block_id", int),
+    ("finish_block_id", int),
+)
+BLOCK_RECORD_FIELDS: tuple[tuple[str, type], ...] = (
+    ("id", int),
+    ("long_name", str),
+    ("short_name", str),
+    ("start", str),
+    ("finish", str),
+    ("start_dec", int),
+    ("finish_dec", int),
+    ("total_allocated", int),
+    ("total_defined", int),
+    ("plane_id", int),
+)
+
+
+class Section(IntEnum):
+    PROPERTY_VALUES = 0
+    RECORD_STRING_OFFSETS = 1
+    RECORD_STRINGS = 2
+    PLANES = 3
+    BLOCKS = 4
+    NON_UNIHAN_CODEPOINTS = 5
+    NON_UNIHAN_NAME_OFFSETS = 6
+    NON_UNIHAN_NAMES = 7
+    UNIHAN_CODEPOINTS = 8
+    UNIHAN_BLOCK_IDS = 9
+    TANGUT_CODEPOINTS = 10
+    TANGUT_BLOCK_IDS = 11
+    ALL_DEFINED_CODEPOINTS = 12
+
+
+SECTION_TABLE = struct.Struct(f"={len(Section) * 2}Q")
+FILE_HEADER_SIZE = len(PACKED_UNICODE_DATA_HEADER) + 8 + SECTION_TABLE.size
+
+
+class _ValueTable[T](Protocol):
+    def __len__(self) -> int: ...
+    def __iter__(self) -> Iterator[T]: ...
+    def __getitem__(self, index: int, /) -> T: ...
+
+
+class PackedStringTable:
+    """
+    Immutable sequence of strings, decoded from a packed table of UTF-8 strings when accessed.
+
+    Attributes:
+        offsets (memoryview): The offset of each string in `strings`, followed by the total length of `strings`.
+        strings (memoryview): The UTF-8 encoded strings, concatenated without separators.
+    """
+
+    __slots__ = ("offsets", "strings")
+
+    def __init__(self, offsets: memoryview, strings: memoryview):
+        self.offsets = offsets
+        self.strings = strings
+
+    def __len__(self) -> int:
+        return len(self.offsets) - 1
+
+    def __getitem__(self, index: int) -> str:
+        return str(self.strings[self.offsets[index] : self.offsets[index + 1]], "utf-8")
+
+    def __iter__(self) -> Iterator[str]:
+        strings = str(self.strings, "utf-8")
+        if len(strings) == len(self.strings):
+            # If every string is ASCII (e.g., character names), byte offsets are the same as character offsets
+            return (strings[start:end] for (start, end) in pairwise(self.offsets))
+        return (self[index] for index in range(len(self)))
+
+
+class CodepointSet(AbstractSet[int]):
+    """
+    Immutable set of codepoints backed by a sorted array, membership is tested with a binary search.
+
+    Attributes:
+        codepoints (Sequence[int]): The codepoints in the set, sorted in ascending order.
+    """
+
+    __slots__ = ("codepoints",)
+
+    def __init__(self, codepoints: Sequence[int]):
+        self.codepoints = codepoints
+
+    @classmethod
+    def _from_iterable(cls, it: Iterable[int]) -> frozenset[int]:
+        # Set operations (e.g., union) produce a frozenset, since the result is not necessarily sorted
+        return frozenset(it)
+
+    @property
+    def nbytes(self) -> int:
+        return _get_nbytes(self.codepoints)
+
+    def __contains__(self, value: object) -> bool:
+        if not isinstance(value, int):
+            return False
+        index = bisect_left(self.codepoints, value)
+        return index < len(self.codepoints) and self.codepoints[index] == value
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(self.codepoints)
+
+    def __len__(self) -> int:
+        return len(self.codepoints)
+
+
+class CodepointMap[T](Mapping[int, T]):
+    """
+    Immutable mapping of codepoints to values, backed by a sorted array of codepoints and a table containing the
+    value for each codepoint (in the same order). Values are found with a binary search.
+
+    Attributes:
+        codepoints (Sequence[int]): The codepoints in the mapping, sorted in ascending order.
+        values (_ValueTable[T]): The value for each codepoint.
+    """
+
+    __slots__ = ("codepoints", "values")
+
+    def __init__(self, codepoints: Sequence[int], values: _ValueTable[T]):
+        self.codepoints = codepoints
+        self.values = values
+
+    @property
+    def codepoint_set(self) -> CodepointSet:
+        return CodepointSet(self.codepoints)
+
+    @property
+    def nbytes(self) -> int:
+        if isinstance(self.values, PackedStringTable):
+            return _get_nbytes(self.codepoints) + self.values.offsets.nbytes + self.values.strings.nbytes
+        return _get_nbytes(self.codepoints) + _get_nbytes(self.values)
+
+    def iter_items(self) -> Iterator[tuple[int, T]]:
+        # Faster than `items()`, which performs a binary search for each codepoint
+        return zip(self.codepoints, self.values, strict=True)
+
+    def __getitem__(self, codepoint: int) -> T:
+        index = bisect_left(self.codepoints, codepoint)
+        if index < len(self.codepoints) and self.codepoints[index] == codepoint:
+            return self.values[index]
+        raise KeyError(codepoint)
+
+    def __contains__(self, codepoint: object) -> bool:
+        return codepoint in self.codepoint_set
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(self.codepoints)
+
+    def __len__(self) -> int:
+        return len(self.codepoints)
+
+
+@dataclass(frozen=True, slots=True)
+class PackedUnicodeData:
+    property_value_id_map: "UnicodePropertyGroupMap"
+    planes: list[dict[str, Any]]
+    blocks: list[dict[str, Any]]
+    non_unihan_character_name_map: CodepointMap[str]
+    unihan_character_block_map: CodepointMap[int]
+    tangut_character_block_map: CodepointMap[int]
+    all_defined_codepoints: memoryview
+
+    @classmethod
+    def from_buffer(cls, buffer: Buffer) -> "PackedUnicodeData | None":
+        """
+        Reads the Unicode data in a buffer created by `pack_unicode_data`. The codepoint arrays and string tables
+        are not copied, they are accessed through views of the buffer.
+
+        Args:
+            buffer (Buffer): The packed Unicode data (e.g., bytes or a memory-mapped file).
+
+        Returns:
+            PackedUnicodeData | None: The Unicode data, or None if the buffer has an unexpected format, was created
+            by a different version of this module, or was created on a machine with a different byte order.
+        """
+        data = memoryview(buffer)
+        header_size = len(PACKED_UNICODE_DATA_HEADER)
+        if len(data) < FILE_HEADER_SIZE or data[:header_size] != PACKED_UNICODE_DATA_HEADER:
+            return None
+        (byte_order_mark, section_count) = struct.unpack_from("=II", data, header_size)
+        if byte_order_mark != BYTE_ORDER_MARK or section_count != len(Section):
+            return None
+        section_table = SECTION_TABLE.unpack_from(data, header_size + 8)
+        section_bounds = list(batched(section_table, 2))
+        if any(offset + length > len(data) for (offset, length) in section_bounds):
+            return None
+        sections = [data[offset : offset + length] for (offset, length) in section_bounds]
+
+        def get_array(section: Section, typecode: str = "I") -> memoryview:
+            return sections[section].cast("B").cast(typecode)
+
+        record_strings = PackedStringTable(get_array(Section.RECORD_STRING_OFFSETS), sections[Section.RECORD_STRINGS])
+        return cls(
+            property_value_id_map=json.loads(bytes(sections[Section.PROPERTY_VALUES])),
+            planes=_unpack_records(sections[Section.PLANES], PLANE_RECORD_FIELDS, record_strings),
+            blocks=_unpack_records(sections[Section.BLOCKS], BLOCK_RECORD_FIELDS, record_strings),
+            non_unihan_character_name_map=CodepointMap(
+                get_array(Section.NON_UNIHAN_CODEPOINTS),
+                PackedStringTable(get_array(Section.NON_UNIHAN_NAME_OFFSETS), sections[Section.NON_UNIHAN_NAMES]),
+            ),
+            unihan_character_block_map=CodepointMap(
+                get_array(Section.UNIHAN_CODEPOINTS), get_array(Section.UNIHAN_BLOCK_IDS)
+            ),
+            tangut_character_block_map=CodepointMap(
+                get_array(Section.TANGUT_CODEPOINTS), get_array(Section.TANGUT_BLOCK_IDS)
+            ),
+            all_defined_codepoints=get_array(Section.ALL_DEFINED_CODEPOINTS),
+        )
+
+
+def pack_unicode_data(
+    property_value_id_map: "UnicodePropertyGroupMap",
+    planes: Iterable[dict[str, Any]],
+    blocks: Iterable[dict[str, Any]],
+    non_unihan_character_name_map: Mapping[int, str],
+    unihan_character_block_map: Mapping[int, int],
+    tangut_character_block_map: Mapping[int, int],
+) -> bytes:
+    """
+    Packs the Unicode data loaded by the API into the binary format read by `PackedUnicodeData`.
+
+    Args:
+        property_value_id_map (UnicodePropertyGroupMap): The contents of prop_values.json.
+        planes (Iterable[dict[str, Any]]): The contents of planes.json.
+        blocks (Iterable[dict[str, Any]]): The contents of blocks.json.
+        non_unihan_character_name_map (Mapping[int, str]): The name of every non-Unihan character.
+        unihan_character_block_map (Mapping[int, int]): The block ID of every Unihan character.
+        tangut_character_block_map (Mapping[int, int]): The block ID of every Tangut character.
+
+    Returns:
+        bytes: The packed Unicode data (with header).
+    """
+    record_strings: dict[str, int] = {}
+    non_unihan_codepoints = sorted(non_unihan_character_name_map)
+    unihan_codepoints = sorted(unihan_character_block_map)
+    tangut_codepoints = sorted(tangut_character_block_map)
+    (name_offsets, names) = _pack_strings(non_unihan_character_name_map[cp] for cp in non_unihan_codepoints)
+    section_map: dict[Section, bytes] = {
+        Section.PROPERTY_VALUES: json.dumps(property_value_id_map, separators=(",", ":")).encode(),
+        Section.PLANES: _pack_records(planes, PLANE_RECORD_FIELDS, record_strings),
+        Section.BLOCKS: _pack_records(blocks, BLOCK_RECORD_FIELDS, record_strings),
+        Section.NON_UNIHAN_CODEPOINTS: array("I", non_unihan_codepoints).tobytes(),
+        Section.NON_UNIHAN_NAME_OFFSETS: name_offsets,
+        Section.NON_UNIHAN_NAMES: names,
+        Section.UNIHAN_CODEPOINTS: array("I", unihan_codepoints).tobytes(),
+        Section.UNIHAN_BLOCK_IDS: array("I", (unihan_character_block_map[cp] for cp in unihan_codepoints)).tobytes(),
+        Section.TANGUT_CODEPOINTS: array("I", tangut_codepoints).tobytes(),
+        Section.TANGUT_BLOCK_IDS: array("I", (tangut_character_block_map[cp] for cp in tangut_codepoints)).tobytes(),
+        Section.ALL_DEFINED_CODEPOINTS: array(
+            "I", sorted({*non_unihan_codepoints, *unihan_codepoints, *tangut_codepoints})
+        ).tobytes(),
+    }
+    (section_map[Section.RECORD_STRING_OFFSETS], section_map[Section.RECORD_STRINGS]) = _pack_strings(record_strings)
+
+    data = bytearray(FILE_HEADER_SIZE)
+    section_table: list[int] = []
+    for section in Section:
+        data += bytes(-len(data) % SECTION_ALIGNMENT)
+        section_table.extend([len(data), len(section_map[section])])
+        data += section_map[section]
+    header_size = len(PACKED_UNICODE_DATA_HEADER)
+    data[:header_size] = PACKED_UNICODE_DATA_HEADER
+    struct.pack_into("=II", data, header_size, BYTE_ORDER_MARK, len(Section))
+    SECTION_TABLE.pack_into(data, header_size + 8, *section_table)
+    return bytes(data)
+
+
+def save_packed_unicode_data(data: bytes, data_file: Path) -> None:
+    # The file is replaced rather than overwritten, since it may be memory-mapped by a running process
+    temp_file = data_file.with_suffix(".tmp")
+    temp_file.write_bytes(data)
+    temp_file.replace(data_file)
+
+
+def load_packed_unicode_data(data_file: Path) -> PackedUnicodeData | None:
+    if not data_file.exists() or data_file.stat().st_size < FILE_HEADER_SIZE:
+        return None
+    with data_file.open("rb") as f:
+        data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    return PackedUnicodeData.from_buffer(data)
+
+
+def _pack_strings(strings: Iterable[str]) -> tuple[bytes, bytes]:
+    offsets = array("I", [0])
+    packed = bytearray()
+    for string in strings:
+        packed += string.encode()
+        offsets.append(len(packed))
+    return (offsets.tobytes(), bytes(packed))
+
+
+def _get_record_struct(fields: tuple[tuple[str, type], ...]) -> struct.Struct:
+    return struct.Struct("=" + "".join("I" if field_type is str else "i" for (_, field_type) in fields))
+
+
+def _pack_records(
+    records: Iterable[dict[str, Any]],
+    fields: tuple[tuple[str, type], ...],
+    record_strings: dict[str, int],
+) -> bytes:
+    # String fields are stored as the index of the string in `record_strings`, which is added if not present
+    record_struct = _get_record_struct(fields)
+    return b"".join(
+        record_struct.pack(
+            *(
+                record_strings.setdefault(record[name], len(record_strings)) if field_type is str else record[name]
+                for (name, field_type) in fields
+            )
+        )
+        for record in records
+    )
+
+
+def _unpack_records(
+    data: memoryview, fields: tuple[tuple[str, type], ...], record_strings: PackedStringTable
+) -> list[dict[str, Any]]:
+    record_struct = _get_record_struct(fields)
+    return [
+        {
+            name: record_strings[value] if field_type is str else value
+            for ((name, field_type), value) in zip(fields, values, strict=True)
+        }
+        for values in record_struct.iter_unpack(data)
+    ]
+
+
+def _get_nbytes(values: Any) -> int:
+    return values.nbytes if isinstance(values, memoryview) else values.itemsize * len(values)
@@ -1,6 +1,12 @@
 """
 This module implements rate limiting functionality for an API using the Generic Cell Rate Algorithm (GCRA)
-with burst support. It leverages Redis as a backend for tracking request timestamps and managing locks.
+with burst support. It leverages Redis as a backend for tracking request timestamps.
+
+The rate limit decision for each request is made by a Lua script that runs on the Redis server, which reads the
+client's theoretical arrival time (TAT), compares it to the server time and stores the new TAT in a single
+atomic operation. Since the script is atomic, no lock is needed to handle concurrent requests from the same IP,
+and each request requires a single (non-blocking) round trip to the server. The TAT key expires when the TAT has
+passed, since an expired TAT has the same effect as a missing key.
 
 Classes:
     RateLimitDecision:
@@ -16,6 +22,9 @@ Constants:
     RATE_LIMIT_ROUTE_REGEX:
         A compiled regular expression used to determine if rate limiting applies to a specific route.
 
+    GCRA_LUA_SCRIPT:
+        The Lua script that applies the GCRA algorithm to a single request on the Redis server.
+
     rate_limit:
         An instance of the RateLimit class initialized with a Redis client.
 """
@@ -27,7 +36,8 @@ from dataclasses import dataclass, field
 from datetime import timedelta
 
 from fastapi import Request
-from redis.exceptions import LockError
+from redis.commands.core import AsyncScript
+from redis.exceptions import RedisError
 
 from unicode_api.config.api_settings import get_settings
 from unicode_api.core.redis_client import IRedisClient, redis
@@ -43,6 +53,23 @@ from unicode_api.enums.request_type import RequestType
 
 RATE_LIMIT_ROUTE_REGEX = re.compile(r"^\/v1\/blocks|characters|codepoints|planes")
 
+# KEYS[1]: client IP, ARGV[1]: emission interval (seconds), ARGV[2]: delay tolerance (seconds)
+# Returns {allowed (1 or 0), arrived_at, allowed_at, new_tat}, timestamps are returned as strings since Redis
+# truncates Lua numbers to integers
+GCRA_LUA_SCRIPT = """
+local now = redis.call('TIME')
+local arrived_at = tonumber(now[1]) + tonumber(now[2]) / 1000000
+local tat = tonumber(redis.call('GET', KEYS[1]) or '0') or 0
+local allowed_at = tat - tonumber(ARGV[2])
+if arrived_at < allowed_at then
+    return {0, string.format('%.6f', arrived_at), string.format('%.6f', allowed_at), '0'}
+end
+local new_tat = math.max(tat, arrived_at) + tonumber(ARGV[1])
+local ttl_ms = math.max(1, math.ceil((new_tat - arrived_at) * 1000))
+redis.call('SET', KEYS[1], string.format('%.6f', new_tat), 'PX', ttl_ms)
+return {1, string.format('%.6f', arrived_at), string.format('%.6f', allowed_at), string.format('%.6f', new_tat)}
+"""
+
 
 @dataclass
 class RateLimitDecision:
@@ -133,7 +160,7 @@ class RateLimit:
     """
     RateLimit is a class that implements the Generic Cell Rate Algorithm (GCRA) with burst support
     to enforce rate limiting for incoming API requests. It uses Redis as a backend for tracking request
-    timestamps and managing locks.
+    timestamps.
 
     Adapted for Python from this article:
     https://vikas-kumar.medium.com/rate-limiting-techniques-245c3a5e9cad
@@ -142,6 +169,7 @@ class RateLimit:
         redis (IRedisClient): Redis client instance for managing rate limit data.
         logger (logging.Logger): Logger instance for logging rate limit events.
         settings (UnicodeApiSettings): Application settings containing rate limit configurations.
+        gcra_script (AsyncScript | None): The GCRA Lua script, registered with the Redis client on first use.
 
     Properties:
         is_test_env (bool): Indicates if the application is running in a test environment.
@@ -154,7 +182,7 @@ class RateLimit:
         delay_tolerance_ms (timedelta): Maximum delay tolerance for burst requests in milliseconds.
 
     Methods:
-        validate_request(request: Request) -> RateLimitDecision:
+        async validate_request(request: Request) -> RateLimitDecision:
             Validates an incoming request against the rate limit rules.
     """
 
@@ -168,6 +196,7 @@ class RateLimit:
         self.settings = get_settings()
         self.redis = redis
         self.logger = logging.getLogger("unicode_api.api")
+        self.gcra_script: AsyncScript | None = None
 
     @property
     def is_test_env(self) -> bool:
@@ -261,7 +290,7 @@ class RateLimit:
         interval = self.emission_interval_ms / timedelta(milliseconds=1)
         return timedelta(milliseconds=(interval * self.burst))
 
-    def validate_request(self, request: Request) -> RateLimitDecision:
+    async def validate_request(self, request: Request) -> RateLimitDecision:
         """
         Validates an incoming request and determines whether it should be rate-limited.
 
@@ -283,7 +312,7 @@ class RateLimit:
             case RequestType.TEST_REQUEST | RequestType.INTERNAL_REQUEST | RequestType.STATIC_RESOURCE:
                 return RateLimitDecision(ip, request_type, 0, 0, 0)
             case _:
-                return self._apply_rate_limiting(ip)
+                return await self._apply_rate_limiting(ip)
 
     def _check_for_simple_request_types(self, request: Request, ip: str) -> RequestType | None:
         if self.is_test_env and not _enable_rate_limit_feature_for_test(request):
@@ -312,30 +341,24 @@ class RateLimit:
     def _rate_limit_applies_to_route(self, request: Request) -> bool:  # pragma: no cover
         return bool(RATE_LIMIT_ROUTE_REGEX.search(request.url.path))
 
-    def _apply_rate_limiting(self, ip: str) -> RateLimitDecision:
-        arrived_at = self.redis.time()
-        self.redis.setnx(ip, "0")
+    async def _apply_rate_limiting(self, ip: str) -> RateLimitDecision:
+        if not self.gcra_script:
+            self.gcra_script = await self.redis.register_script(GCRA_LUA_SCRIPT)
         try:
-            with self.redis.lock("lock:" + ip, blocking_timeout=5):
-                tat = float(self.redis.get(ip) or 0)  # type: ignore  # noqa: PGH003
-                allowed_at = self._get_allowed_at(tat)
-                if arrived_at < allowed_at:
-                    decision = RateLimitDecision(ip, RequestType.RATE_LIMITED_DENIED, arrived_at, allowed_at, 0)
-                    decision.error = self._rate_limit_exceeded(ip, allowed_at)
-                    return decision
-                new_tat = self._get_new_tat(tat, arrived_at)
-                self.redis.set(ip, new_tat)
-                return RateLimitDecision(ip, RequestType.RATE_LIMITED_ALLOWED, arrived_at, allowed_at, new_tat)
-        except LockError:  # pragma: no cover
-            decision = RateLimitDecision(ip, RequestType.ERROR, arrived_at, 0, 0)
-            decision.error = self._get_lock_error(ip)
+            emission_interval = self.emission_interval_ms.total_seconds()
+            delay_tolerance = self.delay_tolerance_ms.total_seconds()
+            result = await self.gcra_script(keys=[ip], args=[emission_interval, delay_tolerance])
+        except RedisError as ex:  # pragma: no cover
+            decision = RateLimitDecision(ip, RequestType.ERROR, 0, 0, 0)
+            decision.error = self._get_redis_error(ip, ex)
             return decision
-
-    def _get_allowed_at(self, tat: float) -> float:
-        return (dtaware_fromtimestamp(tat) - self.delay_tolerance_ms).timestamp()
-
-    def _get_new_tat(self, tat: float, arrived_at: float) -> float:
-        return (dtaware_fromtimestamp(max(tat, arrived_at)) + self.emission_interval_ms).timestamp()
+        (allowed, *timestamps) = result
+        (arrived_at, allowed_at, new_tat) = (float(ts) for ts in timestamps)
+        if not allowed:
+            decision = RateLimitDecision(ip, RequestType.RATE_LIMITED_DENIED, arrived_at, allowed_at, 0)
+            decision.error = self._rate_limit_exceeded(ip, allowed_at)
+            return decision
+        return RateLimitDecision(ip, RequestType.RATE_LIMITED_ALLOWED, arrived_at, allowed_at, new_tat)
 
     def _rate_limit_exceeded(self, ip: str, allowed_at: float) -> str:
         limit_duration = get_time_until_timestamp(allowed_at)
@@ -348,11 +371,8 @@ class RateLimit:
         self.logger.debug(detail)
         return detail
 
-    def _get_lock_error(self, client: str) -> str:  # pragma: no cover
-        error = (
-            f"An error occurred attempting to access rate limit data for IP {client} "
-            f"(Error: Unable to acquire Redis lock for shared resource)."
-        )
+    def _get_redis_error(self, client: str, ex: RedisError) -> str:  # pragma: no cover
+        error = f"An error occurred attempting to access rate limit data for IP {client} (Error: {repr(ex)})."
         self.logger.error(error)
         return error
 
@@ -7,13 +7,21 @@ Classes:
         and properties.
 
     RedisClient: Utility class for connecting to and interacting with a Redis server, with automatic
-        connection retries and fallback to a fake Redis instance.
+        connection retries and fallback to a fake Redis instance. Lua scripts are executed with an
+        asyncio client, so they do not block the event loop (the connection to the server is also verified
+        without blocking). A second asyncio client (with short timeouts and no connection retries) is provided
+        for caching.
 
     TestRedisClient: In-memory mock implementation of a Redis client for testing purposes.
 
 Constants:
     MAX_ATTEMPTS (int): Maximum number of connection attempts to the Redis server.
 
+    ASYNC_CLIENT_PING_TIMEOUT_SECONDS (float): Time allowed for the Redis server to respond to the ping that
+        verifies the connection of the asyncio client used to execute Lua scripts.
+
+    CACHE_CLIENT_TIMEOUT_SECONDS (float): Connect and read timeout of the asyncio client used for caching.
+
     redis (RedisClient | TestRedisClient): Singleton instance of the appropriate Redis client,
         depending on the application environment.
 
@@ -22,23 +30,27 @@ Usage:
     The client automatically handles connection retries and provides a fake Redis instance for testing environments.
 """
 
+import asyncio
 import logging
 import time
-from contextlib import contextmanager
 from datetime import datetime
-from typing import Any, Protocol
+from typing import Protocol
 
-from fakeredis import FakeRedis
+from fakeredis import FakeAsyncRedis, FakeRedis
 from redis import from_url
+from redis.asyncio import Redis as AsyncRedis
+from redis.asyncio import from_url as async_from_url
 from redis.client import Redis
-from redis.exceptions import ConnectionError
-from redis.lock import Lock
+from redis.commands.core import AsyncScript
+from redis.exceptions import ConnectionError, RedisError
 
 from unicode_api.config.api_settings import get_settings
 from unicode_api.core.redis_types import RedisKey, RedisResponse, RedisValue
 from unicode_api.core.util import dtaware_fromtimestamp
 
 MAX_ATTEMPTS = 3
+ASYNC_CLIENT_PING_TIMEOUT_SECONDS = 3.0
+CACHE_CLIENT_TIMEOUT_SECONDS = 0.5
 
 
 class IRedisClient(Protocol):
@@ -49,14 +61,18 @@ class IRedisClient(Protocol):
         """
         ...
 
-    def lock(self, name: str, blocking_timeout: float | int) -> Any:
+    @property
+    def cache_client(self) -> AsyncRedis:
         """
-        Return a new Lock object using key ``name`` that mimics
-        the behavior of threading.Lock.
+        Returns an asyncio Redis client for caching. The client never waits (or retries) to connect to the
+        server, a command raises a ``RedisError`` if the server is unavailable.
+        """
+        ...
 
-        ``blocking_timeout`` indicates the maximum amount of time in seconds to spend trying to acquire the lock.
-         A value of ``None`` indicates continue trying forever. ``blocking_timeout`` can be specified as a float
-         or integer, both representing the number of seconds to wait.
+    async def register_script(self, script: str) -> AsyncScript:
+        """
+        Register a Lua script, returning a callable that runs it on the asyncio client. The script is run with
+        ``EVALSHA`` and is only sent to the server if it has not been cached there yet.
         """
         ...
 
@@ -101,6 +117,9 @@ class RedisClient:
         connected (bool): Indicates whether the client is connected to the Redis server.
         failed_attempts (int): The number of failed connection attempts.
         _client (Redis): The Redis client instance.
+        _async_client (AsyncRedis | None): The asyncio Redis client instance, created on first use.
+        _async_client_lock (asyncio.Lock): Ensures that only one asyncio Redis client instance is created.
+        _cache_client (AsyncRedis | None): The asyncio Redis client instance used for caching, created on first use.
 
     Properties:
         redis_host (str): The Redis server hostname.
@@ -109,10 +128,14 @@ class RedisClient:
         redis_pw (str): The Redis server password.
         redis_url (str): The Redis connection URL.
         client (Redis): The Redis client instance, connecting if not already connected.
+        cache_client (AsyncRedis): The asyncio Redis client instance used for caching.
 
     Methods:
-        lock(name: str, blocking_timeout: float | int) -> Any:
-            Creates a distributed lock with the given name and blocking timeout.
+        get_async_client() -> AsyncRedis:
+            Returns the asyncio Redis client instance, connected to the same server as `client`.
+
+        register_script(script: str) -> AsyncScript:
+            Registers a Lua script that is executed (via EVALSHA) by the asyncio client.
 
         setnx(name: RedisKey, value: RedisValue) -> RedisResponse:
             Sets a value in Redis only if the key does not already exist.
@@ -143,12 +166,19 @@ class RedisClient:
             connected (bool): Indicates whether the client is connected to the Redis server.
             failed_attempts (int): Tracks the number of failed connection attempts.
             _client (Redis): The Redis client instance (uninitialized at this stage).
+            _async_client (AsyncRedis | None): The asyncio Redis client instance (uninitialized at this stage).
+            _async_client_lock (asyncio.Lock): Ensures that only one asyncio Redis client instance is created.
+            _cache_client (AsyncRedis | None): The asyncio Redis client instance used for caching (uninitialized
+                at this stage).
         """
         self.settings = get_settings()
         self.logger = logging.getLogger("unicode_api.api")
         self.connected: bool = False
         self.failed_attempts: int = 0
         self._client: Redis
+        self._async_client: AsyncRedis | None = None
+        self._async_client_lock = asyncio.Lock()
+        self._cache_client: AsyncRedis | None = None
 
     @property
     def redis_host(self) -> str:
@@ -235,6 +265,56 @@ class RedisClient:
                 self._handle_connect_attempt_failed()
         return self._client
 
+    async def get_async_client(self) -> AsyncRedis:
+        """
+        Returns an asyncio Redis client connected to the same server as the `client` property.
+
+        The connection to the server is verified the first time this method is called, by sending a ping that
+        must be answered within `ASYNC_CLIENT_PING_TIMEOUT_SECONDS`. The ping is awaited (rather than using the
+        retry logic of the `client` property, which sleeps between attempts), so the event loop is never
+        blocked. If the server is unavailable, a fake asyncio Redis instance is used instead.
+
+        Returns:
+            AsyncRedis: An instance of the asyncio Redis client.
+        """
+        async with self._async_client_lock:
+            if not self._async_client:
+                self._async_client = await self._connect_async_client()
+        return self._async_client
+
+    async def _connect_async_client(self) -> AsyncRedis:
+        client = async_from_url(self.redis_url, socket_connect_timeout=ASYNC_CLIENT_PING_TIMEOUT_SECONDS)
+        try:
+            if await asyncio.wait_for(client.ping(), timeout=ASYNC_CLIENT_PING_TIMEOUT_SECONDS):
+                self.logger.info("Successfully connected asyncio client to Redis server.")
+                return client
+        except (RedisError, OSError, TimeoutError):
+            pass
+        await client.aclose()
+        self.logger.warning("Failed to connect asyncio client to Redis server, using a fake Redis instance.")
+        return FakeAsyncRedis()
+
+    @property
+    def cache_client(self) -> AsyncRedis:
+        """
+        Returns an asyncio Redis client used for caching.
+
+        Unlike the `client` property and `get_async_client`, the connection to the server is not verified (and
+        the client never falls back to a fake Redis instance). Each command times out after
+        `CACHE_CLIENT_TIMEOUT_SECONDS` and raises a `RedisError` if the server is unavailable, so the caller can
+        stop using Redis without blocking the event loop.
+
+        Returns:
+            AsyncRedis: An instance of the asyncio Redis client.
+        """
+        if not self._cache_client:
+            self._cache_client = async_from_url(
+                self.redis_url,
+                socket_connect_timeout=CACHE_CLIENT_TIMEOUT_SECONDS,
+                socket_timeout=CACHE_CLIENT_TIMEOUT_SECONDS,
+            )
+        return self._cache_client
+
     def _handle_connect_attempt_failed(self) -> None:
         self.failed_attempts += 1
         if self.failed_attempts < MAX_ATTEMPTS:
@@ -248,20 +328,18 @@ class RedisClient:
             self.connected = False
             self.logger.warning(f"Failed to connect to Redis server (attempt {self.failed_attempts}/{MAX_ATTEMPTS}).")
 
-    def lock(self, name: str, blocking_timeout: float | int) -> Lock:
+    async def register_script(self, script: str) -> AsyncScript:
         """
-        Acquire a distributed lock using the Redis client.
+        Register a Lua script with the asyncio Redis client.
 
         Args:
-            name (str): The name of the lock.
-            blocking_timeout (float | int): The maximum time in seconds to block
-                while waiting to acquire the lock. If 0, the method will not block.
+            script (str): The source code of the Lua script.
 
         Returns:
-            Any: A lock object if the lock is successfully acquired, or None if
-            the lock could not be acquired within the specified timeout.
+            AsyncScript: A callable that executes the script using EVALSHA (the script is loaded into the
+            server's script cache automatically if the server responds with a NOSCRIPT error).
         """
-        return self.client.lock(name, blocking_timeout=blocking_timeout)
+        return (await self.get_async_client()).register_script(script)
 
     def setnx(self, name: RedisKey, value: RedisValue) -> RedisResponse:
         """
@@ -335,13 +413,15 @@ class TestRedisClient:
 
     Attributes:
         db (dict): An in-memory dictionary used to simulate Redis key-value storage.
+        async_client (FakeAsyncRedis): A fake asyncio Redis client used to execute Lua scripts.
+        cache_client (FakeAsyncRedis): The fake asyncio Redis client (also used for caching).
 
     Methods:
         client:
             A property that returns a fake Redis client instance.
 
-        lock(name: str, blocking_timeout: float | int) -> Any:
-            Simulates acquiring a lock in Redis. Returns a context manager that does nothing.
+        register_script(script: str) -> AsyncScript:
+            Registers a Lua script with a fake asyncio Redis client (requires the lupa package).
 
         setnx(name: RedisKey, value: RedisValue) -> RedisResponse:
             Sets a value in the database only if the key does not already exist.
@@ -361,17 +441,18 @@ class TestRedisClient:
 
     def __init__(self) -> None:
         self.db: dict[RedisKey, RedisValue] = {}
+        self.async_client = FakeAsyncRedis()
 
     @property
     def client(self) -> Redis:
         return FakeRedis()
 
-    def lock(self, name: str, blocking_timeout: float | int) -> Any:
-        @contextmanager
-        def fake_lock_context():
-            yield None
+    @property
+    def cache_client(self) -> AsyncRedis:
+        return self.async_client
 
-        return fake_lock_context()
+    async def register_script(self, script: str) -> AsyncScript:
+        return self.async_client.register_script(script)
 
     def setnx(self, name: RedisKey, value: RedisValue) -> RedisResponse:
         if name not in self.db:
@@ -0,0 +1,164 @@
+"""
+This module implements an optional response cache that is shared by all API worker processes via Redis.
+
+The JSON returned by the endpoints that describe a single codepoint, string, block or plane only depends on the
+version of Unicode and the request parameters, so the serialized response body can be reused by every worker.
+When the cache is enabled (`RESPONSE_CACHE_ENABLED=true`), the body of each successful response from one of
+these endpoints is stored in Redis for `RESPONSE_CACHE_TTL_SECONDS`, keyed by the Unicode version and a hash of
+the request path and (sorted) query parameters.
+
+Every response is also stored in a small in-process LRU tier (`RESPONSE_CACHE_MAX_LOCAL_ENTRIES`). This tier is
+checked before Redis. Redis is accessed with an asyncio client, so the event loop is never blocked waiting for the
+server. If a Redis command fails, Redis is skipped (and only the in-process tier is used) for
+`REDIS_RETRY_DELAY`, after which the next request tries Redis again.
+
+Classes:
+    ResponseCache:
+        Two-tier (in-process + Redis) cache for serialized response bodies.
+
+Constants:
+    CACHED_ROUTE_NAMES:
+        Names of the API routes whose responses are cached.
+
+    REDIS_RETRY_DELAY:
+        Amount of time Redis is skipped after a Redis command fails.
+
+    response_cache:
+        An instance of the ResponseCache class initialized with the application's Redis client.
+"""
+
+import hashlib
+import logging
+import time
+from collections.abc import Iterable
+from datetime import timedelta
+
+from redis.exceptions import RedisError
+
+from unicode_api.config.api_settings import get_settings
+from unicode_api.core.cache import cached_data
+from unicode_api.core.http_cache import get_canonical_request
+from unicode_api.core.redis_client import IRedisClient, redis
+from unicode_api.core.result_cache import ResultCache
+
+CACHED_ROUTE_NAMES = frozenset(
+    [
+        "get_unicode_character_at_codepoint",
+        "get_unicode_character_details",
+        "get_unicode_block_details",
+        "get_unicode_plane_details",
+    ]
+)
+REDIS_RETRY_DELAY = timedelta(seconds=30)
+
+
+class ResponseCache:
+    """
+    Two-tier (in-process + Redis) cache for serialized response bodies.
+
+    Attributes:
+        redis (IRedisClient): The Redis client used for the shared tier.
+        enabled (bool): If False, no responses are cached.
+        ttl (timedelta): Amount of time a response remains in the cache.
+        unicode_version (str): Version of Unicode served by the API, included in every cache key.
+        local (ResultCache[str, bytes]): The in-process tier.
+        retry_delay (timedelta): Amount of time Redis is skipped after a Redis command fails.
+        redis_retry_at (float): Monotonic time before which Redis is skipped (0 if Redis is available).
+    """
+
+    def __init__(
+        self,
+        redis_client: IRedisClient,
+        enabled: bool,
+        ttl: timedelta,
+        max_local_entries: int,
+        unicode_version: str,
+        retry_delay: timedelta = REDIS_RETRY_DELAY,
+    ):
+        self.redis = redis_client
+        self.enabled = enabled
+        self.ttl = ttl
+        self.unicode_version = unicode_version
+        self.local: ResultCache[str, bytes] = ResultCache("response_local", max_local_entries, ttl)
+        self.retry_delay = retry_delay
+        self.redis_retry_at = 0.0
+        self.logger = logging.getLogger("unicode_api.api")
+
+    @property
+    def redis_available(self) -> bool:
+        return not self.redis_retry_at or time.monotonic() >= self.redis_retry_at
+
+    def get_cache_key(self, path: str, query_params: Iterable[tuple[str, str]]) -> str | None:
+        """
+        Returns the cache key for a request, or None if responses for the requested route are not cached.
+
+        Args:
+            path (str): The request path.
+            query_params (Iterable[tuple[str, str]]): All query parameters (including repeated keys).
+
+        Returns:
+            str | None: The cache key, which contains the Unicode version and a hash of the canonical
+            request parameters.
+        """
+        if not self.enabled:
+            return None
+        (route, _) = cached_data.get_api_route_from_requested_path(path)
+        if route["name"] not in CACHED_ROUTE_NAMES:
+            return None
+        request_hash = hashlib.sha256(get_canonical_request(path, query_params).encode()).hexdigest()
+        return f"response:{self.unicode_version}:{route['name']}:{request_hash}"
+
+    async def get(self, key: str) -> bytes | None:
+        if (body := self.local.get(key)) is not None:
+            return body
+        if not self.redis_available:
+            return None
+        try:
+            body = await self.redis.cache_client.get(key)
+        except RedisError:
+            self._handle_redis_error()
+            return None
+        self._handle_redis_success()
+        if not isinstance(body, bytes | str):
+            return None
+        body = body.encode() if isinstance(body, str) else body
+        self.local.set(key, body)
+        return body
+
+    async def set(self, key: str, body: bytes) -> None:
+        self.local.set(key, body)
+        if not self.redis_available:
+            return
+        try:
+            await self.redis.cache_client.setex(key, self.ttl, body)
+        except RedisError:
+            self._handle_redis_error()
+        else:
+            self._handle_redis_success()
+
+    def _handle_redis_error(self) -> None:
+        if not self.redis_retry_at:
+            self.logger.warning(
+                "Redis server is unavailable, response cache is using the in-process tier only "
+                f"(will retry in {self.retry_delay.total_seconds():.0f} seconds)."
+            )
+        self.redis_retry_at = time.monotonic() + self.retry_delay.total_seconds()
+
+    def _handle_redis_success(self) -> None:
+        if self.redis_retry_at:
+            self.logger.info("Redis server is available, response cache is using the shared tier.")
+        self.redis_retry_at = 0.0
+
+
+def _create_response_cache() -> ResponseCache:
+    settings = get_settings()
+    return ResponseCache(
+        redis,
+        settings.RESPONSE_CACHE_ENABLED,
+        settings.RESPONSE_CACHE_TTL_SECONDS,
+        settings.RESPONSE_CACHE_MAX_LOCAL_ENTRIES,
+        settings.UNICODE_VERSION,
+    )
+
+
+response_cache = _create_response_cache()
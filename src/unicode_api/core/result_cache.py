@@ -0,0 +1,178 @@
+"""
+This module provides bounded in-process caches for the results of character/block searches and character filters.
+
+Paging through the results of a search or filter request sends the same query to the API once per page. Rather
+than re-running the fuzzy search (or the SQL query) for every page, the full result set is cached the first time
+it is computed, keyed by a canonical form of the query parameters. Results are stored as compact `array`
+objects (or CodepointBitmaps) instead of lists of Python ints/floats to keep the memory used by each entry small.
+
+Each cache evicts the least recently used entry when it is full, and entries expire after a configurable amount
+of time. The maximum number of entries and the TTL are read from the `RESULT_CACHE_MAX_ENTRIES` and
+`RESULT_CACHE_TTL_SECONDS` settings (setting `RESULT_CACHE_MAX_ENTRIES` to 0 disables caching). Hit/miss/eviction
+counters are tracked for each cache and can be retrieved with `get_result_cache_stats`.
+
+Classes:
+    ResultCacheStats:
+        Counters and settings for a single ResultCache.
+    ResultCache:
+        Thread-safe LRU cache with a per-entry TTL.
+
+Functions:
+    pack_search_results(results: list[tuple[int, float]]) -> CompactSearchResults:
+        Converts a list of (key, score) search results to a compact representation.
+    unpack_search_results(packed: CompactSearchResults) -> list[tuple[int, float]]:
+        Converts a compact search result back to a list of (key, score) tuples.
+    get_result_cache_stats() -> list[ResultCacheStats]:
+        Returns the current stats for all result caches.
+    clear_all_result_caches() -> None:
+        Removes all entries from all result caches.
+"""
+
+import threading
+import time
+from array import array
+from collections import OrderedDict
+from collections.abc import Callable, Hashable, Sequence
+from dataclasses import asdict, dataclass
+from datetime import timedelta
+from typing import Any
+
+from unicode_api.config.api_settings import get_settings
+
+type CompactSearchResults = tuple[array[int], array[float]]
+
+
+@dataclass(frozen=True, slots=True)
+class ResultCacheStats:
+    name: str
+    max_entries: int
+    ttl_seconds: float
+    entries: int
+    hits: int
+    misses: int
+    evictions: int
+    expirations: int
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def as_dict(self) -> dict[str, Any]:
+        return asdict(self) | {"hit_rate": round(self.hit_rate, 4)}
+
+
+class ResultCache[K: Hashable, V]:
+    """
+    Thread-safe LRU cache with a per-entry TTL.
+
+    Attributes:
+        name (str): Name used to identify the cache in reports.
+        max_entries (int): Maximum number of entries held in the cache. If zero, nothing is cached.
+        ttl (timedelta): Amount of time an entry remains valid after it is added to the cache.
+    """
+
+    def __init__(self, name: str, max_entries: int, ttl: timedelta):
+        self.name = name
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._entries: OrderedDict[K, tuple[float, V]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._expirations = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def stats(self) -> ResultCacheStats:
+        with self._lock:
+            return ResultCacheStats(
+                name=self.name,
+                max_entries=self.max_entries,
+                ttl_seconds=self.ttl.total_seconds(),
+                entries=len(self._entries),
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                expirations=self._expirations,
+            )
+
+    def get(self, key: K) -> V | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._misses += 1
+                return None
+            (expires_at, value) = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                self._expirations += 1
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return value
+
+    def set(self, key: K, value: V) -> None:
+        if self.max_entries <= 0:
+            return
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl.total_seconds(), value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+
+    def get_or_compute(self, key: K, compute: Callable[[], V]) -> V:
+        """
+        Returns the cached value for `key`, calling `compute` (and caching the value it returns) on a cache miss.
+
+        Args:
+            key (K): Canonical representation of the query parameters.
+            compute (Callable[[], V]): Function that produces the value for `key`.
+
+        Returns:
+            V: The cached or newly computed value.
+        """
+        if (value := self.get(key)) is not None:
+            return value
+        value = compute()
+        self.set(key, value)
+        return value
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+def pack_search_results(results: list[tuple[int, float]]) -> CompactSearchResults:
+    return (array("I", (key for (key, _) in results)), array("d", (score for (_, score) in results)))
+
+
+def unpack_search_results(packed: CompactSearchResults) -> list[tuple[int, float]]:
+    (keys, scores) = packed
+    return list(zip(keys, scores, strict=True))
+
+
+def _create_result_cache(name: str) -> ResultCache[Any, Any]:
+    settings = get_settings()
+    return ResultCache(name, settings.RESULT_CACHE_MAX_ENTRIES, settings.RESULT_CACHE_TTL_SECONDS)
+
+
+character_search_cache: ResultCache[tuple[str, int], CompactSearchResults] = _create_result_cache("character_search")
+block_search_cache: ResultCache[tuple[str, int], CompactSearchResults] = _create_result_cache("block_search")
+character_filter_cache: ResultCache[tuple[Any, ...], Sequence[int]] = _create_result_cache("character_filter")
+
+ALL_RESULT_CACHES: list[ResultCache[Any, Any]] = [character_search_cache, block_search_cache, character_filter_cache]
+
+
+def get_result_cache_stats() -> list[ResultCacheStats]:
+    return [cache.stats for cache in ALL_RESULT_CACHES]
+
+
+def clear_all_result_caches() -> None:
+    for cache in ALL_RESULT_CACHES:
+        cache.clear()
@@ -1,9 +1,11 @@
+from unicode_api.data.scripts.export_characters import export_characters
 from unicode_api.data.scripts.get_prod_data import get_prod_data
 from unicode_api.data.scripts.sync_req_files import sync_requirements_files
 from unicode_api.data.scripts.update_all_data.update_all_data import update_all_data
 from unicode_api.data.scripts.update_test_data.update_test_data import update_test_data
 
 __all__ = [
+    "export_characters",
     "get_prod_data",
     "sync_requirements_files",
     "update_all_data",
@@ -0,0 +1,110 @@
+"""
+Micro-benchmark for the block, plane and character name lookups provided by UnicodeDataCache.
+
+This script compares the indexed lookups used by `UnicodeDataCache` (a binary search over the sorted
+block start offsets, and a block ID -> plane map) against the linear scans they replaced. Every codepoint
+in the Unicode codespace (0x0000...0x10FFFF) is resolved with both implementations, the results are
+checked for equality and the elapsed time for each implementation is reported.
+
+Character name searches are benchmarked by running a set of queries against both the name search index and
+a full `process.extract` scan of a codepoint -> name dict, and verifying that both return the same ranking.
+
+Functions:
+    benchmark_cache_lookups() -> Result[None]:
+        Runs the benchmark and prints a summary of the results.
+
+Usage:
+    $ python -m unicode_api.data.scripts.benchmark_cache_lookups
+"""
+
+import time
+from collections.abc import Callable
+from datetime import timedelta
+
+from rapidfuzz import process
+
+from unicode_api.constants import ALL_UNICODE_CODEPOINTS
+from unicode_api.core.cache import NULL_BLOCK, NULL_PLANE, cached_data
+from unicode_api.core.result import Result
+from unicode_api.core.util import format_timedelta_str
+from unicode_api.models.block import UnicodeBlock
+from unicode_api.models.plane import UnicodePlane
+
+NAME_SEARCH_QUERIES = ["home", "house", "smiling face", "arrow", "latin small letter a", "greek capital"]
+
+
+def benchmark_cache_lookups() -> Result[None]:
+    """
+    Resolves the block and plane for every codepoint in the Unicode codespace using both the linear scan
+    and indexed implementations, and prints the time required by each.
+
+    Returns:
+        Result[None]: A Result object indicating success, or an error message if the two implementations
+        returned different results for any codepoint.
+    """
+    (linear_blocks, linear_elapsed) = _time_block_lookup(_linear_block_lookup)
+    (indexed_blocks, indexed_elapsed) = _time_block_lookup(cached_data.get_unicode_block_containing_codepoint)
+    if mismatched := [cp for cp in ALL_UNICODE_CODEPOINTS if linear_blocks[cp].id != indexed_blocks[cp].id]:
+        return Result[None].Fail(f"Block lookup returned different results for {len(mismatched)} codepoints")
+    _print_results("Block containing codepoint", len(ALL_UNICODE_CODEPOINTS), linear_elapsed, indexed_elapsed)
+
+    block_ids = [block.id or 0 for block in indexed_blocks]
+    (linear_planes, linear_elapsed) = _time_plane_lookup(_linear_plane_lookup, block_ids)
+    (indexed_planes, indexed_elapsed) = _time_plane_lookup(cached_data.get_unicode_plane_containing_block_id, block_ids)
+    if any(linear.number != indexed.number for (linear, indexed) in zip(linear_planes, indexed_planes, strict=True)):
+        return Result[None].Fail("Plane lookup returned different results for one or more block IDs")
+    _print_results("Plane containing block", len(block_ids), linear_elapsed, indexed_elapsed)
+
+    (full_scan_results, full_scan_elapsed) = _time_name_search(_full_scan_name_search)
+    (indexed_results, indexed_elapsed) = _time_name_search(cached_data.search_characters_by_name)
+    if full_scan_results != indexed_results:
+        return Result[None].Fail("Character name search returned different results for one or more queries")
+    _print_results("Character name search", len(NAME_SEARCH_QUERIES), full_scan_elapsed, indexed_elapsed)
+    return Result[None].Ok()
+
+
+def _time_block_lookup(lookup: Callable[[int], UnicodeBlock]) -> tuple[list[UnicodeBlock], float]:
+    start = time.perf_counter()
+    blocks = [lookup(codepoint) for codepoint in ALL_UNICODE_CODEPOINTS]
+    return (blocks, time.perf_counter() - start)
+
+
+def _time_plane_lookup(lookup: Callable[[int], UnicodePlane], block_ids: list[int]) -> tuple[list[UnicodePlane], float]:
+    start = time.perf_counter()
+    planes = [lookup(block_id) for block_id in block_ids]
+    return (planes, time.perf_counter() - start)
+
+
+def _time_name_search(search: Callable[[str], list[tuple[int, float]]]) -> tuple[list[list[tuple[int, float]]], float]:
+    start = time.perf_counter()
+    results = [search(query) for query in NAME_SEARCH_QUERIES]
+    return (results, time.perf_counter() - start)
+
+
+def _linear_block_lookup(codepoint: int) -> UnicodeBlock:
+    found = [block for block in cached_data.blocks if block.start_dec <= codepoint and codepoint <= block.finish_dec]
+    return found[0] if found else NULL_BLOCK
+
+
+def _linear_plane_lookup(block_id: int) -> UnicodePlane:
+    found = [p for p in cached_data.planes if p.start_block_id <= block_id and block_id <= p.finish_block_id]
+    return found[0] if found else NULL_PLANE
+
+
+def _full_scan_name_search(query: str) -> list[tuple[int, float]]:
+    name_choices = {cp: name.lower() for (cp, name) in cached_data.non_unihan_character_name_map.items()}
+    results = process.extract(query.lower(), name_choices, limit=len(name_choices))
+    return [(codepoint, score) for (_, score, codepoint) in results if score >= 80.0]
+
+
+def _print_results(lookup_name: str, total_lookups: int, linear_elapsed: float, indexed_elapsed: float):
+    speedup = linear_elapsed / indexed_elapsed if indexed_elapsed else 0.0
+    print(f"{lookup_name} ({total_lookups:,} lookups):")
+    print(f"    linear scan: {format_timedelta_str(timedelta(seconds=linear_elapsed))}")
+    print(f"    indexed:     {format_timedelta_str(timedelta(seconds=indexed_elapsed))} ({speedup:.1f}x faster)")
+
+
+if __name__ == "__main__":
+    result = benchmark_cache_lookups()
+    if result.failure:
+        print(result.error)
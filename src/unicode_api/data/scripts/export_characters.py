@@ -0,0 +1,81 @@
+"""
+Exports the details of every Unicode character in the database, optionally filtered, as NDJSON or CSV.
+
+This is the command-line equivalent of the `/v1/characters/export` endpoint. Characters are read from the
+database in batches with a streaming cursor and written to the output as each batch is encoded, so the export
+uses the same (small) amount of memory no matter how many characters are included.
+
+Functions:
+    export_characters(output_file, export_format, show_props, filters, verbose) -> Result[None]:
+        Writes the details of all characters that match the filter settings to a file (or stdout).
+
+    parse_filter_settings(filters: list[str], show_props: list[str]) -> Result[FilterParameters]:
+        Converts a list of 'name=value' strings into the filter settings used by the API.
+
+Usage:
+    $ python src/unicode_api/cli.py export-characters --format csv -f block=Basic_Latin -o basic_latin.csv
+"""
+
+import sys
+from pathlib import Path
+from typing import Any
+
+from sqlmodel import Session
+
+import unicode_api.db.models as db
+from unicode_api.api.api_v1.dependencies.filter_settings import FilterParameters
+from unicode_api.core.character_export import encode_characters
+from unicode_api.core.result import Result
+from unicode_api.db.engine import ro_db_engine
+from unicode_api.db.session import DBSession
+from unicode_api.enums.export_format import ExportFormat
+
+# Filter settings that accept a single value, all others accept a list of values
+SINGLE_VALUE_FILTERS = ["name", "cjk_definition"]
+
+
+def export_characters(
+    output_file: Path | None, export_format: ExportFormat, show_props: list[str], filters: list[str], verbose: bool
+) -> Result[None]:
+    result = parse_filter_settings(filters, show_props)
+    if result.failure or not result.value:
+        return Result[None].Fail(result.error)
+    filter_params = result.value
+    prop_groups = filter_params.show_prop_list or []
+    with Session(ro_db_engine) as session:
+        db_ctx = DBSession(session, ro_db_engine)
+        batches = db_ctx.stream_character_properties(
+            prop_groups, verbose, None if filter_params.no_settings_provided else filter_params
+        )
+        output = output_file.open("wb") if output_file else sys.stdout.buffer
+        try:
+            for chunk in encode_characters(batches, export_format, prop_groups):
+                output.write(chunk)
+        finally:
+            if output_file:
+                output.close()
+    return Result[None].Ok()
+
+
+def parse_filter_settings(filters: list[str], show_props: list[str]) -> Result[FilterParameters]:
+    settings: dict[str, Any] = {"show_props": show_props or None}
+    for setting in filters:
+        (name, _, value) = setting.partition("=")
+        name = name.strip().replace("-", "_")
+        if name not in db.UserFilterSettings.model_fields or name == "show_props" or not value:
+            return Result[FilterParameters].Fail(
+                f"The filter setting {setting!r} is invalid, each filter setting must be formatted as 'name=value' "
+                f"where name is one of: {', '.join(SINGLE_VALUE_FILTERS + _get_list_filter_names())}"
+            )
+        if name in SINGLE_VALUE_FILTERS:
+            settings[name] = value
+        else:
+            settings.setdefault(name, []).append(value)
+    filter_params = FilterParameters(db.UserFilterSettings(**settings))
+    if not filter_params.did_parse:
+        return Result[FilterParameters].Fail(filter_params.error_message)
+    return Result[FilterParameters].Ok(filter_params)
+
+
+def _get_list_filter_names() -> list[str]:
+    return [name for name in db.UserFilterSettings.model_fields if name not in SINGLE_VALUE_FILTERS + ["show_props"]]
@@ -1,3 +1,8 @@
+from collections import Counter
+from collections.abc import Sequence
+from dataclasses import dataclass, field
+from typing import Any
+
 import unicode_api.db.models as db
 
 AllParsedUnicodeData = tuple[
@@ -8,7 +13,8 @@ AllParsedUnicodeData = tuple[
     list[db.UnicodeCharacterUnihan],
 ]
 CharUnicodeModel = db.UnicodeCharacter | db.UnicodeCharacterUnihan
-UnicodeModel = db.UnicodePlane | db.UnicodeBlock | CharUnicodeModel
+UnicodeModel = db.UnicodePlane | db.UnicodeBlock | CharUnicodeModel | db.CharacterScriptExtension
+TableRows = dict[str, list[Sequence[Any]]]
 UnicodePropertyGroupType = (
     type[db.Age]
     | type[db.Bidi_Class]
@@ -32,3 +38,63 @@ UnicodePropertyGroupType = (
     | type[db.Vertical_Orientation]
     | type[db.Word_Break]
 )
+
+
+@dataclass
+class ParsedUnicodeDataSummary:
+    """
+    The parsed Unicode data that is needed to create the JSON data files, without the full character models.
+
+    When the XML database file is parsed in streaming mode, each character is inserted into the database as
+    soon as it has been validated. Only the small maps below are kept in memory, rather than every parsed
+    character.
+    """
+
+    planes: list[db.UnicodePlane]
+    blocks: list[db.UnicodeBlock]
+    total_characters: int = 0
+    char_name_map: dict[int, str] = field(default_factory=dict)
+    unihan_char_block_map: dict[int, int] = field(default_factory=dict)
+    tangut_char_block_map: dict[int, int] = field(default_factory=dict)
+    defined_char_counts: Counter[int] = field(default_factory=Counter)
+
+    @classmethod
+    def from_parsed_data(cls, parsed_data: AllParsedUnicodeData) -> "ParsedUnicodeDataSummary":
+        all_planes, all_blocks, non_unihan_chars, tangut_chars, unihan_chars = parsed_data
+        summary = cls(all_planes, all_blocks, len(non_unihan_chars) + len(tangut_chars) + len(unihan_chars))
+        for char in non_unihan_chars + unihan_chars:
+            summary.add_character(char, tangut=False)
+        for char in tangut_chars:
+            summary.add_character(char, tangut=True)
+        return summary
+
+    def add_character(self, char: CharUnicodeModel, tangut: bool) -> None:
+        if isinstance(char, db.UnicodeCharacterUnihan):
+            self.unihan_char_block_map[char.codepoint_dec] = char.block_id
+        elif tangut:
+            self.tangut_char_block_map[char.codepoint_dec] = char.block_id
+        else:
+            self.char_name_map[char.codepoint_dec] = char.name
+        self.defined_char_counts[char.block_id] += 1
+
+    def count_defined_characters(self) -> None:
+        for block in self.blocks:
+            block.total_allocated = block.finish_dec - block.start_dec + 1
+            block.total_defined = self.defined_char_counts[block.id or 0]
+        for plane in self.planes:
+            plane.total_allocated = plane.finish_dec - plane.start_dec + 1
+            plane.total_defined = sum(block.total_defined for block in self.blocks if block.plane_id == plane.id)
+
+
+@dataclass
+class ParsedUnicodeDataRows:
+    """
+    The parsed Unicode data in the form that is inserted into the database by the bulk loader.
+
+    `table_rows` maps each table name to the values of every row, in the order of the table's columns (after
+    conversion by each column's bind processor). Unlike the character models, these rows can be written to
+    and read from the parsed data cache quickly.
+    """
+
+    summary: ParsedUnicodeDataSummary
+    table_rows: TableRows
@@ -9,7 +9,11 @@ Imported functions:
 - get_prop_values: Obtains Unicode property values.
 - download_xml_unicode_database: Downloads the XML Unicode database.
 - parse_xml_unicode_database: Parses the downloaded XML Unicode database.
+- stream_xml_unicode_database: Parses the downloaded XML Unicode database incrementally.
+- parse_xml_unicode_database_with_cache: Parses the XML Unicode database, unless it is unchanged since it was cached.
 - populate_sqlite_database: Populates the SQLite database with parsed data.
+- populate_sqlite_database_from_rows: Populates the SQLite database with parsed data converted to table rows.
+- populate_sqlite_database_from_stream: Populates the SQLite database while the XML Unicode database is parsed.
 - save_parsed_data: Saves the parsed data to appropriate files.
 """
 
@@ -17,8 +21,16 @@ from unicode_api.data.scripts.update_all_data.backup_db_and_json_files import ba
 from unicode_api.data.scripts.update_all_data.get_api_settings import get_api_settings
 from unicode_api.data.scripts.update_all_data.get_prop_values import get_prop_values
 from unicode_api.data.scripts.update_all_data.get_xml_unicode_db import download_xml_unicode_database
-from unicode_api.data.scripts.update_all_data.parse_xml_unicode_db import parse_xml_unicode_database
-from unicode_api.data.scripts.update_all_data.populate_sqlite_db import populate_sqlite_database
+from unicode_api.data.scripts.update_all_data.parse_xml_unicode_db import (
+    parse_xml_unicode_database,
+    stream_xml_unicode_database,
+)
+from unicode_api.data.scripts.update_all_data.parsed_data_cache import parse_xml_unicode_database_with_cache
+from unicode_api.data.scripts.update_all_data.populate_sqlite_db import (
+    populate_sqlite_database,
+    populate_sqlite_database_from_rows,
+    populate_sqlite_database_from_stream,
+)
 from unicode_api.data.scripts.update_all_data.save_parsed_data import save_parsed_data
 
 __all__ = [
@@ -27,6 +39,10 @@ __all__ = [
     "get_prop_values",
     "download_xml_unicode_database",
     "parse_xml_unicode_database",
+    "stream_xml_unicode_database",
+    "parse_xml_unicode_database_with_cache",
     "populate_sqlite_database",
+    "populate_sqlite_database_from_rows",
+    "populate_sqlite_database_from_stream",
     "save_parsed_data",
 ]
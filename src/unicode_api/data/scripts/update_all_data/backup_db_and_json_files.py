@@ -57,6 +57,8 @@ def backup_db_and_json_files(settings: UnicodeApiSettings) -> Result[None]:
 def _backup_sqlite_db(settings: UnicodeApiSettings):
     with ZipFile(settings.db_zip_file, "w", ZIP_DEFLATED) as zip:
         zip.write(settings.db_file, f"{settings.db_file.name}")
+        if settings.filter_bitmaps_file.exists():
+            zip.write(settings.filter_bitmaps_file, f"{settings.filter_bitmaps_file.name}")
 
 
 def _backup_json_files(settings: UnicodeApiSettings):
@@ -68,6 +70,8 @@ def _backup_json_files(settings: UnicodeApiSettings):
         zip.write(settings.char_name_map, f"{settings.char_name_map.name}")
         zip.write(settings.unihan_chars_json, f"{settings.unihan_chars_json.name}")
         zip.write(settings.tangut_chars_json, f"{settings.tangut_chars_json.name}")
+        zip.write(settings.char_type_table, f"{settings.char_type_table.name}")
+        zip.write(settings.unicode_data_file, f"{settings.unicode_data_file.name}")
 
 
 def _upload_zip_file_to_s3(settings: UnicodeApiSettings, local_file: Path) -> Result[None]:
@@ -8,16 +8,26 @@ Main Functions:
 - parse_xml_unicode_database(settings: UnicodeApiSettings) -> Result[AllParsedUnicodeData]:
     Parses the Unicode XML database file and returns all parsed Unicode data, including planes, blocks,
     non-Unihan characters, Tangut characters, and Unihan characters.
+- stream_xml_unicode_database(settings: UnicodeApiSettings, batch_size: int) -> Result[tuple[...]]:
+    Parses the Unicode plane and block data, and returns an iterator that parses and validates batches of
+    characters as the XML database file is read, without loading the entire file into memory.
+- update_block_property_values(settings: UnicodeApiSettings, all_blocks: list[db.UnicodeBlock]) -> None:
+    Updates the Block property values in prop_values.json to match the parsed blocks.
 """
 
 import json
-from collections.abc import Sequence
+from bisect import bisect_right
+from collections import deque
+from collections.abc import Iterable, Iterator, Sequence
+from concurrent.futures import Future, ProcessPoolExecutor
+from itertools import batched
+from multiprocessing import get_context
 from pathlib import Path
 from textwrap import dedent, fill
-from typing import TYPE_CHECKING, Any, cast
+from typing import TYPE_CHECKING, Any, NamedTuple, cast
 
 import lxml.etree as etree
-from lxml.etree import _Element, _ElementTree  # type: ignore[reportPrivateUsage]
+from lxml.etree import _Attrib, _Element, _ElementTree  # type: ignore[reportPrivateUsage]
 from pydantic import ValidationError
 
 import unicode_api.db.models as db
@@ -26,7 +36,12 @@ from unicode_api.constants import PROP_GROUP_INVALID_FOR_VERSION_ROW_ID
 from unicode_api.core.cache import NULL_BLOCK, NULL_PLANE
 from unicode_api.core.encoding import get_codepoint_string
 from unicode_api.core.result import Result
-from unicode_api.data.scripts.script_types import AllParsedUnicodeData, CharUnicodeModel, UnicodeModel
+from unicode_api.data.scripts.script_types import (
+    AllParsedUnicodeData,
+    CharUnicodeModel,
+    ParsedUnicodeDataSummary,
+    UnicodeModel,
+)
 from unicode_api.data.util.spinner import Spinner
 from unicode_api.models.util import normalize_string_lm3
 
@@ -35,9 +50,59 @@ if TYPE_CHECKING:  # pragma: no cover
 
 ERROR_MESSAGE_MAX_WIDTH = 80
 YES_NO_MAP = {"Y": True, "N": False}
+UCD_NAMESPACE = "http://www.unicode.org/ns/2003/ucd/1.0"
+UCD_BLOCK_TAG = f"{{{UCD_NAMESPACE}}}block"
+UCD_CHAR_TAG = f"{{{UCD_NAMESPACE}}}char"
+STREAM_BATCH_SIZE = 5000
+CHARACTER_SHARD_SIZE = 2000
+# Must be incremented whenever a change to this module alters the parsed data, since the parsed data cache is
+# only invalidated by a change to the XML database file, prop_values.json or this value
+PARSER_VERSION = 1
 
+ParsedCharacter = tuple[bool, bool, Result[db.UnicodeCharacter] | None, Result[db.UnicodeCharacterUnihan] | None]
 
-def parse_xml_unicode_database(settings: UnicodeApiSettings) -> Result[AllParsedUnicodeData]:
+
+class BlockInterval(NamedTuple):
+    start_dec: int
+    finish_dec: int
+    id: int
+    long_name: str
+    plane_id: int
+
+
+NULL_BLOCK_INTERVAL = BlockInterval(
+    NULL_BLOCK.start_dec, NULL_BLOCK.finish_dec, NULL_BLOCK.id or 0, NULL_BLOCK.long_name, NULL_BLOCK.plane_id
+)
+
+
+class BlockIntervalIndex:
+    """
+    A compact (and picklable) index of the codepoint range assigned to each block, which is sent to every
+    worker process when characters are parsed in parallel.
+
+    Since blocks never overlap, the block containing a codepoint is found with a binary search of the sorted
+    start codepoints.
+    """
+
+    def __init__(self, blocks: Iterable[db.UnicodeBlock]) -> None:
+        self.intervals = sorted(
+            BlockInterval(block.start_dec, block.finish_dec, block.id or 0, block.long_name, block.plane_id)
+            for block in blocks
+        )
+        self.starts = [interval.start_dec for interval in self.intervals]
+
+    def find(self, codepoint: int) -> BlockInterval:
+        index = bisect_right(self.starts, codepoint) - 1
+        if index >= 0 and codepoint <= self.intervals[index].finish_dec:
+            return self.intervals[index]
+        return NULL_BLOCK_INTERVAL
+
+
+# Populated in each worker process by _init_character_parser_process
+_worker_state: dict[str, Any] = {}
+
+
+def parse_xml_unicode_database(settings: UnicodeApiSettings, workers: int = 1) -> Result[AllParsedUnicodeData]:
     """
     Parses the Unicode XML database file and extracts all relevant Unicode data.
 
@@ -50,6 +115,10 @@ def parse_xml_unicode_database(settings: UnicodeApiSettings) -> Result[AllParsed
     Args:
         settings (UnicodeApiSettings): The settings object containing configuration, including the path to
         the Unicode XML file.
+        workers (int): The number of processes used to parse the character data. If greater than 1, the
+        characters are split into shards of consecutive codepoints which are parsed by a process pool. The
+        results are merged in codepoint order, so the parsed data is identical for any number of workers.
+        Defaults to 1.
 
     Returns:
         Result[AllParsedUnicodeData]: A Result object containing the parsed Unicode data on success,
@@ -70,7 +139,7 @@ def parse_xml_unicode_database(settings: UnicodeApiSettings) -> Result[AllParsed
         )
     planes, blocks = result.value
 
-    result = _parse_unicode_character_data_from_xml(settings, unicode_xml, blocks, planes)
+    result = _parse_unicode_character_data_from_xml(settings, unicode_xml, blocks, workers)
     if result.failure:
         return Result[AllParsedUnicodeData].Fail(result.error)
     if not result.value:
@@ -83,6 +152,42 @@ def parse_xml_unicode_database(settings: UnicodeApiSettings) -> Result[AllParsed
     return Result[AllParsedUnicodeData].Ok(_finalize_all_parsed_unicode_data(settings, all_parsed_data))
 
 
+def stream_xml_unicode_database(
+    settings: UnicodeApiSettings, batch_size: int = STREAM_BATCH_SIZE, workers: int = 1
+) -> Result[tuple[ParsedUnicodeDataSummary, Iterator[Result[list[CharUnicodeModel]]]]]:
+    """
+    Parses the Unicode XML database file incrementally, without building an ElementTree for the entire file.
+
+    The plane and block data is parsed first (every character must be assigned to a block, and the `<blocks>`
+    element follows the `<repertoire>` element in the XML file). The characters are parsed by the returned
+    iterator, which reads the XML file a second time and yields batches of validated characters (or an error
+    for each character that is invalid). Each XML element is discarded as soon as it has been parsed, so
+    memory use does not grow with the size of the XML file.
+
+    As each character is parsed, the returned summary is updated with the data needed to create the JSON data
+    files. The number of defined characters in each block and plane is only known after the iterator is
+    exhausted.
+
+    Args:
+        settings (UnicodeApiSettings): The settings object containing configuration, including the path to
+        the Unicode XML file.
+        batch_size (int): The maximum number of characters in each batch yielded by the iterator.
+        workers (int): The number of processes used to parse the character data (see
+        `parse_xml_unicode_database`). Defaults to 1.
+
+    Returns:
+        Result[tuple[ParsedUnicodeDataSummary, Iterator[Result[list[CharUnicodeModel]]]]]: A Result object
+        containing the parsed plane and block data and an iterator over batches of parsed characters on
+        success, or an error message on failure.
+    """
+    result = _parse_unicode_plane_and_block_data_from_xml_stream(settings)
+    if result.failure or not result.value:
+        return Result[tuple[ParsedUnicodeDataSummary, Iterator[Result[list[CharUnicodeModel]]]]].Fail(result.error)
+    summary = result.value
+    char_batches = _iter_unicode_character_data_from_xml(settings, summary, batch_size, workers)
+    return Result[tuple[ParsedUnicodeDataSummary, Iterator[Result[list[CharUnicodeModel]]]]].Ok((summary, char_batches))
+
+
 def _parse_etree_from_xml_file(xml: Path) -> Result[_ElementTree]:
     spinner = Spinner()
     spinner.start("Parsing Unicode XML file to ETree..")
@@ -96,6 +201,49 @@ def _parse_etree_from_xml_file(xml: Path) -> Result[_ElementTree]:
         return Result[_ElementTree].Fail(error)
 
 
+def _iter_xml_elements(xml_file: Path, tags: set[str]) -> Iterator[_Element]:
+    for _, node in etree.iterparse(str(xml_file), events=("end",)):  # type: ignore[reportUnknownMemberType]
+        if node.tag in tags:
+            yield node
+        # Discard each element once it has been handled, otherwise the entire tree would be kept in memory
+        node.clear()
+        while node.getprevious() is not None:
+            del node.getparent()[0]  # type: ignore[reportOptionalSubscript]
+
+
+def _parse_unicode_plane_and_block_data_from_xml_stream(
+    settings: UnicodeApiSettings,
+) -> Result[ParsedUnicodeDataSummary]:
+    spinner = Spinner()
+    spinner.start("Parsing Unicode plane and block data from XML database file...")
+    all_planes = [db.UnicodePlane(**plane) for plane in json.loads(settings.planes_json.read_text())]
+    block_results: list[Result[db.UnicodeBlock]] = []
+    total_characters = 0
+    try:
+        for node in _iter_xml_elements(settings.xml_file, {UCD_BLOCK_TAG, UCD_CHAR_TAG}):
+            if node.tag == UCD_BLOCK_TAG:
+                block_results.append(_parse_block_details(len(block_results) + 1, node, all_planes))
+            elif "cp" in node.keys():  # noqa: SIM118
+                total_characters += 1
+    except Exception as ex:
+        error = f"Error occurred parsing Unicode XML database file: {repr(ex)}"
+        spinner.failed(error)
+        return Result[ParsedUnicodeDataSummary].Fail(error)
+    all_blocks, parse_errors = _evaluate_parse_results(block_results)
+    if parse_errors:
+        error = f"Error parsing Unicode block data from XML database file: {'\n\n'.join(parse_errors)}"
+        spinner.failed(error)
+        return Result[ParsedUnicodeDataSummary].Fail(error)
+    if not all_blocks:
+        error = "Error parsing Unicode block data from XML database file: No data found!"
+        spinner.failed(error)
+        return Result[ParsedUnicodeDataSummary].Fail(error)
+    (all_planes, all_blocks) = _get_block_range_for_each_plane(all_planes, all_blocks)
+    update_block_property_values(settings, all_blocks)
+    spinner.successful("Successfully parsed Unicode plane and block data from XML database file!")
+    return Result[ParsedUnicodeDataSummary].Ok(ParsedUnicodeDataSummary(all_planes, all_blocks, total_characters))
+
+
 def _parse_unicode_plane_and_block_data_from_xml(
     unicode_xml: _ElementTree, settings: UnicodeApiSettings
 ) -> Result[tuple[list[db.UnicodePlane], list[db.UnicodeBlock]]]:
@@ -118,7 +266,7 @@ def _parse_unicode_plane_and_block_data_from_xml(
 def _parse_unicode_block_data_from_xml(
     xml: _ElementTree, parsed_planes: list[db.UnicodePlane]
 ) -> Result[list[db.UnicodeBlock]]:
-    all_blocks = xml.findall(".//block", {None: "http://www.unicode.org/ns/2003/ucd/1.0"})
+    all_blocks = xml.findall(".//block", {None: UCD_NAMESPACE})
     results = [_parse_block_details(id, block, parsed_planes) for id, block in enumerate(all_blocks, start=1)]
     valid_results, invalid_results = _evaluate_parse_results(results)
     if invalid_results:
@@ -204,24 +352,17 @@ def _get_block_range_for_each_plane(
 
 
 def _parse_unicode_character_data_from_xml(
-    settings: UnicodeApiSettings,
-    xml: _ElementTree,
-    blocks: list[db.UnicodeBlock],
-    planes: list[db.UnicodePlane],
+    settings: UnicodeApiSettings, xml: _ElementTree, blocks: list[db.UnicodeBlock], workers: int
 ) -> Result[tuple[list[db.UnicodeCharacter], list[db.UnicodeCharacter], list[db.UnicodeCharacterUnihan]]]:
     non_unihan_results: list[Result[db.UnicodeCharacter]] = []
     tangut_results: list[Result[db.UnicodeCharacter]] = []
     unihan_results: list[Result[db.UnicodeCharacterUnihan]] = []
     prop_value_id_map = json.loads(settings.prop_values_json.read_text())
-    char_nodes = xml.findall(".//char", {None: "http://www.unicode.org/ns/2003/ucd/1.0"})
+    char_nodes = xml.findall(".//char", {None: UCD_NAMESPACE})
     spinner = Spinner()
     spinner.start("Parsing Unicode character data from XML database file...", total=len(char_nodes))
-    for char in char_nodes:
-        if "cp" not in char.keys():  # noqa: SIM118
-            continue
-        (unihan, tangut, non_unihan_result, unihan_result) = _parse_character_details(
-            prop_value_id_map, char, blocks, planes
-        )
+    parsed_chars = _parse_character_nodes(prop_value_id_map, char_nodes, BlockIntervalIndex(blocks), workers)
+    for unihan, tangut, non_unihan_result, unihan_result in parsed_chars:
         if unihan and unihan_result:
             unihan_results.append(unihan_result)
         elif tangut and non_unihan_result:
@@ -233,16 +374,91 @@ def _parse_unicode_character_data_from_xml(
     return _validate_all_parsed_character_data(non_unihan_results, tangut_results, unihan_results)
 
 
+def _iter_unicode_character_data_from_xml(
+    settings: UnicodeApiSettings, summary: ParsedUnicodeDataSummary, batch_size: int, workers: int
+) -> Iterator[Result[list[CharUnicodeModel]]]:
+    prop_value_id_map = json.loads(settings.prop_values_json.read_text())
+    # The index is created before the iterator is consumed, since the parser runs in a separate thread
+    block_index = BlockIntervalIndex(summary.blocks)
+    return _iter_parsed_character_batches(settings, summary, prop_value_id_map, block_index, batch_size, workers)
+
+
+def _iter_parsed_character_batches(
+    settings: UnicodeApiSettings,
+    summary: ParsedUnicodeDataSummary,
+    prop_value_id_map: "UnicodePropertyGroupMap",
+    block_index: BlockIntervalIndex,
+    batch_size: int,
+    workers: int,
+) -> Iterator[Result[list[CharUnicodeModel]]]:
+    batch: list[CharUnicodeModel] = []
+    char_nodes = _iter_xml_elements(settings.xml_file, {UCD_CHAR_TAG})
+    for unihan, tangut, non_unihan_result, unihan_result in _parse_character_nodes(
+        prop_value_id_map, char_nodes, block_index, workers
+    ):
+        if not (result := unihan_result if unihan else non_unihan_result):
+            continue
+        if result.failure or not result.value:
+            yield Result[list[CharUnicodeModel]].Fail(result.error)
+            continue
+        summary.add_character(result.value, tangut)
+        batch.append(result.value)
+        if len(batch) >= batch_size:
+            yield Result[list[CharUnicodeModel]].Ok(batch)
+            batch = []
+    if batch:
+        yield Result[list[CharUnicodeModel]].Ok(batch)
+
+
+def _parse_character_nodes(
+    prop_value_id_map: "UnicodePropertyGroupMap",
+    char_nodes: Iterable[_Element],
+    block_index: BlockIntervalIndex,
+    workers: int,
+) -> Iterator[ParsedCharacter]:
+    char_nodes = (char for char in char_nodes if "cp" in char.keys())  # noqa: SIM118
+    if workers <= 1:
+        for char in char_nodes:
+            yield _parse_character_details(prop_value_id_map, char.attrib, block_index)
+        return
+    # Elements cannot be pickled, so each shard contains the attributes of consecutive <char> elements. Worker
+    # processes are spawned rather than forked, since the streaming parser runs in a separate thread.
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        mp_context=get_context("spawn"),
+        initializer=_init_character_parser_process,
+        initargs=(prop_value_id_map, block_index),
+    ) as executor:
+        pending: deque[Future[list[ParsedCharacter]]] = deque()
+        for shard in batched((dict(char.attrib) for char in char_nodes), CHARACTER_SHARD_SIZE):
+            pending.append(executor.submit(_parse_character_shard, shard))
+            # Results are yielded in the order the shards were submitted, and the number of shards waiting to
+            # be parsed is limited so that memory use stays flat when the XML file is streamed
+            if len(pending) > workers * 2:
+                yield from pending.popleft().result()
+        while pending:
+            yield from pending.popleft().result()
+
+
+def _init_character_parser_process(
+    prop_value_id_map: "UnicodePropertyGroupMap", block_index: BlockIntervalIndex
+) -> None:
+    _worker_state.update(prop_value_id_map=prop_value_id_map, block_index=block_index)
+
+
+def _parse_character_shard(char_attrs: tuple[dict[str, str], ...]) -> list[ParsedCharacter]:
+    (prop_value_id_map, block_index) = (_worker_state["prop_value_id_map"], _worker_state["block_index"])
+    return [_parse_character_details(prop_value_id_map, attrs, block_index) for attrs in char_attrs]
+
+
 def _parse_character_details(
     prop_value_id_map: "UnicodePropertyGroupMap",
-    char_node: _Element,
-    parsed_blocks: list[db.UnicodeBlock],
-    parsed_planes: list[db.UnicodePlane],
-) -> tuple[bool, bool, Result[db.UnicodeCharacter] | None, Result[db.UnicodeCharacterUnihan] | None]:
+    char_node: "_Attrib | dict[str, str]",
+    block_index: BlockIntervalIndex,
+) -> ParsedCharacter:
     codepoint = char_node.get("cp", "0")
     codepoint_dec = int(codepoint, 16)
-    block = _get_unicode_block_containing_codepoint(codepoint_dec, parsed_blocks)
-    plane = [plane for plane in parsed_planes if plane.id == block.plane_id][0]
+    block = block_index.find(codepoint_dec)
     unihan = any(
         bname in block.long_name.lower() for bname in ["cjk unified ideographs", "cjk compatibility ideographs"]
     )
@@ -302,8 +518,8 @@ def _parse_character_details(
         "emoji_modifier_base": YES_NO_MAP[char_node.get("EBase", "N")],
         "emoji_component": YES_NO_MAP[char_node.get("EComp", "N")],
         "extended_pictographic": YES_NO_MAP[char_node.get("ExtPict", "N")],
-        "block_id": block.id or 0,
-        "plane_id": plane.id or -1,
+        "block_id": block.id,
+        "plane_id": block.plane_id or -1,
         "general_category_id": _get_prop_value_id_from_short_name(
             prop_value_id_map, "General_Category", char_node.get("gc", "0")
         ),
@@ -386,13 +602,9 @@ def _get_prop_value_id_from_short_name(
     return 999999
 
 
-def _get_unicode_block_containing_codepoint(codepoint: int, parsed_blocks: list[db.UnicodeBlock]) -> db.UnicodeBlock:
-    if any((found := block).start_dec <= codepoint <= found.finish_dec for block in parsed_blocks):
-        return found
-    return NULL_BLOCK
-
-
-def _get_character_name(char_node: _Element, codepoint: str, codepoint_dec: int, block: db.UnicodeBlock) -> str:
+def _get_character_name(
+    char_node: "_Attrib | dict[str, str]", codepoint: str, codepoint_dec: int, block: BlockInterval
+) -> str:
     if not codepoint:
         return f"Undefined Codepoint ({get_codepoint_string(codepoint_dec)}) (Reserved for {block.long_name})"
     if not (name := char_node.get("na", "")):
@@ -521,14 +733,22 @@ def _finalize_all_parsed_unicode_data(
     spinner = Spinner()
     spinner.start("Counting number of defined characters in each block and plane...")
     all_planes, all_blocks, non_unihan_chars, tangut_chars, unihan_chars = all_parsed_data
-    _update_block_property_values(settings, all_blocks)
+    update_block_property_values(settings, all_blocks)
     _count_defined_characters_per_block(non_unihan_chars, tangut_chars, unihan_chars, all_blocks)
     _count_defined_characters_per_plane(all_blocks, all_planes)
     spinner.successful("Successfully counted number of defined characters in each block and plane!")
     return (all_planes, all_blocks, non_unihan_chars, tangut_chars, unihan_chars)
 
 
-def _update_block_property_values(settings: UnicodeApiSettings, all_blocks: list[db.UnicodeBlock]):
+def update_block_property_values(settings: UnicodeApiSettings, all_blocks: list[db.UnicodeBlock]):
+    """
+    Sets the short name of each block and replaces the Block property values in prop_values.json with the
+    parsed blocks (whose IDs are used by every parsed character).
+
+    Args:
+        settings (UnicodeApiSettings): The application settings containing the location of prop_values.json.
+        all_blocks (list[db.UnicodeBlock]): The blocks parsed from the XML database file.
+    """
     prop_value_id_map = json.loads(settings.prop_values_json.read_text())
     block_name_map = {normalize_string_lm3(block["long_name"]): block for block in prop_value_id_map["Block"].values()}
     updated_block_value_map = {}
@@ -0,0 +1,202 @@
+"""
+Caches the parsed Unicode data, so that the XML database file is only parsed again when it (or the parser) has
+changed since the previous update.
+
+The cache file contains the rows inserted into each table by the bulk loader, along with the data needed to
+create the JSON data files. It is identified by a key derived from the contents of the XML database file, the
+contents of prop_values.json (which contains the ID of every property value referenced by the parsed data),
+`PARSER_VERSION` and the code that converts the parsed data to table rows (the JSON schema of each model, and
+the source of the modules containing the models, their column types and the row builder). If the key stored in
+the cache file does not match, the XML database file is parsed and the cache file is replaced. If the cache file
+cannot be saved, the update continues without it.
+
+Functions:
+    parse_xml_unicode_database_with_cache(
+        settings: UnicodeApiSettings, workers: int = 1
+    ) -> Result[ParsedUnicodeDataRows]:
+        Returns the cached parsed data if the cache file is valid, otherwise parses the XML database file and
+        saves the parsed data to the cache file.
+
+Constants:
+    PARSED_DATA_CACHE_HEADER (bytes): Identifies the format of the cache file.
+    TABLE_ROW_MODELS (list[type[UnicodeModel]]): The models converted to the rows stored in the cache file.
+    TABLE_ROW_SOURCE_MODULES (list[ModuleType]): The modules that determine the rows built from the models.
+"""
+
+import hashlib
+import zlib
+from collections import Counter
+from pathlib import Path
+from types import ModuleType
+from typing import Any
+
+import orjson
+from sqlmodel import SQLModel
+
+import unicode_api.db.models as db
+import unicode_api.enums.triadic_logic
+import unicode_api.models.block
+import unicode_api.models.character
+import unicode_api.models.plane
+from unicode_api.config.api_settings import UnicodeApiSettings
+from unicode_api.core.result import Result
+from unicode_api.data.scripts.script_types import ParsedUnicodeDataRows, ParsedUnicodeDataSummary, UnicodeModel
+from unicode_api.data.scripts.update_all_data import populate_sqlite_db
+from unicode_api.data.scripts.update_all_data.parse_xml_unicode_db import (
+    PARSER_VERSION,
+    parse_xml_unicode_database,
+    update_block_property_values,
+)
+from unicode_api.data.scripts.update_all_data.populate_sqlite_db import get_table_rows
+from unicode_api.data.util.spinner import Spinner
+
+PARSED_DATA_CACHE_HEADER = b"UCPARSE1"
+CACHE_KEY_SIZE = hashlib.sha256().digest_size
+TABLE_ROW_MODELS: list[type[UnicodeModel]] = [
+    db.UnicodePlane,
+    db.UnicodeBlock,
+    db.UnicodeCharacter,
+    db.UnicodeCharacterUnihan,
+    db.CharacterScriptExtension,
+]
+TABLE_ROW_SOURCE_MODULES: list[ModuleType] = [
+    unicode_api.models.plane,
+    unicode_api.models.block,
+    unicode_api.models.character,
+    unicode_api.enums.triadic_logic,
+    populate_sqlite_db,
+]
+
+
+def parse_xml_unicode_database_with_cache(
+    settings: UnicodeApiSettings, workers: int = 1
+) -> Result[ParsedUnicodeDataRows]:
+    """
+    Returns the parsed Unicode data from the cache file if neither the XML database file nor the parser have
+    changed, otherwise parses the XML database file and saves the parsed data to the cache file.
+
+    Args:
+        settings (UnicodeApiSettings): The application settings containing the location of the XML database
+            file and the cache file.
+        workers (int): The number of processes used to parse the character data if the cache file is not valid.
+            Defaults to 1.
+
+    Returns:
+        Result[ParsedUnicodeDataRows]: The parsed data (converted to table rows), or an error if the XML database
+        file could not be parsed.
+    """
+    cache_key = _get_parsed_data_cache_key(settings)
+    spinner = Spinner()
+    spinner.start("Checking for cached parsed Unicode data...")
+    parsed = _read_parsed_data_cache(settings.parsed_data_cache, cache_key)
+    if parsed:
+        # prop_values.json is created again before every update, so the parsed blocks must be added to it
+        update_block_property_values(settings, parsed.summary.blocks)
+        total = parsed.summary.total_characters
+        spinner.successful(f"XML database file has not changed, using cached parsed data ({total:,} characters)")
+        return Result[ParsedUnicodeDataRows].Ok(parsed)
+    spinner.successful("No valid cached parsed data was found, XML database file must be parsed")
+
+    result = parse_xml_unicode_database(settings, workers)
+    if result.failure or not result.value:
+        return Result[ParsedUnicodeDataRows].Fail(result.error)
+    parsed = ParsedUnicodeDataRows(
+        ParsedUnicodeDataSummary.from_parsed_data(result.value), get_table_rows(settings, result.value)
+    )
+
+    spinner = Spinner()
+    spinner.start("Saving parsed Unicode data to cache file...")
+    result = _save_parsed_data_cache(settings.parsed_data_cache, cache_key, parsed)
+    if result.failure:
+        # The cache only speeds up the next update, so the parsed data is still used if it cannot be saved
+        spinner.failed(f"Unable to save parsed Unicode data to cache file, skipping: {result.error}")
+    else:
+        spinner.successful(f"Successfully saved parsed Unicode data to {settings.parsed_data_cache.name}")
+    return Result[ParsedUnicodeDataRows].Ok(parsed)
+
+
+def _get_parsed_data_cache_key(settings: UnicodeApiSettings) -> bytes:
+    cache_key = hashlib.sha256(f"{PARSER_VERSION}".encode())
+    for source_file in [settings.xml_file, settings.prop_values_json]:
+        with source_file.open("rb") as f:
+            cache_key.update(hashlib.file_digest(f, "sha256").digest())
+    cache_key.update(_get_table_rows_digest())
+    return cache_key.digest()
+
+
+def _get_table_rows_digest() -> bytes:
+    # The rows are built from the validated models by the bind processor of each column, so a change to any field,
+    # validator or column type (or to the row builder itself) can change the rows without changing the parsed data
+    digest = hashlib.sha256()
+    for model in TABLE_ROW_MODELS:
+        digest.update(orjson.dumps(model.model_json_schema(), option=orjson.OPT_SORT_KEYS))
+    for module in TABLE_ROW_SOURCE_MODULES:
+        digest.update(Path(module.__file__ or "").read_bytes())
+    return digest.digest()
+
+
+def _read_parsed_data_cache(cache_file: Path, cache_key: bytes) -> ParsedUnicodeDataRows | None:
+    if not cache_file.exists():
+        return None
+    data = cache_file.read_bytes()
+    key_start = len(PARSED_DATA_CACHE_HEADER)
+    key_end = key_start + CACHE_KEY_SIZE
+    if data[:key_start] != PARSED_DATA_CACHE_HEADER or data[key_start:key_end] != cache_key:
+        return None
+    try:
+        cached = orjson.loads(zlib.decompress(data[key_end:]))
+        # The cached rows are only valid if each table has the same columns as when the cache file was saved
+        if cached["columns"] != _get_table_columns(cached["table_rows"]):
+            return None
+        return ParsedUnicodeDataRows(_deserialize_summary(cached["summary"]), cached["table_rows"])
+    except (zlib.error, orjson.JSONDecodeError, KeyError, TypeError, ValueError):
+        return None
+
+
+def _save_parsed_data_cache(cache_file: Path, cache_key: bytes, parsed: ParsedUnicodeDataRows) -> Result[None]:
+    cached = {
+        "columns": _get_table_columns(parsed.table_rows),
+        "summary": _serialize_summary(parsed.summary),
+        "table_rows": parsed.table_rows,
+    }
+    try:
+        # The fastest compression level is used since the cache file is only read by the update process
+        data = zlib.compress(orjson.dumps(cached, option=orjson.OPT_NON_STR_KEYS), level=1)
+        cache_file.write_bytes(PARSED_DATA_CACHE_HEADER + cache_key + data)
+    except (orjson.JSONEncodeError, OSError) as ex:
+        # A partially written cache file would be rejected when it is read, but there is no reason to keep it
+        cache_file.unlink(missing_ok=True)
+        return Result[None].Fail(f"Error! {repr(ex)}")
+    return Result[None].Ok()
+
+
+def _get_table_columns(table_rows: dict[str, Any]) -> dict[str, list[str]]:
+    return {
+        table_name: [column.name for column in SQLModel.metadata.tables[table_name].columns]
+        for table_name in table_rows
+    }
+
+
+def _serialize_summary(summary: ParsedUnicodeDataSummary) -> dict[str, Any]:
+    return {
+        "planes": [plane.model_dump() for plane in summary.planes],
+        "blocks": [block.model_dump() for block in summary.blocks],
+        "total_characters": summary.total_characters,
+        "char_name_map": summary.char_name_map,
+        "unihan_char_block_map": summary.unihan_char_block_map,
+        "tangut_char_block_map": summary.tangut_char_block_map,
+        "defined_char_counts": summary.defined_char_counts,
+    }
+
+
+def _deserialize_summary(cached: dict[str, Any]) -> ParsedUnicodeDataSummary:
+    # JSON object keys are always strings, every map in the summary is keyed by codepoint or block ID
+    return ParsedUnicodeDataSummary(
+        planes=[db.UnicodePlane.model_validate(plane) for plane in cached["planes"]],
+        blocks=[db.UnicodeBlock.model_validate(block) for block in cached["blocks"]],
+        total_characters=cached["total_characters"],
+        char_name_map={int(codepoint): name for codepoint, name in cached["char_name_map"].items()},
+        unihan_char_block_map={int(cp): block_id for cp, block_id in cached["unihan_char_block_map"].items()},
+        tangut_char_block_map={int(cp): block_id for cp, block_id in cached["tangut_char_block_map"].items()},
+        defined_char_counts=Counter({int(block_id): n for block_id, n in cached["defined_char_counts"].items()}),
+    )
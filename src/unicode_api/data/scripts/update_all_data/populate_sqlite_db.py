@@ -3,23 +3,45 @@ Populates a SQLite database with Unicode data, including planes, blocks, charact
 and property groups.
 
 Functions:
-    populate_sqlite_database(settings: UnicodeApiSettings, parsed_data: AllParsedUnicodeData) -> Result[None]:
+    populate_sqlite_database(
+        settings: UnicodeApiSettings, parsed_data: AllParsedUnicodeData, bulk_insert: bool = True
+    ) -> Result[None]:
         Orchestrates the entire population process, including schema creation, data
-        import, and maintenance operations.
+        import, full-text index creation, bitmap filter index creation and maintenance operations.
+
+    populate_sqlite_database_from_rows(settings: UnicodeApiSettings, table_rows: TableRows) -> Result[None]:
+        Performs the same process using parsed data that has already been converted to table rows (e.g., by
+        get_table_rows(settings: UnicodeApiSettings, parsed_data: AllParsedUnicodeData) -> TableRows).
+
+    populate_sqlite_database_from_stream(
+        settings: UnicodeApiSettings,
+        summary: ParsedUnicodeDataSummary,
+        char_batches: Iterator[Result[list[CharUnicodeModel]]],
+        bulk_insert: bool = True,
+    ) -> Result[None]:
+        Performs the same process, but inserts each batch of characters while the XML database file is still
+        being parsed.
 
 Constants:
     BATCH_SIZE (int): Number of records to insert per batch (5000).
+    STREAM_QUEUE_SIZE (int): Maximum number of parsed character batches waiting to be inserted (8).
     PROP_GROUP_DB_MODEL_MAP (dict[str, UnicodePropertyGroupType]): Maps property
         group names to their corresponding database model classes.
 """
 
 import json
-from collections.abc import Sequence
-from typing import TYPE_CHECKING, cast
+import sqlite3
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from functools import cache, partial
+from itertools import batched, groupby
+from queue import Queue
+from threading import Thread
+from typing import TYPE_CHECKING, Any, cast
 
-from sqlalchemy import text
+from sqlalchemy import Table, text
 from sqlalchemy.engine import Engine
 from sqlalchemy.exc import StatementError
+from sqlalchemy.schema import CreateTable
 from sqlmodel import Session, SQLModel
 
 import unicode_api.db.models as db
@@ -28,17 +50,23 @@ from unicode_api.constants import PROP_GROUP_INVALID_FOR_VERSION_ROW_ID
 from unicode_api.core.result import Result
 from unicode_api.data.scripts.script_types import (
     AllParsedUnicodeData,
+    CharUnicodeModel,
+    ParsedUnicodeDataSummary,
+    TableRows,
     UnicodeModel,
     UnicodePropertyGroupType,
 )
 from unicode_api.data.util.spinner import Spinner
+from unicode_api.db.bitmap_filter import BitmapFilterIndex, get_index_fingerprint
 from unicode_api.db.character_props import PROPERTY_GROUPS
 from unicode_api.db.engine import rw_db_engine as engine
+from unicode_api.db.full_text_search import get_full_text_index_statements
 
 if TYPE_CHECKING:  # pragma: no cover
     from unicode_api.custom_types import UnicodePropertyGroupMap, UnicodePropertyGroupValues
 
 BATCH_SIZE = 5000
+STREAM_QUEUE_SIZE = 8
 PROP_GROUP_DB_MODEL_MAP: dict[str, UnicodePropertyGroupType] = {
     "Age": db.Age,
     "Bidi_Class": db.Bidi_Class,
@@ -64,58 +92,170 @@ PROP_GROUP_DB_MODEL_MAP: dict[str, UnicodePropertyGroupType] = {
 }
 
 
-def populate_sqlite_database(settings: UnicodeApiSettings, parsed_data: AllParsedUnicodeData) -> Result[None]:
+def populate_sqlite_database(
+    settings: UnicodeApiSettings, parsed_data: AllParsedUnicodeData, bulk_insert: bool = True
+) -> Result[None]:
     """
     Populates the SQLite database with Unicode data.
 
     This function initializes the database and its tables, imports Unicode property groups,
-    and inserts parsed Unicode data into the appropriate tables. It also performs database
-    maintenance operations such as VACUUM and ANALYZE after data insertion.
+    and inserts parsed Unicode data into the appropriate tables (including the character_script_extension
+    table, which stores one row for each script in a character's Script_Extensions property). It also builds
+    the FTS5 indexes used to filter characters by name and CJK definition, saves the bitmap index used by the
+    bitmap filter engine next to the database file, and performs database maintenance operations such as
+    VACUUM and ANALYZE after data insertion.
+
+    By default, rows are inserted with `executemany` in a single transaction, and every index is created
+    after all rows have been inserted. If `bulk_insert` is False, rows are added through the ORM in batches
+    of `BATCH_SIZE` (with a commit per batch) and indexes are created with the tables. Both methods produce
+    identical table contents.
 
     Args:
         settings (UnicodeApiSettings): The application settings containing database configuration.
         parsed_data (AllParsedUnicodeData): A tuple containing all parsed Unicode data, including planes,
             blocks, non-Unihan characters, Tangut characters, and Unihan characters.
+        bulk_insert (bool): Whether to use the bulk loader instead of the ORM. Defaults to True.
 
     Returns:
         Result[None]: A Result object indicating success or failure. On failure, contains the error.
     """
-    all_planes, all_blocks, non_unihan_chars, tangut_chars, unihan_chars = parsed_data
-
-    parsed_data_table_map: dict[
-        type[UnicodeModel],
-        list[db.UnicodePlane] | list[db.UnicodeBlock] | list[db.UnicodeCharacter] | list[db.UnicodeCharacterUnihan],
-    ] = {
-        db.UnicodePlane: all_planes,
-        db.UnicodeBlock: all_blocks,
-        db.UnicodeCharacter: non_unihan_chars + tangut_chars,
-        db.UnicodeCharacterUnihan: unihan_chars,
-    }
+    if bulk_insert:
+        return populate_sqlite_database_from_rows(settings, get_table_rows(settings, parsed_data))
     result = Result[None].Ok()
     with Session(engine) as session:
-        _initialize_database_schema(settings, engine)
+        _initialize_database_schema(settings, engine, create_indexes=True)
         result = _import_unicode_property_groups(settings, session)
         if result.failure:
             return result
-        for table, parsed in parsed_data_table_map.items():
+        for table, parsed in _get_parsed_data_table_map(settings, parsed_data).items():
             result = _import_unicode_entities(session, parsed, table)
             if result.failure:
                 break
-        with engine.connect() as conn:
-            conn.execute(text("VACUUM;"))
-            conn.execute(text("ANALYZE;"))
+        result = _build_indexes_and_optimize_database(settings, result, create_indexes=False)
     return Result[None].Ok() if result.success else Result[None].Fail(result.error)
 
 
-def _initialize_database_schema(settings: UnicodeApiSettings, engine: Engine) -> None:
+def populate_sqlite_database_from_rows(settings: UnicodeApiSettings, table_rows: TableRows) -> Result[None]:
+    """
+    Populates the SQLite database with parsed Unicode data that has already been converted to table rows
+    (e.g., parsed data loaded from the parsed data cache).
+
+    Rows are inserted by the bulk loader used by `populate_sqlite_database`, followed by the same index
+    creation and maintenance operations.
+
+    Args:
+        settings (UnicodeApiSettings): The application settings containing database configuration.
+        table_rows (TableRows): The rows to insert into each table, in the order the tables must be populated.
+
+    Returns:
+        Result[None]: A Result object indicating success or failure. On failure, contains the error.
+    """
+    result = Result[None].Ok()
+    with Session(engine) as session:
+        _initialize_database_schema(settings, engine, create_indexes=False)
+        result = _import_unicode_property_groups(settings, session)
+        if result.failure:
+            return result
+        result = _run_bulk_insert_transaction(lambda db_conn: _bulk_import_table_rows(db_conn, table_rows))
+        result = _build_indexes_and_optimize_database(settings, result, create_indexes=True)
+    return Result[None].Ok() if result.success else Result[None].Fail(result.error)
+
+
+def get_table_rows(settings: UnicodeApiSettings, parsed_data: AllParsedUnicodeData) -> TableRows:
+    """
+    Converts parsed Unicode data to the rows that are inserted into each table by the bulk loader.
+
+    Args:
+        settings (UnicodeApiSettings): The application settings containing the location of the JSON files.
+        parsed_data (AllParsedUnicodeData): A tuple containing all parsed Unicode data.
+
+    Returns:
+        TableRows: The values of every row (in column order) for each table, in the order the tables must be
+        populated.
+    """
+    return dict(
+        _get_table_rows(table, parsed) for table, parsed in _get_parsed_data_table_map(settings, parsed_data).items()
+    )
+
+
+def populate_sqlite_database_from_stream(
+    settings: UnicodeApiSettings,
+    summary: ParsedUnicodeDataSummary,
+    char_batches: Iterator[Result[list[CharUnicodeModel]]],
+    bulk_insert: bool = True,
+) -> Result[None]:
+    """
+    Populates the SQLite database with Unicode data while the XML database file is being parsed.
+
+    The iterator of parsed character batches is consumed by a separate thread, which places each batch in a
+    bounded queue. Each batch is inserted (along with its character_script_extension rows) as soon as it is
+    taken from the queue, so parsing overlaps with insertion and at most `STREAM_QUEUE_SIZE` batches are held
+    in memory. The database is then indexed and optimized in the same way as `populate_sqlite_database`.
+
+    The number of defined characters in each plane and block is only known after the last batch has been
+    inserted. The bulk loader inserts every row in a single transaction, so foreign key checks are deferred
+    until the transaction is committed and planes and blocks are inserted last. The ORM inserts planes and
+    blocks before any characters and updates them at the end.
+
+    Args:
+        settings (UnicodeApiSettings): The application settings containing database configuration.
+        summary (ParsedUnicodeDataSummary): The parsed plane and block data, which is updated by
+            `char_batches` as each character is parsed.
+        char_batches (Iterator[Result[list[CharUnicodeModel]]]): An iterator that yields batches of parsed
+            characters, or an error for each character that is invalid.
+        bulk_insert (bool): Whether to use the bulk loader instead of the ORM. Defaults to True.
+
+    Returns:
+        Result[None]: A Result object indicating success or failure. On failure, contains the error.
+    """
+    # Inserted rows are never read again, so there is no need to expire (and reload) them after each commit
+    with Session(engine, expire_on_commit=False) as session:
+        _initialize_database_schema(settings, engine, create_indexes=not bulk_insert)
+        result = _import_unicode_property_groups(settings, session)
+        if result.failure:
+            return result
+        if bulk_insert:
+            result = _run_bulk_insert_transaction(
+                lambda db_conn: _bulk_import_streamed_data(db_conn, settings, summary, char_batches)
+            )
+        else:
+            result = _import_streamed_data(session, settings, summary, char_batches)
+        result = _build_indexes_and_optimize_database(settings, result, create_indexes=bulk_insert)
+    return Result[None].Ok() if result.success else Result[None].Fail(result.error)
+
+
+def _initialize_database_schema(settings: UnicodeApiSettings, engine: Engine, create_indexes: bool) -> None:
     if settings.db_file.exists():
         settings.db_file.unlink()
+    if not create_indexes:
+        # Indexes are created by _create_database_indexes after all rows have been inserted
+        with engine.connect() as con:
+            for table in SQLModel.metadata.sorted_tables:
+                con.execute(CreateTable(table))
+        return
     SQLModel.metadata.create_all(engine)
     with engine.connect() as con:
         for create_index_sql in _generate_covering_index_statements():
             con.execute(text(create_index_sql))
 
 
+def _create_database_indexes(engine: Engine) -> Result[None]:
+    spinner = Spinner()
+    spinner.start("Creating database indexes...")
+    try:
+        with engine.connect() as con:
+            for table in SQLModel.metadata.sorted_tables:
+                for index in table.indexes:
+                    index.create(con)
+            for create_index_sql in _generate_covering_index_statements():
+                con.execute(text(create_index_sql))
+    except StatementError as ex:
+        spinner.failed(f"Error! {repr(ex)}")
+        return Result[None].Fail(f"Error! {repr(ex)}")
+    spinner.successful("Successfully created database indexes")
+    return Result[None].Ok()
+
+
 def _generate_covering_index_statements() -> list[str]:
     sql_statements = [
         _generate_covering_index_sql(prop_group)
@@ -185,6 +325,39 @@ def _import_property_group_values(
         )
 
 
+def _get_parsed_data_table_map(
+    settings: UnicodeApiSettings, parsed_data: AllParsedUnicodeData
+) -> dict[type[UnicodeModel], Sequence[UnicodeModel]]:
+    all_planes, all_blocks, non_unihan_chars, tangut_chars, unihan_chars = parsed_data
+    return {
+        db.UnicodePlane: all_planes,
+        db.UnicodeBlock: all_blocks,
+        db.UnicodeCharacter: non_unihan_chars + tangut_chars,
+        db.UnicodeCharacterUnihan: unihan_chars,
+        db.CharacterScriptExtension: _get_character_script_extensions(
+            _get_script_ids(settings), [*non_unihan_chars, *tangut_chars, *unihan_chars]
+        ),
+    }
+
+
+def _get_script_ids(settings: UnicodeApiSettings) -> dict[str, int]:
+    prop_value_map: UnicodePropertyGroupMap = json.loads(settings.prop_values_json.read_text())
+    script_values = cast(dict[str, "UnicodePropertyGroupValues"], prop_value_map.get("Script", {}))
+    return {prop_value["short_name"].lower(): prop_value["id"] for prop_value in script_values.values()}
+
+
+def _get_character_script_extensions(
+    script_ids: dict[str, int], all_chars: Sequence[CharUnicodeModel]
+) -> list[db.CharacterScriptExtension]:
+    # Rows are created in the order the scripts are listed in the UCD, which is the order used in API responses
+    return [
+        db.CharacterScriptExtension(codepoint_dec=char.codepoint_dec, script_id=script_ids[script.lower()])
+        for char in all_chars
+        for script in dict.fromkeys(char.script_extensions.split())
+        if script.lower() in script_ids
+    ]
+
+
 def _import_unicode_entities[T: UnicodeModel](
     session: Session,
     parsed: Sequence[T],
@@ -215,6 +388,86 @@ def _import_unicode_entities[T: UnicodeModel](
     return Result[None].Ok()
 
 
+def _import_streamed_data(
+    session: Session,
+    settings: UnicodeApiSettings,
+    summary: ParsedUnicodeDataSummary,
+    char_batches: Iterator[Result[list[CharUnicodeModel]]],
+) -> Result[None]:
+    for table, parsed in [(db.UnicodePlane, summary.planes), (db.UnicodeBlock, summary.blocks)]:
+        result = _import_unicode_entities(session, parsed, table)
+        if result.failure:
+            return result
+    insert_batch = partial(_perform_batch_insert, session)
+    result = _import_streamed_characters(settings, summary, char_batches, insert_batch)
+    if result.failure:
+        return result
+    summary.count_defined_characters()
+    return insert_batch([*summary.planes, *summary.blocks])
+
+
+def _import_streamed_characters(
+    settings: UnicodeApiSettings,
+    summary: ParsedUnicodeDataSummary,
+    char_batches: Iterator[Result[list[CharUnicodeModel]]],
+    insert_batch: Callable[[list[UnicodeModel]], Result[None]],
+) -> Result[None]:
+    script_ids = _get_script_ids(settings)
+    batch_queue: Queue[Result[list[CharUnicodeModel]] | None] = Queue(maxsize=STREAM_QUEUE_SIZE)
+    parser = Thread(target=_enqueue_character_batches, args=(char_batches, batch_queue), daemon=True)
+    parser.start()
+    spinner = Spinner()
+    spinner.start(
+        "Parsing Unicode character data and adding it to database...", total=summary.total_characters, unit="chars"
+    )
+    errors: list[str] = []
+    while (result := batch_queue.get()) is not None:
+        if result.failure or not result.value:
+            errors.append(result.error)
+            continue
+        chars = result.value
+        # After an error, the remaining batches are still parsed (to report every invalid character) but not inserted
+        if not errors:
+            insert_result = _insert_character_batch(insert_batch, script_ids, chars)
+            if insert_result.failure:
+                errors.append(insert_result.error)
+        spinner.increment(amount=len(chars))
+    parser.join()
+    if errors:
+        error = f"Error parsing Unicode character data from XML database file: {'\n\n'.join(errors)}"
+        spinner.failed(error)
+        return Result[None].Fail(error)
+    spinner.successful("Successfully parsed Unicode character data and added it to database")
+    return Result[None].Ok()
+
+
+def _insert_character_batch(
+    insert_batch: Callable[[list[UnicodeModel]], Result[None]],
+    script_ids: dict[str, int],
+    chars: list[CharUnicodeModel],
+) -> Result[None]:
+    # An unexpected error must not escape the loop that drains the queue, otherwise the parser thread would be
+    # blocked forever waiting for space in the queue
+    try:
+        return insert_batch([*chars, *_get_character_script_extensions(script_ids, chars)])
+    except Exception as ex:
+        return Result[None].Fail(f"Error! {repr(ex)}")
+
+
+def _enqueue_character_batches(
+    char_batches: Iterator[Result[list[CharUnicodeModel]]],
+    batch_queue: Queue[Result[list[CharUnicodeModel]] | None],
+) -> None:
+    try:
+        for result in char_batches:
+            batch_queue.put(result)
+    except Exception as ex:
+        error = f"Error occurred parsing Unicode XML database file: {repr(ex)}"
+        batch_queue.put(Result[list[CharUnicodeModel]].Fail(error))
+    finally:
+        batch_queue.put(None)
+
+
 def _perform_batch_insert(session: Session, batch: list[UnicodeModel]) -> Result[None]:
     try:
         session.add_all(batch)
@@ -222,3 +475,132 @@ def _perform_batch_insert(session: Session, batch: list[UnicodeModel]) -> Result
         return Result[None].Ok()
     except StatementError as ex:
         return Result[None].Fail(f"Error! {repr(ex)}")
+
+
+def _run_bulk_insert_transaction(insert_rows: Callable[[sqlite3.Connection], Result[None]]) -> Result[None]:
+    # The read-write connection is in autocommit mode, so the transaction must be started and committed manually
+    with engine.connect() as conn:
+        db_conn = cast(sqlite3.Connection, conn.connection.driver_connection)
+        db_conn.execute("BEGIN;")
+        try:
+            result = insert_rows(db_conn)
+        except Exception as ex:
+            # The transaction must not be left open, since the connection is returned to the pool
+            db_conn.execute("ROLLBACK;")
+            return Result[None].Fail(f"Error! {repr(ex)}")
+        try:
+            db_conn.execute("COMMIT;" if result.success else "ROLLBACK;")
+        except sqlite3.Error as ex:
+            db_conn.execute("ROLLBACK;")
+            return Result[None].Fail(f"Error! {repr(ex)}")
+    return result
+
+
+def _bulk_import_table_rows(db_conn: sqlite3.Connection, table_rows: TableRows) -> Result[None]:
+    for table_name, rows in table_rows.items():
+        spinner = Spinner()
+        spinner.start(f"Adding parsed {table_name} data to database...", total=len(rows), unit="rows")
+        for batch in batched(rows, BATCH_SIZE):
+            result = _insert_table_rows(db_conn, table_name, batch)
+            if result.failure:
+                spinner.failed(result.error)
+                return result
+            spinner.increment(amount=len(batch))
+        spinner.successful(f"Successfully added parsed {table_name} data to database ({spinner.rate:,.0f} rows/s)")
+    return Result[None].Ok()
+
+
+def _bulk_import_streamed_data(
+    db_conn: sqlite3.Connection,
+    settings: UnicodeApiSettings,
+    summary: ParsedUnicodeDataSummary,
+    char_batches: Iterator[Result[list[CharUnicodeModel]]],
+) -> Result[None]:
+    # Planes and blocks are inserted after the last character (when the number of defined characters in each is
+    # known), so foreign keys are not checked until the transaction is committed
+    db_conn.execute("PRAGMA defer_foreign_keys=ON;")
+    insert_batch = partial(_perform_bulk_insert, db_conn)
+    result = _import_streamed_characters(settings, summary, char_batches, insert_batch)
+    if result.failure:
+        return result
+    summary.count_defined_characters()
+    return insert_batch([*summary.planes, *summary.blocks])
+
+
+def _perform_bulk_insert(db_conn: sqlite3.Connection, batch: Sequence[UnicodeModel]) -> Result[None]:
+    for table, objs in groupby(batch, key=type):
+        result = _insert_table_rows(db_conn, *_get_table_rows(table, objs))
+        if result.failure:
+            return result
+    return Result[None].Ok()
+
+
+def _insert_table_rows(db_conn: sqlite3.Connection, table_name: str, rows: Iterable[Sequence[Any]]) -> Result[None]:
+    try:
+        (insert_sql, _) = _get_bulk_insert_statement(table_name)
+        db_conn.executemany(insert_sql, rows)
+        return Result[None].Ok()
+    except sqlite3.Error as ex:
+        return Result[None].Fail(f"Error! {repr(ex)}")
+
+
+def _get_table_rows(table: type[UnicodeModel], objs: Iterable[UnicodeModel]) -> tuple[str, list[Sequence[Any]]]:
+    table_name = cast(Table, table.__table__).name  # type: ignore[reportAttributeAccessIssue]
+    (_, columns) = _get_bulk_insert_statement(table_name)
+    rows: list[Sequence[Any]] = [
+        tuple(process(getattr(obj, name)) if process else getattr(obj, name) for name, process in columns)
+        for obj in objs
+    ]
+    return (table_name, rows)
+
+
+@cache
+def _get_bulk_insert_statement(table_name: str) -> tuple[str, list[tuple[str, Callable[[Any], Any] | None]]]:
+    # Values are converted by the same bind processors that are used by the ORM (e.g., for ChoiceType columns)
+    sa_table = SQLModel.metadata.tables[table_name]
+    columns = [(column.name, column.type.bind_processor(engine.dialect)) for column in sa_table.columns]
+    column_names = ", ".join(f'"{name}"' for name, _ in columns)
+    placeholders = ", ".join("?" for _ in columns)
+    return (f'INSERT INTO "{table_name}" ({column_names}) VALUES ({placeholders})', columns)
+
+
+def _build_indexes_and_optimize_database(
+    settings: UnicodeApiSettings, result: Result[None], create_indexes: bool
+) -> Result[None]:
+    if result.success and create_indexes:
+        result = _create_database_indexes(engine)
+    if result.success:
+        result = _build_full_text_indexes(engine)
+    if result.success:
+        result = _build_bitmap_filter_index(settings, engine)
+    with engine.connect() as conn:
+        conn.execute(text("VACUUM;"))
+        conn.execute(text("ANALYZE;"))
+    return result
+
+
+def _build_full_text_indexes(engine: Engine) -> Result[None]:
+    spinner = Spinner()
+    spinner.start("Building full-text indexes for character names and CJK definitions...")
+    try:
+        with engine.connect() as conn:
+            for sql in get_full_text_index_statements():
+                conn.execute(text(sql))
+    except StatementError as ex:
+        spinner.failed(f"Error! {repr(ex)}")
+        return Result[None].Fail(f"Error! {repr(ex)}")
+    spinner.successful("Successfully built full-text indexes for character names and CJK definitions")
+    return Result[None].Ok()
+
+
+def _build_bitmap_filter_index(settings: UnicodeApiSettings, engine: Engine) -> Result[None]:
+    spinner = Spinner()
+    spinner.start("Building bitmap index for character filters...")
+    try:
+        fingerprint = get_index_fingerprint(engine, settings.UNICODE_VERSION)
+        BitmapFilterIndex.load(engine).save(settings.filter_bitmaps_file, fingerprint)
+    except (StatementError, OSError) as ex:
+        spinner.failed(f"Error! {repr(ex)}")
+        return Result[None].Fail(f"Error! {repr(ex)}")
+    spinner.successful("Successfully built bitmap index for character filters")
+    return Result[None].Ok()
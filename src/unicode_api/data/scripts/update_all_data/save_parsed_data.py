@@ -1,54 +1,81 @@
 """
-This module provides functionality to save parsed Unicode data into JSON files.
+This module provides functionality to save parsed Unicode data into JSON files, along with the packed
+binary copy of the same data (which is memory-mapped by the API at startup) and the binary table used to
+classify every codepoint by CharacterType.
 
 Functions:
-    save_parsed_data(settings: UnicodeApiSettings, parsed_data: AllParsedUnicodeData) -> Result[None]:
+    save_parsed_data(
+        settings: UnicodeApiSettings, parsed_data: AllParsedUnicodeData | ParsedUnicodeDataSummary
+    ) -> Result[None]:
         Saves parsed Unicode data to JSON files based on the provided settings.
 """
 
 import json
 
-import unicode_api.db.models as db
 from unicode_api.config.api_settings import UnicodeApiSettings
+from unicode_api.core.cache_snapshot import build_unicode_data_snapshot
+from unicode_api.core.character_type_table import save_character_type_table
+from unicode_api.core.packed_unicode_data import pack_unicode_data, save_packed_unicode_data
 from unicode_api.core.result import Result
-from unicode_api.data.scripts.script_types import AllParsedUnicodeData
+from unicode_api.data.scripts.script_types import AllParsedUnicodeData, ParsedUnicodeDataSummary
 from unicode_api.data.util.spinner import Spinner
 
 
-def save_parsed_data(settings: UnicodeApiSettings, parsed_data: AllParsedUnicodeData) -> Result[None]:
+def save_parsed_data(
+    settings: UnicodeApiSettings, parsed_data: AllParsedUnicodeData | ParsedUnicodeDataSummary
+) -> Result[None]:
     """
     Saves parsed Unicode data to JSON files based on the provided settings.
 
     Args:
         settings (UnicodeApiSettings): Configuration settings for saving the data.
 
-        parsed_data (AllParsedUnicodeData): A tuple containing all parsed Unicode data, including planes, blocks,
-            non-Unihan characters, Tangut characters, and Unihan characters.
+        parsed_data (AllParsedUnicodeData | ParsedUnicodeDataSummary): Either a tuple containing all parsed
+            Unicode data, including planes, blocks, non-Unihan characters, Tangut characters, and Unihan
+            characters, or the summary of the parsed data produced when the XML database file is streamed.
 
     Returns:
         Result[None]: A Result object indicating success or failure of the save operation.
     """
-    all_planes, all_blocks, non_unihan_chars, tangut_chars, unihan_chars = parsed_data
-    _update_json_files(settings, all_planes, all_blocks, non_unihan_chars, tangut_chars, unihan_chars)
+    if not isinstance(parsed_data, ParsedUnicodeDataSummary):
+        parsed_data = ParsedUnicodeDataSummary.from_parsed_data(parsed_data)
+    _update_json_files(settings, parsed_data)
+    _update_packed_unicode_data(settings, parsed_data)
+    _update_character_type_table(settings)
     return Result[None].Ok()
 
 
-def _update_json_files(
-    settings: UnicodeApiSettings,
-    all_planes: list[db.UnicodePlane],
-    all_blocks: list[db.UnicodeBlock],
-    non_unihan_chars: list[db.UnicodeCharacter],
-    tangut_chars: list[db.UnicodeCharacter],
-    unihan_chars: list[db.UnicodeCharacterUnihan],
-) -> None:
+def _update_json_files(settings: UnicodeApiSettings, summary: ParsedUnicodeDataSummary) -> None:
     spinner = Spinner()
     spinner.start("Creating JSON files for parsed Unicode data...")
-    settings.planes_json.write_text(json.dumps([p.model_dump() for p in all_planes], indent=4))
-    settings.blocks_json.write_text(json.dumps([b.model_dump() for b in all_blocks], indent=4))
-    char_name_map = {char.codepoint_dec: char.name for char in non_unihan_chars}
-    settings.char_name_map.write_text(json.dumps(char_name_map, indent=4))
-    unihan_char_block_map = {char.codepoint_dec: char.block_id for char in unihan_chars}
-    settings.unihan_chars_json.write_text(json.dumps(unihan_char_block_map, indent=4))
-    tangut_char_block_map = {char.codepoint_dec: char.block_id for char in tangut_chars}
-    settings.tangut_chars_json.write_text(json.dumps(tangut_char_block_map, indent=4))
+    settings.planes_json.write_text(json.dumps([p.model_dump() for p in summary.planes], indent=4))
+    settings.blocks_json.write_text(json.dumps([b.model_dump() for b in summary.blocks], indent=4))
+    settings.char_name_map.write_text(json.dumps(summary.char_name_map, indent=4))
+    settings.unihan_chars_json.write_text(json.dumps(summary.unihan_char_block_map, indent=4))
+    settings.tangut_chars_json.write_text(json.dumps(summary.tangut_char_block_map, indent=4))
     spinner.successful("Successfully created JSON files for parsed Unicode data")
+
+
+def _update_packed_unicode_data(settings: UnicodeApiSettings, summary: ParsedUnicodeDataSummary) -> None:
+    spinner = Spinner()
+    spinner.start("Creating packed data file for parsed Unicode data...")
+    data = pack_unicode_data(
+        json.loads(settings.prop_values_json.read_text()),
+        [p.model_dump() for p in summary.planes],
+        [b.model_dump() for b in summary.blocks],
+        summary.char_name_map,
+        summary.unihan_char_block_map,
+        summary.tangut_char_block_map,
+    )
+    save_packed_unicode_data(data, settings.unicode_data_file)
+    spinner.successful(f"Successfully created packed data file for parsed Unicode data ({len(data) / 1024:,.0f} KB)")
+
+
+def _update_character_type_table(settings: UnicodeApiSettings) -> None:
+    spinner = Spinner()
+    spinner.start("Creating character type table for parsed Unicode data...")
+    # Remove the existing table first, otherwise the snapshot would load it instead of building a new table
+    settings.char_type_table.unlink(missing_ok=True)
+    snapshot = build_unicode_data_snapshot(settings)
+    save_character_type_table(snapshot.character_type_table, settings.char_type_table)
+    spinner.successful("Successfully created character type table for parsed Unicode data")
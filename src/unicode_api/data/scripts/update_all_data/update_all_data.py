@@ -6,10 +6,13 @@ the SQLite database. Depending on the environment, it either deletes the XML fil
 production) or backs up the database and JSON files (in non-production environments).
 
 Functions:
-    update_all_data() -> Result[None]:
+    update_all_data(
+        stream: bool = False, workers: int = 1, bulk_insert: bool = True, use_cache: bool = True
+    ) -> Result[None]:
         Executes the full update workflow and returns a Result indicating success or failure.
 """
 
+from unicode_api.config.api_settings import UnicodeApiSettings
 from unicode_api.core.result import Result
 from unicode_api.data.scripts.update_all_data import (
     backup_db_and_json_files,
@@ -17,18 +20,37 @@ from unicode_api.data.scripts.update_all_data import (
     get_api_settings,
     get_prop_values,
     parse_xml_unicode_database,
+    parse_xml_unicode_database_with_cache,
     populate_sqlite_database,
+    populate_sqlite_database_from_rows,
+    populate_sqlite_database_from_stream,
     save_parsed_data,
+    stream_xml_unicode_database,
 )
 
 
-def update_all_data() -> Result[None]:
+def update_all_data(
+    stream: bool = False, workers: int = 1, bulk_insert: bool = True, use_cache: bool = True
+) -> Result[None]:
     """
     Updates all Unicode-related data by performing a series of operations including fetching API settings,
     retrieving property values, downloading and parsing the Unicode XML database, saving parsed data, and
     populating the SQLite database. Depending on the environment, it either deletes the XML file or back
     up the database and JSON files.
 
+    Args:
+        stream (bool): If True, the XML database is parsed incrementally and each batch of characters is
+            inserted into the database while the rest of the file is parsed, instead of loading the entire
+            file (and every parsed character) into memory. Defaults to False.
+        workers (int): The number of processes used to parse the character data. The parsed data is identical
+            for any number of workers. Defaults to 1.
+        bulk_insert (bool): If True, rows are inserted with `executemany` in a single transaction and indexes
+            are created after all rows have been inserted. If False, rows are inserted through the ORM.
+            Defaults to True.
+        use_cache (bool): If True (and the XML database is neither streamed nor inserted through the ORM),
+            the parsed data is saved to a cache file, and the XML database is only parsed again if it (or the
+            parser) has changed since the cache file was saved. Defaults to True.
+
     Returns:
         Result[None]: A Result object indicating success or failure, with error details if any step fails.
     """
@@ -45,7 +67,26 @@ def update_all_data() -> Result[None]:
     if result.failure:
         return Result[None].Fail(result.error)
 
-    result = parse_xml_unicode_database(settings)
+    if stream:
+        result = _stream_parsed_data_to_database(settings, workers, bulk_insert)
+    elif bulk_insert and use_cache:
+        result = _parse_and_save_data_with_cache(settings, workers)
+    else:
+        result = _parse_and_save_data(settings, workers, bulk_insert)
+    if result.failure:
+        return result
+
+    if settings.is_prod and settings.xml_file.exists():
+        settings.xml_file.unlink()
+    else:
+        result = backup_db_and_json_files(settings)
+        if result.failure:
+            return result
+    return Result[None].Ok()
+
+
+def _parse_and_save_data(settings: UnicodeApiSettings, workers: int, bulk_insert: bool) -> Result[None]:
+    result = parse_xml_unicode_database(settings, workers)
     if result.failure or not result.value:
         return Result[None].Fail(result.error)
     parsed_data = result.value
@@ -53,18 +94,33 @@ def update_all_data() -> Result[None]:
     result = save_parsed_data(settings, parsed_data)
     if result.failure:
         return result
+    return populate_sqlite_database(settings, parsed_data, bulk_insert)
 
-    result = populate_sqlite_database(settings, parsed_data)
+
+def _parse_and_save_data_with_cache(settings: UnicodeApiSettings, workers: int) -> Result[None]:
+    result = parse_xml_unicode_database_with_cache(settings, workers)
+    if result.failure or not result.value:
+        return Result[None].Fail(result.error)
+    parsed = result.value
+
+    result = save_parsed_data(settings, parsed.summary)
     if result.failure:
         return result
+    return populate_sqlite_database_from_rows(settings, parsed.table_rows)
 
-    if settings.is_prod and settings.xml_file.exists():
-        settings.xml_file.unlink()
-    else:
-        result = backup_db_and_json_files(settings)
-        if result.failure:
-            return result
-    return Result[None].Ok()
+
+def _stream_parsed_data_to_database(settings: UnicodeApiSettings, workers: int, bulk_insert: bool) -> Result[None]:
+    result = stream_xml_unicode_database(settings, workers=workers)
+    if result.failure or not result.value:
+        return Result[None].Fail(result.error)
+    (summary, char_batches) = result.value
+
+    # The JSON files contain the number of defined characters in each block, which is known only after every
+    # character has been parsed and inserted into the database
+    result = populate_sqlite_database_from_stream(settings, summary, char_batches, bulk_insert)
+    if result.failure:
+        return result
+    return save_parsed_data(settings, summary)
 
 
 if __name__ == "__main__":
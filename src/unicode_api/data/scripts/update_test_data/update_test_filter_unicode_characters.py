@@ -3,7 +3,7 @@ import json
 from fastapi import HTTPException
 
 from unicode_api.api.api_v1.dependencies import FilterSettings
-from unicode_api.api.api_v1.endpoints.characters import filter_unicode_characters
+from unicode_api.api.api_v1.endpoints.characters import get_character_filter_results
 from unicode_api.config.api_settings import UnicodeApiSettings
 from unicode_api.core.result import Result
 from unicode_api.core.util import convert_keys_to_camel_case
@@ -144,7 +144,7 @@ def get_test_test_invalid_filter_param_values(db_ctx: DBSession):
 
 
 def get_formatted_filter_results(db_ctx: DBSession, filter_settings: FilterSettings) -> str:
-    response = filter_unicode_characters(db_ctx, filter_settings)
+    response = get_character_filter_results(db_ctx, filter_settings)
     response["filter_settings"] = response["filter_settings"].model_dump(
         by_alias=True, exclude_unset=True, exclude_defaults=True, exclude_none=True
     )
@@ -154,7 +154,7 @@ def get_formatted_filter_results(db_ctx: DBSession, filter_settings: FilterSetti
 
 def get_error_detail(db_ctx: DBSession, filter_settings: FilterSettings) -> Result[str]:
     try:
-        _ = filter_unicode_characters(db_ctx, filter_settings)
+        _ = get_character_filter_results(db_ctx, filter_settings)
         return Result[str].Fail("Expected an HTTPException to be raised")
     except HTTPException as ex:
         response = convert_json_to_python_literals(json.dumps({"detail": ex.detail}, indent=4, ensure_ascii=False))
@@ -2,7 +2,7 @@ import json
 
 from fastapi import HTTPException
 
-from unicode_api.api.api_v1.endpoints.codepoints import get_unicode_character_at_codepoint
+from unicode_api.api.api_v1.endpoints.codepoints import get_character_details_at_codepoint
 from unicode_api.config.api_settings import UnicodeApiSettings
 from unicode_api.core.result import Result
 from unicode_api.core.util import convert_keys_to_camel_case
@@ -31,21 +31,21 @@ def update_test_get_unicode_character_at_codepoint(db_ctx: DBSession, settings:
 
 
 def get_character_at_codepoint_raw_hex(db_ctx: DBSession):
-    char_data = get_unicode_character_at_codepoint(db_ctx, codepoint="24AF", show_props=[], verbose=None)
+    char_data = get_character_details_at_codepoint(db_ctx, codepoint="24AF", show_props=[], verbose=None)
     return convert_json_to_python_literals(
         json.dumps(convert_keys_to_camel_case(char_data), indent=4, ensure_ascii=False)
     )
 
 
 def get_character_at_codepoint_with_prefix_1(db_ctx: DBSession):
-    char_data = get_unicode_character_at_codepoint(db_ctx, codepoint="U+24AF", show_props=["basic"], verbose=True)
+    char_data = get_character_details_at_codepoint(db_ctx, codepoint="U+24AF", show_props=["basic"], verbose=True)
     return convert_json_to_python_literals(
         json.dumps(convert_keys_to_camel_case(char_data), indent=4, ensure_ascii=False)
     )
 
 
 def get_character_at_codepoint_with_prefix_2(db_ctx: DBSession):
-    char_data = get_unicode_character_at_codepoint(db_ctx, codepoint="0x24AF", show_props=["all"], verbose=None)
+    char_data = get_character_details_at_codepoint(db_ctx, codepoint="0x24AF", show_props=["all"], verbose=None)
     return convert_json_to_python_literals(
         json.dumps(convert_keys_to_camel_case(char_data), indent=4, ensure_ascii=False)
     )
@@ -79,7 +79,7 @@ def get_character_at_codepoint_invalid_prop_name(db_ctx: DBSession):
 def get_formatted_character_details(
     db_ctx: DBSession, codepoint: str, show_props: list[str], verbose: bool | None = None
 ):
-    char_data = get_unicode_character_at_codepoint(db_ctx, codepoint, show_props, verbose)
+    char_data = get_character_details_at_codepoint(db_ctx, codepoint, show_props, verbose)
     char_data = convert_keys_to_camel_case(char_data)
     return convert_json_to_python_literals(json.dumps(char_data, indent=4, ensure_ascii=False))
 
@@ -88,7 +88,7 @@ def get_error_detail(
     db_ctx: DBSession, codepoint: str, show_props: list[str], verbose: bool | None = None
 ) -> Result[str]:
     try:
-        _ = get_unicode_character_at_codepoint(db_ctx, codepoint, show_props, verbose)
+        _ = get_character_details_at_codepoint(db_ctx, codepoint, show_props, verbose)
         return Result[str].Fail("Expected an HTTPException to be raised")
     except HTTPException as ex:
         response = convert_json_to_python_literals(json.dumps({"detail": ex.detail}, indent=4, ensure_ascii=False))
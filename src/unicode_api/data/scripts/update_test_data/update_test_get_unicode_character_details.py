@@ -1,7 +1,7 @@
 import json
 from typing import Any
 
-from unicode_api.api.api_v1.endpoints.codepoints import get_unicode_character_at_codepoint
+from unicode_api.api.api_v1.endpoints.codepoints import get_character_details_at_codepoint
 from unicode_api.config.api_settings import UnicodeApiSettings
 from unicode_api.core.result import Result
 from unicode_api.data.scripts.update_test_data.util import convert_json_to_python_literals
@@ -59,7 +59,7 @@ def update_test_get_unicode_character_details(db_ctx: DBSession, settings: Unico
 
 
 def get_char_props(db_ctx: DBSession, char: str, verbose: bool) -> dict[str, Any]:
-    char_props = get_unicode_character_at_codepoint(
+    char_props = get_character_details_at_codepoint(
         db_ctx=db_ctx,
         codepoint=f"{ord(char):04X}",
         show_props=[str(CharPropertyGroup.ALL)],
@@ -15,6 +15,7 @@ def update_test_search_unicode_blocks_by_name(settings: UnicodeApiSettings) -> R
         f"SEARCH_TERM_OLD_PER_PAGE_5_PAGE_1_OF_2 = {get_search_term_old_page_1_of_2()}\n"
         f"SEARCH_TERM_OLD_PER_PAGE_5_PAGE_2_OF_2 = {get_search_term_old_page_2_of_2()}\n"
         f"SEARCH_TERM_OLD_PER_PAGE_5_PAGE_3_OF_2 = {get_search_term_old_page_3_of_2()}\n"
+        f"SEARCH_TERM_OLD_PER_PAGE_5_NEXT_CURSOR = {get_search_term_old_next_cursor()}\n"
         f"SEARCH_TERM_CAP = {get_search_term_cap()}\n"
         f"SEARCH_TERM_BLAH = {get_search_term_blah()}\n"
     )
@@ -43,6 +44,12 @@ def get_search_term_old_page_3_of_2():
     return result.value if result.success and result.value else ""
 
 
+def get_search_term_old_next_cursor():
+    first_page = search_unicode_blocks_by_name(BlockSearchParameters(name="old", per_page=5))
+    search_parameters = BlockSearchParameters(name="old", per_page=5, cursor=first_page["next_cursor"])
+    return get_formatted_search_results(search_parameters)
+
+
 def get_search_term_cap():
     search_parameters = BlockSearchParameters(name="cap")
     return get_formatted_search_results(search_parameters)
@@ -3,7 +3,7 @@ import json
 from fastapi import HTTPException
 
 from unicode_api.api.api_v1.dependencies import CharacterSearchParameters
-from unicode_api.api.api_v1.endpoints.characters import search_unicode_characters_by_name
+from unicode_api.api.api_v1.endpoints.characters import get_character_search_results
 from unicode_api.config.api_settings import UnicodeApiSettings
 from unicode_api.core.result import Result
 from unicode_api.core.util import convert_keys_to_camel_case
@@ -17,7 +17,8 @@ def update_test_search_unicode_characters_by_name(db_ctx: DBSession, settings: U
         f"SEARCH_TERM_HOME = {get_search_term_home(db_ctx)}\n\n"
         f"SEARCH_TERM_HOUSE_PAGE_1_OF_2 = {get_search_term_house_page_1_of_3(db_ctx)}\n\n"
         f"SEARCH_TERM_HOUSE_PAGE_2_OF_2 = {get_search_term_house_page_2_of_3(db_ctx)}\n\n"
-        f"SEARCH_TERM_HOUSE_PAGE_3_OF_2 = {get_search_term_house_page_3_of_3(db_ctx)}\n"
+        f"SEARCH_TERM_HOUSE_PAGE_3_OF_2 = {get_search_term_house_page_3_of_3(db_ctx)}\n\n"
+        f"SEARCH_TERM_HOUSE_NEXT_CURSOR = {get_search_term_house_next_cursor(db_ctx)}\n"
         "# fmt: on\n"
     )
     test_data_file = (
@@ -50,15 +51,21 @@ def get_search_term_house_page_3_of_3(db_ctx: DBSession):
     return result.value if result.success and result.value else ""
 
 
+def get_search_term_house_next_cursor(db_ctx: DBSession):
+    first_page = get_character_search_results(db_ctx, CharacterSearchParameters(name="house"))
+    search_parameters = CharacterSearchParameters(name="house", cursor=first_page["next_cursor"])
+    return get_formatted_search_results(db_ctx, search_parameters)
+
+
 def get_formatted_search_results(db_ctx: DBSession, search_params: CharacterSearchParameters) -> str:
-    response = search_unicode_characters_by_name(db_ctx, search_params)
+    response = get_character_search_results(db_ctx, search_params)
     response = convert_keys_to_camel_case(response)
     return convert_json_to_python_literals(json.dumps(response, indent=4, ensure_ascii=False))
 
 
 def get_error_detail(db_ctx: DBSession, search_params: CharacterSearchParameters) -> Result[str]:
     try:
-        _ = search_unicode_characters_by_name(db_ctx, search_params)
+        _ = get_character_search_results(db_ctx, search_params)
         return Result[str].Fail("Expected an HTTPException to be raised")
     except HTTPException as ex:
         response = convert_json_to_python_literals(json.dumps({"detail": ex.detail}, indent=4, ensure_ascii=False))
@@ -21,16 +21,18 @@ class Spinner:
         current (int): The current progress count.
         last_reported (float): The last reported percentage of completion.
         message (str): The message displayed alongside the spinner.
+        unit (str): The name of the items being counted. If set, the progress includes the rate per second.
         start_time (float): The time when the spinner started.
         end_time (float): The time when the spinner finished.
 
     Properties:
         percent_complete (float): The percentage of completion (0.0 to 1.0).
         elapsed_time (timedelta): The elapsed time since the spinner started.
+        rate (float): The number of steps completed per second since the spinner started.
 
     Methods:
-        start(message: str, total: int = 0, clear_screen: bool = False) -> None:
-            Starts the spinner with an optional message, total steps, and screen clearing.
+        start(message: str, total: int = 0, clear_screen: bool = False, unit: str = "") -> None:
+            Starts the spinner with an optional message, total steps, screen clearing, and unit name.
 
         increment(amount: int = 1) -> None:
             Increments the current progress by the specified amount and updates the spinner
@@ -55,6 +57,7 @@ class Spinner:
     current: int
     last_reported: float
     message: str
+    unit: str
     start_time: float
     end_time: float
 
@@ -64,6 +67,7 @@ class Spinner:
         self.current = 0
         self.last_reported = 0.0
         self.message = ""
+        self.unit = ""
         self.start_time = 0.0
         self.end_time = 0.0
 
@@ -78,12 +82,18 @@ class Spinner:
         end = time.perf_counter() if self.end_time == 0.0 else self.end_time
         return timedelta(seconds=(end - self.start_time))
 
-    def start(self, message: str, total: int = 0, clear_screen: bool = False) -> None:
+    @property
+    def rate(self) -> float:
+        seconds = self.elapsed_time.total_seconds()
+        return self.current / seconds if seconds > 0 else 0.0
+
+    def start(self, message: str, total: int = 0, clear_screen: bool = False, unit: str = "") -> None:
         if clear_screen:
             subprocess.run(["clear"])  # noqa: PLW1510
         self.total = total
         self.current = 0
         self.message = message
+        self.unit = unit
         self.spinner.text = self._get_current_message()
         self.start_time = time.perf_counter()
         self.spinner.start()
@@ -96,6 +106,8 @@ class Spinner:
 
     def _get_current_message(self) -> str:
         progress = f"{self.current}/{self.total} {self.percent_complete:.0%}"
+        if self.unit:
+            progress += f", {self.rate:,.0f} {self.unit}/s"
         elapsed = f"elapsed: {format_timedelta_str(self.elapsed_time)}"
         return f"{self.message} ({progress}) ({elapsed})"
 
@@ -0,0 +1,226 @@
+"""
+This module provides an inverted index of the character properties used by the filter endpoint.
+
+For every property value ID (e.g., each block, general category and script), every boolean flag and every
+script that appears in the Script_Extensions property, the index stores the set of characters with that value as
+a compressed CodepointBitmap (a posting list). When the `FILTER_ENGINE` setting is "bitmap", a filter request is
+evaluated by taking the union of the posting lists for all values selected for a property, and intersecting the
+unions for all properties. The result is itself a CodepointBitmap, so the number of matching characters (and
+the characters on the requested page) are available without building a list of every matching codepoint. This
+makes very broad filters (e.g., all alphabetic characters) as cheap to evaluate as narrow ones.
+
+The index is built by the `populate_sqlite_db` script and saved next to the database file. The file header
+stores a fingerprint of the data the index was built from (the Unicode version and the number of rows in each
+table that is indexed). If the file does not exist, was written by an incompatible version of this module, or its
+fingerprint does not match the database (e.g., the database was rebuilt without rebuilding the index), the index
+is built from the database when it is first used. The results are identical to the SQL query constructed by
+`db.procs.filter_characters`. Requests that filter by name or CJK definition are not supported by this engine
+and are always evaluated by the SQL query.
+
+Classes:
+    BitmapFilterIndex:
+        Posting lists (as CodepointBitmaps) for every filterable property value.
+
+Functions:
+    get_index_fingerprint(engine: Engine, unicode_version: str) -> str:
+        Returns a fingerprint of the data in the database that is stored in the index.
+    get_bitmap_filter_index() -> BitmapFilterIndex:
+        Returns the bitmap index, which is loaded the first time this function is called.
+"""
+
+from collections.abc import Sequence
+from functools import cache
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from sqlalchemy import text
+from sqlalchemy.engine import Engine
+
+import unicode_api.db.models as db
+from unicode_api.config.api_settings import get_settings
+from unicode_api.core.codepoint_bitmap import CodepointBitmap
+from unicode_api.db.engine import ro_db_engine
+from unicode_api.db.procs.filter_characters import (
+    CHAR_TABLES,
+    SCRIPT_EXTENSION_IDS_COLUMN,
+    get_filterable_property_rows,
+    get_property_id_filters,
+)
+
+if TYPE_CHECKING:  # pragma: no cover
+    from unicode_api.api.api_v1.dependencies.filter_settings import FilterParameters
+
+BITMAP_INDEX_HEADER = b"UCBMAP03"
+INT_VALUE = 0
+STR_VALUE = 1
+
+type PostingListKey = tuple[str, int | str]
+
+
+class BitmapFilterIndex:
+    """
+    Posting lists (as CodepointBitmaps) for every filterable property value.
+
+    Attributes:
+        posting_lists (dict[PostingListKey, CodepointBitmap]): Maps (column name, value) to the set of characters
+            with that value. Property value ID columns use the ID as the value, boolean flags use the value 1 (only
+            characters where the flag is true are indexed) and the `script_extension_ids` column has a separate
+            posting list for each script ID.
+    """
+
+    def __init__(self, posting_lists: dict[PostingListKey, CodepointBitmap]):
+        self.posting_lists = posting_lists
+
+    def __len__(self) -> int:
+        return len(self.posting_lists)
+
+    @classmethod
+    def build(
+        cls, column_names: Sequence[str], flag_names: Sequence[str], rows: Sequence[Sequence[Any]]
+    ) -> "BitmapFilterIndex":
+        """
+        Builds the index from the value of every filterable property for all characters.
+
+        Args:
+            column_names (Sequence[str]): The names of the columns in each row (after the codepoint).
+            flag_names (Sequence[str]): The names of the columns that are boolean flags.
+            rows (Sequence[Sequence[Any]]): One row for each character, the first value is the codepoint.
+
+        Returns:
+            BitmapFilterIndex: The new index.
+        """
+        codepoint_lists: dict[PostingListKey, list[int]] = {}
+        flag_columns = set(flag_names)
+        for row in rows:
+            codepoint = row[0]
+            for column_name, value in zip(column_names, row[1:], strict=True):
+                if value is None or (column_name in flag_columns and not value):
+                    continue
+                if column_name == SCRIPT_EXTENSION_IDS_COLUMN:
+                    for script_id in value.split():
+                        codepoint_lists.setdefault((column_name, int(script_id)), []).append(codepoint)
+                    continue
+                key = (column_name, 1 if column_name in flag_columns else value)
+                codepoint_lists.setdefault(key, []).append(codepoint)
+        return cls({key: CodepointBitmap.from_codepoints(cps) for (key, cps) in codepoint_lists.items()})
+
+    @classmethod
+    def load(cls, engine: Engine) -> "BitmapFilterIndex":
+        return cls.build(*get_filterable_property_rows(engine))
+
+    @classmethod
+    def read(cls, index_file: Path, fingerprint: str) -> "BitmapFilterIndex | None":
+        """
+        Reads an index previously written by `save`.
+
+        Args:
+            index_file (Path): The index file.
+            fingerprint (str): The fingerprint of the data the index must have been built from (see
+                `get_index_fingerprint`).
+
+        Returns:
+            BitmapFilterIndex | None: The index, or None if the file does not exist, has an unexpected format or
+                was built from different data.
+        """
+        if not index_file.exists():
+            return None
+        data = memoryview(index_file.read_bytes())
+        expected_header = _get_header(fingerprint)
+        if data[: len(expected_header)] != expected_header:
+            return None
+        position = len(expected_header)
+        posting_lists: dict[PostingListKey, CodepointBitmap] = {}
+        while position < len(data):
+            column_length = data[position]
+            column_name = bytes(data[position + 1 : position + 1 + column_length]).decode()
+            position += 1 + column_length
+            value_kind = data[position]
+            value_length = int.from_bytes(data[position + 1 : position + 3], "little")
+            raw_value = bytes(data[position + 3 : position + 3 + value_length])
+            value = int.from_bytes(raw_value, "little", signed=True) if value_kind == INT_VALUE else raw_value.decode()
+            position += 3 + value_length
+            bitmap_length = int.from_bytes(data[position : position + 4], "little")
+            position += 4
+            posting_lists[(column_name, value)] = CodepointBitmap.from_bytes(data[position : position + bitmap_length])
+            position += bitmap_length
+        return cls(posting_lists)
+
+    def save(self, index_file: Path, fingerprint: str) -> None:
+        data = bytearray(_get_header(fingerprint))
+        for (column_name, value), bitmap in self.posting_lists.items():
+            column_bytes = column_name.encode()
+            (value_kind, value_bytes) = (
+                (INT_VALUE, value.to_bytes(4, "little", signed=True))
+                if isinstance(value, int)
+                else (STR_VALUE, value.encode())
+            )
+            bitmap_bytes = bitmap.to_bytes()
+            data += bytes([len(column_bytes)]) + column_bytes
+            data += bytes([value_kind]) + len(value_bytes).to_bytes(2, "little") + value_bytes
+            data += len(bitmap_bytes).to_bytes(4, "little") + bitmap_bytes
+        index_file.write_bytes(data)
+
+    @staticmethod
+    def supports(filter_params: "FilterParameters") -> bool:
+        return not filter_params.name and not filter_params.cjk_definition
+
+    def filter(self, filter_params: "FilterParameters") -> CodepointBitmap:
+        """
+        Returns the set of characters that match the filter settings.
+
+        Args:
+            filter_params (FilterParameters): The filter settings. Must not filter by name or CJK definition.
+
+        Returns:
+            CodepointBitmap: The codepoints of the matching characters.
+        """
+        conditions = [
+            self._get_union((column_name, value_id) for value_id in value_ids)
+            for (column_name, value_ids) in get_property_id_filters(filter_params)
+        ]
+        if filter_params.scripts:
+            (_, script_ids) = filter_params.scripts
+            conditions.append(
+                self._get_union(
+                    (column_name, script_id)
+                    for script_id in script_ids
+                    for column_name in ["script_id", SCRIPT_EXTENSION_IDS_COLUMN]
+                )
+            )
+        if filter_params.flags:
+            conditions.append(self._get_union((flag.db_column_name, 1) for flag in filter_params.flags if flag))
+        return CodepointBitmap.intersection(conditions) if conditions else CodepointBitmap()
+
+    def _get_union(self, keys: Any) -> CodepointBitmap:
+        return CodepointBitmap.union(self.posting_lists[key] for key in keys if key in self.posting_lists)
+
+
+def get_index_fingerprint(engine: Engine, unicode_version: str) -> str:
+    """
+    Returns a fingerprint of the data in the database that is stored in the index.
+
+    Args:
+        engine (Engine): The engine used to query the database.
+        unicode_version (str): The version of the Unicode Standard the database was built from.
+
+    Returns:
+        str: The Unicode version followed by the number of rows in each table that is indexed.
+    """
+    tables = [table.__tablename__ for table in [*CHAR_TABLES, db.CharacterScriptExtension]]
+    query = ", ".join(f"(SELECT count(*) FROM {table})" for table in tables)
+    with engine.connect() as conn:
+        row_counts = conn.execute(text(f"SELECT {query}")).one()
+    return " ".join([unicode_version, *(str(count) for count in row_counts)])
+
+
+def _get_header(fingerprint: str) -> bytes:
+    fingerprint_bytes = fingerprint.encode()
+    return BITMAP_INDEX_HEADER + bytes([len(fingerprint_bytes)]) + fingerprint_bytes
+
+
+@cache
+def get_bitmap_filter_index() -> BitmapFilterIndex:
+    fingerprint = get_index_fingerprint(ro_db_engine, get_settings().UNICODE_VERSION)
+    return BitmapFilterIndex.read(get_settings().filter_bitmaps_file, fingerprint) or BitmapFilterIndex.load(
+        ro_db_engine
+    )
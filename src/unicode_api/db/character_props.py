@@ -536,7 +536,9 @@ PROPERTY_GROUPS: dict[CharPropertyGroup, list[CharacterPropertyDetails]] = {
             name_out="script_extensions",
             char_property="scx",
             db_column=True,
-            response_value=lambda char: get_script_extensions(char["script_extensions"], char["codepoint_dec"])
+            response_value=lambda char: get_script_extensions(
+                char.get("script_extension_ids", []), char["codepoint_dec"]
+            )
             if "script_extensions" in char
             else [cached_data.get_display_name_for_property_value("Script", None, char["codepoint_dec"])],
         ),
@@ -1002,13 +1004,10 @@ def get_list_of_mapped_codepoints(input: str) -> list[str]:
     return [cached_data.get_mapped_codepoint_from_hex(codepoint) for codepoint in CP_PREFIX_1_REGEX.findall(input)]
 
 
-def get_script_extensions(value: str, codepoint: int) -> list[str]:
-    script_ids: list[int] = []
-    for script in value.split(" "):
-        result = cached_data.get_property_value_id_by_name("Script", script)
-        if result.failure or not result.value:  # pragma: no cover
-            return ["N/A"]
-        script_ids.append(result.value)
+def get_script_extensions(script_ids: list[int], codepoint: int) -> list[str]:
+    # The script IDs are read from the character_script_extension table (see get_char_details)
+    if not script_ids:  # pragma: no cover
+        return ["N/A"]
     return [cached_data.get_display_name_for_property_value("Script", sid, codepoint) for sid in script_ids]
 
 
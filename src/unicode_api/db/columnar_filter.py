@@ -0,0 +1,134 @@
+"""
+This module provides an in-memory, column-oriented copy of the character properties used by the filter endpoint.
+
+Every property that can be used to filter characters (other than the name and CJK definition) is either a small
+integer ID or a boolean flag. When the `FILTER_ENGINE` setting is "columnar", these properties are loaded
+from both character tables once, and stored as NumPy arrays that are sorted by codepoint (one element per
+character in the database). A filter request is evaluated with vectorized operations: each filter setting
+produces a boolean mask (e.g., `np.isin(block_id, [1, 2])`), masks for different settings are combined with
+AND, and the sorted list of matching codepoints is read directly from the codepoint array.
+
+The results are identical to the SQL query constructed by `db.procs.filter_characters`. Requests that filter
+by name or CJK definition are not supported by this engine and are always evaluated by the SQL query.
+
+Classes:
+    ColumnarCharacterStore:
+        Column-oriented copy of the filterable properties of all characters.
+
+Functions:
+    get_columnar_store() -> ColumnarCharacterStore:
+        Returns the columnar store, which is loaded from the database the first time this function is called.
+"""
+
+from collections.abc import Sequence
+from functools import cache
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+from numpy.typing import NDArray
+from sqlalchemy.engine import Engine
+
+from unicode_api.db.engine import ro_db_engine
+from unicode_api.db.procs.filter_characters import (
+    SCRIPT_EXTENSION_IDS_COLUMN,
+    get_filterable_property_rows,
+    get_property_id_filters,
+    script_extension_ids_match,
+)
+
+if TYPE_CHECKING:  # pragma: no cover
+    from unicode_api.api.api_v1.dependencies.filter_settings import FilterParameters
+
+NULL_PROPERTY_ID = -1
+
+
+class ColumnarCharacterStore:
+    """
+    Column-oriented copy of the filterable properties of all characters.
+
+    Attributes:
+        codepoints (NDArray[np.uint32]): The codepoint of every character in the database, sorted.
+        property_ids (dict[str, NDArray[np.int32]]): Value IDs for each property value ID column (NULL values
+            are stored as -1).
+        flags (dict[str, NDArray[np.bool_]]): Values of each boolean flag column (NULL values are stored
+            as False).
+        script_extension_codes (NDArray[np.int32]): Index into `script_extension_values` for each character.
+        script_extension_values (list[str]): All distinct combinations of script extension IDs (space-separated).
+    """
+
+    def __init__(self, column_names: Sequence[str], flag_names: Sequence[str], rows: Sequence[Sequence[Any]]):
+        (codepoints, unique_indices) = np.unique(
+            np.fromiter((row[0] for row in rows), dtype=np.uint32, count=len(rows)), return_index=True
+        )
+        rows = [rows[i] for i in unique_indices]
+        self.codepoints: NDArray[np.uint32] = codepoints
+        self.property_ids: dict[str, NDArray[np.int32]] = {}
+        self.flags: dict[str, NDArray[np.bool_]] = {}
+        for i, name in enumerate(column_names, start=1):
+            if name in flag_names:
+                self.flags[name] = np.fromiter((bool(row[i]) for row in rows), dtype=np.bool_, count=len(rows))
+            elif name == SCRIPT_EXTENSION_IDS_COLUMN:
+                (values, codes) = np.unique([row[i] or "" for row in rows], return_inverse=True)
+                self.script_extension_values: list[str] = values.tolist()
+                self.script_extension_codes: NDArray[np.int32] = codes.astype(np.int32)
+            else:
+                self.property_ids[name] = np.fromiter(
+                    (NULL_PROPERTY_ID if row[i] is None else row[i] for row in rows), dtype=np.int32, count=len(rows)
+                )
+
+    def __len__(self) -> int:
+        return len(self.codepoints)
+
+    @classmethod
+    def load(cls, engine: Engine) -> "ColumnarCharacterStore":
+        """
+        Loads the filterable properties of all characters from the database.
+
+        Args:
+            engine (Engine): The engine used to query both character tables.
+
+        Returns:
+            ColumnarCharacterStore: A new store containing every character in the database.
+        """
+        return cls(*get_filterable_property_rows(engine))
+
+    @staticmethod
+    def supports(filter_params: "FilterParameters") -> bool:
+        return not filter_params.name and not filter_params.cjk_definition
+
+    def filter(self, filter_params: "FilterParameters") -> NDArray[np.uint32]:
+        """
+        Returns the sorted codepoints of all characters that match the filter settings.
+
+        Args:
+            filter_params (FilterParameters): The filter settings. Must not filter by name or CJK definition.
+
+        Returns:
+            NDArray[np.uint32]: The codepoints of the matching characters, sorted in ascending order.
+        """
+        mask = np.ones(len(self), dtype=np.bool_)
+        for column_name, value_ids in get_property_id_filters(filter_params):
+            mask &= np.isin(self.property_ids[column_name], value_ids)
+        if filter_params.scripts:
+            mask &= self._get_script_mask(filter_params.scripts[1])
+        if filter_params.flags:
+            flag_mask = np.zeros(len(self), dtype=np.bool_)
+            for flag in filter_params.flags:
+                if flag:
+                    flag_mask |= self.flags[flag.db_column_name]
+            mask &= flag_mask
+        return self.codepoints[mask]
+
+    def _get_script_mask(self, script_ids: list[int]) -> NDArray[np.bool_]:
+        matching_codes = [
+            code
+            for (code, value) in enumerate(self.script_extension_values)
+            if script_extension_ids_match(value, script_ids)
+        ]
+        script_mask = np.isin(self.script_extension_codes, matching_codes)
+        return script_mask | np.isin(self.property_ids["script_id"], script_ids)
+
+
+@cache
+def get_columnar_store() -> ColumnarCharacterStore:
+    return ColumnarCharacterStore.load(ro_db_engine)
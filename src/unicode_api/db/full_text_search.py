@@ -0,0 +1,69 @@
+"""
+This module defines the SQLite FTS5 indexes used to filter characters by name and CJK definition.
+
+The `name` and `cjk_definition` filters match whole words (i.e., the regular expression `\\bWORD\\b`). Evaluating
+this regular expression requires SQLite to call a Python function for every row in the table, so each FTS5 index
+stores the words of a single text column and is used to find the (small) set of rows that contain every word in
+the filter value as a phrase. Only these candidate rows are checked against the regular expression, so the
+results are identical to a full table scan.
+
+The indexes are external-content FTS5 tables (the text is read from the character tables, not duplicated), and
+are created and populated by the `populate_sqlite_db` script after all characters have been added.
+
+Functions:
+    get_full_text_index_statements() -> list[str]:
+        Returns the SQL statements that create and populate the FTS5 indexes.
+    get_full_text_index_name(table_name: str, column_name: str) -> str | None:
+        Returns the name of the FTS5 index for a column, or None if the column is not indexed.
+    get_phrase_query(value: str) -> str | None:
+        Converts a filter value to an FTS5 phrase query, or None if the value cannot be matched with a phrase.
+
+Constants:
+    FULL_TEXT_INDEXES:
+        Maps (table name, column name) to the name of the FTS5 index for the column.
+"""
+
+import re
+
+FULL_TEXT_INDEXES: dict[tuple[str, str], str] = {
+    ("character", "name"): "character_name_fts",
+    ("character_unihan", "name"): "character_unihan_name_fts",
+    ("character_unihan", "description"): "character_unihan_description_fts",
+}
+
+REGEX_METACHARACTERS = re.compile(r"[.^$*+?{}\[\]\\|()]")
+ALPHANUMERIC_CHARACTERS = re.compile(r"[^\W_]")
+
+
+def get_full_text_index_statements() -> list[str]:
+    sql_statements: list[str] = []
+    for (table_name, column_name), index_name in FULL_TEXT_INDEXES.items():
+        sql_statements.append(
+            f"CREATE VIRTUAL TABLE {index_name} USING fts5({column_name}, content='{table_name}', "
+            "content_rowid='codepoint_dec', tokenize='unicode61 remove_diacritics 0')"
+        )
+        sql_statements.append(f"INSERT INTO {index_name}({index_name}) VALUES('rebuild')")
+    return sql_statements
+
+
+def get_full_text_index_name(table_name: str, column_name: str) -> str | None:
+    return FULL_TEXT_INDEXES.get((table_name, column_name))
+
+
+def get_phrase_query(value: str) -> str | None:
+    """
+    Converts a filter value to an FTS5 phrase query.
+
+    The phrase query matches every row where the words in `value` appear in the same order with no other words
+    between them, which is a superset of the rows matched by the regular expression `\\bVALUE\\b`.
+
+    Args:
+        value (str): The value of the `name` or `cjk_definition` filter.
+
+    Returns:
+        str | None: The phrase query, or None if `value` contains regular expression metacharacters (or does not
+        contain any words), in which case the FTS5 index cannot be used.
+    """
+    if REGEX_METACHARACTERS.search(value) or not ALPHANUMERIC_CHARACTERS.search(value):
+        return None
+    return '"' + value.replace('"', '""') + '"'
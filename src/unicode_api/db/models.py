@@ -4,6 +4,7 @@ from unicode_api.enums.property_group import CharPropertyGroup
 from unicode_api.enums.triadic_logic import TriadicLogic
 from unicode_api.models.block import UnicodeBlock, UnicodeBlockResponse, UnicodeBlockResult
 from unicode_api.models.character import (
+    CharacterScriptExtension,
     UnicodeCharacter,
     UnicodeCharacterBase,
     UnicodeCharacterResponse,
@@ -53,6 +54,7 @@ type DatabaseCharacterProperty = (
 type CharacterProperty = DatabaseCharacterProperty | CharacterFilterFlag | CharPropertyGroup
 
 __all__ = [
+    "CharacterScriptExtension",
     "CharacterFilterFlag",
     "CharacterProperty",
     "CharacterType",
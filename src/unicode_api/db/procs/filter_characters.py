@@ -1,64 +1,236 @@
-from typing import TYPE_CHECKING
+from collections.abc import Iterator, Sequence
+from typing import TYPE_CHECKING, Any, overload
 
-from sqlmodel import Session, column, or_, select, true
+from sqlalchemy import ColumnElement, CompoundSelect, Row, and_, false, func, literal_column, text, union_all
+from sqlalchemy import table as sql_table
+from sqlalchemy.engine import Engine
+from sqlmodel import Session, col, column, or_, select, true
 from sqlmodel.sql._expression_select_cls import SelectOfScalar
 
 import unicode_api.db.models as db
+from unicode_api.db.full_text_search import FULL_TEXT_INDEXES, get_full_text_index_name, get_phrase_query
 
 if TYPE_CHECKING:  # pragma: no cover
     from unicode_api.api.api_v1.dependencies.filter_settings import FilterParameters
 
 CHAR_TABLES = [db.UnicodeCharacter, db.UnicodeCharacterUnihan]
+PROPERTY_ID_COLUMNS = [
+    "block_id",
+    "general_category_id",
+    "age_id",
+    "script_id",
+    "bidi_class_id",
+    "decomposition_type_id",
+    "line_break_id",
+    "combining_class_id",
+    "numeric_type_id",
+    "joining_type_id",
+]
+SCRIPT_EXTENSION_IDS_COLUMN = "script_extension_ids"
 
+type FilterQuery = SelectOfScalar[int] | CompoundSelect
 
-def filter_all_characters(session: Session, filter_params: "FilterParameters") -> list[int]:
+
+def construct_filter_query(session: Session, filter_params: "FilterParameters") -> FilterQuery:
     """
-    Apply filtering logic to all character types and return matching codepoints.
+    Constructs a single statement that selects the codepoints of all characters that match the filter settings.
 
-    This function applies the provided filter parameters across all character tables
-    and returns a sorted list of unique codepoints that match the criteria.
+    The queries for each character table are combined with `UNION ALL` (each codepoint is stored in exactly one
+    table, so the results never contain duplicates). The `block` filter is rewritten as a list of
+    `codepoint_dec BETWEEN start AND finish` ranges (read from the block table), which are evaluated with the
+    primary key index of each character table. If the database contains the FTS5 indexes for character names
+    and CJK definitions, they are used to narrow down the rows that are checked by the `name` and
+    `cjk_definition` filters.
 
     Args:
-        session (Session): The database session used to execute queries.
+        session (Session): The database session used to read the block ranges and the available FTS5 indexes.
         filter_params (FilterParameters): The filtering criteria to apply.
 
     Returns:
-        list[int]: A sorted list of unique codepoints that match the filter criteria.
+        FilterQuery: An unordered statement with a single `codepoint_dec` column.
+    """
+    fts_indexes = _get_existing_full_text_indexes(session)
+    block_ranges = _get_block_ranges(session, filter_params.blocks) if filter_params.blocks else []
+    queries = [
+        query
+        for table in CHAR_TABLES
+        if (query := _construct_filter_query(filter_params, table, fts_indexes, block_ranges)) is not None
+    ]
+    return queries[0] if len(queries) == 1 else union_all(*queries)
+
+
+class FilterQueryPlan(Sequence[int]):
+    """
+    The sorted codepoints of all characters that match a set of filter settings, read from the database as needed.
 
-    Note:
-        This function aggregates results from all character tables by constructing
-        separate queries for each table and combining the results.
+    The filter is compiled to a single statement when the plan is created. `len()` executes a `COUNT(*)` query
+    (once), and slicing executes the statement with `ORDER BY codepoint_dec LIMIT ... OFFSET ...`, so a page of
+    results can be returned without retrieving every matching codepoint from the database. A page that follows
+    a known codepoint can be retrieved with `get_codepoints_after`, which does not need to skip over the
+    preceding rows.
+
+    Attributes:
+        engine (Engine): The engine used to execute the statement.
+        query (FilterQuery): The unordered statement that selects the matching codepoints.
     """
-    matching_codepoints: list[int] = []
-    for query in [_construct_filter_query(filter_params, table) for table in CHAR_TABLES]:
-        if query is None:
-            continue
-        results = session.scalars(query).all()
-        matching_codepoints.extend(results)
-    return sorted(set(matching_codepoints))
+
+    def __init__(self, engine: Engine, filter_params: "FilterParameters"):
+        self.engine = engine
+        with Session(engine) as session:
+            self.query = construct_filter_query(session, filter_params)
+        self._count: int | None = None
+
+    def __len__(self) -> int:
+        if self._count is None:
+            with self.engine.connect() as conn:
+                self._count = conn.execute(select(func.count()).select_from(self.query.subquery())).scalar_one()
+        return self._count
+
+    def __iter__(self) -> Iterator[int]:
+        yield from self._get_range(0, None)
+
+    @overload
+    def __getitem__(self, index: int) -> int: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[int]: ...
+
+    def __getitem__(self, index: int | slice) -> int | list[int]:
+        if isinstance(index, slice):
+            (start, stop, step) = index.indices(len(self))
+            if step != 1:
+                return list(self)[index]
+            return self._get_range(start, stop) if start < stop else []
+        if index < 0:
+            index += len(self)
+        codepoints = self._get_range(index, index + 1) if index >= 0 else []
+        if not codepoints:
+            raise IndexError("FilterQueryPlan index out of range")
+        return codepoints[0]
+
+    def get_codepoints_after(self, codepoint: int, limit: int) -> list[int]:
+        """
+        Retrieves the first `limit` matching codepoints greater than `codepoint` (keyset pagination).
+
+        Args:
+            codepoint (int): The last codepoint on the previous page.
+            limit (int): The maximum number of codepoints to retrieve.
+
+        Returns:
+            list[int]: The matching codepoints, sorted in ascending order.
+        """
+        subquery = self.query.subquery()
+        query = (
+            select(subquery.c.codepoint_dec)
+            .where(subquery.c.codepoint_dec > codepoint)
+            .order_by(subquery.c.codepoint_dec)
+            .limit(limit)
+        )
+        with self.engine.connect() as conn:
+            return list(conn.execute(query).scalars().all())
+
+    def _get_range(self, start: int, stop: int | None) -> list[int]:
+        query = self.query.order_by(literal_column("codepoint_dec")).offset(start)
+        if stop is not None:
+            query = query.limit(stop - start)
+        with self.engine.connect() as conn:
+            return list(conn.execute(query).scalars().all())
+
+
+def get_filterable_property_rows(engine: Engine) -> tuple[list[str], list[str], Sequence[Row[Any]]]:
+    """
+    Retrieves the value of every filterable property (other than name and CJK definition) for all characters.
+
+    Args:
+        engine (Engine): The engine used to query both character tables.
+
+    Returns:
+        tuple[list[str], list[str], Sequence[Row[Any]]]: The names of the columns that were retrieved, the
+        names of the columns that are boolean flags, and one row for each character. The first value in each
+        row is the codepoint, followed by the value of each column (in the same order as the column names).
+        The `script_extension_ids` column contains the IDs of all scripts in the character's Script_Extensions
+        property, separated by spaces (or NULL if the character has no script extensions).
+    """
+    flag_names = [flag.db_column_name for flag in db.CharacterFilterFlag if int(flag)]  # type: ignore[reportAttributeAccessIssue]
+    column_names = [*PROPERTY_ID_COLUMNS, SCRIPT_EXTENSION_IDS_COLUMN, *flag_names]
+    script_extension_ids = (
+        f"(SELECT group_concat(scx.script_id, ' ') FROM {db.CharacterScriptExtension.__tablename__} AS scx "
+        f"WHERE scx.codepoint_dec = c.codepoint_dec) AS {SCRIPT_EXTENSION_IDS_COLUMN}"
+    )
+    select_list = ", ".join([*PROPERTY_ID_COLUMNS, script_extension_ids, *flag_names])
+    query = " UNION ALL ".join(
+        f"SELECT c.codepoint_dec, {select_list} FROM {table.__tablename__} AS c" for table in CHAR_TABLES
+    )
+    with engine.connect() as conn:
+        rows = conn.execute(text(query)).all()
+    return (column_names, flag_names, rows)
+
+
+def get_property_id_filters(filter_params: "FilterParameters") -> list[tuple[str, list[int]]]:
+    # Filter settings that match a property value ID column against a list of IDs (script is not included,
+    # since the script filter also checks the character_script_extension table)
+    property_id_filters = [
+        ("block_id", filter_params.blocks),
+        ("general_category_id", filter_params.categories),
+        ("age_id", filter_params.age_list),
+        ("bidi_class_id", filter_params.bidi_class_list),
+        ("decomposition_type_id", filter_params.decomp_types),
+        ("line_break_id", filter_params.line_break_types),
+        ("combining_class_id", filter_params.ccc_list),
+        ("numeric_type_id", filter_params.num_types),
+        ("joining_type_id", filter_params.join_types),
+    ]
+    return [(column_name, value_ids) for (column_name, value_ids) in property_id_filters if value_ids]
+
+
+def script_extension_ids_match(script_extension_ids: str, script_ids: list[int]) -> bool:
+    # Same result as the SQL filter, true if any of the script IDs is one of the character's script extensions
+    return not {int(script_id) for script_id in script_extension_ids.split()}.isdisjoint(script_ids)
+
+
+def _get_existing_full_text_indexes(session: Session) -> set[str]:
+    index_names = ", ".join(f"'{index_name}'" for index_name in FULL_TEXT_INDEXES.values())
+    query = text(f"SELECT name FROM sqlite_master WHERE type = 'table' AND name IN ({index_names})")
+    return set(session.connection().execute(query).scalars().all())
+
+
+def _get_block_ranges(session: Session, block_ids: list[int]) -> list[tuple[int, int]]:
+    # Adjacent blocks are merged into a single range
+    query = select(db.UnicodeBlock.start_dec, db.UnicodeBlock.finish_dec).where(col(db.UnicodeBlock.id).in_(block_ids))
+    block_ranges: list[tuple[int, int]] = []
+    for start, finish in sorted(session.exec(query).all()):
+        if block_ranges and start == block_ranges[-1][1] + 1:
+            block_ranges[-1] = (block_ranges[-1][0], finish)
+        else:
+            block_ranges.append((start, finish))
+    return block_ranges
 
 
 def _construct_filter_query(  # noqa: C901
     filter_params: "FilterParameters",
     table: type[db.UnicodeCharacter | db.UnicodeCharacterUnihan],
+    fts_indexes: set[str],
+    block_ranges: list[tuple[int, int]],
 ) -> SelectOfScalar[int] | None:
     if table == db.UnicodeCharacter and filter_params.cjk_definition:
         return None
     query = select(table.codepoint_dec)
     if filter_params.name:
-        query = query.where(column("name").regexp_match(f"\\b{filter_params.name.upper()}\\b"))
+        query = query.where(_construct_word_filter(table, "name", filter_params.name.upper(), fts_indexes))
     if filter_params.cjk_definition:
-        query = query.where(column("description").regexp_match(f"\\b{filter_params.cjk_definition.lower()}\\b"))
+        query = query.where(
+            _construct_word_filter(table, "description", filter_params.cjk_definition.lower(), fts_indexes)
+        )
     if filter_params.blocks:
-        query = query.where(column("block_id").in_(filter_params.blocks))
+        block_conditions = [col(table.codepoint_dec).between(start, finish) for (start, finish) in block_ranges]
+        query = query.where(or_(*block_conditions) if block_conditions else false())
     if filter_params.categories:
         query = query.where(column("general_category_id").in_(filter_params.categories))
     if filter_params.age_list:
         query = query.where(column("age_id").in_(filter_params.age_list))
     if filter_params.scripts:
-        names, ids = filter_params.scripts
-        script_conditions = [column("script_extensions").contains(s) for s in names] + [column("script_id").in_(ids)]
-        query = query.where(or_(*script_conditions))
+        (_, script_ids) = filter_params.scripts
+        query = query.where(_construct_script_filter(table, script_ids))
     if filter_params.bidi_class_list:
         query = query.where(column("bidi_class_id").in_(filter_params.bidi_class_list))
     if filter_params.decomp_types:
@@ -76,3 +248,30 @@ def _construct_filter_query(  # noqa: C901
         query = query.where(or_(*flag_conditions))
 
     return query
+
+
+def _construct_script_filter(
+    table: type[db.UnicodeCharacter | db.UnicodeCharacterUnihan], script_ids: list[int]
+) -> ColumnElement[bool]:
+    # The (script_id, codepoint_dec) index on the association table is used to find every character that lists
+    # one of the scripts in its Script_Extensions property
+    script_extension = db.CharacterScriptExtension
+    extension_codepoints = select(script_extension.codepoint_dec).where(col(script_extension.script_id).in_(script_ids))
+    return or_(column("script_id").in_(script_ids), col(table.codepoint_dec).in_(extension_codepoints))
+
+
+def _construct_word_filter(
+    table: type[db.UnicodeCharacter | db.UnicodeCharacterUnihan],
+    column_name: str,
+    value: str,
+    fts_indexes: set[str],
+) -> ColumnElement[bool]:
+    word_filter = column(column_name).regexp_match(f"\\b{value}\\b")
+    index_name = get_full_text_index_name(table.__tablename__, column_name)
+    phrase_query = get_phrase_query(value)
+    if not index_name or index_name not in fts_indexes or not phrase_query:
+        return word_filter
+    # The FTS5 index returns a superset of the matching rows, the regular expression is only evaluated for these rows
+    candidates = select(literal_column("rowid")).select_from(sql_table(index_name))
+    candidates = candidates.where(literal_column(index_name).op("MATCH")(phrase_query))
+    return and_(column("codepoint_dec").in_(candidates), word_filter)
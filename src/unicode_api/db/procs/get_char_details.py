@@ -1,8 +1,14 @@
+import heapq
+import json
+from collections.abc import Iterator
+from operator import itemgetter
 from typing import TYPE_CHECKING, Any
 
+from sqlalchemy import Connection, func, literal_column
 from sqlalchemy.engine import Engine
 from sqlalchemy.orm import Mapped
 from sqlmodel import col, select
+from sqlmodel.sql.expression import SelectOfScalar
 
 import unicode_api.db.models as db
 from unicode_api.core.cache import cached_data
@@ -10,6 +16,9 @@ from unicode_api.db.character_props import PROPERTY_GROUPS
 
 if TYPE_CHECKING:  # pragma: no cover
     from unicode_api.db.models import CharPropertyGroup
+    from unicode_api.db.procs.filter_characters import FilterQuery
+
+EXPORT_BATCH_SIZE = 1000
 
 
 def get_character_properties(
@@ -38,15 +47,142 @@ def get_character_properties(
         dict[str, Any]: A dictionary containing the character's properties.
             Keys are property names and values are the corresponding property values.
     """
+    return get_character_properties_many(engine, [codepoint], show_props, verbose)[0]
+
+
+def get_character_properties_many(
+    engine: Engine, codepoints: list[int], show_props: list[db.CharPropertyGroup], verbose: bool
+) -> list[dict[str, Any]]:
+    """
+    Retrieve Unicode character properties for a list of codepoints using a single database connection.
+
+    Codepoints are grouped by the table that stores them (UnicodeCharacter or UnicodeCharacterUnihan)
+    and the property values for each group are fetched with one query per table, rather than one query
+    per codepoint. Each codepoint is only fetched once, even if it appears more than once in the
+    list. The same property group formatting and trimming rules used by
+    `get_character_properties` are then applied to each character.
+
+    Args:
+        engine (Engine): SQLAlchemy engine instance for database access.
+
+        codepoints (list[int]): The Unicode codepoint values to retrieve properties for.
+
+        show_props (list[db.CharPropertyGroup] | None): Optional list of property groups
+            to include. If None, the default set of properties from the Minimum (or CJK
+            Minimum) property group will be included.
+
+        verbose (bool): If True, return all property values; if False, exclude
+            properties that are not relevant for each codepoint.
+
+    Returns:
+        list[dict[str, Any]]: A list containing the properties of each character, in the same
+            order as the codepoints provided.
+    """
+    prop_groups_map = {codepoint: _get_prop_groups(codepoint, show_props) for codepoint in codepoints}
+    db_values_map = _get_prop_values_from_database_many(engine, prop_groups_map)
+    return [
+        _format_character_props(codepoint, prop_groups_map[codepoint], db_values_map[codepoint], verbose)
+        for codepoint in codepoints
+    ]
+
+
+def stream_character_properties(
+    engine: Engine,
+    show_props: list[db.CharPropertyGroup],
+    verbose: bool,
+    filter_query: "FilterQuery | None" = None,
+    batch_size: int = EXPORT_BATCH_SIZE,
+) -> Iterator[list[dict[str, Any]]]:
+    """
+    Retrieve the properties of every Unicode character (or every character that matches a filter) in batches.
+
+    The rows of each character table are read in codepoint order with a streaming cursor, `batch_size` rows
+    at a time, and the two tables are merged into a single sequence ordered by codepoint. Only one batch of
+    rows from each table is held in memory, no matter how many characters are retrieved.
+
+    Args:
+        engine (Engine): SQLAlchemy engine instance for database access.
+
+        show_props (list[db.CharPropertyGroup]): The property groups to include for each character (the
+            Minimum or CJK Minimum property group is always included).
+
+        verbose (bool): If True, return all property values; if False, exclude
+            properties that are not relevant for each codepoint.
+
+        filter_query (FilterQuery | None): Optional statement that selects the codepoints of the characters
+            to retrieve (see `construct_filter_query`). If None, all characters are retrieved.
+
+        batch_size (int): The number of rows fetched from the database at a time, and the number of
+            characters in each batch that is yielded.
+
+    Yields:
+        list[dict[str, Any]]: The properties of the next `batch_size` characters, in codepoint order.
+    """
+    table_rows = [
+        _stream_table_rows(engine, table, show_props, filter_query, batch_size)
+        for table in [db.UnicodeCharacter, db.UnicodeCharacterUnihan]
+    ]
+    batch: list[dict[str, Any]] = []
+    for codepoint, prop_groups, db_values in heapq.merge(*table_rows, key=itemgetter(0)):
+        batch.append(_format_character_props(codepoint, prop_groups, db_values, verbose))
+        if len(batch) == batch_size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
 
-    prop_groups = _get_prop_groups(codepoint, show_props)
-    character_props = _get_prop_values(engine, codepoint, prop_groups)
+def get_property_names(show_props: list[db.CharPropertyGroup]) -> set[str]:
+    """
+    Returns the name of every property that can be included in the details of a character (either a unihan or a
+    non-unihan character) when the given property groups are requested.
+    """
+    return {
+        prop.name_out
+        for unihan in [False, True]
+        for prop_group in _get_prop_groups_for_character_type(unihan, show_props)
+        for prop in PROPERTY_GROUPS[prop_group]
+    }
+
+
+def _stream_table_rows(
+    engine: Engine,
+    table: type[db.UnicodeCharacter | db.UnicodeCharacterUnihan],
+    show_props: list[db.CharPropertyGroup],
+    filter_query: "FilterQuery | None",
+    batch_size: int,
+) -> Iterator[tuple[int, list[db.CharPropertyGroup], dict[str, Any]]]:
+    # Every character in a table uses the same property groups, since unihan characters have their own table
+    prop_groups = _get_prop_groups_for_character_type(table is db.UnicodeCharacterUnihan, show_props)
+    columns = _get_db_columns_for_prop_groups(table, [prop_groups]) or [table.codepoint_dec]
+    query = select(*columns).select_from(table).order_by(col(table.codepoint_dec))
+    if filter_query is not None:
+        query = query.where(col(table.codepoint_dec).in_(filter_query))
+    with engine.connect() as con:
+        result = con.execution_options(stream_results=True).execute(query).mappings()
+        while rows := result.fetchmany(batch_size):
+            db_values_map = {row["codepoint_dec"]: dict(row) for row in rows}
+            if any(column.key == "script_extensions" for column in columns):
+                _add_script_extension_ids(con, list(db_values_map), db_values_map)
+            for codepoint, db_values in db_values_map.items():
+                yield (codepoint, prop_groups, db_values)
+
+
+def _format_character_props(
+    codepoint: int, prop_groups: list[db.CharPropertyGroup], db_values: dict[str, Any], verbose: bool
+) -> dict[str, Any]:
+    character_props = _get_prop_values(prop_groups, db_values)
     character_props = _trim_values_not_supported_in_this_version(character_props)
     return character_props if verbose else _trim_irrelevant_values(codepoint, character_props)
 
 
 def _get_prop_groups(codepoint: int, show_props: list[db.CharPropertyGroup]) -> list[db.CharPropertyGroup]:
-    unihan = cached_data.character_is_unihan(codepoint)
+    return _get_prop_groups_for_character_type(cached_data.character_is_unihan(codepoint), show_props)
+
+
+def _get_prop_groups_for_character_type(
+    unihan: bool, show_props: list[db.CharPropertyGroup]
+) -> list[db.CharPropertyGroup]:
     props_set: set[CharPropertyGroup] = set(show_props) if show_props else set()
     # If all property groups are requested, return appropriate property groups for non-unihan/unihan
     if db.CharPropertyGroup.ALL in props_set:
@@ -69,13 +205,7 @@ def _get_prop_groups(codepoint: int, show_props: list[db.CharPropertyGroup]) ->
     return list(props_set)
 
 
-def _get_prop_values(engine: Engine, codepoint: int, prop_groups: list[db.CharPropertyGroup]) -> dict[str, Any]:
-    table = db.UnicodeCharacter if cached_data.character_is_non_unihan(codepoint) else db.UnicodeCharacterUnihan
-    columns: list[Mapped[Any]] = []
-    for prop_group in prop_groups:
-        columns.extend([getattr(table, prop.name_in) for prop in PROPERTY_GROUPS[prop_group] if prop.db_column])
-    char_props = _get_prop_values_from_database(engine, table, codepoint, columns)
-
+def _get_prop_values(prop_groups: list[db.CharPropertyGroup], char_props: dict[str, Any]) -> dict[str, Any]:
     prop_values: dict[str, Any] = {}
     for prop_group in prop_groups:
         prop_values.update(
@@ -84,20 +214,65 @@ def _get_prop_values(engine: Engine, codepoint: int, prop_groups: list[db.CharPr
     return prop_values
 
 
-def _get_prop_values_from_database(
-    engine: Engine,
-    table: type[db.UnicodeCharacter | db.UnicodeCharacterUnihan],
-    codepoint: int,
-    columns: list[Mapped[Any]],
-) -> dict[str, Any]:
-    char_props = {"codepoint_dec": codepoint}
-    if not columns:
-        return char_props
-    query = select(*columns).select_from(table).where(col(table.codepoint_dec) == codepoint)
+def _get_character_table(codepoint: int) -> type[db.UnicodeCharacter | db.UnicodeCharacterUnihan]:
+    return db.UnicodeCharacter if cached_data.character_is_non_unihan(codepoint) else db.UnicodeCharacterUnihan
+
+
+def _get_prop_values_from_database_many(
+    engine: Engine, prop_groups_map: dict[int, list[db.CharPropertyGroup]]
+) -> dict[int, dict[str, Any]]:
+    db_values_map: dict[int, dict[str, Any]] = {cp: {"codepoint_dec": cp} for cp in prop_groups_map}
+    codepoints_by_table: dict[type[db.UnicodeCharacter | db.UnicodeCharacterUnihan], list[int]] = {}
+    for codepoint in prop_groups_map:
+        codepoints_by_table.setdefault(_get_character_table(codepoint), []).append(codepoint)
+
     with engine.connect() as con:
-        for row in con.execute(query).mappings():
-            char_props.update(dict(row))
-    return char_props
+        for table, codepoints in codepoints_by_table.items():
+            columns = _get_db_columns_for_prop_groups(table, [prop_groups_map[cp] for cp in codepoints])
+            if not columns:
+                continue
+            query = select(*columns).select_from(table).where(col(table.codepoint_dec).in_(_select_values(codepoints)))
+            for row in con.execute(query).mappings():
+                db_values_map[row["codepoint_dec"]].update(dict(row))
+            if any(column.key == "script_extensions" for column in columns):
+                _add_script_extension_ids(con, codepoints, db_values_map)
+    return db_values_map
+
+
+def _add_script_extension_ids(con: Connection, codepoints: list[int], db_values_map: dict[int, dict[str, Any]]):
+    for codepoint in codepoints:
+        db_values_map[codepoint]["script_extension_ids"] = []
+    # Rows are inserted in the order the scripts are listed in the UCD, rowid preserves that order
+    query = (
+        select(db.CharacterScriptExtension.codepoint_dec, db.CharacterScriptExtension.script_id)
+        .where(col(db.CharacterScriptExtension.codepoint_dec).in_(_select_values(codepoints)))
+        .order_by(literal_column("rowid"))
+    )
+    for codepoint, script_id in con.execute(query):
+        db_values_map[codepoint]["script_extension_ids"].append(script_id)
+
+
+def _get_db_columns_for_prop_groups(
+    table: type[db.UnicodeCharacter | db.UnicodeCharacterUnihan], all_prop_groups: list[list[db.CharPropertyGroup]]
+) -> list[Mapped[Any]]:
+    column_names = {
+        prop.name_in
+        for prop_groups in all_prop_groups
+        for prop_group in prop_groups
+        for prop in PROPERTY_GROUPS[prop_group]
+        if prop.db_column
+    }
+    if not column_names:
+        return []
+    column_names.discard("codepoint_dec")
+    columns: list[Mapped[Any]] = [getattr(table, name) for name in sorted(column_names)]
+    return [table.codepoint_dec, *columns]  # type: ignore[reportReturnType]
+
+
+def _select_values(codepoints: list[int]) -> SelectOfScalar[int]:
+    # The codepoints are bound as a single JSON array, SQLite limits the number of host parameters in a statement
+    values = func.json_each(json.dumps(codepoints)).table_valued("value")
+    return select(values.c.value)
 
 
 def _trim_values_not_supported_in_this_version(response_dict: dict[str, Any]) -> dict[str, Any]:  # pragma: no cover
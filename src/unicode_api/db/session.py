@@ -13,7 +13,8 @@ Classes:
               providing methods for character properties, filtering, and version information.
 """
 
-from collections.abc import Generator
+from array import array
+from collections.abc import Generator, Iterator, Sequence
 from typing import TYPE_CHECKING, Any
 
 from sqlalchemy.engine import Engine
@@ -23,12 +24,20 @@ import unicode_api.db.procs.filter_characters as proc_filter
 import unicode_api.db.procs.get_char_details as proc_char
 import unicode_api.db.procs.get_unicode_versions as proc_ver
 from unicode_api.config.api_settings import get_settings
+from unicode_api.core.result_cache import character_filter_cache
+from unicode_api.db.bitmap_filter import BitmapFilterIndex, get_bitmap_filter_index
+from unicode_api.db.columnar_filter import ColumnarCharacterStore, get_columnar_store
 from unicode_api.db.engine import ro_db_engine as engine
+from unicode_api.enums.filter_engine import FilterEngine
 from unicode_api.enums.property_group import CharPropertyGroup
 
 if TYPE_CHECKING:  # pragma: no cover
     from unicode_api.api.api_v1.dependencies.filter_settings import FilterParameters
 
+# SQL filter results with at most this many codepoints are cached as an array (4 bytes per codepoint), larger
+# results are cached as a FilterQueryPlan, which only stores the number of matching characters
+MAX_MATERIALIZED_FILTER_RESULTS = 10000
+
 
 def get_session() -> Generator["DBSession", None, None]:
     """
@@ -99,7 +108,46 @@ class DBSession:
         """
         return proc_char.get_character_properties(self.engine, codepoint, show_props, verbose)
 
-    def filter_all_characters(self, filter_params: "FilterParameters") -> list[int]:
+    def get_character_properties_many(
+        self, codepoints: list[int], show_props: list[CharPropertyGroup], verbose: bool
+    ) -> list[dict[str, Any]]:
+        """
+        Retrieves properties of multiple Unicode characters using a single database connection.
+
+        Parameters:
+            codepoints (list[int]): The Unicode codepoints of the characters.
+            show_props (list[CharPropertyGroup] | None): List of character property groups to include.
+                If None, all properties are included.
+            verbose (bool): If True, provides more detailed property information.
+
+        Returns:
+            list[dict[str, Any]]: A list of character property dictionaries, in the same order as
+                the codepoints provided.
+        """
+        return proc_char.get_character_properties_many(self.engine, codepoints, show_props, verbose)
+
+    def stream_character_properties(
+        self, show_props: list[CharPropertyGroup], verbose: bool, filter_params: "FilterParameters | None" = None
+    ) -> Iterator[list[dict[str, Any]]]:
+        """
+        Retrieves the properties of every Unicode character (or every character that matches the filter
+        settings) in batches, ordered by codepoint.
+
+        Parameters:
+            show_props (list[CharPropertyGroup]): List of character property groups to include.
+            verbose (bool): If True, provides more detailed property information.
+            filter_params (FilterParameters | None): Optional filter settings that select the characters to
+                include. If None, all characters are included.
+
+        Returns:
+            Iterator[list[dict[str, Any]]]: Batches of character property dictionaries. The rows are read from
+                the database with a streaming cursor as the batches are consumed, so memory usage does not
+                depend on the number of characters.
+        """
+        filter_query = proc_filter.construct_filter_query(self.session, filter_params) if filter_params else None
+        return proc_char.stream_character_properties(self.engine, show_props, verbose, filter_query)
+
+    def filter_all_characters(self, filter_params: "FilterParameters") -> Sequence[int]:
         """
         Filter Unicode characters based on specified parameters.
 
@@ -111,6 +159,31 @@ class DBSession:
                 This can include properties such as block, category, age, etc.
 
         Returns:
-            list[int]: A list of Unicode code points (integers) that match the filter criteria.
+            Sequence[int]: The Unicode code points (integers) that match the filter criteria, sorted in
+                ascending order.
+
+        Note:
+            Results are cached (keyed by the canonical form of the filter parameters), so paging through
+            the results of a filter request only builds the filter once. If the `FILTER_ENGINE` setting is
+            "columnar" or "bitmap", filters that do not include a name or CJK definition are evaluated in
+            memory by that engine. Otherwise, the filter is evaluated by a FilterQueryPlan, which counts the
+            matching characters with a single SQL statement. If there are no more than
+            `MAX_MATERIALIZED_FILTER_RESULTS` matching characters, their codepoints are retrieved and cached as
+            an array, so later pages are read from memory. Otherwise, the FilterQueryPlan is cached and each
+            page is retrieved with a single SQL statement (only the number of matching characters is cached).
+            Both the FilterQueryPlan and the CodepointBitmap returned by the bitmap engine support `len()` and
+            slicing without building a list of every matching codepoint.
         """
-        return proc_filter.filter_all_characters(self.session, filter_params)
+        return character_filter_cache.get_or_compute(
+            filter_params.cache_key, lambda: self._filter_all_characters(filter_params)
+        )
+
+    def _filter_all_characters(self, filter_params: "FilterParameters") -> Sequence[int]:
+        match self.api_settings.FILTER_ENGINE:
+            case FilterEngine.BITMAP if BitmapFilterIndex.supports(filter_params):
+                return get_bitmap_filter_index().filter(filter_params)
+            case FilterEngine.COLUMNAR if ColumnarCharacterStore.supports(filter_params):
+                return array("I", get_columnar_store().filter(filter_params).tobytes())
+            case _:
+                plan = proc_filter.FilterQueryPlan(self.engine, filter_params)
+                return array("I", plan) if len(plan) <= MAX_MATERIALIZED_FILTER_RESULTS else plan
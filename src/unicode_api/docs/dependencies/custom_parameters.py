@@ -18,6 +18,9 @@ from unicode_api.docs.dependencies import (
 )
 
 MIN_SEARCH_RESULT_SCORE = 70
+MAX_BATCH_ITEMS = 1000
+MAX_BATCH_CODEPOINTS = 10000
+MAX_BATCH_COST = 50000
 
 LIMIT_DESCRIPTION = """
 <ul class="param-notes">
@@ -115,6 +118,9 @@ UNICODE_CHAR_URI_EXAMPLES = f"""
 """
 
 UNICODE_CHAR_STRING_DESCRIPTION = f"""
+<ul class="param-notes">
+    <li>The string can contain a maximum of <strong>{cached_data.settings.MAX_CHAR_STRING_LENGTH}</strong> characters</li>
+</ul>
 <p>A string containing Unicode characters, which can be expressed either directly (unencoded) or as a URI-encoded string. If you are unsure which format to use, please see the <strong>Examples</strong> below.</p>
 {UNICODE_CHAR_NORMAL_EXAMPLES}
 {UNICODE_CHAR_URI_EXAMPLES}
@@ -126,6 +132,23 @@ CODEPOINT_PATH_PARAM_DESSCRIPTION = f"""
 {CODEPOINT_EXAMPLES}
 """
 
+CODEPOINT_BATCH_DESCRIPTION = f"""
+<ul class="param-notes">
+    <li>A maximum of <strong>{MAX_BATCH_ITEMS}</strong> values can be sent in a single request</li>
+    <li>The values sent can include a maximum of <strong>{MAX_BATCH_CODEPOINTS}</strong> codepoints, after expanding all ranges</li>
+</ul>
+<p>A list of codepoints and/or ranges of codepoints. Each codepoint must be expressed as a hexadecimal value within range <code>0000...10FFFF</code>, optionally prefixed by <code>U+</code> or <code>0x</code>. A range of codepoints is expressed as two codepoints separated by <code>..</code> (e.g., <code>U+0041..U+005A</code>).</p>
+<p>Each character is included in the response only once, in the order that the character was first requested.</p>
+"""
+
+BATCH_SHOW_PROPS_DESCRIPTION = f"""
+<ul class="param-notes">
+    <li>This value is optional</li>
+    <li>The number of codepoints multiplied by the number of property groups included in the response cannot exceed <strong>{MAX_BATCH_COST}</strong></li>
+</ul>
+<p>A list of property groups to include in the response for each character, accepting the same values as the <code>show_props</code> query parameter of the <code>/v1/codepoints/{{codepoint}}</code> endpoint.</p>
+"""
+
 BLOCK_NAME_DESCRIPTION = f"""
 <ul class="param-notes">
     <li class=\"loose-match\">The <a href="#loose-matching">Loose-matching rule</a> is applied to the value of this parameter</li>
@@ -188,6 +211,14 @@ PAGE_NUMBER_DESCRIPTION = """
 <p>If <code>hasMore=True</code>, the response will contain a <code>nextPage</code> property. You can access the next set of search results by sending a subsequent request with <code>page</code> equal to <code>nextPage</code>.</p>
 """
 
+CURSOR_DESCRIPTION = """
+<ul class="param-notes">
+    <li class=\"note\">This value is optional, and cannot be combined with the <code>page</code> parameter</li>
+</ul>
+<p>Used to request the set of search results that follows a previous response. If <code>hasMore=True</code>, each response includes a <code>nextCursor</code> property. You can access the next set of search results by sending a subsequent request with <code>cursor</code> equal to <code>nextCursor</code> (all other parameters should be the same as the previous request).</p>
+<p>Unlike <code>page</code>, the cursor identifies the last search result in the previous response, so requesting the next set of results does not require the API to skip over all of the results on the preceding pages. Responses to requests that include a <code>cursor</code> do not include the <code>currentPage</code> and <code>nextPage</code> properties.</p>
+"""
+
 CHAR_NAME_FILTER_DESCRIPTION = """
 <ul class="param-notes">
     <li class=\"note\">This value is optional</li>
@@ -204,6 +235,20 @@ CJK_DEFINITION_FILTER_DESCRIPTION = """
 <p>Filter CJK characters by the English-language definition, if available. A character is considered a match if the CJK definition of the character <strong>contains</strong> the value provided.</p>
 """
 
+DEFINED_ONLY_DESCRIPTION = """
+<ul class="param-notes">
+    <li class=\"note\">This value is optional (default: <code>defined_only=false</code>)</li>
+</ul>
+<p>Sending <code>defined_only=true</code> skips all reserved and unassigned codepoints, so that every object in the response is a character that has been defined in the Unicode Standard. The <code>starting_after</code> and <code>ending_before</code> parameters do not need to be defined characters when this value is sent.</p>
+"""
+
+EXPORT_FORMAT_DESCRIPTION = """
+<ul class="param-notes">
+    <li class=\"note\">This value is optional (default: <code>format=ndjson</code>)</li>
+</ul>
+<p>The format of the exported data. Sending <code>format=ndjson</code> returns one JSON object per line (newline-delimited JSON), sending <code>format=csv</code> returns a CSV file with one row per character, where any property containing a list of values is stored as a JSON array.</p>
+"""
+
 VERBOSE_DESCRIPTION = """
 <ul class="param-notes">
     <li class=\"note\">This value is optional (default: <code>verbose=false</code>)</li>
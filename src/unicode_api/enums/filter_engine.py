@@ -0,0 +1,7 @@
+from enum import StrEnum
+
+
+class FilterEngine(StrEnum):
+    SQL = "sql"
+    COLUMNAR = "columnar"
+    BITMAP = "bitmap"
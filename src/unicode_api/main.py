@@ -16,12 +16,18 @@ from starlette.responses import FileResponse, RedirectResponse
 from unicode_api.api.api_v1.api import router
 from unicode_api.config.api_settings import UnicodeApiSettings, get_settings
 from unicode_api.core.cache import cached_data
+from unicode_api.core.http_cache import CACHE_CONTROL_HEADER, etag_matches, get_etag
 from unicode_api.core.logging import LOGGING_CONFIG
 from unicode_api.core.rate_limit import rate_limit
 from unicode_api.core.redis_client import redis
+from unicode_api.core.response_cache import response_cache
+from unicode_api.core.result_cache import get_result_cache_stats
 from unicode_api.core.umami import send_api_request_event_to_umami, send_rate_limit_exceeded_event_to_umami
 from unicode_api.core.util import format_timedelta_str
+from unicode_api.db.bitmap_filter import get_bitmap_filter_index
+from unicode_api.db.columnar_filter import get_columnar_store
 from unicode_api.docs.api_docs.swagger_ui import get_api_docs_for_swagger_ui, get_swagger_ui_html
+from unicode_api.enums.filter_engine import FilterEngine
 from unicode_api.enums.request_type import RequestType
 
 
@@ -45,6 +51,7 @@ async def lifespan(app: FastAPI):
     init_logging(settings)
     init_redis()
     init_unicode_data(settings)
+    init_filter_engine(settings)
     yield
 
 
@@ -83,28 +90,23 @@ def init_redis():
 
 def init_unicode_data(settings: UnicodeApiSettings) -> None:
     """
-    Initializes and loads Unicode data into memory by accessing various cached data properties.
-    This function measures the time taken to load the data and logs the duration.
+    Initializes and loads Unicode data into memory by building the Unicode data snapshot.
+    This function measures the time taken to load the data and logs the duration, along with
+    the build time and approximate memory usage of each structure in the snapshot.
 
     Args:
         settings (UnicodeApiSettings): The settings object containing the Unicode version information.
 
     Side Effects:
-        - Accesses cached Unicode data properties to ensure they are loaded into memory.
+        - Builds the snapshot of all cached Unicode data to ensure it is loaded into memory.
         - Logs the time taken to load the Unicode data.
+        - Logs a report of the build time and size of each structure in the snapshot (DEBUG level).
 
     Example Log Message:
         "Unicode v13.0 data loaded in 123.45 milliseconds."
     """
     start_ns = time.process_time_ns()
-    _ = cached_data.property_value_id_map
-    _ = cached_data.non_unihan_character_name_map
-    _ = cached_data.blocks
-    _ = cached_data.planes
-    _ = cached_data.all_non_unihan_codepoints
-    _ = cached_data.all_cjk_codepoints
-    _ = cached_data.all_tangut_ideograph_codepoints
-    _ = cached_data.all_tangut_component_codepoints
+    snapshot = cached_data.snapshot
     end_ns = time.process_time_ns()
     td_ms = (end_ns - start_ns) / 1_000_000
     td = timedelta(milliseconds=td_ms)
@@ -112,6 +114,29 @@ def init_unicode_data(settings: UnicodeApiSettings) -> None:
     logger.info(
         f"Unicode v{settings.UNICODE_VERSION} data loaded in {format_timedelta_str(td, precise=True)} milliseconds."
     )
+    for line in snapshot.build_report:
+        logger.debug(line)
+
+
+def init_filter_engine(settings: UnicodeApiSettings) -> None:
+    """
+    Loads the in-memory filter engine selected by the `FILTER_ENGINE` setting (nothing is loaded if the setting is
+    "sql").
+
+    Args:
+        settings (UnicodeApiSettings): The settings object.
+    """
+    start_ns = time.process_time_ns()
+    match settings.FILTER_ENGINE:
+        case FilterEngine.COLUMNAR:
+            message = f"Columnar filter engine loaded {len(get_columnar_store())} characters"
+        case FilterEngine.BITMAP:
+            message = f"Bitmap filter index loaded {len(get_bitmap_filter_index())} posting lists"
+        case _:
+            return
+    td = timedelta(milliseconds=(time.process_time_ns() - start_ns) / 1_000_000)
+    logger = logging.getLogger("unicode_api.api")
+    logger.info(f"{message} in {format_timedelta_str(td, precise=True)}.")
 
 
 def simplify_operation_ids(app: FastAPI) -> None:
@@ -153,8 +178,8 @@ app.add_middleware(
         "http://172.17.0.1",
     ],
     allow_credentials=True,
-    allow_methods=["GET", "OPTIONS"],
-    allow_headers=["X-UnicodeAPI-Test"],
+    allow_methods=["GET", "POST", "OPTIONS"],
+    allow_headers=["Content-Type", "X-UnicodeAPI-Test"],
 )
 STATIC_FOLDER = Path(__file__).parent.joinpath("static")
 app.mount("/static", StaticFiles(directory=str(STATIC_FOLDER)), name="static")
@@ -162,6 +187,74 @@ app.include_router(router, prefix=get_settings().API_VERSION)
 simplify_operation_ids(app)
 
 
+@app.middleware("http")
+async def apply_response_caching(request: Request, call_next: Callable[[Request], Awaitable[Response]]):
+    """
+    Middleware function that serves cached responses for the codepoint, character string, block and plane
+    detail endpoints.
+
+    If the response cache is disabled or the requested route is not cached, the request is passed to the next
+    middleware or endpoint unchanged. Otherwise, a cached response body is returned if one exists, and the
+    body of a successful (200 OK) response is stored in the cache before it is returned.
+
+    Args:
+        request (Request): The incoming HTTP request object.
+        call_next (Callable): The next middleware or endpoint to call if no cached response exists.
+
+    Returns:
+        Response: The cached response (with the header `X-Response-Cache: HIT`), or the response returned by
+            the next middleware or endpoint.
+    """
+    cache_key = (
+        response_cache.get_cache_key(request.url.path, request.query_params.multi_items())
+        if request.method == "GET"
+        else None
+    )
+    if not cache_key:
+        return await call_next(request)
+    if (body := await response_cache.get(cache_key)) is not None:
+        return Response(content=body, media_type="application/json", headers={"X-Response-Cache": "HIT"})
+    response = await call_next(request)
+    if response.status_code != status.HTTP_200_OK:
+        return response
+    body = b"".join([chunk async for chunk in response.body_iterator])  # type: ignore[reportAttributeAccessIssue]
+    await response_cache.set(cache_key, body)
+    headers = dict(response.headers) | {"X-Response-Cache": "MISS"}
+    return Response(content=body, status_code=response.status_code, headers=headers, media_type=response.media_type)
+
+
+@app.middleware("http")
+async def apply_conditional_requests(request: Request, call_next: Callable[[Request], Awaitable[Response]]):
+    """
+    Middleware function that adds HTTP validators and caching headers to API responses, and answers conditional
+    requests for responses the client already has.
+
+    The ETag for a request is derived from the Unicode version and the canonical form of the request URL, so it
+    can be computed without running the endpoint. If the `If-None-Match` header of a GET request matches the
+    ETag, a 304 Not Modified response is returned immediately, without querying the database or rendering the
+    response body.
+
+    Args:
+        request (Request): The incoming HTTP request object.
+        call_next (Callable): The next middleware or endpoint to call if the client's copy of the response is
+            missing or out of date.
+
+    Returns:
+        Response: A 304 Not Modified response, or the response returned by the next middleware or endpoint
+            (with `ETag` and `Cache-Control` headers added if the response was successful).
+    """
+    etag = get_etag(request.url.path, request.query_params.multi_items()) if request.method == "GET" else None
+    if not etag:
+        return await call_next(request)
+    cache_headers = {"ETag": etag, "Cache-Control": CACHE_CONTROL_HEADER}
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=cache_headers)
+    response = await call_next(request)
+    if response.status_code == status.HTTP_200_OK:
+        response.headers.update(cache_headers)
+    return response
+
+
 @app.middleware("http")
 async def apply_rate_limiting(request: Request, call_next: Callable[[Request], Awaitable[Response]]):
     """
@@ -182,7 +275,7 @@ async def apply_rate_limiting(request: Request, call_next: Callable[[Request], A
         Awaitable: The result of calling the next middleware or endpoint if the
             request is allowed.
     """
-    # decision = rate_limit.validate_request(request)
+    # decision = await rate_limit.validate_request(request)
     # match decision.request_type:
     #     case RequestType.RATE_LIMITED_ALLOWED:
     #         send_api_request_event_to_umami(request, decision.ip)
@@ -270,5 +363,18 @@ def get_api_root():
     )
 
 
+@app.get(f"{get_settings().API_VERSION}/result-cache-stats", include_in_schema=False)
+def get_result_cache_stats_report():
+    """
+    Returns the current size and hit/miss/eviction counters for each search/filter result cache and for the
+    in-process tier of the response cache.
+
+    Returns:
+        list[dict[str, Any]]: Stats for each cache, used to tune the `RESULT_CACHE_MAX_ENTRIES`,
+        `RESULT_CACHE_TTL_SECONDS` and `RESPONSE_CACHE_MAX_LOCAL_ENTRIES` settings.
+    """
+    return [stats.as_dict() for stats in [*get_result_cache_stats(), response_cache.local.stats]]
+
+
 if __name__ == "__main__":
     uvicorn.run(app, host="0.0.0.0", port=8000)
@@ -1,6 +1,6 @@
 from typing import TYPE_CHECKING
 
-from sqlalchemy import Integer
+from sqlalchemy import Index, Integer
 from sqlalchemy_utils import ChoiceType
 from sqlmodel import Field, Relationship
 
@@ -287,3 +287,11 @@ class UnicodeCharacterUnihan(UnicodeCharacterBase, table=True):
     japanese_kun: str | None = None
     japanese_on: str | None = None
     vietnamese: str | None = None
+
+
+class CharacterScriptExtension(CamelModel, table=True):
+    __tablename__: str = "character_script_extension"  # type: ignore  # noqa: PGH003
+    __table_args__ = (Index("ix_character_script_extension_script_id", "script_id", "codepoint_dec"),)
+
+    codepoint_dec: int = Field(primary_key=True)
+    script_id: int = Field(primary_key=True, foreign_key="script.id")
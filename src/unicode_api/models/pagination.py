@@ -30,7 +30,8 @@ class PaginatedSearchResults[T](CamelModel):
     query: str | None = None
     filter_settings: UserFilterSettings | None = None
     has_more: bool
-    current_page: int
+    current_page: int | None = None
     next_page: int | None = None
+    next_cursor: str | None = None
     total_results: int
     results: list[T]
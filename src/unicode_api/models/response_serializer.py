@@ -0,0 +1,107 @@
+"""
+This module provides a precompiled serializer for API responses that are described by a CamelModel.
+
+When an endpoint returns a dict, FastAPI validates it against the endpoint's `response_model` and then
+serializes the validated model. For responses containing a page of characters with dozens of properties each,
+this validation step dominates the time needed to create the response. Since the response data is produced by
+the API itself (not by the user), the serializer can instead emit the response directly: the output key (alias),
+position and value conversion for every field of the response model are computed once when the serializer is
+created, and applied to each response with a single pass over the model's fields.
+
+The output is identical to `response_model` with `response_model_exclude_unset=True`: only keys present in the
+input are emitted, keys are emitted in the order the fields are defined in the model, int values of `float`
+fields are converted to floats, and nested models (and lists of nested models) are serialized recursively.
+
+Classes:
+    ResponseSerializer:
+        Serializes dicts (and nested dicts/models) using the field aliases and order defined by a pydantic model.
+"""
+
+from collections.abc import Callable, Mapping
+from typing import Any, get_args, get_origin
+
+from pydantic import BaseModel
+
+type FieldSerializer = Callable[[Any], Any]
+
+
+class ResponseSerializer:
+    """
+    Serializes dicts (and nested dicts/models) using the field aliases and order defined by a pydantic model.
+
+    Attributes:
+        model (type[BaseModel]): The response model.
+        fields (tuple[tuple[str, str, FieldSerializer], ...]): Field name, output key (alias) and value
+            serializer for each field of the response model, in the order the fields are defined.
+    """
+
+    def __init__(self, model: type[BaseModel]):
+        self.model = model
+        self.fields: tuple[tuple[str, str, FieldSerializer], ...] = tuple(
+            (name, field.alias or name, _get_field_serializer(field.annotation))
+            for (name, field) in model.model_fields.items()
+        )
+
+    def serialize(self, data: Mapping[str, Any] | BaseModel) -> dict[str, Any]:
+        if isinstance(data, BaseModel):
+            return data.model_dump(mode="json", by_alias=True, exclude_unset=True)
+        serialized: dict[str, Any] = {}
+        for name, alias, serialize_value in self.fields:
+            if name in data:
+                serialized[alias] = serialize_value(data[name])
+            elif alias in data:
+                serialized[alias] = serialize_value(data[alias])
+        return serialized
+
+    def serialize_many(self, data: list[Mapping[str, Any]]) -> list[dict[str, Any]]:
+        return [self.serialize(item) for item in data]
+
+
+def _get_field_serializer(annotation: Any) -> FieldSerializer:
+    if _annotation_includes(annotation, float):
+        return _serialize_float
+    if _annotation_includes(annotation, list[float]):
+        return _serialize_float_list
+    if model := _get_list_item_model_type(annotation):
+        return _get_model_list_serializer(ResponseSerializer(model))
+    if model := _get_model_type(annotation):
+        return _get_model_serializer(ResponseSerializer(model))
+    return _serialize_value
+
+
+def _annotation_includes(annotation: Any, target: Any) -> bool:
+    return annotation == target or target in get_args(annotation)
+
+
+def _get_model_type(annotation: Any) -> type[BaseModel] | None:
+    for arg in [annotation, *get_args(annotation)]:
+        if isinstance(arg, type) and issubclass(arg, BaseModel):
+            return arg
+    return None
+
+
+def _get_list_item_model_type(annotation: Any) -> type[BaseModel] | None:
+    for arg in [annotation, *get_args(annotation)]:
+        if get_origin(arg) is list and (item_type := _get_model_type(get_args(arg)[0])):
+            return item_type
+    return None
+
+
+def _get_model_serializer(serializer: ResponseSerializer) -> FieldSerializer:
+    return lambda value: serializer.serialize(value) if value is not None else None
+
+
+def _get_model_list_serializer(serializer: ResponseSerializer) -> FieldSerializer:
+    return lambda value: serializer.serialize_many(value) if value is not None else None
+
+
+def _serialize_float(value: Any) -> Any:
+    return float(value) if isinstance(value, int) and not isinstance(value, bool) else value
+
+
+def _serialize_float_list(value: Any) -> Any:
+    return [_serialize_float(item) for item in value] if value is not None else None
+
+
+def _serialize_value(value: Any) -> Any:
+    return value.model_dump(mode="json", by_alias=True, exclude_unset=True) if isinstance(value, BaseModel) else value
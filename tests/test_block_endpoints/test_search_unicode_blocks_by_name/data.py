@@ -5,6 +5,7 @@ SEARCH_TERM_OLD_PER_PAGE_5_PAGE_1_OF_2 = {
     "hasMore": True,
     "currentPage": 1,
     "nextPage": 2,
+    "nextCursor": "YWZ0ZXI6MTk5",
     "results": [
         {
             "id": 174,
@@ -119,6 +120,58 @@ SEARCH_TERM_OLD_PER_PAGE_5_PAGE_2_OF_2 = {
 SEARCH_TERM_OLD_PER_PAGE_5_PAGE_3_OF_2 = {
     "detail": "Request for page #3 is invalid since there are 2 total pages."
 }
+SEARCH_TERM_OLD_PER_PAGE_5_NEXT_CURSOR = {
+    "url": "/v1/blocks/search",
+    "query": "old",
+    "totalResults": 9,
+    "hasMore": False,
+    "results": [
+        {
+            "id": 205,
+            "name": "Old Turkic",
+            "shortName": "Old_Turkic",
+            "plane": "SMP",
+            "start": "U+10C00",
+            "finish": "U+10C4F",
+            "totalAllocated": 80,
+            "totalDefined": 73,
+            "score": 90.0
+        },
+        {
+            "id": 206,
+            "name": "Old Hungarian",
+            "shortName": "Old_Hungarian",
+            "plane": "SMP",
+            "start": "U+10C80",
+            "finish": "U+10CFF",
+            "totalAllocated": 128,
+            "totalDefined": 108,
+            "score": 90.0
+        },
+        {
+            "id": 211,
+            "name": "Old Sogdian",
+            "shortName": "Old_Sogdian",
+            "plane": "SMP",
+            "start": "U+10F00",
+            "finish": "U+10F2F",
+            "totalAllocated": 48,
+            "totalDefined": 40,
+            "score": 90.0
+        },
+        {
+            "id": 213,
+            "name": "Old Uyghur",
+            "shortName": "Old_Uyghur",
+            "plane": "SMP",
+            "start": "U+10F70",
+            "finish": "U+10FAF",
+            "totalAllocated": 64,
+            "totalDefined": 26,
+            "score": 90.0
+        }
+    ]
+}
 SEARCH_TERM_CAP = {
     "url": "/v1/blocks/search",
     "query": "cap",
@@ -1,6 +1,7 @@
 from tests.test_block_endpoints.test_search_unicode_blocks_by_name.data import (
     SEARCH_TERM_BLAH,
     SEARCH_TERM_CAP,
+    SEARCH_TERM_OLD_PER_PAGE_5_NEXT_CURSOR,
     SEARCH_TERM_OLD_PER_PAGE_5_PAGE_1_OF_2,
     SEARCH_TERM_OLD_PER_PAGE_5_PAGE_2_OF_2,
     SEARCH_TERM_OLD_PER_PAGE_5_PAGE_3_OF_2,
@@ -35,3 +36,10 @@ def test_search_term_blah(client):
     response = client.get("/v1/blocks/search?name=blah")
     assert response.status_code == 200
     assert response.json() == SEARCH_TERM_BLAH
+
+
+def test_search_term_old_next_cursor(client):
+    next_cursor = SEARCH_TERM_OLD_PER_PAGE_5_PAGE_1_OF_2["nextCursor"]
+    response = client.get(f"/v1/blocks/search?name=old&per_page=5&cursor={next_cursor}")
+    assert response.status_code == 200
+    assert response.json() == SEARCH_TERM_OLD_PER_PAGE_5_NEXT_CURSOR
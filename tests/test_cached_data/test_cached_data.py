@@ -1,4 +1,8 @@
+import pytest
+from rapidfuzz import process
+
 from unicode_api.core.cache import cached_data
+from unicode_api.enums.character_type import CharacterType
 
 TOTAL_CHARACTERS_IN_UNICODE_V15_0 = 149186
 
@@ -16,3 +20,57 @@ def test_get_char_name_invalid_codepoint(client):
 def test_get_unicode_version():
     version = "15.0.0"
     assert cached_data.unicode_version == version
+
+
+def test_get_unicode_block_containing_codepoint_at_block_boundaries():
+    for block in cached_data.blocks:
+        assert cached_data.get_unicode_block_containing_codepoint(block.start_dec).id == block.id
+        assert cached_data.get_unicode_block_containing_codepoint(block.finish_dec).id == block.id
+    assert cached_data.get_unicode_block_containing_codepoint(0x0870).long_name == "Arabic Extended-B"
+    assert cached_data.get_unicode_block_containing_codepoint(0x2FE0).id == 0
+    assert cached_data.get_unicode_block_containing_codepoint(0x110000).id == 0
+
+
+def test_get_unicode_plane_containing_block_id():
+    for block in cached_data.blocks:
+        plane = cached_data.get_unicode_plane_containing_block_id(block.id or 0)
+        assert plane.start_dec <= block.start_dec and block.finish_dec <= plane.finish_dec
+
+
+def test_reload_unicode_data_snapshot():
+    current_snapshot = cached_data.snapshot
+    reloaded_snapshot = cached_data.reload()
+    assert reloaded_snapshot is not current_snapshot
+    assert cached_data.snapshot is reloaded_snapshot
+    assert reloaded_snapshot.official_number_of_unicode_characters == TOTAL_CHARACTERS_IN_UNICODE_V15_0
+    assert len(reloaded_snapshot.build_stats) > 0
+
+
+def test_get_character_type():
+    assert cached_data.get_character_type(0x0041) == CharacterType.NON_UNIHAN
+    assert cached_data.get_character_type(0x4E00) == CharacterType.UNIHAN
+    assert cached_data.get_character_type(0x17000) == CharacterType.TANGUT
+    assert cached_data.get_character_type(0xFDD0) == CharacterType.NONCHARACTER
+    assert cached_data.get_character_type(0x10FFFF) == CharacterType.NONCHARACTER
+    assert cached_data.get_character_type(0xD800) == CharacterType.SURROGATE
+    assert cached_data.get_character_type(0xE000) == CharacterType.PRIVATE_USE
+    assert cached_data.get_character_type(0xF0000) == CharacterType.PRIVATE_USE
+    assert cached_data.get_character_type(0x0378) == CharacterType.RESERVED
+    assert cached_data.get_character_type(0x110000) == CharacterType.INVALID
+    assert cached_data.get_character_type(-1) == CharacterType.INVALID
+
+
+@pytest.mark.parametrize(
+    "codepoint, is_private_use",
+    [(0xE000, True), (0xF0000, True), (0xFFFFE, True), (0x10FFFF, True), (0xFDD0, False), (0xFFFF, False)],
+)
+def test_codepoint_is_private_use(codepoint, is_private_use):
+    assert cached_data.codepoint_is_private_use(codepoint) is is_private_use
+
+
+def test_character_name_search_matches_full_scan():
+    name_choices = {cp: name.lower() for (cp, name) in cached_data.non_unihan_character_name_map.items()}
+    for query in ["home", "house", "smiling face", "arrow"]:
+        full_scan = process.extract(query, name_choices, limit=len(name_choices))
+        expected = [(cp, score) for (_, score, cp) in full_scan if score >= 80.0]
+        assert cached_data.search_characters_by_name(query) == expected
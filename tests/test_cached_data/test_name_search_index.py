@@ -0,0 +1,35 @@
+import unicodedata
+
+import pytest
+from rapidfuzz import fuzz, process
+
+from unicode_api.core.name_search_index import NameSearchIndex
+
+CHARACTER_NAMES = {
+    codepoint: unicodedata.name(chr(codepoint)) for codepoint in range(0x3000) if unicodedata.name(chr(codepoint), None)
+}
+
+
+@pytest.fixture(scope="module")
+def name_search_index():
+    return NameSearchIndex(reversed(CHARACTER_NAMES.items()))
+
+
+@pytest.mark.parametrize("score_cutoff", [0, 60, 70, 80, 90])
+@pytest.mark.parametrize(
+    "query",
+    ["home", "old", "a", "Greek Capital", "latin small letter a", "smiling face", "arrow  left", "tab\tarrow", "", "é"],
+)
+def test_search_matches_full_scan(name_search_index, query, score_cutoff):
+    name_map = {codepoint: name.lower() for (codepoint, name) in CHARACTER_NAMES.items()}
+    results = process.extract(
+        query.lower(), name_map, scorer=fuzz.WRatio, processor=None, limit=None, score_cutoff=score_cutoff
+    )
+    expected = [(codepoint, score) for (_, score, codepoint) in results]
+    assert name_search_index.search(query, score_cutoff) == expected
+    assert name_search_index.search(query, score_cutoff, limit=5) == expected[:5]
+
+
+def test_get_score(name_search_index):
+    assert name_search_index.get_score("Latin Small Letter A", 0x61) == 100
+    assert name_search_index.get_score("latin small letter a", 0x10FFFF) is None
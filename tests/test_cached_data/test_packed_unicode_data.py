@@ -0,0 +1,105 @@
+import pytest
+
+from unicode_api.core.packed_unicode_data import (
+    PACKED_UNICODE_DATA_HEADER,
+    CodepointSet,
+    PackedUnicodeData,
+    load_packed_unicode_data,
+    pack_unicode_data,
+    save_packed_unicode_data,
+)
+
+PROP_VALUES = {
+    "Script": {"1": {"id": 1, "short_name": "Latn", "long_name": "Latin"}},
+    "boolean_properties": ["Alphabetic", "Emoji"],
+    "missing_prop_groups": [],
+}
+PLANES = [
+    {
+        "number": 0,
+        "name": "Basic Multilingual Plane",
+        "abbreviation": "BMP",
+        "start": "0000",
+        "finish": "FFFF",
+        "total_allocated": 65536,
+        "total_defined": 6,
+        "id": 1,
+        "start_dec": 0,
+        "finish_dec": 0xFFFF,
+        "start_block_id": 1,
+        "finish_block_id": 2,
+    }
+]
+BLOCKS = [
+    {
+        "id": 1,
+        "long_name": "Basic Latin",
+        "short_name": "ASCII",
+        "start": "0000",
+        "finish": "007F",
+        "start_dec": 0,
+        "finish_dec": 0x7F,
+        "total_allocated": 128,
+        "total_defined": 3,
+        "plane_id": 1,
+    },
+    {
+        "id": 2,
+        "long_name": "CJK Unified Ideographs",
+        "short_name": "CJK",
+        "start": "4E00",
+        "finish": "9FFF",
+        "start_dec": 0x4E00,
+        "finish_dec": 0x9FFF,
+        "total_allocated": 20992,
+        "total_defined": 3,
+        "plane_id": 1,
+    },
+]
+CHAR_NAMES = {0x0061: "LATIN SMALL LETTER A", 0x0041: "LATIN CAPITAL LETTER A", 0x00E9: "LATIN SMALL LETTER É"}
+UNIHAN_CHARS = {0x4E01: 2, 0x4E00: 2}
+TANGUT_CHARS = {0x17000: 3}
+
+
+@pytest.fixture
+def packed_data():
+    return pack_unicode_data(PROP_VALUES, PLANES, BLOCKS, CHAR_NAMES, UNIHAN_CHARS, TANGUT_CHARS)
+
+
+def test_packed_unicode_data_matches_json_data(tmp_path, packed_data):
+    data_file = tmp_path / "unicode_data.bin"
+    save_packed_unicode_data(packed_data, data_file)
+    unicode_data = load_packed_unicode_data(data_file)
+    assert unicode_data
+    assert unicode_data.property_value_id_map == PROP_VALUES
+    assert [list(plane.items()) for plane in unicode_data.planes] == [list(plane.items()) for plane in PLANES]
+    assert [list(block.items()) for block in unicode_data.blocks] == [list(block.items()) for block in BLOCKS]
+    assert dict(unicode_data.non_unihan_character_name_map) == CHAR_NAMES
+    assert dict(unicode_data.non_unihan_character_name_map.iter_items()) == CHAR_NAMES
+    assert list(unicode_data.non_unihan_character_name_map) == sorted(CHAR_NAMES)
+    assert dict(unicode_data.unihan_character_block_map.iter_items()) == UNIHAN_CHARS
+    assert dict(unicode_data.tangut_character_block_map) == TANGUT_CHARS
+    assert unicode_data.all_defined_codepoints.tolist() == sorted([*CHAR_NAMES, *UNIHAN_CHARS, *TANGUT_CHARS])
+
+
+def test_codepoint_lookups(packed_data):
+    unicode_data = PackedUnicodeData.from_buffer(packed_data)
+    assert unicode_data
+    name_map = unicode_data.non_unihan_character_name_map
+    assert name_map[0x00E9] == "LATIN SMALL LETTER É"
+    assert name_map.get(0x0042, "") == ""
+    assert 0x0041 in name_map and 0x0042 not in name_map
+    with pytest.raises(KeyError):
+        name_map[0x10FFFF]
+    codepoints = unicode_data.unihan_character_block_map.codepoint_set
+    assert 0x4E00 in codepoints and 0x4E02 not in codepoints and "4E00" not in codepoints
+    assert codepoints | CodepointSet([0x17000]) == frozenset([0x4E00, 0x4E01, 0x17000])
+
+
+@pytest.mark.parametrize("corrupt", [lambda d: d[:-4], lambda d: d[:20], lambda d: b"UCDATA00" + d[8:]])
+def test_invalid_packed_unicode_data_is_not_loaded(tmp_path, packed_data, corrupt):
+    assert packed_data.startswith(PACKED_UNICODE_DATA_HEADER)
+    data_file = tmp_path / "unicode_data.bin"
+    save_packed_unicode_data(corrupt(packed_data), data_file)
+    assert load_packed_unicode_data(data_file) is None
+    assert load_packed_unicode_data(tmp_path / "missing.bin") is None
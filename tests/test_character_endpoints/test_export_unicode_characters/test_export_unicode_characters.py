@@ -0,0 +1,60 @@
+import csv
+import io
+
+import orjson
+
+import unicode_api.db.models as db
+from unicode_api.core.character_export import encode_characters, get_csv_field_names
+from unicode_api.enums.export_format import ExportFormat
+
+CHARACTERS = [
+    {"character": "A", "name": "LATIN CAPITAL LETTER A", "codepoint": "U+0041", "html_entities": ["&#65;"]},
+    {"character": "一", "name": "CJK UNIFIED IDEOGRAPH-4E00", "codepoint": "U+4E00", "description": "one"},
+]
+
+
+def test_export_filtered_characters_ndjson(client):
+    response = client.get("/v1/characters/export?block=Ancient_Symbols&show_props=basic")
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    exported = [orjson.loads(line) for line in response.text.splitlines()]
+    filtered = client.get("/v1/characters/filter?block=Ancient_Symbols&show_props=basic&per_page=100").json()
+    assert exported == filtered["results"]
+
+
+def test_export_filtered_characters_csv(client):
+    response = client.get("/v1/characters/export?block=Ancient_Symbols&format=csv")
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/csv")
+    rows = list(csv.DictReader(io.StringIO(response.text)))
+    filtered = client.get("/v1/characters/filter?block=Ancient_Symbols&per_page=100").json()
+    assert [row["codepoint"] for row in rows] == [char["codepoint"] for char in filtered["results"]]
+
+
+def test_export_invalid_filter_settings(client):
+    response = client.get("/v1/characters/export?category=foo")
+    assert response.status_code == 400
+
+
+def test_encode_characters_ndjson():
+    chunks = list(encode_characters([CHARACTERS[:1], CHARACTERS[1:]], ExportFormat.NDJSON, []))
+    assert len(chunks) == 2
+    assert [orjson.loads(line) for chunk in chunks for line in chunk.splitlines()] == [
+        {"character": "A", "name": "LATIN CAPITAL LETTER A", "codepoint": "U+0041", "htmlEntities": ["&#65;"]},
+        {"character": "一", "name": "CJK UNIFIED IDEOGRAPH-4E00", "codepoint": "U+4E00", "description": "one"},
+    ]
+
+
+def test_encode_characters_csv():
+    show_props = [db.CharPropertyGroup.BASIC]
+    field_names = get_csv_field_names(show_props)
+    assert field_names[:3] == ["character", "name", "description"]
+    assert field_names[-3:] == ["rsCountUnicode", "rsCountKangxi", "totalStrokes"]
+
+    chunks = list(encode_characters([CHARACTERS], ExportFormat.CSV, show_props))
+    assert chunks[0].decode().strip() == ",".join(field_names)
+    rows = list(csv.DictReader(io.StringIO(b"".join(chunks).decode())))
+    assert [row["codepoint"] for row in rows] == ["U+0041", "U+4E00"]
+    assert rows[0]["htmlEntities"] == '["&#65;"]'
+    assert rows[1]["htmlEntities"] == ""
+    assert rows[1]["description"] == "one"
@@ -164,6 +164,7 @@ FILTER_BY_LINE_BREAK_TYPE = {
     "hasMore": True,
     "currentPage": 1,
     "nextPage": 2,
+    "nextCursor": "YWZ0ZXI6ODI2MA",
     "results": [
         {
             "character": ",",
@@ -439,6 +440,7 @@ FILTER_BY_BLOCK_NAME = {
     "hasMore": True,
     "currentPage": 1,
     "nextPage": 2,
+    "nextCursor": "YWZ0ZXI6NjU5NDU",
     "results": [
         {
             "character": "𐆐",
@@ -520,6 +522,7 @@ FILTER_BY_COMBINED_CATEGORY = {
     "hasMore": True,
     "currentPage": 1,
     "nextPage": 2,
+    "nextCursor": "YWZ0ZXI6NDQ",
     "results": [
         {
             "character": "!",
@@ -607,6 +610,7 @@ FILTER_BY_SEPARATE_CATEGORIES = {
     "hasMore": True,
     "currentPage": 1,
     "nextPage": 2,
+    "nextCursor": "YWZ0ZXI6NDQ",
     "results": [
         {
             "character": "!",
@@ -683,6 +687,7 @@ FILTER_BY_CJK_DEFINITION = {
     "hasMore": True,
     "currentPage": 1,
     "nextPage": 2,
+    "nextCursor": "YWZ0ZXI6MzQ0MTI",
     "results": [
         {
             "character": "㡣",
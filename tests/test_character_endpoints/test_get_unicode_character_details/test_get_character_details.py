@@ -76,3 +76,15 @@ def test_invalid_prop_group_name(client):
     response = client.get("/v1/characters/-/%F0%9B%B1%A0?show_props=foo&show_props=bar&show_props=baz")
     assert response.status_code == 400
     assert response.json() == INVALID_PROP_GROUP_NAMES
+
+
+def test_get_character_details_repeated_characters(client):
+    response = client.get("/v1/characters/-/abcabca")
+    assert response.status_code == 200
+    expected = {char["codepoint"]: char for char in client.get("/v1/characters/-/abc").json()}
+    assert response.json() == [expected[f"U+{ord(char):04X}"] for char in "abcabca"]
+
+
+def test_string_exceeds_max_length(client):
+    response = client.get(f"/v1/characters/-/{'a' * (cached_data.settings.MAX_CHAR_STRING_LENGTH + 1)}")
+    assert response.status_code == 400
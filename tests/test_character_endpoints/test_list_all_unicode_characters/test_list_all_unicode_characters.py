@@ -63,3 +63,15 @@ def test_invalid_block_name_no_fuzzy_matches(client):
     response = client.get("/v1/characters?block=blah")
     assert response.status_code == 400
     assert response.json() == INVALID_BLOCK_NAME_NO_FUZZY_MATCHES
+
+
+def test_defined_only_skips_reserved_codepoints(client):
+    all_chars = client.get("/v1/characters?limit=100&starting_after=16FF").json()["data"]
+    defined_chars = [char for char in all_chars if not char["name"].startswith("<reserved-")]
+    response = client.get("/v1/characters?limit=25&starting_after=172E&defined_only=true")
+    assert response.status_code == 200
+    assert response.json()["data"] == [char for char in defined_chars if char["codepoint"] > "U+172E"][:25]
+    response = client.get("/v1/characters?limit=5&ending_before=1740&defined_only=true")
+    assert response.status_code == 200
+    assert response.json()["data"] == [char for char in defined_chars if char["codepoint"] < "U+1740"][-5:]
+    assert response.json()["hasMore"]
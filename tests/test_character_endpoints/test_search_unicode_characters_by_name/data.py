@@ -15,6 +15,7 @@ SEARCH_TERM_HOUSE_PAGE_1_OF_2 = {
     "hasMore": True,
     "currentPage": 1,
     "nextPage": 2,
+    "nextCursor": "YWZ0ZXI6MTI4NDIy",
     "results": [
         {
             "character": "⌂",
@@ -123,4 +124,34 @@ SEARCH_TERM_HOUSE_PAGE_2_OF_2 = {
 SEARCH_TERM_HOUSE_PAGE_3_OF_2 = {
     "detail": "Request for page #3 is invalid since there are 2 total pages."
 }
+
+SEARCH_TERM_HOUSE_NEXT_CURSOR = {
+    "url": "/v1/characters/search",
+    "query": "house",
+    "totalResults": 13,
+    "hasMore": False,
+    "results": [
+        {
+            "character": "🖯",
+            "name": "ONE BUTTON MOUSE",
+            "codepoint": "U+1F5AF",
+            "uriEncoded": "%F0%9F%96%AF",
+            "score": 80.0
+        },
+        {
+            "character": "🖰",
+            "name": "TWO BUTTON MOUSE",
+            "codepoint": "U+1F5B0",
+            "uriEncoded": "%F0%9F%96%B0",
+            "score": 80.0
+        },
+        {
+            "character": "🖱",
+            "name": "THREE BUTTON MOUSE",
+            "codepoint": "U+1F5B1",
+            "uriEncoded": "%F0%9F%96%B1",
+            "score": 80.0
+        }
+    ]
+}
 # fmt: on
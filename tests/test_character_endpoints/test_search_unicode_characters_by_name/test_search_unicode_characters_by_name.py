@@ -1,5 +1,6 @@
 from tests.test_character_endpoints.test_search_unicode_characters_by_name.data import (
     SEARCH_TERM_HOME,
+    SEARCH_TERM_HOUSE_NEXT_CURSOR,
     SEARCH_TERM_HOUSE_PAGE_1_OF_2,
     SEARCH_TERM_HOUSE_PAGE_2_OF_2,
     SEARCH_TERM_HOUSE_PAGE_3_OF_2,
@@ -28,3 +29,15 @@ def test_search_term_house_page_3_of_3(client):
     response = client.get("/v1/characters/search?name=house&page=3")
     assert response.status_code == 400
     assert response.json() == SEARCH_TERM_HOUSE_PAGE_3_OF_2
+
+
+def test_search_term_house_next_cursor(client):
+    next_cursor = SEARCH_TERM_HOUSE_PAGE_1_OF_2["nextCursor"]
+    response = client.get(f"/v1/characters/search?name=house&cursor={next_cursor}")
+    assert response.status_code == 200
+    assert response.json() == SEARCH_TERM_HOUSE_NEXT_CURSOR
+
+
+def test_search_term_house_page_and_cursor(client):
+    response = client.get("/v1/characters/search?name=house&page=2&cursor=YWZ0ZXI6MTI4NDIy")
+    assert response.status_code == 400
@@ -0,0 +1,43 @@
+import pytest
+from fastapi import HTTPException
+
+from unicode_api.api.api_v1.dependencies.codepoint_batch_params import (
+    get_unique_codepoints,
+    parse_codepoint_ranges,
+)
+
+
+def test_get_characters_at_codepoints_matches_single_lookups(client):
+    codepoints = ["24AF", "U+0041..U+0043", "0x4E00", "0042", "1F600"]
+    response = client.post("v1/codepoints/batch", json={"codepoints": codepoints, "show_props": ["basic"]})
+    assert response.status_code == 200
+    expected = [
+        client.get(f"v1/codepoints/{codepoint}?show_props=basic").json()
+        for codepoint in ["24AF", "0041", "0042", "0043", "4E00", "1F600"]
+    ]
+    assert response.json() == expected
+
+
+def test_get_characters_at_codepoints_invalid_range(client):
+    response = client.post("v1/codepoints/batch", json={"codepoints": ["0043..0041"]})
+    assert response.status_code == 400
+
+
+def test_get_characters_at_codepoints_too_many_codepoints(client):
+    response = client.post("v1/codepoints/batch", json={"codepoints": ["0000..FFFF"]})
+    assert response.status_code == 400
+
+
+def test_get_characters_at_codepoints_too_costly(client):
+    response = client.post("v1/codepoints/batch", json={"codepoints": ["0000..1FFF"], "show_props": ["all"]})
+    assert response.status_code == 400
+
+
+def test_parse_codepoint_ranges():
+    codepoint_ranges = parse_codepoint_ranges(["0041", "U+0040..U+0043", " 0x42 ", "10FFFF"])
+    assert codepoint_ranges == [range(0x41, 0x42), range(0x40, 0x44), range(0x42, 0x43), range(0x10FFFF, 0x110000)]
+    assert get_unique_codepoints(codepoint_ranges) == [0x41, 0x40, 0x42, 0x43, 0x10FFFF]
+    for values in [["0041..0040"], ["0041.."], ["U+41"], ["0000..10FFFF"]]:
+        with pytest.raises(HTTPException) as exc_info:
+            parse_codepoint_ranges(values)
+        assert exc_info.value.status_code == 400
@@ -0,0 +1,26 @@
+from sqlmodel import Session
+
+import unicode_api.db.models as db
+from unicode_api.db.engine import ro_db_engine as engine
+from unicode_api.db.session import DBSession
+
+# Non-unihan, unihan, tangut, surrogate and unassigned codepoints
+MIXED_CODEPOINTS = [0x41, 0x4E00, 0x17000, 0xD800, 0x0378, 0x1F600, 0x41]
+
+
+def test_get_character_properties_many():
+    with Session(engine) as session:
+        db_session = DBSession(session, engine)
+        show_props = [db.CharPropertyGroup.ALL]
+        batch = db_session.get_character_properties_many(MIXED_CODEPOINTS, show_props, False)
+        single = [db_session.get_character_properties(cp, show_props, False) for cp in MIXED_CODEPOINTS]
+    assert batch == single
+    assert [char["codepoint"] for char in batch] == [
+        "U+0041",
+        "U+4E00",
+        "U+17000",
+        "U+D800",
+        "U+0378",
+        "U+1F600",
+        "U+0041",
+    ]
@@ -0,0 +1,16 @@
+from typing import Any
+
+import pytest
+
+import unicode_api.db.models as db
+from unicode_api.api.api_v1.dependencies.filter_settings import FilterParameters
+
+
+@pytest.fixture
+def create_filter_params():
+    def create(**settings: Any) -> FilterParameters:
+        filter_params = FilterParameters(db.UserFilterSettings(**settings))
+        assert filter_params.did_parse
+        return filter_params
+
+    return create
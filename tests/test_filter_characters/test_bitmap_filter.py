@@ -0,0 +1,59 @@
+import random
+
+import unicode_api.db.models as db
+from unicode_api.api.api_v1.dependencies.filter_settings import FilterParameters
+from unicode_api.core.codepoint_bitmap import CodepointBitmap
+from unicode_api.db.bitmap_filter import BitmapFilterIndex
+
+
+def test_codepoint_bitmap_set_operations():
+    rng = random.Random(13)
+    sparse = {rng.randrange(0x110000) for _ in range(3000)}
+    dense = set(range(0x4E00, 0x9FFF)) | {rng.randrange(0x20000, 0x30000) for _ in range(6000)}
+    (a, b) = (CodepointBitmap.from_codepoints(sparse), CodepointBitmap.from_codepoints(dense))
+
+    assert list(a) == sorted(sparse)
+    assert len(b) == len(dense)
+    assert list(a | b) == sorted(sparse | dense)
+    assert list(a & b) == sorted(sparse & dense)
+    assert CodepointBitmap.intersection([b, a, b]) == a & b
+    assert b[100:110] == sorted(dense)[100:110]
+    assert b[-1] == max(dense)
+    assert 0x4E00 in b and 0x4DFF not in b
+    assert CodepointBitmap.from_bytes(b.to_bytes()) == b
+
+
+def test_bitmap_filter_with_synthetic_rows(tmp_path):
+    rows = [
+        (0x0661, 1, 10, None, 2, "2 7", True),
+        (0x0041, 1, 11, 1, 1, None, False),
+        (0x3001, 2, 12, None, 3, "4 5 6", None),
+        (0x0041, 1, 11, 1, 1, None, False),
+    ]
+    index = BitmapFilterIndex.build(
+        ["block_id", "general_category_id", "decomposition_type_id", "script_id", "script_extension_ids", "dash"],
+        ["dash"],
+        rows,
+    )
+    assert list(index.posting_lists[("block_id", 1)]) == [0x0041, 0x0661]
+    assert list(index.posting_lists[("dash", 1)]) == [0x0661]
+    assert ("decomposition_type_id", None) not in index.posting_lists
+
+    index_file = tmp_path.joinpath("filter_bitmaps.bin")
+    index.save(index_file, "15.0.0 3 0 5")
+    assert BitmapFilterIndex.read(index_file, "15.1.0 3 0 5") is None
+    assert BitmapFilterIndex.read(index_file, "15.0.0 4 0 5") is None
+    index = BitmapFilterIndex.read(index_file, "15.0.0 3 0 5")
+    assert index
+
+    params = FilterParameters(db.UserFilterSettings())
+    params.blocks = [1]
+    assert list(index.filter(params)) == [0x0041, 0x0661]
+    params.scripts = (["latn", "hani"], [1, 6])
+    assert list(index.filter(params)) == [0x0041]
+    params.blocks = None
+    assert list(index.filter(params)) == [0x0041, 0x3001]
+    assert len(index.filter(params)) == 2
+
+    index_file.write_bytes(b"not an index")
+    assert BitmapFilterIndex.read(index_file, "15.0.0 3 0 5") is None
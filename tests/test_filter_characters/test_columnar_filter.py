@@ -0,0 +1,28 @@
+import unicode_api.db.models as db
+from unicode_api.api.api_v1.dependencies.filter_settings import FilterParameters
+from unicode_api.db.columnar_filter import ColumnarCharacterStore
+
+
+def test_columnar_filter_with_synthetic_rows():
+    rows = [
+        (0x0661, 1, 10, None, 2, "2 7", True),
+        (0x0041, 1, 11, 1, 1, None, False),
+        (0x3001, 2, 12, None, 3, "4 5 6", None),
+        (0x0041, 1, 11, 1, 1, None, False),
+    ]
+    store = ColumnarCharacterStore(
+        ["block_id", "general_category_id", "decomposition_type_id", "script_id", "script_extension_ids", "dash"],
+        ["dash"],
+        rows,
+    )
+    assert store.codepoints.tolist() == [0x0041, 0x0661, 0x3001]
+    assert store.property_ids["decomposition_type_id"].tolist() == [1, -1, -1]
+    assert store.flags["dash"].tolist() == [False, True, False]
+
+    params = FilterParameters(db.UserFilterSettings())
+    params.blocks = [1]
+    assert store.filter(params).tolist() == [0x0041, 0x0661]
+    params.scripts = (["latn", "hani"], [1, 6])
+    assert store.filter(params).tolist() == [0x0041]
+    params.blocks = None
+    assert store.filter(params).tolist() == [0x0041, 0x3001]
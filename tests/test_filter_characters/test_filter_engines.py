@@ -0,0 +1,42 @@
+import pytest
+
+from unicode_api.db.bitmap_filter import BitmapFilterIndex, get_bitmap_filter_index
+from unicode_api.db.columnar_filter import ColumnarCharacterStore, get_columnar_store
+from unicode_api.db.engine import ro_db_engine
+from unicode_api.db.procs.filter_characters import FilterQueryPlan
+from unicode_api.enums.filter_engine import FilterEngine
+
+# Maps each engine to (a function that checks if the engine supports the filter settings, a function that returns
+# the codepoints of every character matching the filter settings)
+FILTER_ENGINES = {
+    FilterEngine.BITMAP: (BitmapFilterIndex.supports, lambda params: list(get_bitmap_filter_index().filter(params))),
+    FilterEngine.COLUMNAR: (
+        ColumnarCharacterStore.supports,
+        lambda params: get_columnar_store().filter(params).tolist(),
+    ),
+}
+
+
+@pytest.mark.parametrize(
+    "settings",
+    [
+        {"category": ["sk"], "age": ["13.0", "14.0", "15.0"]},
+        {"line_break": ["is"]},
+        {"ccc": ["214"]},
+        {"script": ["khar"], "num_type": ["di"]},
+        {"join_type": ["l"]},
+        {"flag": ["Is Hyphen"]},
+        {"block": ["Ancient_Symbols"]},
+        {"block": ["Basic_Latin"], "category": ["p"]},
+        {"script": ["copt"], "category": ["mn"]},
+        {"script": ["zyyy", "latn"], "bidi_class": ["et"]},
+        {"decomp_type": ["enc"], "flag": ["Is Emoji", "Is Dash"]},
+    ],
+)
+@pytest.mark.parametrize("filter_engine", FILTER_ENGINES)
+def test_filter_engine_matches_sql_filter(client, create_filter_params, filter_engine, settings):
+    (supports, filter_characters) = FILTER_ENGINES[filter_engine]
+    filter_params = create_filter_params(**settings)
+    assert supports(filter_params)
+    expected = list(FilterQueryPlan(ro_db_engine, filter_params))
+    assert filter_characters(filter_params) == expected
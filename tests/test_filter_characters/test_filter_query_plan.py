@@ -0,0 +1,98 @@
+from array import array
+
+import pytest
+from sqlalchemy.pool import StaticPool
+from sqlmodel import Session, create_engine, text
+
+import unicode_api.db.models as db
+from unicode_api.api.api_v1.dependencies.filter_settings import FilterParameters
+from unicode_api.api.api_v1.pagination import decode_cursor, encode_cursor, paginate_codepoints_after_cursor
+from unicode_api.core.result_cache import character_filter_cache
+from unicode_api.db import session as db_session
+from unicode_api.db.procs.filter_characters import FilterQueryPlan, _get_block_ranges
+from unicode_api.db.session import DBSession
+
+# Each block is (id, start_dec, finish_dec)
+BLOCKS = [(1, 0x0000, 0x007F), (2, 0x0080, 0x00FF), (3, 0x0100, 0x017F), (4, 0x4E00, 0x9FFF)]
+CHARACTERS = [(cp, 1 if cp < 0x80 else 2 if cp < 0x100 else 3) for cp in range(0x20, 0x180, 3)]
+UNIHAN_CHARACTERS = [(cp, 4) for cp in range(0x4E00, 0x4E40)]
+
+
+@pytest.fixture
+def engine():
+    # All connections must share the same in-memory database
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    with engine.begin() as conn:
+        conn.execute(text("CREATE TABLE block (id INTEGER PRIMARY KEY, start_dec INTEGER, finish_dec INTEGER)"))
+        for table in ["character", "character_unihan"]:
+            conn.execute(text(f"CREATE TABLE {table} (codepoint_dec INTEGER PRIMARY KEY, block_id INTEGER)"))
+        for block in BLOCKS:
+            conn.execute(
+                text("INSERT INTO block VALUES (:id, :start, :finish)"), dict(zip(["id", "start", "finish"], block))
+            )
+        for table, rows in [("character", CHARACTERS), ("character_unihan", UNIHAN_CHARACTERS)]:
+            for codepoint, block_id in rows:
+                conn.execute(
+                    text(f"INSERT INTO {table} VALUES (:cp, :block_id)"), {"cp": codepoint, "block_id": block_id}
+                )
+    return engine
+
+
+def block_filter_params(block_ids: list[int] | None) -> FilterParameters:
+    filter_params = FilterParameters(db.UserFilterSettings())
+    filter_params.blocks = block_ids
+    return filter_params
+
+
+@pytest.mark.parametrize("block_ids", [[1], [2, 3], [3, 4], [1, 4], [5]])
+def test_filter_query_plan_pages_match_block_id_filter(engine, block_ids):
+    expected = sorted(cp for (cp, block_id) in CHARACTERS + UNIHAN_CHARACTERS if block_id in block_ids)
+    plan = FilterQueryPlan(engine, block_filter_params(block_ids))
+    assert len(plan) == len(expected)
+    assert list(plan) == expected
+    assert plan[5:15] == expected[5:15]
+    assert plan[len(expected) - 3 : len(expected) + 10] == expected[-3:]
+    if expected:
+        assert plan[-1] == expected[-1]
+
+
+def test_adjacent_block_ranges_are_merged(engine):
+    with Session(engine) as session:
+        assert _get_block_ranges(session, [3, 1, 2]) == [(0x0000, 0x017F)]
+        assert _get_block_ranges(session, [1, 3, 4]) == [(0x0000, 0x007F), (0x0100, 0x017F), (0x4E00, 0x9FFF)]
+
+
+@pytest.mark.parametrize("block_ids", [[1], [2, 3], [1, 4]])
+def test_cursor_pages_match_block_id_filter(engine, block_ids):
+    expected = sorted(cp for (cp, block_id) in CHARACTERS + UNIHAN_CHARACTERS if block_id in block_ids)
+    for codepoints in [FilterQueryPlan(engine, block_filter_params(block_ids)), expected]:
+        (pages, cursor) = ([], encode_cursor(0))
+        while cursor:
+            result = paginate_codepoints_after_cursor(codepoints, cursor, per_page=7)
+            assert result.success and result.value
+            (paginated, page) = result.value
+            assert paginated["total_results"] == len(expected)
+            pages.extend(page)
+            cursor = paginated.get("next_cursor")
+        assert pages == expected
+
+
+def test_small_sql_filter_results_are_cached_as_array(engine, monkeypatch):
+    monkeypatch.setattr(db_session, "MAX_MATERIALIZED_FILTER_RESULTS", 100)
+    character_filter_cache.clear()
+    with Session(engine) as session:
+        db_ctx = DBSession(session, engine)
+        small_result = db_ctx.filter_all_characters(block_filter_params([1, 2]))
+        large_result = db_ctx.filter_all_characters(block_filter_params([1, 2, 3]))
+    assert isinstance(small_result, array)
+    assert list(small_result) == [cp for (cp, block_id) in CHARACTERS if block_id in [1, 2]]
+    assert isinstance(large_result, FilterQueryPlan)
+    assert len(large_result) == len(CHARACTERS) == 118
+    character_filter_cache.clear()
+
+
+def test_decode_cursor():
+    assert decode_cursor(encode_cursor(0x1F3E0)).value == 0x1F3E0
+    for cursor in ["", "1234", "YWZ0ZXI6", encode_cursor(12)[:-2], "!!!!"]:
+        result = decode_cursor(cursor)
+        assert result.failure and result.error == f"The value provided for 'cursor' ({cursor}) is invalid."
@@ -0,0 +1,78 @@
+import pytest
+from sqlmodel import Session, create_engine, select, text
+
+import unicode_api.db.models as db
+from unicode_api.db.full_text_search import FULL_TEXT_INDEXES, get_full_text_index_statements, get_phrase_query
+from unicode_api.db.procs.filter_characters import _construct_word_filter, _get_existing_full_text_indexes
+
+CHARACTERS = [
+    (65, "LATIN CAPITAL LETTER A"),
+    (97, "LATIN SMALL LETTER A"),
+    (198, "LATIN CAPITAL LETTER AE"),
+    (1040, "CYRILLIC CAPITAL LETTER A"),
+    (8364, "EURO SIGN"),
+    (9731, "SNOWMAN"),
+    (11816, "LEFT DOUBLE PARENTHESIS"),
+]
+UNIHAN_CHARACTERS = [
+    (19968, "CJK UNIFIED IDEOGRAPH-4E00", "one; a, an; alone"),
+    (19969, "CJK UNIFIED IDEOGRAPH-4E01", "male adult; robust, vigorous; 4th heavenly stem"),
+    (19971, "CJK UNIFIED IDEOGRAPH-4E03", "seven"),
+    (20154, "CJK UNIFIED IDEOGRAPH-4EBA", "man; people; mankind; someone else"),
+    (20843, "CJK UNIFIED IDEOGRAPH-516B", "eight; all around, all sides"),
+]
+
+
+@pytest.fixture
+def session():
+    engine = create_engine("sqlite://")
+    with Session(engine) as session:
+        session.execute(text("CREATE TABLE character (codepoint_dec INTEGER PRIMARY KEY, name VARCHAR)"))
+        session.execute(
+            text("CREATE TABLE character_unihan (codepoint_dec INTEGER PRIMARY KEY, name VARCHAR, description VARCHAR)")
+        )
+        for codepoint, name in CHARACTERS:
+            session.execute(text("INSERT INTO character VALUES (:cp, :name)"), {"cp": codepoint, "name": name})
+        for codepoint, name, definition in UNIHAN_CHARACTERS:
+            session.execute(
+                text("INSERT INTO character_unihan VALUES (:cp, :name, :definition)"),
+                {"cp": codepoint, "name": name, "definition": definition},
+            )
+        yield session
+
+
+def filter_characters(session: Session, table, column_name: str, value: str, fts_indexes: set[str]) -> list[int]:
+    query = select(table.codepoint_dec).where(_construct_word_filter(table, column_name, value, fts_indexes))
+    return sorted(session.scalars(query).all())
+
+
+@pytest.mark.parametrize(
+    "table, column_name, value",
+    [
+        (db.UnicodeCharacter, "name", "LETTER A"),
+        (db.UnicodeCharacter, "name", "A"),
+        (db.UnicodeCharacter, "name", "CAPITAL"),
+        (db.UnicodeCharacter, "name", "SNOW"),
+        (db.UnicodeCharacter, "name", "LETTER A.*"),
+        (db.UnicodeCharacterUnihan, "name", "4E00"),
+        (db.UnicodeCharacterUnihan, "name", "IDEOGRAPH-4E03"),
+        (db.UnicodeCharacterUnihan, "description", "man"),
+        (db.UnicodeCharacterUnihan, "description", "all sides"),
+        (db.UnicodeCharacterUnihan, "description", "a, an"),
+        (db.UnicodeCharacterUnihan, "description", "se(ven|ptember)"),
+    ],
+)
+def test_full_text_index_matches_regexp(session, table, column_name, value):
+    expected = filter_characters(session, table, column_name, value, set())
+    for sql in get_full_text_index_statements():
+        session.execute(text(sql))
+    fts_indexes = _get_existing_full_text_indexes(session)
+    assert fts_indexes == set(FULL_TEXT_INDEXES.values())
+    assert filter_characters(session, table, column_name, value, fts_indexes) == expected
+
+
+def test_get_phrase_query():
+    assert get_phrase_query("LATIN SMALL") == '"LATIN SMALL"'
+    assert get_phrase_query('say "hi"') == '"say ""hi"""'
+    assert get_phrase_query("LETTER [AB]") is None
+    assert get_phrase_query(" - ") is None
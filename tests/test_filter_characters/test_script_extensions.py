@@ -0,0 +1,46 @@
+import pytest
+from sqlmodel import Session, create_engine, select, text
+
+import unicode_api.db.models as db
+from unicode_api.db.procs.filter_characters import _construct_script_filter, script_extension_ids_match
+
+# (codepoint, script_id, script extension IDs)
+CHARACTERS = [
+    (0x0041, 1, [1]),
+    (0x0661, 2, [2, 7]),
+    (0x3001, 3, [4, 5, 6]),
+    (0x0640, 3, [2, 4, 7]),
+    (0xFFFF, 8, []),
+]
+
+
+@pytest.fixture
+def session():
+    engine = create_engine("sqlite://")
+    db.CharacterScriptExtension.__table__.create(engine)  # type: ignore[reportAttributeAccessIssue]
+    with Session(engine) as session:
+        session.execute(text("CREATE TABLE character (codepoint_dec INTEGER PRIMARY KEY, script_id INTEGER)"))
+        for codepoint, script_id, script_extension_ids in CHARACTERS:
+            session.execute(text("INSERT INTO character VALUES (:cp, :sc)"), {"cp": codepoint, "sc": script_id})
+            session.add_all(
+                db.CharacterScriptExtension(codepoint_dec=codepoint, script_id=sid) for sid in script_extension_ids
+            )
+        session.commit()
+        yield session
+
+
+@pytest.mark.parametrize("script_ids", [[1], [2], [3], [4, 7], [8], [9]])
+def test_script_filter_uses_script_extension_table(session, script_ids):
+    query = select(db.UnicodeCharacter.codepoint_dec).where(_construct_script_filter(db.UnicodeCharacter, script_ids))
+    expected = [
+        codepoint
+        for (codepoint, script_id, script_extension_ids) in CHARACTERS
+        if script_id in script_ids or set(script_extension_ids).intersection(script_ids)
+    ]
+    assert sorted(session.scalars(query).all()) == sorted(expected)
+
+
+def test_script_extension_ids_match():
+    assert script_extension_ids_match("2 7", [7])
+    assert not script_extension_ids_match("2 7", [27])
+    assert not script_extension_ids_match("", [1])
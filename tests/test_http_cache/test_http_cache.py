@@ -0,0 +1,30 @@
+from unicode_api.core.http_cache import CACHE_CONTROL_HEADER, etag_matches, get_etag
+
+
+def test_etag_is_independent_of_query_param_order(client):
+    etag = get_etag("/v1/codepoints/0041", [("show_props", "Minimum"), ("verbose", "true")])
+    assert etag and etag.startswith('"') and etag.endswith('"')
+    assert etag == get_etag("/v1/codepoints/0041", [("verbose", "true"), ("show_props", "Minimum")])
+    assert etag != get_etag("/v1/codepoints/0042", [("verbose", "true"), ("show_props", "Minimum")])
+    assert get_etag("/static/favicon.png", []) is None
+
+
+def test_etag_matches():
+    etag = '"abc123"'
+    assert etag_matches('"abc123"', etag)
+    assert etag_matches('W/"abc123"', etag)
+    assert etag_matches('"xyz", "abc123"', etag)
+    assert etag_matches("*", etag)
+    assert not etag_matches('"xyz"', etag)
+    assert not etag_matches(None, etag)
+
+
+def test_conditional_request_returns_304(client):
+    response = client.get("/v1/planes/0")
+    assert response.status_code == 200
+    assert response.headers["cache-control"] == CACHE_CONTROL_HEADER
+    etag = response.headers["etag"]
+    response = client.get("/v1/planes/0", headers={"If-None-Match": etag})
+    assert response.status_code == 304
+    assert response.headers["etag"] == etag
+    assert not response.content
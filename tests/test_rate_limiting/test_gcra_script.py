@@ -0,0 +1,32 @@
+import asyncio
+
+import pytest
+
+from unicode_api.core.rate_limit import RateLimit
+from unicode_api.core.redis_client import TestRedisClient
+from unicode_api.enums.request_type import RequestType
+
+
+def test_gcra_script():
+    async def apply_rate_limiting(ip: str, count: int):
+        return [await rate_limit._apply_rate_limiting(ip) for _ in range(count)]
+
+    redis = TestRedisClient()
+    rate_limit = RateLimit(redis)
+    (first, second, third) = asyncio.run(apply_rate_limiting("10.0.0.1", 3))
+
+    assert first.request_type == RequestType.RATE_LIMITED_ALLOWED
+    assert first.new_tat == pytest.approx(first.arrived_at + rate_limit.emission_interval_ms.total_seconds())
+    assert second.request_type == RequestType.RATE_LIMITED_ALLOWED
+    assert second.new_tat == pytest.approx(first.new_tat + rate_limit.emission_interval_ms.total_seconds())
+    assert third.request_type == RequestType.RATE_LIMITED_DENIED
+    assert third.new_tat == 0
+    assert third.allowed_at == pytest.approx(second.new_tat - rate_limit.delay_tolerance_ms.total_seconds())
+    assert "API rate limit of 2 requests in 1.0 second exceeded for IP 10.0.0.1" in third.error
+
+    async def get_tat_and_ttl(ip: str):
+        return (float(await redis.async_client.get(ip)), await redis.async_client.pttl(ip))
+
+    (tat, ttl) = asyncio.run(get_tat_and_ttl("10.0.0.1"))
+    assert tat == pytest.approx(second.new_tat)
+    assert 0 < ttl <= 1000
@@ -0,0 +1,23 @@
+import asyncio
+
+import pytest
+from fakeredis import FakeAsyncRedis
+
+from unicode_api.core import redis_client
+from unicode_api.core.redis_client import RedisClient
+
+
+def test_async_client_falls_back_to_fake_redis_without_blocking(monkeypatch: pytest.MonkeyPatch):
+    def sleep(_: float):
+        raise AssertionError("The event loop must not be blocked while connecting to the Redis server")
+
+    async def get_async_clients(redis: RedisClient):
+        return await asyncio.gather(*(redis.get_async_client() for _ in range(3)))
+
+    monkeypatch.setattr(redis_client.time, "sleep", sleep)
+    # The test settings point to a Redis server that is not running
+    redis = RedisClient()
+    async_clients = asyncio.run(get_async_clients(redis))
+    assert isinstance(async_clients[0], FakeAsyncRedis)
+    assert all(async_client is async_clients[0] for async_client in async_clients)
+    assert (redis.connected, redis.failed_attempts) == (False, 0)
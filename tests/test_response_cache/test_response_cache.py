@@ -0,0 +1,86 @@
+import asyncio
+from datetime import timedelta
+from typing import Any
+
+from fakeredis import FakeAsyncRedis
+from redis.asyncio import Redis as AsyncRedis
+from redis.exceptions import ConnectionError
+
+from unicode_api.core.redis_client import TestRedisClient
+from unicode_api.core.response_cache import ResponseCache
+
+
+class UnavailableAsyncRedis(FakeAsyncRedis):
+    def __init__(self) -> None:
+        super().__init__()
+        self.commands = 0
+
+    async def get(self, *args: Any, **kwargs: Any) -> Any:
+        self.commands += 1
+        raise ConnectionError
+
+    async def setex(self, *args: Any, **kwargs: Any) -> Any:
+        self.commands += 1
+        raise ConnectionError
+
+
+class UnavailableRedisClient(TestRedisClient):
+    def __init__(self) -> None:
+        super().__init__()
+        self.unavailable = UnavailableAsyncRedis()
+
+    @property
+    def cache_client(self) -> AsyncRedis:
+        return self.unavailable
+
+
+def create_response_cache(
+    redis_client: TestRedisClient, enabled: bool = True, retry_delay: timedelta = timedelta(seconds=30)
+) -> ResponseCache:
+    return ResponseCache(redis_client, enabled, timedelta(minutes=1), 10, "15.0.0", retry_delay)
+
+
+def test_response_cache_key(client):
+    cache = create_response_cache(TestRedisClient())
+    key = cache.get_cache_key("/v1/codepoints/0041", [("show_props", "Minimum"), ("verbose", "true")])
+    assert key and key.startswith("response:15.0.0:get_unicode_character_at_codepoint:")
+    assert key == cache.get_cache_key("/v1/codepoints/0041", [("verbose", "true"), ("show_props", "Minimum")])
+    assert key != cache.get_cache_key("/v1/codepoints/0042", [("verbose", "true"), ("show_props", "Minimum")])
+    assert cache.get_cache_key("/v1/blocks/basic_latin", []) is not None
+    assert cache.get_cache_key("/v1/planes/0", []) is not None
+    assert cache.get_cache_key("/v1/characters/search", [("name", "house")]) is None
+
+
+def test_response_cache_disabled(client):
+    cache = create_response_cache(TestRedisClient(), enabled=False)
+    assert cache.get_cache_key("/v1/codepoints/0041", []) is None
+
+
+def test_response_cache_shared_tier():
+    async def share_response():
+        await cache.set("response:test", b'{"name": "LATIN CAPITAL LETTER A"}')
+        return (await other_worker.get("response:test"), await other_worker.get("response:missing"))
+
+    redis_client = TestRedisClient()
+    cache = create_response_cache(redis_client)
+    other_worker = create_response_cache(redis_client)
+    (shared, missing) = asyncio.run(share_response())
+    assert shared == b'{"name": "LATIN CAPITAL LETTER A"}'
+    assert other_worker.local.get("response:test") == b'{"name": "LATIN CAPITAL LETTER A"}'
+    assert missing is None
+
+
+def test_response_cache_skips_redis_after_failure():
+    async def get_and_set_responses(cache: ResponseCache):
+        await cache.set("response:test", b"{}")
+        return (await cache.get("response:test"), await cache.get("response:missing"))
+
+    redis_client = UnavailableRedisClient()
+    cache = create_response_cache(redis_client)
+    assert asyncio.run(get_and_set_responses(cache)) == (b"{}", None)
+    assert not cache.redis_available
+    assert redis_client.unavailable.commands == 1
+
+    cache = create_response_cache(redis_client, retry_delay=timedelta(0))
+    assert asyncio.run(get_and_set_responses(cache)) == (b"{}", None)
+    assert redis_client.unavailable.commands == 3
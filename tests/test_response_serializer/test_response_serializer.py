@@ -0,0 +1,99 @@
+import json
+from typing import Any
+
+import orjson
+from pydantic import BaseModel
+
+import unicode_api.db.models as db
+from unicode_api.models.response_serializer import ResponseSerializer
+
+CHARACTER_DETAILS = {
+    "character": "½",
+    "name": "VULGAR FRACTION ONE HALF",
+    "codepoint": "U+00BD",
+    "uri_encoded": "%C2%BD",
+    "block": "Latin-1 Supplement",
+    "plane": "BMP",
+    "age": "1.1",
+    "general_category": "Other Number (No)",
+    "combining_class": "Spacing, split, enclosing, reordrant, and Tibetan subjoined (0)",
+    "html_entities": ["&#189;", "&#xBD;", "&frac12;"],
+    "utf8_dec_bytes": [194, 189],
+    "numeric_type": "Numeric (nu)",
+    "numeric_value": ["1/2"],
+    "numeric_value_parsed": [0.5],
+    "NFKC_QC": "No (N)",
+    "bidi_mirrored": False,
+    "score": 90,
+}
+CJK_CHARACTER_DETAILS = {
+    "character": "一",
+    "name": "CJK UNIFIED IDEOGRAPH-4E00",
+    "description": "one; a, an; alone",
+    "codepoint": "U+4E00",
+    "uri_encoded": "%E4%B8%80",
+    "ideo_frequency": 1,
+    "total_strokes": [1],
+    "numeric_value_parsed": [1],
+}
+
+
+def validate_and_serialize(model: Any, content: Any) -> bytes:
+    # Mirrors the way FastAPI serializes a response with `response_model_exclude_unset=True`
+    if isinstance(content, list):
+        validated = [
+            model.model_validate(item).model_dump(mode="json", by_alias=True, exclude_unset=True) for item in content
+        ]
+    else:
+        validated = model.model_validate(content).model_dump(mode="json", by_alias=True, exclude_unset=True)
+    return json.dumps(validated, ensure_ascii=False, allow_nan=False, indent=None, separators=(",", ":")).encode()
+
+
+def serialize(model: type[BaseModel], content: Any) -> bytes:
+    serializer = ResponseSerializer(model)
+    return orjson.dumps(
+        serializer.serialize_many(content) if isinstance(content, list) else serializer.serialize(content)
+    )
+
+
+def test_serialize_character_details():
+    content = [CHARACTER_DETAILS, CJK_CHARACTER_DETAILS]
+    assert serialize(db.UnicodeCharacterResponse, content) == validate_and_serialize(
+        db.UnicodeCharacterResponse, content
+    )
+
+
+def test_serialize_paginated_list():
+    model = db.PaginatedList[db.UnicodeCharacterResponse]
+    content = {"url": "/v1/characters", "has_more": True, "data": [CHARACTER_DETAILS, CJK_CHARACTER_DETAILS]}
+    assert serialize(model, content) == validate_and_serialize(model, content)
+
+
+def test_serialize_search_results():
+    model = db.PaginatedSearchResults[db.UnicodeCharacterResult]
+    content = {
+        "url": "/v1/characters/search",
+        "query": "fraction",
+        "has_more": False,
+        "current_page": 1,
+        "total_results": 1,
+        "results": [CHARACTER_DETAILS],
+    }
+    assert serialize(model, content) == validate_and_serialize(model, content)
+
+
+def test_serialize_filter_results():
+    model = db.PaginatedSearchResults[db.UnicodeCharacterResponse]
+    filter_settings = db.UserFilterSettings.model_validate(
+        {"category": ["Other Number (No)"], "show_props": ["Minimum"]}
+    )
+    content = {
+        "url": "/v1/characters/filter",
+        "filter_settings": filter_settings,
+        "has_more": True,
+        "current_page": 1,
+        "next_page": 2,
+        "total_results": 2,
+        "results": [CHARACTER_DETAILS, CJK_CHARACTER_DETAILS],
+    }
+    assert serialize(model, content) == validate_and_serialize(model, content)
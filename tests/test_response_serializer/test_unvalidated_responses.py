@@ -0,0 +1,83 @@
+from dataclasses import replace
+from typing import Any
+
+import pytest
+
+import unicode_api.db.session
+from tests.test_character_endpoints.test_filter_unicode_characters.data import (
+    FILTER_BY_CHAR_FLAG,
+    FILTER_BY_CJK_DEFINITION,
+    FILTER_BY_NAME_BY_CATEGORY_BY_SCRIPT,
+    NO_CHARS_MATCH_SETTINGS,
+)
+from tests.test_character_endpoints.test_get_unicode_character_details.data import CHARACTER_PROPERTIES
+from tests.test_character_endpoints.test_list_all_unicode_characters.data import ALL_CHARS_START_AFTER_172E_LIMIT_25
+from tests.test_character_endpoints.test_search_unicode_characters_by_name.data import (
+    SEARCH_TERM_HOME,
+    SEARCH_TERM_HOUSE_PAGE_1_OF_2,
+)
+from tests.test_codepoint_endpoints.test_get_unicode_character_at_codepoint.data import (
+    CODEPOINT_24AF_RAW_HEX,
+    CODEPOINT_24AF_WITH_PREFIX_1,
+    CODEPOINT_24AF_WITH_PREFIX_2,
+)
+from unicode_api.config.api_settings import create_test_settings
+from unicode_api.core.encoding import get_uri_encoded_value
+
+
+@pytest.fixture
+def disable_response_validation(monkeypatch):
+    # Responses are only serialized with the precompiled serializer (the production path) when validation is disabled
+    def get_settings_without_validation():
+        return replace(create_test_settings(), VALIDATE_RESPONSES=False)
+
+    def disable():
+        monkeypatch.setattr(unicode_api.db.session, "get_settings", get_settings_without_validation)
+
+    return disable
+
+
+def get_validated_and_serialized_responses(client, disable_response_validation, method: str, url: str, **kwargs: Any):
+    validated = client.request(method, url, **kwargs)
+    disable_response_validation()
+    serialized = client.request(method, url, **kwargs)
+    assert validated.status_code == serialized.status_code == 200
+    assert serialized.headers["content-type"] == validated.headers["content-type"]
+    return (validated, serialized)
+
+
+@pytest.mark.parametrize(
+    "url, expected",
+    [
+        ("/v1/characters?limit=25&starting_after=172E", ALL_CHARS_START_AFTER_172E_LIMIT_25),
+        ("/v1/characters/search?name=home", SEARCH_TERM_HOME),
+        ("/v1/characters/search?name=house", SEARCH_TERM_HOUSE_PAGE_1_OF_2),
+        ("/v1/characters/filter?name=spiritus&category=mn&script=copt", FILTER_BY_NAME_BY_CATEGORY_BY_SCRIPT),
+        ("/v1/characters/filter?flag=Is%20Hyphen&per_page=20", FILTER_BY_CHAR_FLAG),
+        ("/v1/characters/filter?cjk_definition=dragon", FILTER_BY_CJK_DEFINITION),
+        ("/v1/characters/filter?name=test&script=copt&show_props=all", NO_CHARS_MATCH_SETTINGS),
+        ("/v1/codepoints/24AF", CODEPOINT_24AF_RAW_HEX),
+        ("/v1/codepoints/U+24AF?show_props=basic&verbose=true", CODEPOINT_24AF_WITH_PREFIX_1),
+        ("/v1/codepoints/0x24AF?show_props=all", CODEPOINT_24AF_WITH_PREFIX_2),
+    ],
+)
+def test_serialized_response_matches_test_data(client, disable_response_validation, url, expected):
+    (validated, serialized) = get_validated_and_serialized_responses(client, disable_response_validation, "GET", url)
+    assert serialized.content == validated.content
+    assert serialized.json() == expected
+
+
+@pytest.mark.parametrize("verbose", ["true", "false"])
+@pytest.mark.parametrize("char", CHARACTER_PROPERTIES.keys())
+def test_serialized_character_details_match_validated_response(client, disable_response_validation, char, verbose):
+    url = f"/v1/characters/-/{get_uri_encoded_value(char)}?show_props=all&verbose={verbose}"
+    (validated, serialized) = get_validated_and_serialized_responses(client, disable_response_validation, "GET", url)
+    assert serialized.content == validated.content
+
+
+def test_serialized_codepoint_batch_matches_validated_response(client, disable_response_validation):
+    body = {"codepoints": ["0041..0045", "4E00", "1F40D"], "show_props": ["all"], "verbose": True}
+    (validated, serialized) = get_validated_and_serialized_responses(
+        client, disable_response_validation, "POST", "/v1/codepoints/batch", json=body
+    )
+    assert serialized.content == validated.content
@@ -0,0 +1,46 @@
+import time
+from datetime import timedelta
+
+from unicode_api.core.result_cache import ResultCache, pack_search_results, unpack_search_results
+
+
+def test_result_cache_hit_and_miss():
+    cache: ResultCache[str, int] = ResultCache("test", max_entries=2, ttl=timedelta(minutes=1))
+    assert cache.get_or_compute("a", lambda: 1) == 1
+    assert cache.get_or_compute("a", lambda: 2) == 1
+    stats = cache.stats
+    assert (stats.hits, stats.misses, stats.entries) == (1, 1, 1)
+    assert stats.hit_rate == 0.5
+
+
+def test_result_cache_evicts_least_recently_used_entry():
+    cache: ResultCache[str, int] = ResultCache("test", max_entries=2, ttl=timedelta(minutes=1))
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == 1
+    cache.set("c", 3)
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+    assert cache.stats.evictions == 1
+
+
+def test_result_cache_entries_expire():
+    cache: ResultCache[str, int] = ResultCache("test", max_entries=2, ttl=timedelta(milliseconds=10))
+    cache.set("a", 1)
+    time.sleep(0.02)
+    assert cache.get("a") is None
+    assert cache.stats.expirations == 1
+    assert len(cache) == 0
+
+
+def test_result_cache_disabled():
+    cache: ResultCache[str, int] = ResultCache("test", max_entries=0, ttl=timedelta(minutes=1))
+    assert cache.get_or_compute("a", lambda: 1) == 1
+    assert cache.get_or_compute("a", lambda: 2) == 2
+    assert cache.stats.hits == 0
+
+
+def test_pack_search_results():
+    results = [(0x1F3E0, 100.0), (0x1F3E1, 85.5), (0x2302, 72.0)]
+    assert unpack_search_results(pack_search_results(results)) == results
@@ -0,0 +1,72 @@
+import json
+from collections.abc import Callable, Iterator
+from pathlib import Path
+from typing import Any
+
+import pytest
+from sqlalchemy import event, text
+from sqlalchemy.engine import Engine
+from sqlmodel import create_engine
+
+from tests.test_update_all_data.data import create_prop_values, create_ucd_xml
+from unicode_api.config.api_settings import UnicodeApiSettings, create_test_settings
+from unicode_api.constants import UNICODE_PLANES_DEFAULT
+from unicode_api.data.scripts.update_all_data import populate_sqlite_db
+from unicode_api.db.engine import setup_rw_db_conn
+
+
+@pytest.fixture
+def ucd_settings(tmp_path: Path) -> UnicodeApiSettings:
+    """Settings whose data files are in a temporary folder, containing a small synthetic XML database file."""
+    settings = create_test_settings()
+    for folder in ["xml", "db", "json"]:
+        tmp_path.joinpath(folder).mkdir()
+    settings.xml_file = tmp_path.joinpath("xml", "ucd.all.flat.xml")
+    settings.parsed_data_cache = tmp_path.joinpath("xml", "parsed_data.bin")
+    settings.db_file = tmp_path.joinpath("db", "unicode-api.db")
+    settings.filter_bitmaps_file = tmp_path.joinpath("db", "filter_bitmaps.bin")
+    settings.json_folder = tmp_path.joinpath("json")
+    settings.prop_values_json = settings.json_folder.joinpath("prop_values.json")
+    settings.planes_json = settings.json_folder.joinpath("planes.json")
+    settings.blocks_json = settings.json_folder.joinpath("blocks.json")
+    settings.char_name_map = settings.json_folder.joinpath("char_name_map.json")
+    settings.unihan_chars_json = settings.json_folder.joinpath("unihan_chars.json")
+    settings.tangut_chars_json = settings.json_folder.joinpath("tangut_chars.json")
+    settings.char_type_table = settings.json_folder.joinpath("char_types.bin")
+    settings.unicode_data_file = settings.json_folder.joinpath("unicode_data.bin")
+    settings.xml_file.write_text(create_ucd_xml())
+    settings.prop_values_json.write_text(json.dumps(create_prop_values(), indent=4))
+    settings.planes_json.write_text(json.dumps(UNICODE_PLANES_DEFAULT, indent=4))
+    return settings
+
+
+@pytest.fixture
+def ucd_db_engine(ucd_settings: UnicodeApiSettings, monkeypatch: pytest.MonkeyPatch) -> Iterator[Engine]:
+    """Replaces the engine used to populate the database with an engine for the temporary database file."""
+    engine = create_engine(f"sqlite:///{ucd_settings.db_file}", connect_args={"check_same_thread": False})
+    event.listen(engine, "connect", setup_rw_db_conn)
+    monkeypatch.setattr(populate_sqlite_db, "engine", engine)
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def dump_database(ucd_db_engine: Engine) -> Callable[[], dict[str, list[Any]]]:
+    """Returns a function that reads every row of every table in the temporary database, in a stable order."""
+
+    def dump() -> dict[str, list[Any]]:
+        # The database file is deleted before it is populated again, so every pooled connection must be closed
+        ucd_db_engine.dispose()
+        tables: dict[str, list[Any]] = {}
+        with ucd_db_engine.connect() as conn:
+            table_names = conn.execute(
+                text("SELECT name FROM sqlite_master WHERE type = 'table' AND name NOT LIKE 'sqlite_%' ORDER BY name")
+            ).scalars()
+            for table_name in table_names.all():
+                column_count = len(conn.execute(text(f'SELECT * FROM "{table_name}" LIMIT 0')).keys())
+                order_by = ", ".join(str(n) for n in range(1, column_count + 1))
+                tables[table_name] = list(conn.execute(text(f'SELECT * FROM "{table_name}" ORDER BY {order_by}')))
+        ucd_db_engine.dispose()
+        return tables
+
+    return dump
@@ -0,0 +1,88 @@
+from typing import Any
+
+# (first codepoint, last codepoint, block name, codepoints of the <char> elements in the block)
+SYNTHETIC_BLOCKS = [
+    (0x0000, 0x007F, "Basic Latin", range(0x80)),
+    (0x0370, 0x03FF, "Greek and Coptic", [*range(0x0391, 0x03A2), *range(0x03A3, 0x03AA)]),
+    (0x0600, 0x06FF, "Arabic", range(0x0660, 0x066A)),
+    (0x4E00, 0x9FFF, "CJK Unified Ideographs", range(0x4E00, 0x4E1D)),
+    (0x17000, 0x187FF, "Tangut", range(0x17000, 0x17013)),
+]
+SCRIPT_SHORT_NAMES = ["Arab", "Grek", "Hani", "Latn", "Tang", "Zyyy"]
+
+
+def _prop_values(*short_names: str) -> dict[str, dict[str, Any]]:
+    return {
+        f"{id}": {"id": id, "short_name": short_name, "long_name": short_name}
+        for id, short_name in enumerate(short_names, start=1)
+    }
+
+
+def create_prop_values() -> dict[str, Any]:
+    return {
+        "Age": _prop_values("1.1", "6.0", "9.0"),
+        "Bidi_Class": _prop_values("AN", "L", "ON", "WS"),
+        "Bidi_Paired_Bracket_Type": _prop_values("c", "n", "o"),
+        "Canonical_Combining_Class": {
+            "0": {"id": 0, "short_name": "NR", "long_name": "Not_Reordered"},
+            "230": {"id": 230, "short_name": "A", "long_name": "Above"},
+        },
+        # The parser uses the 12th value (None) as the default Decomposition_Type
+        "Decomposition_Type": _prop_values(
+            "can", "com", "enc", "fin", "font", "fra", "init", "iso", "med", "nar", "nb", "none"
+        ),
+        "East_Asian_Width": _prop_values("N", "Na", "W"),
+        "General_Category": {
+            id: {**value, "is_group": False, "grouped_values": ""}
+            for id, value in _prop_values("Cc", "Lo", "Lu", "Nd", "Po", "Zs").items()
+        },
+        "Joining_Type": _prop_values("T", "U"),
+        "Line_Break": _prop_values("AL", "ID", "NU"),
+        "Numeric_Type": _prop_values("De", "None"),
+        "Script": _prop_values(*SCRIPT_SHORT_NAMES),
+        "Block": {},
+        "boolean_properties": [],
+        "missing_prop_groups": [],
+    }
+
+
+def create_ucd_xml() -> str:
+    chars: list[str] = []
+    for start, _, block_name, codepoints in SYNTHETIC_BLOCKS:
+        chars.extend(_create_char_element(codepoint, block_name, codepoint - start) for codepoint in codepoints)
+        if block_name == "Greek and Coptic":
+            # Ranges of unassigned or reserved codepoints have no cp attribute and are skipped by the parser
+            chars.append('<reserved first-cp="03A2" last-cp="03A2"/>')
+    blocks = [
+        f'<block first-cp="{start:04X}" last-cp="{finish:04X}" name="{name}"/>'
+        for start, finish, name, _ in SYNTHETIC_BLOCKS
+    ]
+    return (
+        '<?xml version="1.0" encoding="UTF-8"?>\n'
+        '<ucd xmlns="http://www.unicode.org/ns/2003/ucd/1.0">\n'
+        "<description>Synthetic Unicode Character Database</description>\n"
+        f"<repertoire>\n{'\n'.join(chars)}\n</repertoire>\n"
+        f"<blocks>\n{'\n'.join(blocks)}\n</blocks>\n"
+        "</ucd>\n"
+    )
+
+
+def _create_char_element(codepoint: int, block_name: str, offset: int) -> str:
+    attrs = {"cp": f"{codepoint:04X}", "age": "1.1", "ccc": "0", "bc": "L", "ea": "N", "lb": "AL", "sc": "Zyyy"}
+    if block_name == "Basic Latin":
+        if codepoint < 0x20 or codepoint == 0x7F:
+            attrs.update(na="", gc="Cc", bc="ON")
+        elif chr(codepoint).isalpha():
+            attrs.update(na=f"LATIN LETTER {chr(codepoint)}", gc="Lu", sc="Latn", Alpha="Y", Upper="Y", slc="#")
+        else:
+            attrs.update(na=f"ASCII SYMBOL {offset}", gc="Po", scx="Arab Grek Latn Arab")
+    elif block_name == "Greek and Coptic":
+        attrs.update(na=f"GREEK LETTER {offset}", gc="Lu", sc="Grek", Alpha="Y", ccc="230" if offset % 7 else "0")
+    elif block_name == "Arabic":
+        attrs.update(na=f"ARABIC-INDIC DIGIT {offset}", gc="Nd", bc="AN", sc="Arab", nt="De", nv=f"{offset % 10}")
+    elif block_name == "CJK Unified Ideographs":
+        attrs.update(na="CJK UNIFIED IDEOGRAPH-#", gc="Lo", ea="W", lb="ID", sc="Hani", scx="Hani Latn")
+        attrs.update(kDefinition=f"definition {offset}", kFrequency=f"{offset % 5 + 1}", kTotalStrokes="4")
+    else:
+        attrs.update(na="TANGUT IDEOGRAPH-#", gc="Lo", ea="W", lb="ID", sc="Tang", age="9.0")
+    return f"<char {' '.join(f'{name}="{value}"' for name, value in attrs.items())}/>"
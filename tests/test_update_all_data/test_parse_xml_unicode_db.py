@@ -0,0 +1,29 @@
+from itertools import accumulate
+
+import pytest
+
+from tests.test_update_all_data.data import SYNTHETIC_BLOCKS
+from unicode_api.data.scripts.update_all_data import parse_xml_unicode_db
+from unicode_api.data.scripts.update_all_data.parse_xml_unicode_db import parse_xml_unicode_database
+
+# Chosen so that no shard boundary falls on the first character of a block
+SHARD_SIZE = 7
+
+
+def test_parsed_data_is_identical_for_any_number_of_workers(ucd_settings, monkeypatch: pytest.MonkeyPatch):
+    block_edges = list(accumulate(len(codepoints) for (_, _, _, codepoints) in SYNTHETIC_BLOCKS))
+    assert all(edge % SHARD_SIZE for edge in block_edges[:-1])
+    monkeypatch.setattr(parse_xml_unicode_db, "CHARACTER_SHARD_SIZE", SHARD_SIZE)
+
+    result = parse_xml_unicode_database(ucd_settings, workers=1)
+    assert result.success and result.value
+    (planes, blocks, non_unihan_chars, tangut_chars, unihan_chars) = result.value
+    assert [len(non_unihan_chars), len(tangut_chars), len(unihan_chars)] == [162, 19, 29]
+    assert [block.total_defined for block in blocks] == [len(codepoints) for (_, _, _, codepoints) in SYNTHETIC_BLOCKS]
+
+    parallel_result = parse_xml_unicode_database(ucd_settings, workers=2)
+    assert parallel_result.success
+    assert parallel_result.value == result.value
+    assert [char.codepoint_dec for char in parallel_result.value[2]] == [
+        char.codepoint_dec for char in non_unihan_chars
+    ]
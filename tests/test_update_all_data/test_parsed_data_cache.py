@@ -0,0 +1,106 @@
+import pytest
+
+from unicode_api.core.result import Result
+from unicode_api.data.scripts.script_types import ParsedUnicodeDataRows, ParsedUnicodeDataSummary
+from unicode_api.data.scripts.update_all_data import parsed_data_cache
+from unicode_api.data.scripts.update_all_data.parse_xml_unicode_db import parse_xml_unicode_database
+from unicode_api.data.scripts.update_all_data.parsed_data_cache import (
+    _get_parsed_data_cache_key,
+    _get_table_columns,
+    _read_parsed_data_cache,
+    _save_parsed_data_cache,
+    parse_xml_unicode_database_with_cache,
+)
+from unicode_api.data.scripts.update_all_data.populate_sqlite_db import get_table_rows
+
+
+@pytest.fixture
+def parsed(ucd_settings) -> ParsedUnicodeDataRows:
+    result = parse_xml_unicode_database(ucd_settings)
+    assert result.success and result.value
+    return ParsedUnicodeDataRows(
+        ParsedUnicodeDataSummary.from_parsed_data(result.value), get_table_rows(ucd_settings, result.value)
+    )
+
+
+def assert_parsed_data_equal(cached: ParsedUnicodeDataRows | None, parsed: ParsedUnicodeDataRows):
+    assert cached
+    assert cached.summary == parsed.summary
+    # Rows are saved as JSON arrays, so they are read back as lists instead of tuples
+    assert cached.table_rows == {name: [list(row) for row in rows] for name, rows in parsed.table_rows.items()}
+
+
+def test_save_and_read_parsed_data_cache(ucd_settings, parsed):
+    cache_key = _get_parsed_data_cache_key(ucd_settings)
+    assert _save_parsed_data_cache(ucd_settings.parsed_data_cache, cache_key, parsed).success
+    assert_parsed_data_equal(_read_parsed_data_cache(ucd_settings.parsed_data_cache, cache_key), parsed)
+
+
+def test_parsed_data_cache_is_ignored_if_key_does_not_match(ucd_settings, parsed):
+    cache_key = _get_parsed_data_cache_key(ucd_settings)
+    assert _save_parsed_data_cache(ucd_settings.parsed_data_cache, cache_key, parsed).success
+    assert _read_parsed_data_cache(ucd_settings.parsed_data_cache, bytes(reversed(cache_key))) is None
+    ucd_settings.xml_file.write_text(ucd_settings.xml_file.read_text().replace("GREEK LETTER", "GREEK CAPITAL"))
+    assert _get_parsed_data_cache_key(ucd_settings) != cache_key
+
+
+def test_cache_key_changes_if_table_rows_are_built_differently(ucd_settings, monkeypatch: pytest.MonkeyPatch):
+    cache_key = _get_parsed_data_cache_key(ucd_settings)
+    monkeypatch.setattr(parsed_data_cache, "TABLE_ROW_MODELS", parsed_data_cache.TABLE_ROW_MODELS[:-1])
+    assert _get_parsed_data_cache_key(ucd_settings) != cache_key
+    monkeypatch.undo()
+    monkeypatch.setattr(parsed_data_cache, "TABLE_ROW_SOURCE_MODULES", parsed_data_cache.TABLE_ROW_SOURCE_MODULES[:-1])
+    assert _get_parsed_data_cache_key(ucd_settings) != cache_key
+
+
+def test_truncated_parsed_data_cache_is_ignored(ucd_settings, parsed):
+    cache_key = _get_parsed_data_cache_key(ucd_settings)
+    assert _save_parsed_data_cache(ucd_settings.parsed_data_cache, cache_key, parsed).success
+    data = ucd_settings.parsed_data_cache.read_bytes()
+    for size in [4, len(data) // 2, len(data) - 1]:
+        ucd_settings.parsed_data_cache.write_bytes(data[:size])
+        assert _read_parsed_data_cache(ucd_settings.parsed_data_cache, cache_key) is None
+
+
+def test_parsed_data_cache_is_ignored_if_columns_do_not_match(ucd_settings, parsed, monkeypatch: pytest.MonkeyPatch):
+    def get_previous_table_columns(table_rows):
+        columns = _get_table_columns(table_rows)
+        columns["character"] = columns["character"][:-1]
+        return columns
+
+    cache_key = _get_parsed_data_cache_key(ucd_settings)
+    monkeypatch.setattr(parsed_data_cache, "_get_table_columns", get_previous_table_columns)
+    assert _save_parsed_data_cache(ucd_settings.parsed_data_cache, cache_key, parsed).success
+    monkeypatch.undo()
+    assert _read_parsed_data_cache(ucd_settings.parsed_data_cache, cache_key) is None
+
+
+def test_parsed_data_cache_is_skipped_if_it_cannot_be_saved(ucd_settings, parsed):
+    cache_key = _get_parsed_data_cache_key(ucd_settings)
+    missing_folder_cache_file = ucd_settings.parsed_data_cache.parent.joinpath("missing", "parsed_data.bin")
+    result = _save_parsed_data_cache(missing_folder_cache_file, cache_key, parsed)
+    assert result.failure
+    assert "FileNotFoundError" in result.error
+
+    parsed.table_rows["character"].append((object(),))
+    result = _save_parsed_data_cache(ucd_settings.parsed_data_cache, cache_key, parsed)
+    assert result.failure
+    assert "not JSON serializable" in result.error
+    assert not ucd_settings.parsed_data_cache.exists()
+
+
+def test_parse_xml_unicode_database_with_cache(ucd_settings, parsed, monkeypatch: pytest.MonkeyPatch):
+    ucd_settings.parsed_data_cache = ucd_settings.parsed_data_cache.parent.joinpath("missing", "parsed_data.bin")
+    result = parse_xml_unicode_database_with_cache(ucd_settings)
+    assert result.success
+    assert result.value == parsed
+    assert not ucd_settings.parsed_data_cache.exists()
+
+    ucd_settings.parsed_data_cache.parent.mkdir()
+    assert parse_xml_unicode_database_with_cache(ucd_settings).success
+    monkeypatch.setattr(
+        parsed_data_cache, "parse_xml_unicode_database", lambda *_: Result[None].Fail("XML file was parsed again")
+    )
+    result = parse_xml_unicode_database_with_cache(ucd_settings)
+    assert result.success
+    assert_parsed_data_equal(result.value, parsed)
@@ -0,0 +1,58 @@
+import sqlite3
+from typing import Any
+
+from sqlalchemy import text
+
+from unicode_api.core.result import Result
+from unicode_api.data.scripts.update_all_data.parse_xml_unicode_db import parse_xml_unicode_database
+from unicode_api.data.scripts.update_all_data.populate_sqlite_db import (
+    _run_bulk_insert_transaction,
+    populate_sqlite_database,
+)
+from unicode_api.db.bitmap_filter import BitmapFilterIndex, get_index_fingerprint
+
+
+def populate_database(settings, dump_database, bulk_insert: bool) -> dict[str, list[Any]]:
+    # The parsed models are added to the ORM session, so each database is populated from a separate copy
+    result = parse_xml_unicode_database(settings)
+    assert result.success and result.value
+    assert populate_sqlite_database(settings, result.value, bulk_insert).success
+    return dump_database()
+
+
+def test_bulk_insert_matches_orm_insert(ucd_settings, dump_database):
+    bulk_tables = populate_database(ucd_settings, dump_database, bulk_insert=True)
+    orm_tables = populate_database(ucd_settings, dump_database, bulk_insert=False)
+    assert bulk_tables.keys() == orm_tables.keys()
+    for table_name in ["plane", "block", "character", "character_unihan", "character_script_extension"]:
+        assert bulk_tables[table_name], table_name
+    for table_name, rows in bulk_tables.items():
+        assert rows == orm_tables[table_name], table_name
+
+
+def test_bulk_insert_transaction_is_rolled_back_after_any_error(ucd_db_engine):
+    def insert_rows(db_conn: sqlite3.Connection) -> Result[None]:
+        db_conn.execute("CREATE TABLE test_rollback (id INTEGER)")
+        raise RuntimeError("Unexpected error")
+
+    result = _run_bulk_insert_transaction(insert_rows)
+    assert result.failure
+    assert "Unexpected error" in result.error
+    with ucd_db_engine.connect() as conn:
+        assert not conn.connection.driver_connection.in_transaction
+        assert not conn.execute(text("SELECT name FROM sqlite_master WHERE name = 'test_rollback'")).all()
+
+
+def test_bitmap_index_is_not_read_after_database_changes(ucd_settings, ucd_db_engine):
+    result = parse_xml_unicode_database(ucd_settings)
+    assert result.success and result.value
+    assert populate_sqlite_database(ucd_settings, result.value, bulk_insert=True).success
+    fingerprint = get_index_fingerprint(ucd_db_engine, ucd_settings.UNICODE_VERSION)
+    index = BitmapFilterIndex.read(ucd_settings.filter_bitmaps_file, fingerprint)
+    assert index and index.posting_lists == BitmapFilterIndex.load(ucd_db_engine).posting_lists
+
+    assert not BitmapFilterIndex.read(ucd_settings.filter_bitmaps_file, fingerprint.replace("15.0.0", "15.1.0"))
+    with ucd_db_engine.begin() as conn:
+        conn.execute(text("DELETE FROM character WHERE codepoint_dec = 0x41"))
+    fingerprint = get_index_fingerprint(ucd_db_engine, ucd_settings.UNICODE_VERSION)
+    assert not BitmapFilterIndex.read(ucd_settings.filter_bitmaps_file, fingerprint)
@@ -0,0 +1,77 @@
+import json
+from collections.abc import Iterator
+
+import pytest
+
+from unicode_api.constants import UNICODE_PLANES_DEFAULT
+from unicode_api.core.result import Result
+from unicode_api.data.scripts.update_all_data.parse_xml_unicode_db import (
+    parse_xml_unicode_database,
+    stream_xml_unicode_database,
+)
+from unicode_api.data.scripts.update_all_data.populate_sqlite_db import (
+    STREAM_QUEUE_SIZE,
+    _import_streamed_characters,
+    populate_sqlite_database,
+    populate_sqlite_database_from_stream,
+)
+from unicode_api.data.scripts.update_all_data.save_parsed_data import save_parsed_data
+
+
+def read_data_files(settings) -> dict[str, bytes]:
+    data_files = [
+        settings.planes_json,
+        settings.blocks_json,
+        settings.char_name_map,
+        settings.unihan_chars_json,
+        settings.tangut_chars_json,
+        settings.prop_values_json,
+        settings.unicode_data_file,
+        settings.char_type_table,
+    ]
+    data = {data_file.name: data_file.read_bytes() for data_file in data_files}
+    # planes.json is read by the parser, so it is restored before the data files are created again
+    settings.planes_json.write_text(json.dumps(UNICODE_PLANES_DEFAULT, indent=4))
+    return data
+
+
+@pytest.mark.parametrize("bulk_insert", [True, False])
+def test_streamed_data_matches_parsed_data(ucd_settings, dump_database, bulk_insert):
+    result = parse_xml_unicode_database(ucd_settings)
+    assert result.success and result.value
+    assert save_parsed_data(ucd_settings, result.value).success
+    assert populate_sqlite_database(ucd_settings, result.value).success
+    (parsed_tables, parsed_data_files) = (dump_database(), read_data_files(ucd_settings))
+
+    stream_result = stream_xml_unicode_database(ucd_settings, batch_size=16)
+    assert stream_result.success and stream_result.value
+    (summary, char_batches) = stream_result.value
+    assert populate_sqlite_database_from_stream(ucd_settings, summary, char_batches, bulk_insert).success
+    assert save_parsed_data(ucd_settings, summary).success
+    (streamed_tables, streamed_data_files) = (dump_database(), read_data_files(ucd_settings))
+
+    assert parsed_tables["character"]
+    assert streamed_tables == parsed_tables
+    assert streamed_data_files == parsed_data_files
+
+
+def test_queue_is_drained_after_unexpected_insert_error(ucd_settings):
+    result = stream_xml_unicode_database(ucd_settings, batch_size=4)
+    assert result.success and result.value
+    (summary, char_batches) = result.value
+    batches_parsed = 0
+
+    def count_batches() -> Iterator:
+        nonlocal batches_parsed
+        for batch in char_batches:
+            batches_parsed += 1
+            yield batch
+
+    def insert_batch(_) -> Result[None]:
+        raise RuntimeError("Unexpected error")
+
+    result = _import_streamed_characters(ucd_settings, summary, count_batches(), insert_batch)
+    assert result.failure
+    assert "Unexpected error" in result.error
+    # Every batch is parsed (the parser thread is never left blocked on a full queue) before the error is returned
+    assert batches_parsed == summary.total_characters // 4 + 1 > STREAM_QUEUE_SIZE